@@ -0,0 +1,56 @@
+"""
+Compare the throughput of fetching balances one call at a time and with `HarmonyAPI.iter_account_balances`,
+against a local fake node that answers every request after a fixed latency.
+
+    $ python dev/bench_balances.py [n_addresses] [latency_ms]
+"""
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from harmony.api import HarmonyAPI
+
+class FakeNode(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.02
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(self.latency)
+        calls = request if isinstance(request, list) else [request]
+        payload = [{"jsonrpc" : "2.0", "id" : call["id"], "result" : 10 ** 18} for call in calls]
+        body = json.dumps(payload if isinstance(request, list) else payload[0]).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def bench(name, fn, n_addresses):
+    start = time.perf_counter()
+    n = fn()
+    elapsed = time.perf_counter() - start
+    assert n == n_addresses
+    print("{:<40} {:>8} addresses  {:>8.2f} s  {:>10.0f} addresses/s".format(name, n, elapsed, n / elapsed))
+    return elapsed
+
+if __name__ == "__main__":
+    n_addresses = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    FakeNode.latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 20) / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeNode)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api = HarmonyAPI("http://127.0.0.1:{}".format(server.server_address[1]))
+    addresses = ["one1{:038d}".format(i) for i in range(n_addresses)]
+    n_serial = min(n_addresses, 200)
+    serial = bench("get_account_balance, one at a time", lambda: sum(1 for address in addresses[:n_serial] if api.get_account_balance(address, 100) is not None), n_serial) / n_serial
+    for batch_size, max_workers in ((100, 1), (100, 4), (100, 8), (500, 8)):
+        bulk = bench("iter_account_balances, {} x {}".format(batch_size, max_workers), lambda: sum(1 for _ in api.iter_account_balances(addresses, 100, batch_size, max_workers)), n_addresses) / n_addresses
+        print("{:>40} {:.0f}x".format("speedup", serial / bulk))
+    server.shutdown()
@@ -0,0 +1,70 @@
+"""
+Compare building response models with and without validation on large payloads.
+
+    $ python dev/bench_parsing.py
+"""
+import time
+import typing
+
+from pydantic import BaseModel
+
+from harmony.models import BlockListResponse, ValidatorInformationListResponse
+from harmony.utils.codec import dumps, loads
+from harmony.utils.construct import construct_model
+
+def sample(model, n_items=3):
+    """
+    Make json data for the model with every field filled in.
+    """
+    data = {}
+    for field in model.__fields__.values():
+        data[field.alias] = _sample_value(field.outer_type_, n_items)
+    return data
+
+def _sample_value(tp, n_items):
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin is typing.Union:
+        return _sample_value(args[0], n_items)
+    if origin in (list, typing.List, tuple):
+        return [_sample_value(args[0], n_items) for _ in range(n_items)] if args else []
+    if origin is dict:
+        return {"0" : _sample_value(args[1], n_items)}
+    if isinstance(tp, type) and issubclass(tp, BaseModel):
+        return sample(tp, n_items)
+    if tp is bool:
+        return True
+    if tp is int:
+        return 123456789
+    if tp is float:
+        return 0.5
+    return "0x0123456789abcdef"
+
+def make_block(number, n_transactions):
+    tx = {"blockHash" : "0x%064x" % number, "blockNumber" : number, "from" : "one1", "gas" : 21000, "gasPrice" : 1, "hash" : "0x%064x" % number, "input" : "0x", "nonce" : 1, "to" : "one1", "value" : 10 ** 18}
+    return {
+        "difficulty" : 0, "epoch" : 0, "extraData" : "0x", "gasLimit" : 80000000, "gasUsed" : 0,
+        "hash" : "0x%064x" % number, "logsBloom" : "0x" + "0" * 512, "miner" : "one1", "mixHash" : "0x", "nonce" : 0,
+        "number" : number, "parentHash" : "0x%064x" % (number - 1), "receiptsRoot" : "0x", "size" : 600,
+        "stakingTransactions" : [], "stateRoot" : "0x", "timestamp" : number, "transactions" : [dict(tx) for _ in range(n_transactions)],
+        "transactionsRoot" : "0x", "uncles" : [], "viewID" : number
+    }
+
+def bench(name, model, body, rounds=5):
+    data = loads(body)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        model(**loads(body))
+    validated = (time.perf_counter() - start) / rounds
+    start = time.perf_counter()
+    for _ in range(rounds):
+        construct_model(model, loads(body))
+    trusted = (time.perf_counter() - start) / rounds
+    assert construct_model(model, data) == model(**data)
+    print("{:<32} {:>8.1f} KiB  validated {:>8.2f} ms  trusted {:>8.2f} ms  ({:.1f}x)".format(name, len(body) / 1024, validated * 1000, trusted * 1000, validated / trusted))
+
+if __name__ == "__main__":
+    blocks = dumps({"jsonrpc" : "2.0", "id" : 1, "result" : [make_block(n, 20) for n in range(1000)]}).encode("utf-8")
+    validators = dumps({"jsonrpc" : "2.0", "id" : 1, "result" : [sample(ValidatorInformationListResponse.__fields__["result"].type_, 10) for _ in range(400)]}).encode("utf-8")
+    bench("getBlocks, 1000 blocks", BlockListResponse, blocks)
+    bench("getAllValidatorInformation, 400", ValidatorInformationListResponse, validators)
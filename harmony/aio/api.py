@@ -0,0 +1,1522 @@
+import asyncio
+from typing import Any, AsyncIterator, Iterable, List, Optional, Sequence, Tuple, Union
+
+from pydantic import BaseModel
+import aiohttp
+
+from ..models import (
+    Block,
+    CrossLink,
+    CXReceipt,
+    Delegation,
+    Header,
+    LatestChainHeaders,
+    NodeMetadata,
+    MedianRawStakeSnapshot,
+    PendingCXReceipt,
+    PoolStats,
+    ShardingStructure,
+    SortOrder,
+    StakingError,
+    StakingNetworkInfo,
+    StakingTransaction,
+    SuperCommittees,
+    Transaction,
+    TransactionError,
+    TransactionReceipt,
+    TransactionType,
+    UtilityMetrics,
+    ValidatorIDs,
+    ValidatorInformation
+)
+
+from . import account as act
+from . import balances as bal
+from . import blockchain_network as bc_net
+from . import blocks as blk
+from . import block_range as blk_range
+from . import cross_shard as cx
+from . import delegation as dlg
+from . import history as hist
+from . import node
+from . import receipts as rcpt
+from . import smart_contract as sc
+from . import staking as stk
+from . import staking_network as stk_net
+from . import transaction_pool as tx_pool
+from . import transfer as tx
+from . import validator as val
+from .communication import create_session
+from .endpoints.batch import batch_call
+from .sessions import CoalescingSession, PooledSession, RateLimitedSession, ResilientSession, TrustedSession
+from ..block_range import AdaptiveChunkSize
+from ..cache import BlockCache, TTLCache
+from ..exceptions import HarmonyNodeError
+from ..index import TransactionIndex
+from ..pool import EndpointPool, HedgePolicy
+from ..utils.ratelimit import RateLimiter
+from ..utils.resilience import DEFAULT_RETRY_POLICY, RetryPolicy
+from ..utils.transport import TransportConfig
+
+class AsyncHarmonyAPI(object):
+
+    def __init__(self, api_url : Union[str, Sequence[str], EndpointPool], session : Optional[aiohttp.ClientSession] = None, pool_size : Optional[int] = 100, block_cache : Optional[BlockCache] = None, state_cache : Optional[TTLCache] = None, coalesce_requests : Optional[bool] = False, trusted : Optional[bool] = False, hedging : Optional[HedgePolicy] = None, retry_policy : Optional[RetryPolicy] = None, rate_limiter : Optional[RateLimiter] = None, transport : Optional[TransportConfig] = None, transaction_index : Optional[TransactionIndex] = None) -> None:
+        """
+        The asyncio counterpart of `HarmonyAPI`.
+
+        Every method of `HarmonyAPI` is available as a coroutine, except for the rosetta endpoints.
+
+        Parameters
+        ----------
+        api_url : str, list[str] or EndpointPool
+            The url where the node is located, or the urls of several nodes on the same shard
+            to route each call between (see `HarmonyAPI`)
+        session : aiohttp.ClientSession, optional
+            An already existing aiohttp session. If none is passed
+            a session with a pool of `pool_size` connections will be created
+            for this object on first use.
+        pool_size : int, optional
+            The maximum number of open connections of the created session; defaults to 100
+        block_cache : BlockCache, optional
+            A cache for finalized blocks, headers, signers and transaction counts.
+            If none is passed, blocks are fetched from the node on every call.
+        state_cache : TTLCache, optional
+            A short lived cache for volatile chain state such as the gas price,
+            block number and epoch. If none is passed, they are fetched on every call.
+        coalesce_requests : bool, optional
+            Whether identical requests made at the same time from different tasks
+            should share one network call; defaults to False
+        trusted : bool, optional
+            Whether the node is trusted, in which case responses are built into models
+            without validating them; defaults to False
+        hedging : HedgePolicy, optional
+            When to send a duplicate of a slow read to a second node and take whichever
+            answers first (see `harmony.pool.HedgePolicy`). If none is passed, reads are never hedged.
+        retry_policy : RetryPolicy, optional
+            The timeouts, retries and circuit breakers of the requests (see `harmony.utils.resilience.RetryPolicy`).
+            If none is passed, `DEFAULT_RETRY_POLICY` is used. Either way the client keeps circuit breakers of its own.
+        rate_limiter : RateLimiter, optional
+            The rate and concurrency limits of the calls to each node (see `harmony.utils.ratelimit.RateLimiter`),
+            which can be shared with other clients. If none is passed, calls aren't limited.
+        transport : TransportConfig, optional
+            The connection pool of the session created when none is passed, in place of `pool_size`
+            (see `harmony.aio.communication.create_session`).
+        transaction_index : TransactionIndex, optional
+            A local index of the transactions of the shard (see `harmony.index.TransactionIndex`).
+            Transactions are looked up in it before asking the node, and account transaction
+            histories and counts are answered from it once it is complete and no more
+            than its `max_lag` blocks behind the node. The head of the node is the one the
+            index's follower last saw, or else `current_block_number`, cached by `state_cache`.
+        """
+        self._transaction_index = transaction_index
+        self._endpoint_pool = None
+        if not isinstance(api_url, str):
+            self._endpoint_pool = api_url if isinstance(api_url, EndpointPool) else EndpointPool(api_url)
+            api_url = self._endpoint_pool.urls[0]
+        elif hedging is not None:
+            self._endpoint_pool = EndpointPool([api_url])
+        self._hedging = hedging
+        self._api_url = api_url
+        self._block_cache = block_cache
+        self._state_cache = state_cache
+        self._owns_session = session is None
+        self._pool_size = pool_size
+        self._transport = transport
+        self._coalesce_requests = coalesce_requests
+        self._trusted = trusted
+        self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        if session is not None:
+            session = self._wrap(session)
+        self._session = session
+
+    async def __aenter__(self) -> "AsyncHarmonyAPI":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the session, if it was created by this object.
+        """
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _wrap(self, session : aiohttp.ClientSession) -> aiohttp.ClientSession:
+        if self._rate_limiter is not None:
+            session = RateLimitedSession(self._rate_limiter, session)
+        if self._endpoint_pool is not None:
+            session = PooledSession(self._endpoint_pool, session, self._hedging)
+        if self._coalesce_requests:
+            session = CoalescingSession(session)
+        if self._trusted:
+            session = TrustedSession(session)
+        return ResilientSession(self._retry_policy if self._retry_policy is not None else DEFAULT_RETRY_POLICY, session)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            self._session = self._wrap(create_session(self._pool_size, transport=self._transport))
+        return self._session
+
+    @property
+    def url(self) -> str:
+        return self._api_url
+
+    @property
+    def endpoint_pool(self) -> Optional[EndpointPool]:
+        return self._endpoint_pool
+
+    @property
+    def block_cache(self) -> Optional[BlockCache]:
+        return self._block_cache
+
+    @property
+    def state_cache(self) -> Optional[TTLCache]:
+        return self._state_cache
+
+    async def node_metadata(self) -> NodeMetadata:
+        """
+        Get metadata about the node.
+
+        Returns
+        -------
+        NodeMetadata
+        """
+        if self._state_cache is not None:
+            return await self._state_cache.afetch("node_metadata", self._fetch_node_metadata)
+        return await self._fetch_node_metadata()
+
+    async def _fetch_node_metadata(self) -> NodeMetadata:
+        resp = await node.get_node_metadata(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def peer_count(self) -> int:
+        """
+        Get the number of connected peers.
+
+        Returns
+        -------
+        int
+        """
+        resp = await node.get_peer_count(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return int(resp.result, 16)
+
+    async def protocol_version(self) -> int:
+        """
+        Get the version of the protocol
+
+        Returns
+        -------
+        int
+        """
+        resp = await node.get_protocol_version(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def _current_bad_blocks(self) -> List[str]:
+        """
+        Get the hashes of the bad blocks in the node's memory
+
+        NOTE: Known issues with RPC not returning correctly
+
+        Returns
+        --------
+        list[str]
+        """
+        resp = await node.get_current_bad_blocks(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def current_gas_price(self) -> int:
+        """
+        Get the current average gas price
+
+        Returns
+        -------
+        int
+        """
+        if self._state_cache is not None:
+            return await self._state_cache.afetch("current_gas_price", self._fetch_current_gas_price)
+        return await self._fetch_current_gas_price()
+
+    async def _fetch_current_gas_price(self) -> int:
+        resp = await bc_net.get_current_gas_price(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+    
+    async def circulating_supply(self) -> int:
+        """
+        Get the current circulating supply in ONE tokens.
+
+        Returns
+        -------
+        int
+        """
+        resp = await bc_net.get_circulating_supply(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+    
+    async def total_supply(self) -> int:
+        """
+        Get the current total supply in ONE tokens.
+        
+        Returns
+        -------
+        int
+        """
+        resp = await bc_net.get_total_supply(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def current_block_number(self) -> int:
+        """
+        Get the block number of the current block
+
+        Returns
+        -------
+        int
+        """
+        if self._state_cache is not None:
+            return await self._state_cache.afetch("current_block_number", self._fetch_current_block_number)
+        return await self._fetch_current_block_number()
+
+    async def _fetch_current_block_number(self) -> int:
+        resp = await bc_net.current_block_number(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def current_leader(self) -> str:
+        """
+        Get the wallet address of the current leader.
+
+        Returns
+        -------
+        str
+        """
+        resp = await bc_net.get_current_leader(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def sharding_structure(self) -> List[ShardingStructure]:
+        """
+        Get the sharding structure
+
+        Returns
+        -------
+        list[ShardingStructure]
+        """
+        if self._state_cache is not None:
+            return await self._state_cache.afetch("sharding_structure", self._fetch_sharding_structure)
+        return await self._fetch_sharding_structure()
+
+    async def _fetch_sharding_structure(self) -> List[ShardingStructure]:
+        resp = await bc_net.get_sharding_structure(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def last_cross_links(self) -> List[CrossLink]:
+        """
+        Get the last cross links
+
+        Returns
+        -------
+        List[CrossLink]
+        """
+        resp = await bc_net.get_last_cross_links(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def current_epoch(self) -> int:
+        """
+        Get the current epoch
+
+        Returns
+        -------
+        int
+        """
+        if self._state_cache is not None:
+            return await self._state_cache.afetch("current_epoch", self._fetch_current_epoch, self._seconds_until_next_epoch)
+        return await self._fetch_current_epoch()
+
+    async def _fetch_current_epoch(self) -> int:
+        resp = await bc_net.get_epoch(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def _seconds_until_next_epoch(self, epoch : int) -> float:
+        """
+        Estimate how long the epoch lasts from the last block of the epoch and the current block number.
+        Falls back to the time to live configured for the epoch if they aren't available.
+        """
+        try:
+            info = await self.staking_network_info()
+            block_number = await self.current_block_number()
+        except (HarmonyNodeError, aiohttp.ClientError, asyncio.TimeoutError):
+            return self._state_cache.ttl("current_epoch")
+        if info is None or block_number is None:
+            return self._state_cache.ttl("current_epoch")
+        return max(1, info.epoch_last_block - block_number) * self._state_cache.block_time
+
+    async def validators_by_epoch(self, epoch_number : int, as_pubkeys : Optional[bool] = False) -> Union[ValidatorIDs, List[str]]:
+        """
+        Get the validators for a given epoch
+
+        Parameters
+        ----------
+        epoch_number : int
+        as_pubkeys : bool, optional
+            Represent the validators by their public keys; defaults to False
+
+        Returns
+        -------
+        ValidatorIDs if as_pubkeys is False else list[str]
+        """
+        if as_pubkeys:
+            resp = await bc_net.get_validator_keys_by_epoch(self.url, epoch_number, self.session)
+        else:
+            resp = await bc_net.get_validators_by_epoch(self.url, epoch_number, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def current_utility_metrics(self) -> UtilityMetrics:
+        """
+        Get the current staking network utility metrics
+
+        Returns
+        -------
+        UtilityMetrics
+        """
+        resp = await stk_net.get_current_utility_metrics(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def staking_network_info(self) -> StakingNetworkInfo:
+        """
+        Get information about the staking network
+
+        Returns
+        -------
+        StakingNetworkInfo
+        """
+        if self._state_cache is not None:
+            return await self._state_cache.afetch("staking_network_info", self._fetch_staking_network_info)
+        return await self._fetch_staking_network_info()
+
+    async def _fetch_staking_network_info(self) -> StakingNetworkInfo:
+        resp = await stk_net.get_staking_network_info(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def latest_super_committes(self) -> SuperCommittees:
+        """
+        Get information about the current and previously elected super committees
+
+        Returns
+        -------
+        SuperCommittees  
+        """
+        resp = await stk_net.get_super_committees(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+    
+    async def median_raw_stake_snapshot(self) -> MedianRawStakeSnapshot:
+        """
+        Get a snapshot of the raw median stake.
+
+        Returns
+        -------
+        MedianRawStakeSnapshot
+        """
+        resp = await stk_net.get_median_raw_stake_snapshot(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def transaction_pool_stats(self) -> PoolStats:
+        """
+        Get stats on the transaction pool
+        
+        Returns
+        --------
+        PoolStats
+        """
+        resp = await tx_pool.get_pool_stats(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def pending_staking_transactions(self) -> List[StakingTransaction]:
+        """
+        Get the staking transactions pending in the transaction pool.
+
+        Returns
+        --------
+        list[StakingTransaction]
+        """
+        resp = await tx_pool.get_pending_staking_transactions(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def pending_transactions(self) -> List[Transaction]:
+        """
+        Get the transactions pending in the transaction pool.
+
+        Returns
+        -------
+        list[Transaction]
+        """
+        resp = await tx_pool.get_pending_transactions(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def latest_chain_headers(self) -> LatestChainHeaders:
+        """
+        Get the latest chain headers.
+
+        Returns
+        -------
+        LatestChainHeaders
+        """
+        resp = await blk.get_latest_chain_headers(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def block_header(self, block_number : Optional[int] = None) -> Header:
+        """
+        Get the header of the block.
+
+        Parameters
+        ----------
+        block_number : int, optional
+            The block number of the block to get the header for.
+            If None is given, get the header of the latest block.
+            Defaults to None.
+
+        Returns
+        -------
+        Header
+        """
+        if block_number is not None and self._block_cache is not None:
+            cached = self._block_cache.get(("header",), block_number)
+            if cached is not None:
+                return cached
+        if block_number is not None:
+            resp = await blk.get_block_header_by_number(self.url, block_number, self.session)
+        else:
+            resp = await blk.get_latest_block_header(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        if self._block_cache is not None and resp.result is not None:
+            self._block_cache.put(("header",), resp.result, resp.result.blockNumber, resp.result.blockHash)
+        return resp.result
+    
+    async def get_block(self, block_number : Optional[int] = None, block_hash : Optional[str] = None, include_full_transaction_data : Optional[bool] = False, include_regular_transactions : Optional[bool] = False, include_staking_transactions : Optional[bool] = False) -> Block:
+        """
+        Get a block by either block number or hash
+        
+        One of `block_number` and `block_hash` is required, but not both cannot be passed together.
+        
+        Parameters
+        ----------
+        block_number : int, optional
+            If block_hash is not provided, this must be provided.
+        block_hash : str, optional
+            If block_number is not provided, this must be provided.
+        include_full_transaction_data : bool, optional
+            Whether to include full transaction data; defaults to False
+        include_regular_transactions : bool, optional
+            Whether to include regular transactions; defaults to False
+        include_staking_transactions : bool, optional
+            Whether to include staking transactions; defaults to False
+
+        Returns
+        -------
+        Block
+
+        Raises
+        ------
+        ValueError: If either neither or both the block number and block hash are provided
+        """
+        if block_number is None and block_hash is None:
+            raise ValueError("One of `block_number` or `block_hash` is required")
+        if block_number is not None and block_hash is not None:
+            raise ValueError("Both `block_number` and `block_hash` can't be passed at once. Choose one.")
+    
+        key = ("block", include_full_transaction_data, include_regular_transactions, include_staking_transactions)
+        if self._block_cache is not None:
+            cached = self._block_cache.get(key, block_number, block_hash)
+            if cached is not None:
+                return cached
+        if block_number is not None:
+            resp = await blk.get_block_by_number(self.url, block_number, include_full_transaction_data, include_regular_transactions, include_staking_transactions, self.session)
+        else:
+            resp = await blk.get_block_by_hash(self.url, block_hash, include_full_transaction_data, include_regular_transactions, include_staking_transactions, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        if self._block_cache is not None and resp.result is not None:
+            self._block_cache.put(key, resp.result, resp.result.number, resp.result.hash_)
+        return resp.result
+
+    async def get_block_signers(self, block_number : int, as_pubkeys : Optional[bool] = False) -> List[str]:
+        """
+        Get the signers of the given block.
+        
+        Parameters
+        ----------
+        block_number : int
+        as_pubkeys : bool, optional
+            If True, identify the signers by public key instead of address;
+            defaults to False
+
+        Returns
+        --------
+        list[str]
+            List of signer addresses, unless as_pubkeys is True, then list of public keys
+        """
+        key = ("signers", bool(as_pubkeys))
+        if self._block_cache is not None:
+            cached = self._block_cache.get(key, block_number)
+            if cached is not None:
+                return cached
+        if as_pubkeys:
+            resp = await blk.get_block_signers_keys(self.url, block_number, self.session)
+        else:
+            resp = await blk.get_block_signers(self.url, block_number, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        if self._block_cache is not None and resp.result is not None:
+            self._block_cache.put(key, resp.result, block_number)
+        return resp.result
+
+    async def get_transaction_count_on_block(self, block_number : Optional[int] = None, block_hash : Optional[str] = None) -> int:
+        """
+        Get a block by either block number or hash
+        
+        One of `block_number` and `block_hash` is required, but not both cannot be passed together.
+        
+        Parameters
+        ----------
+        block_number : int, optional
+            If block_hash is not provided, this must be provided.
+        block_hash : str, optional
+            If block_number is not provided, this must be provided.
+
+        Returns
+        -------
+        int
+
+        Raises
+        ------
+        ValueError: If either neither or both the block number and block hash are provided
+        """
+        if block_number is None and block_hash is None:
+            raise ValueError("One of `block_number` or `block_hash` is required")
+        if block_number is not None and block_hash is not None:
+            raise ValueError("Both `block_number` and `block_hash` can't be passed at once. Choose one.")
+        
+        if self._block_cache is not None:
+            cached = self._block_cache.get(("transaction_count",), block_number, block_hash)
+            if cached is not None:
+                return cached
+        if block_number is not None:
+            resp = await blk.get_block_transaction_count_by_number(self.url, block_number, self.session)
+        else:
+            resp = await blk.get_block_transaction_count_by_hash(self.url, block_hash, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        if self._block_cache is not None and resp.result is not None and block_number is not None:
+            self._block_cache.put(("transaction_count",), resp.result, block_number)
+        return resp.result
+
+    async def get_blocks(self, starting_block_number : int, ending_block_number : int, include_signer_addresses : Optional[bool] = False, include_transactions : Optional[bool] = False, include_staking_transactions : Optional[bool] = False) -> List[Block]:
+        """
+        Get the blocks between the starting and ending block number
+
+        Parameters
+        ----------
+        starting_block_number : int
+            The block number of the first block in the range
+        ending_block_number : int
+            The block number of the last block in the range
+        include_signer_addresses : bool, optional
+            Whether to include the wallet addresses of the block signers; defaults to False
+        include_transactions : bool, optional
+            Whether to include the full transaction data on the block; defaults to False
+        include_staking_transactions : bool, optional
+            Whether to include the full staking transaction data on the block; defaults to False
+        
+        Returns
+        -------
+        list[Block]
+        """
+        resp = await blk.get_blocks_from_range(self.url, starting_block_number, ending_block_number, include_signer_addresses, include_transactions, include_staking_transactions, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    def iter_blocks(self, starting_block_number : int, ending_block_number : int, include_signer_addresses : Optional[bool] = False, include_transactions : Optional[bool] = False, include_staking_transactions : Optional[bool] = False, max_workers : Optional[int] = 4, max_retries : Optional[int] = 3, chunk_size : Optional[AdaptiveChunkSize] = None) -> AsyncIterator[Block]:
+        """
+        Iterate over the blocks between the starting and ending block number.
+
+        Unlike `get_blocks`, the range is split into chunks that are fetched concurrently,
+        which keeps large ranges with full transaction data from timing out.
+        The chunk size adapts to the observed latency and payload size.
+
+        Parameters
+        ----------
+        starting_block_number : int
+            The block number of the first block in the range
+        ending_block_number : int
+            The block number of the last block in the range
+        include_signer_addresses : bool, optional
+            Whether to include the wallet addresses of the block signers; defaults to False
+        include_transactions : bool, optional
+            Whether to include the full transaction data on the block; defaults to False
+        include_staking_transactions : bool, optional
+            Whether to include the full staking transaction data on the block; defaults to False
+        max_workers : int, optional
+            The maximum number of chunks fetched at once; defaults to 4
+        max_retries : int, optional
+            How many times to retry a failing chunk; defaults to 3
+        chunk_size : AdaptiveChunkSize, optional
+            The chunk sizing policy, defaults to AdaptiveChunkSize()
+
+        Returns
+        -------
+        AsyncIterator[Block]
+            The blocks, in order
+        """
+        return blk_range.iter_blocks_from_range(self.url, starting_block_number, ending_block_number, include_signer_addresses, include_transactions, include_staking_transactions, max_workers, max_retries, chunk_size=chunk_size, session=self.session)
+
+    def iter_log_candidate_blocks(self, starting_block_number : int, ending_block_number : int, addresses : Optional[Union[str, List[str]]] = None, topics : Optional[List[Optional[Union[str, List[str]]]]] = None, batch_size : Optional[int] = 1000, max_workers : Optional[int] = 4, chunk_size : Optional[AdaptiveChunkSize] = None) -> AsyncIterator[Block]:
+        """
+        Iterate over the blocks between the starting and ending block number whose logs bloom
+        may hold a log from the addresses with the topics, so that only their receipts need fetching.
+        Requires numpy.
+
+        Blooms have false positives, so some candidates may hold no matching log,
+        but the blocks left out hold none.
+
+        Parameters
+        ----------
+        starting_block_number : int
+            The block number of the first block in the range
+        ending_block_number : int
+            The block number of the last block in the range
+        addresses : str or list[str], optional
+            The contract addresses, as hex or bech32; defaults to any address
+        topics : list[str or list[str] or None], optional
+            The topics by position, each either a topic, a list of alternative topics,
+            or None for any topic; defaults to any topics
+        batch_size : int, optional
+            How many blooms to test at once; defaults to 1000
+        max_workers : int, optional
+            The maximum number of chunks fetched at once; defaults to 4
+        chunk_size : AdaptiveChunkSize, optional
+            The chunk sizing policy, defaults to AdaptiveChunkSize()
+
+        Returns
+        -------
+        AsyncIterator[Block]
+            The candidate blocks, in order
+        """
+        from . import bloom as aio_bloom
+        from ..bloom import LogFilter
+        return aio_bloom.iter_candidate_blocks(self.url, starting_block_number, ending_block_number, LogFilter(addresses, topics), batch_size, max_workers, chunk_size=chunk_size, session=self.session)
+
+    async def get_account_balance(self, address : str, block_number : Optional[int] = None) -> int:
+        """
+        Get the balance of an account.
+
+        Parameters
+        ----------
+        address : str
+        block_number : int, optional
+            An optional block number specifier; defaults to None
+        
+        Returns
+        -------
+        int
+        """
+        if block_number is not None:
+            resp = await act.get_balance_by_block_number(self.url, address, block_number, self.session)
+        else:
+            resp = await act.get_balance(self.url, address, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    def iter_account_balances(self, addresses : Iterable[str], block_number : Optional[int] = None, batch_size : Optional[int] = 100, max_workers : Optional[int] = 4) -> AsyncIterator[Tuple[str, int]]:
+        """
+        Get the balance of many accounts, with the calls sent in concurrent batches
+        and failed calls retried (see `harmony.aio.balances.iter_balances`).
+
+        Parameters
+        ----------
+        addresses : Iterable[str]
+            The wallet addresses, read lazily
+        block_number : int, optional
+            The block to get the balances at, defaults to the latest block
+        batch_size : int, optional
+            The number of calls per batch request; defaults to 100
+        max_workers : int, optional
+            The maximum number of batches in flight at once; defaults to 4
+
+        Returns
+        -------
+        AsyncIterator[tuple[str, int]]
+            The (address, balance) pairs, in the order of the addresses
+        """
+        return bal.iter_balances(self.url, addresses, block_number, batch_size, max_workers, session=self.session)
+
+    async def get_account_staking_transaction_count(self, address : str, transaction_type : Optional[TransactionType] = "ALL") -> int:
+        """
+        Get the number of staking transactions on the account
+        
+        Parameters
+        ----------
+        address : str
+        transaction_type : str
+            Either 'SENT', 'RECEIVED', 'ALL', defaults to 'ALL'
+        
+        Returns
+        -------
+        int
+        """
+        resp = await act.get_staking_transactions_count(self.url, address, transaction_type, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def get_account_staking_transaction_history(self, address : str, page_index : Optional[int] = 0, page_size : Optional[int] = 1000, include_full_transaction_data : Optional[bool] = False, transaction_type : Optional[TransactionType] = "ALL", sort_order : Optional[SortOrder] = "ASC") -> Union[List[str], List[StakingTransaction]]:
+        """
+        Get a history of the staking transactions on the account
+        
+        Parameters
+        ----------
+        address: str
+            The wallet address
+        page_index: int, optional
+            Which page of transactions to return, defaults to 0
+        page_size: int, optional
+            The number of transactions per page, defaults to 1000
+        include_full_transaction_data: bool, optional
+            If true return the whole transaction object instead of the hash, defaults to Fasle
+        transaction_type: str, optional
+            Either 'SENT', 'RECEIVED', 'ALL', defaults to 'ALL'
+        sort_order: str, optional
+            How to sort based on timestamp, either 'ASC' or 'DESC', defaults to 'ASC'
+        
+        Returns
+        -------
+        list[str] or list[StakingTransaction]
+        """
+        resp = await act.get_staking_transactions_history(self.url, address, page_index, page_size, include_full_transaction_data, transaction_type, sort_order, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def _answers_from_index(self) -> bool:
+        index = self._transaction_index
+        if index is None or not index.complete:
+            return False
+        if index.max_lag is None:
+            return True
+        # The head seen by the index's follower, or else the cached one, saves asking the node on every call
+        head = index.head
+        if head is None:
+            head = await self.current_block_number()
+        return index.lag(head) <= index.max_lag
+
+    async def get_account_transaction_count(self, address : str, transaction_type : Optional[TransactionType] = "ALL") -> int:
+        """
+        Get the number of transactions on the account
+        
+        Parameters
+        ----------
+        address : str
+        transaction_type : str
+            Either 'SENT', 'RECEIVED', 'ALL', defaults to 'ALL'
+        
+        Returns
+        -------
+        int
+        """
+        if await self._answers_from_index():
+            return self._transaction_index.transaction_count(address, transaction_type)
+        resp = await act.get_transactions_count(self.url, address, transaction_type, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def get_account_transaction_history(self, address : str, page_index : Optional[int] = 0, page_size : Optional[int] = 1000, include_full_transaction_data : Optional[bool] = False, transaction_type : Optional[TransactionType] = "ALL", sort_order : Optional[SortOrder] = "ASC") -> Union[List[str], List[Transaction]]:
+        """
+        Get a history of the transactions on the account
+        
+        Parameters
+        ----------
+        address: str
+            The wallet address
+        page_index: int, optional
+            Which page of transactions to return, defaults to 0
+        page_size: int, optionalOne of `block_number` and `block_hash` is required, but not both cannot be passed together.
+            The number of transactions per page, defaults to 1000
+        include_full_transaction_data: bool, optional
+            If true return the whole transaction object instead of the hash, defaults to Fasle
+        transaction_type: str, optional
+            Either 'SENT', 'RECEIVED', 'ALL', defaults to 'ALL'
+        sort_order: str, optional
+            How to sort based on timestamp, either 'ASC' or 'DESC', defaults to 'ASC'
+        
+        Returns
+        -------
+        list[str] or list[StakingTransaction]
+        """
+        if await self._answers_from_index():
+            hashes = self._transaction_index.transaction_history(address, page_index, page_size, transaction_type, sort_order)
+            return {"transactions" : self._transaction_index.transactions(hashes) if include_full_transaction_data else hashes}
+        resp = await act.get_transactions_history(self.url, address, page_index, page_size, include_full_transaction_data, transaction_type, sort_order, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    def iter_account_transaction_history(self, address : str, include_full_transaction_data : Optional[bool] = False, transaction_type : Optional[TransactionType] = "ALL", sort_order : Optional[SortOrder] = "ASC", page_size : Optional[int] = 1000, max_workers : Optional[int] = 4) -> AsyncIterator[Union[str, Transaction]]:
+        """
+        Iterate over the whole transaction history of the account, with the pages fetched concurrently.
+
+        Unlike `get_account_transaction_history`, the pages are sized from the transaction count
+        of the account and fetched for you, and transactions that arrive during the scan
+        don't come up twice (see `harmony.aio.history.iter_transactions_history`).
+
+        Parameters
+        ----------
+        address: str
+            The wallet address
+        include_full_transaction_data: bool, optional
+            If true yield the whole transaction objects instead of the hashes, defaults to False
+        transaction_type: str, optional
+            Either 'SENT', 'RECEIVED', 'ALL', defaults to 'ALL'
+        sort_order: str, optional
+            How to sort based on timestamp, either 'ASC' or 'DESC', defaults to 'ASC'
+        page_size: int, optional
+            The number of transactions per page, defaults to 1000
+        max_workers : int, optional
+            The maximum number of pages fetched at once; defaults to 4
+
+        Returns
+        -------
+        AsyncIterator[str] or AsyncIterator[Transaction]
+        """
+        return hist.iter_transactions_history(self.url, address, include_full_transaction_data, transaction_type, sort_order, False, page_size, max_workers, self.session)
+
+    def iter_account_staking_transaction_history(self, address : str, include_full_transaction_data : Optional[bool] = False, transaction_type : Optional[TransactionType] = "ALL", sort_order : Optional[SortOrder] = "ASC", page_size : Optional[int] = 1000, max_workers : Optional[int] = 4) -> AsyncIterator[Union[str, StakingTransaction]]:
+        """
+        Iterate over the whole staking transaction history of the account, with the pages fetched concurrently.
+
+        See `iter_account_transaction_history`.
+
+        Parameters
+        ----------
+        address: str
+            The wallet address
+        include_full_transaction_data: bool, optional
+            If true yield the whole transaction objects instead of the hashes, defaults to False
+        transaction_type: str, optional
+            Either 'SENT', 'RECEIVED', 'ALL', defaults to 'ALL'
+        sort_order: str, optional
+            How to sort based on timestamp, either 'ASC' or 'DESC', defaults to 'ASC'
+        page_size: int, optional
+            The number of transactions per page, defaults to 1000
+        max_workers : int, optional
+            The maximum number of pages fetched at once; defaults to 4
+
+        Returns
+        -------
+        AsyncIterator[str] or AsyncIterator[StakingTransaction]
+        """
+        return hist.iter_transactions_history(self.url, address, include_full_transaction_data, transaction_type, sort_order, True, page_size, max_workers, self.session)
+    
+    async def current_transaction_error_sink(self) -> List[TransactionError]:
+        """
+        Get the current transaction error sink.
+
+        Returns
+        -------
+        list[TransactionError]
+        """
+        resp = await tx.get_current_transaction_error_sink(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def get_transaction(self, transaction_hash : str) -> Transaction:
+        """
+        Get the transaction by its hash.
+
+        Parameters
+        ----------
+        transaction_hash : str
+
+        Returns
+        --------
+        Transaction
+        """
+        if self._transaction_index is not None:
+            indexed = self._transaction_index.get_transaction(transaction_hash)
+            if indexed is not None:
+                return indexed
+        resp = await tx.get_transaction_by_hash(self.url, transaction_hash, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+    
+    async def get_transaction_receipt(self, transaction_hash : str) -> TransactionReceipt:
+        """
+        Get the receipt of the transaction by its hash.
+
+        Parameters
+        ----------
+        transaction_hash : str
+
+        Returns
+        --------
+        TransactionReceipt
+        """
+        resp = await tx.get_transaction_receipt(self.url, transaction_hash, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    def iter_transaction_receipts(self, transaction_hashes : Iterable[str], batch_size : Optional[int] = 100, max_workers : Optional[int] = 4) -> AsyncIterator[Optional[TransactionReceipt]]:
+        """
+        Get the receipts of many transactions, with the calls sent in concurrent batches
+        (see `harmony.receipts.iter_receipts`).
+
+        Parameters
+        ----------
+        transaction_hashes : Iterable[str]
+        batch_size : int, optional
+            The number of calls per batch request; defaults to 100
+        max_workers : int, optional
+            The maximum number of batches in flight at once; defaults to 4
+
+        Returns
+        -------
+        AsyncIterator[TransactionReceipt]
+            The receipts in the order of the hashes, None for the transactions the node doesn't know
+        """
+        return rcpt.iter_receipts(self.url, transaction_hashes, batch_size, max_workers, session=self.session)
+
+    def iter_block_receipts(self, starting_block_number : int, ending_block_number : int, batch_size : Optional[int] = 100, max_workers : Optional[int] = 4) -> AsyncIterator[Tuple[Block, List[Optional[TransactionReceipt]]]]:
+        """
+        Get the receipts of the transactions of the blocks between the starting and ending block number,
+        with the calls sent in concurrent batches that span block boundaries.
+
+        To only fetch the receipts of the blocks that may hold some logs, pass the blocks of
+        `iter_log_candidate_blocks` to `harmony.receipts.iter_block_receipts` instead.
+
+        Parameters
+        ----------
+        starting_block_number : int
+            The block number of the first block in the range
+        ending_block_number : int
+            The block number of the last block in the range
+        batch_size : int, optional
+            The number of calls per batch request; defaults to 100
+        max_workers : int, optional
+            The maximum number of block chunks and of batches in flight at once; defaults to 4
+
+        Returns
+        -------
+        AsyncIterator[tuple[Block, list[TransactionReceipt]]]
+            Each block with the receipts of its transactions, in order
+        """
+        blocks = self.iter_blocks(starting_block_number, ending_block_number, max_workers=max_workers)
+        return rcpt.iter_block_receipts(self.url, blocks, batch_size, max_workers, session=self.session)
+
+    async def get_block_receipts(self, block_number : int) -> List[Optional[TransactionReceipt]]:
+        """
+        Get the receipts of the transactions of the block, in order.
+
+        Parameters
+        ----------
+        block_number : int
+
+        Returns
+        -------
+        list[TransactionReceipt]
+        """
+        return [receipts async for _, receipts in self.iter_block_receipts(block_number, block_number)][0]
+
+    async def get_transaction_by_block(self, transaction_index : int, block_number : Optional[int] = None, block_hash : Optional[str] = None) -> Transaction:
+        """
+        Get the transaction by the block specifier
+
+        One of `block_number` and `block_hash` is required, but not both cannot be passed together.
+
+        Parameters
+        ----------
+        transaction_index : int
+        block_number : int, optional
+            If block_hash is not provided, this must be provided.
+        block_hash : str, optional
+            If block_number is not provided, this must be provided.
+
+        Returns
+        -------
+        Transaction
+
+        Raises
+        ------
+        ValueError: If either neither or both the block number and block hash are provided
+        """
+        if block_number is None and block_hash is None:
+            raise ValueError("One of `block_number` or `block_hash` is required")
+        if block_number is not None and block_hash is not None:
+            raise ValueError("Both `block_number` and `block_hash` can't be passed at once. Choose one.")
+
+        if block_number is not None:
+            resp = await tx.get_transaction_by_block_number_and_index(self.url, block_number, transaction_index, self.session)
+        else:
+            resp = await tx.get_transaction_by_block_hash_and_index(self.url, block_hash, transaction_index, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def send_raw_transaction(self, signed_transaction_hex : str) -> str:
+        """
+        Send the raw signed transaction
+
+        Parameters
+        ----------
+        signed_transaction_hex : str
+            The hex representation of the signed transaction
+        
+        Returns
+        -------
+        str
+        """
+        resp = await tx.send_raw_transaction(self.url, signed_transaction_hex, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def current_staking_transaction_error_sink(self) -> List[StakingError]:
+        """
+        Get the current staking transaction error sink.
+
+        Returns
+        -------
+        list[StakingError]
+        """
+        resp = await stk.get_current_staking_error_sink(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def get_staking_transaction(self, transaction_hash : str) -> StakingTransaction:
+        """
+        Get the transaction by its hash.
+
+        Parameters
+        ----------
+        transaction_hash : str
+
+        Returns
+        --------
+        StakingTransaction
+        """
+        resp = await stk.get_staking_transaction_by_hash(self.url, transaction_hash, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+    
+    async def get_staking_transaction_by_block(self, transaction_index : int, block_number : Optional[int] = None, block_hash : Optional[str] = None) -> StakingTransaction:
+        """
+        Get the staking transaction by the block specifier
+
+        One of `block_number` and `block_hash` is required, but not both cannot be passed together.
+
+        Parameters
+        ----------
+        transaction_index : int
+        block_number : int, optional
+            If block_hash is not provided, this must be provided.
+        block_hash : str, optional
+            If block_number is not provided, this must be provided.
+
+        Returns
+        -------
+        StakingTransaction
+
+        Raises
+        ------
+        ValueError: If either neither or both the block number and block hash are provided
+        """
+        if block_number is None and block_hash is None:
+            raise ValueError("One of `block_number` or `block_hash` is required")
+        if block_number is not None and block_hash is not None:
+            raise ValueError("Both `block_number` and `block_hash` can't be passed at once. Choose one.")
+
+        if block_number is not None:
+            resp = await stk.get_staking_transaction_by_block_number_and_index(self.url, block_number, transaction_index, self.session)
+        else:
+            resp = await stk.get_staking_transaction_by_block_hash_and_index(self.url, block_hash, transaction_index, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def send_raw_staking_transaction(self, signed_transaction_hex : str) -> str:
+        """
+        Send the raw signed staking transaction
+
+        Parameters
+        ----------
+        signed_transaction_hex : str
+            The hex representation of the signed staking transaction
+        
+        Returns
+        -------
+        str
+        """
+        resp = await stk.send_raw_staking_transaction(self.url, signed_transaction_hex, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+    
+    
+    async def get_delegations_by_delegator(self, delegator_address : str, block_number : Optional[int] = None) -> List[Delegation]:
+        """
+        Get the delegations by a delegator
+
+        Parameters
+        ----------
+        delegator_address : str
+        block_number : int, optional
+            Optionally filter by block number, defaults to None
+
+        Returns
+        -------
+        list[Delegation]
+        """
+        if block_number is None:
+            resp = await dlg.get_delegations_by_delegator(self.url, delegator_address, self.session)
+        else:
+            resp = await dlg.get_delegations_by_delegator_by_block_number(self.url, delegator_address, block_number, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def get_delegations_by_validator(self, validator_address : str) -> List[Delegation]:
+        """
+        Get the delegations by a validator
+
+        Parameters
+        ----------
+        validator_address : str
+
+        Returns
+        -------
+        list[Delegation]
+        """
+        resp = await dlg.get_delegations_by_validator(self.url, validator_address, self.session)
+        return resp.result
+
+    async def get_all_validators(self) -> List[str]:
+        """
+        Get the addresses of all the validators.
+
+        Returns
+        -------
+        list[str]
+        """
+        resp = await val.get_all_elected_validator_addresses(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def get_all_elected_validators(self) -> List[str]:
+        """
+        Get the addresses of all the elected validators.
+
+        Returns
+        -------
+        list[str]
+        """
+        resp = await val.get_all_elected_validator_addresses(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def get_information_about_validator(self, validator_address : str) -> ValidatorInformation:
+        """
+        Get detailed information about a given validator.
+
+        Returns
+        -------
+        ValidatorInformation
+        """
+        resp = await val.get_validator_information(self.url, validator_address, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+    
+    async def get_all_validator_information(self, page_number : Optional[int] = -1, block_number : Optional[int] = None) -> List[ValidatorInformation]:
+        """
+        Get detailed information about all the validators.
+
+        Parameters
+        ----------
+        page_number : int, optional 
+            The page number of validators to get (100 results per page)
+            with -1 getting all results, defaults to -1
+        block_number : int, optional
+            The block number to optionally filter on
+        
+        Returns
+        -------
+        list[ValidatorInformation]
+        """
+        if block_number is not None:
+            resp = await val.get_all_validator_information_by_block_number(self.url, block_number, page_number, self.session)
+        else:
+            resp = await val.get_all_validator_information(self.url, page_number, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def validator_stats(self, page_number : Optional[int] = -1, block_number : Optional[int] = None) -> "ValidatorStats":
+        """
+        Get detailed information about all the validators, flattened into NumPy arrays
+        for computing aggregates. Requires numpy.
+
+        Parameters
+        ----------
+        page_number : int, optional
+            The page number of validators to get (100 results per page)
+            with -1 getting all results, defaults to -1
+        block_number : int, optional
+            The block number to optionally filter on
+
+        Returns
+        -------
+        ValidatorStats
+        """
+        from ..validator_stats import ValidatorStats
+        return ValidatorStats(await self.get_all_validator_information(page_number, block_number))
+
+    async def get_cx_reciept(self, cx_receipt_hash : str) -> CXReceipt:
+        """
+        Get the cross shard receipt
+
+        Parameters
+        ----------
+        cx_receipt_hash : str
+
+        Returns
+        -------
+        CXReceipt
+        """
+        resp = await cx.get_cx_receipt_by_hash(self.url, cx_receipt_hash, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def pending_cx_receipts(self) -> List[PendingCXReceipt]:
+        """
+        Get the currently pending cross shard receipts
+
+        Returns
+        -------
+        list[PendingCXReceipt]
+        """
+        resp = await cx.get_pending_cx_receipts(self.url, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def resend_cx_receipt(self, cx_receipt_hash : str) -> bool:
+        """
+        Use this to resend the cross shard receipt to the receiving shard to re-process if the transaction did not pay out 
+
+        Parameters
+        ----------
+        cx_receipt_hash : str
+
+        Returns
+        -------
+        bool
+            True if the resend was successful
+        """
+        resp = await cx.resend_cx_receipt(self.url, cx_receipt_hash, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def call_smart_contract(self, to_address : str, block_number : str, from_address : Optional[str] = None, gas: Optional[int] = None, gas_price : Optional[int] = None, value : Optional[int] = None, data : Optional[str] = None) -> str:
+        """
+        Execute a smart contract call without saving state.
+
+        Parameters
+        ----------
+        to_address : str
+            The desitination wallet
+        block_number: int
+        from_address : str, optional
+            The source address
+        gas : int, optional
+            Gas to execute the call
+        gas_price : int, optional
+            Gase price to execute the call
+        value : int, optional
+            Value sent with the smart contract
+        data : str, optional
+            Hash of smart contract method and parameters
+
+        Returns
+        -------
+        str
+            The return value of the call
+        """
+        resp = await sc.call(self.url, to_address, block_number, from_address, gas, gas_price, value, data, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def estimate_smart_contract_gas_price(self, to_address : str, block_number : str, from_address : Optional[str] = None, gas: Optional[int] = None, gas_price : Optional[int] = None, value : Optional[int] = None, data : Optional[str] = None) -> str:
+        """
+        Executes a smart contract transction without creating a transaction and saving data
+
+
+        Parameters
+        ----------
+        to_address : str
+            The desitination wallet
+        block_number: int
+        from_address : str, optional
+            The source address
+        gas : int, optional
+            Gas to execute the call
+        gas_price : int, optional
+            Gase price to execute the call
+        value : int, optional
+            Value sent with the smart contract
+        data : str, optional
+            Hash of smart contract method and parameters
+
+        Returns
+        -------
+        str
+            Hex of the estimated gas price
+        """
+        resp = await sc.estimate_gas(self.url, to_address, block_number, from_address, gas, gas_price, value, data, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def get_smart_contract_code(self, address : str, block : Optional[str] = "latest", callback : Optional[str] = None) -> str:
+        """
+        Get the code at a specific address.
+
+        Parameters
+        ----------
+        address: str
+            The address to get the code from
+        block: str, optional
+            The block to query for information, defaults to 'latest'
+        callback: str, optional
+            Optional callback, returns an error object as first parameter and the result as second
+
+        Returns
+        -------
+        str
+            The data at the give address
+        """
+        resp = await sc.get_code(self.url, address, block, callback, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def get_value_at_smart_contract_storage(self, address : str, storage_location : str, block_number : int) -> str:
+        """
+        Get the value from a sotrage postition at a given address.
+
+        Parameters
+        ----------
+        address : str
+            The address of the storage
+        storage_location : str
+            Hex representation of the storage location
+        block_number : int
+            The block number
+
+        Returns
+        -------
+        str
+            The value stored at the smart contract location
+        """
+        resp = await sc.get_storage_at(self.url, address, storage_location, block_number, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    async def batch(self, calls : Sequence[Tuple[str, Optional[BaseModel]]], batch_size : Optional[int] = 100, return_errors : Optional[bool] = False) -> List[Any]:
+        """
+        Make many calls to the node using JSON-RPC batch requests.
+
+        The calls are split into batches of `batch_size`, and each batch is sent as a single request.
+
+        Parameters
+        ----------
+        calls : list[tuple[str, BaseModel or None]]
+            The (method, parameters) pairs to call, e.g. ("hmyv2_getBalance", AddressParameters(address=address))
+        batch_size : int, optional
+            The maximum number of calls to send in a single request; defaults to 100
+        return_errors : bool, optional
+            If True, a call the node responds to with an error gets a HarmonyNodeError in its place
+            in the results instead of it being raised; defaults to False
+
+        Returns
+        -------
+        list[Any]
+            The result of each call, in the order of the calls
+        """
+        calls = list(calls)
+        results = []
+        for i in range(0, len(calls), batch_size):
+            for resp in await batch_call(self.url, calls[i:i + batch_size], self.session):
+                if resp.error is not None:
+                    err = HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+                    if not return_errors:
+                        raise err
+                    results.append(err)
+                else:
+                    results.append(resp.result)
+        return results
+    
+
+    
@@ -0,0 +1,38 @@
+from typing import AsyncIterator, Iterable, Optional, Tuple
+
+import aiohttp
+
+from .bulk import iter_batched_calls
+from ..balances import _balance_calls
+
+def iter_balances(api_url : str, addresses : Iterable[str], block_number : Optional[int] = None, batch_size : Optional[int] = 100, max_workers : Optional[int] = 4, max_retries : Optional[int] = 3, retry_backoff : Optional[float] = 0.5, session : Optional[aiohttp.ClientSession] = None) -> AsyncIterator[Tuple[str, int]]:
+    """
+    The asyncio counterpart of `harmony.balances.iter_balances`.
+
+    Parameters
+    ----------
+    api_url : str
+    addresses : Iterable[str]
+        The wallet addresses
+    block_number : int, optional
+        The block to get the balances at, defaults to the latest block
+    batch_size : int, optional
+        The number of calls per batch request; defaults to 100
+    max_workers : int, optional
+        The maximum number of batches in flight at once; defaults to 4
+    max_retries : int, optional
+        How many times to retry a failing call before giving up; defaults to 3
+    retry_backoff : float, optional
+        The delay before the first retry in seconds, doubled on each further retry; defaults to 0.5
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : AsyncIterator[tuple[str, int]]
+        The (address, balance) pairs
+
+    Raises
+    ------
+    HarmonyNodeError, aiohttp.ClientError: If a call still fails after `max_retries` retries
+    """
+    return iter_batched_calls(api_url, addresses, lambda batch: _balance_calls(batch, block_number), batch_size, max_workers, max_retries, retry_backoff, session)
@@ -0,0 +1,109 @@
+import asyncio
+import time
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import aiohttp
+
+from .blocks import get_blocks_from_range
+from ..block_range import AdaptiveChunkSize, _check_chunk
+from ..exceptions import HarmonyNodeError
+from ..models import Block
+
+async def _fetch_chunk(api_url : str, starting_block_number : int, ending_block_number : int, include_signer_addresses : bool, include_transactions : bool, include_staking_transactions : bool, delay : float, session : Optional[aiohttp.ClientSession]) -> Tuple[List[Block], float, int]:
+    if delay > 0:
+        await asyncio.sleep(delay)
+    start = time.monotonic()
+    resp = await get_blocks_from_range(api_url, starting_block_number, ending_block_number, include_signer_addresses, include_transactions, include_staking_transactions, session)
+    elapsed = time.monotonic() - start
+    if resp.error is not None:
+        raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+    blocks = resp.result or []
+    _check_chunk(blocks, starting_block_number, ending_block_number)
+    return blocks, elapsed, sum(b.size for b in blocks)
+
+async def iter_blocks_from_range(api_url : str, starting_block_number : int, ending_block_number : int, include_signer_addresses : Optional[bool] = False, include_transactions : Optional[bool] = False, include_staking_transactions : Optional[bool] = False, max_workers : Optional[int] = 4, max_retries : Optional[int] = 3, retry_backoff : Optional[float] = 0.5, chunk_size : Optional[AdaptiveChunkSize] = None, session : Optional[aiohttp.ClientSession] = None) -> AsyncIterator[Block]:
+    """
+    Get the blocks in the given range, split into chunks that are fetched concurrently.
+
+    Blocks are yielded in order as soon as every chunk before them has arrived.
+    A failed chunk is split in half and retried after a backoff, and so is a chunk
+    the node left blocks out of, so no block of the range is silently skipped.
+
+    Parameters
+    ----------
+    api_url : str
+    starting_block_number : int
+        The block number of the first block in the range
+    ending_block_number : int
+        The block number of the last block in the range
+    include_signer_addresses : bool, optional
+        Whether to include the wallet addresses of the block signers; defaults to False
+    include_transactions : bool, optional
+        Whether to include the full transaction data on the block; defaults to False
+    include_staking_transactions : bool, optional
+        Whether to include the full staking transaction data on the block; defaults to False
+    max_workers : int, optional
+        The maximum number of chunks in flight at once; defaults to 4
+    max_retries : int, optional
+        How many times to retry a failing chunk before giving up; defaults to 3
+    retry_backoff : float, optional
+        The delay before the first retry in seconds, doubled on each further retry; defaults to 0.5
+    chunk_size : AdaptiveChunkSize, optional
+        The chunk sizing policy, defaults to AdaptiveChunkSize()
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : AsyncIterator[Block]
+
+    Raises
+    ------
+    HarmonyNodeError, aiohttp.ClientError: If a chunk still fails after `max_retries` retries
+    BlockGapError: If the node still leaves out blocks of a chunk after `max_retries` retries,
+        e.g. because the range goes past the head of the chain
+    """
+    if chunk_size is None:
+        chunk_size = AdaptiveChunkSize()
+    opts = (include_signer_addresses, include_transactions, include_staking_transactions)
+    pending = {}
+    arrived : Dict[int, Tuple[int, List[Block]]] = {}
+    next_start = starting_block_number
+    next_yield = starting_block_number
+
+    def submit(start : int, end : int, attempt : int) -> None:
+        delay = retry_backoff * 2 ** (attempt - 1) if attempt else 0
+        task = asyncio.ensure_future(_fetch_chunk(api_url, start, end, *opts, delay, session))
+        pending[task] = (start, end, attempt)
+
+    try:
+        while next_yield <= ending_block_number:
+            while len(pending) < max_workers and next_start <= ending_block_number and len(arrived) < 2 * max_workers:
+                end = min(ending_block_number, next_start + chunk_size.size - 1)
+                submit(next_start, end, 0)
+                next_start = end + 1
+            finished, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                start, end, attempt = pending.pop(task)
+                try:
+                    blocks, seconds, n_bytes = task.result()
+                except (HarmonyNodeError, aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                    if attempt >= max_retries:
+                        raise
+                    chunk_size.shrink()
+                    if end > start:
+                        middle = (start + end) // 2
+                        submit(start, middle, attempt + 1)
+                        submit(middle + 1, end, attempt + 1)
+                    else:
+                        submit(start, end, attempt + 1)
+                    continue
+                chunk_size.observe(len(blocks), seconds, n_bytes)
+                arrived[start] = (end, blocks)
+            while next_yield in arrived:
+                end, blocks = arrived.pop(next_yield)
+                for block in blocks:
+                    yield block
+                next_yield = end + 1
+    finally:
+        for task in pending:
+            task.cancel()
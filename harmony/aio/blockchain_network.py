@@ -0,0 +1,190 @@
+from typing import Optional
+
+import aiohttp
+
+from ..models import (
+    BlockNumberResponse,
+    BLSKeyListResponse,
+    EphochNumberParameters,
+    GetCirculatingSupplyResponse,
+    GetEpochResponse,
+    GetLastCrossLinksResponse,
+    GetLeaderResponse,
+    GetShardingStructureResponse,
+    GasPriceResponse,
+    GetTotalSupplyResponse,
+    GetValidatorsResponse
+)
+
+from .endpoints.blockchain import (
+    blockNumber,
+    getCirculatingSupply,
+    getEpoch,
+    getLastCrossLinks,
+    getLeader,
+    gasPrice, 
+    getShardingStructure,
+    getTotalSupply,
+    getValidators,
+    getValidatorKeys
+)
+
+async def current_block_number(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> BlockNumberResponse:
+    """
+    Get the current blocknumber
+
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : int 
+        The current block number
+    """
+    return await blockNumber(api_url, session)
+
+async def get_circulating_supply(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetCirculatingSupplyResponse:
+    """
+    Get the current circulating supply of tokens
+    
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : int
+        The circulating supply of tokens in ONE
+    """
+    return await getCirculatingSupply(api_url, session)
+
+async def get_epoch(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetEpochResponse:
+    """
+    Get the current node shard epoch
+
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : int
+        The current node shard epoch in decimal
+    """
+    return await getEpoch(api_url, session)
+
+async def get_last_cross_links(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetLastCrossLinksResponse:
+    """
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : list[CrossLink]
+    """
+    return await getLastCrossLinks(api_url, session)
+
+async def get_current_leader(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetLeaderResponse:
+    """
+    Get the wallet address of the current leader
+
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : str
+        The wallet address of the current leader
+    """
+    return await getLeader(api_url, session)
+
+async def get_current_gas_price(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GasPriceResponse:
+    """
+    Get the current average gas price of transactions
+
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : int
+        The current average gas price
+    """
+    return await gasPrice(api_url, session)
+
+async def get_sharding_structure(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetShardingStructureResponse:
+    """
+    Get the the current shard of the node and the API and WebSocket endpoints for each shard.
+
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : list[ShardingStructure]
+    """
+    return await getShardingStructure(api_url, session)
+
+async def get_total_supply(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetTotalSupplyResponse:
+    """
+    Get the total number of mined tokens
+
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : int
+        The total number of mined tokens
+    """
+    return await getTotalSupply(api_url, session)
+
+async def get_validators_by_epoch(api_url : str, epoch_number : int, session : Optional[aiohttp.ClientSession] = None) -> GetValidatorsResponse:
+    """
+    Get the validators for a given epoch
+
+    Parameters
+    ----------
+    api_url : str
+    epoch_number : int
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : ValidatorIDs
+        The validator addresses and balances on a given shard
+    """
+    params = EphochNumberParameters(epoch_number=epoch_number)
+    return await getValidators(api_url, params, session)
+
+async def get_validator_keys_by_epoch(api_url : str, epoch_number : int, session : Optional[aiohttp.ClientSession] = None) -> GetValidatorsResponse:
+    """
+    Get the public keys of the validator for a given epoch
+
+    Parameters
+    ----------
+    api_url : str
+    epoch_number : int
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : list[str]
+        List of public keys
+    """
+    params = EphochNumberParameters(epoch_number=epoch_number)
+    return await getValidatorKeys(api_url, params, session)
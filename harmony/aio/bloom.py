@@ -0,0 +1,45 @@
+from typing import AsyncIterator, List, Optional
+
+import aiohttp
+
+from .block_range import iter_blocks_from_range
+from ..block_range import AdaptiveChunkSize
+from ..bloom import LogFilter
+from ..models import Block
+
+async def iter_candidate_blocks(api_url : str, starting_block_number : int, ending_block_number : int, log_filter : LogFilter, batch_size : Optional[int] = 1000, max_workers : Optional[int] = 4, max_retries : Optional[int] = 3, chunk_size : Optional[AdaptiveChunkSize] = None, session : Optional[aiohttp.ClientSession] = None) -> AsyncIterator[Block]:
+    """
+    The asyncio counterpart of `harmony.bloom.iter_candidate_blocks`.
+
+    Parameters
+    ----------
+    api_url : str
+    starting_block_number : int
+        The block number of the first block in the range
+    ending_block_number : int
+        The block number of the last block in the range
+    log_filter : LogFilter
+    batch_size : int, optional
+        How many blocks to test at once; defaults to 1000
+    max_workers : int, optional
+        The maximum number of chunks fetched at once; defaults to 4
+    max_retries : int, optional
+        How many times to retry a failing chunk; defaults to 3
+    chunk_size : AdaptiveChunkSize, optional
+        The chunk sizing policy, defaults to AdaptiveChunkSize()
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    AsyncIterator[Block]
+        The candidate blocks, in order
+    """
+    batch : List[Block] = []
+    async for block in iter_blocks_from_range(api_url, starting_block_number, ending_block_number, max_workers=max_workers, max_retries=max_retries, chunk_size=chunk_size, session=session):
+        batch.append(block)
+        if len(batch) >= batch_size:
+            for candidate in log_filter.filter_blocks(batch):
+                yield candidate
+            batch = []
+    for candidate in log_filter.filter_blocks(batch):
+        yield candidate
@@ -0,0 +1,123 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+
+from pydantic import BaseModel
+import aiohttp
+
+from .endpoints.batch import batch_call
+from ..bulk import Calls, _Chunk, _node_error
+from ..exceptions import HarmonyNodeError
+
+T = TypeVar("T")
+
+async def _fetch_batch(api_url : str, calls : List[Tuple[str, Optional[BaseModel]]], session : Optional[aiohttp.ClientSession]) -> List[Any]:
+    return [_node_error(resp.error) if resp.error is not None else resp.result for resp in await batch_call(api_url, calls, session)]
+
+async def _take(items : Any, n : int) -> List[Any]:
+    if not hasattr(items, "__anext__"):
+        return list(itertools.islice(items, n))
+    batch = []
+    while len(batch) < n:
+        try:
+            batch.append(await items.__anext__())
+        except StopAsyncIteration:
+            break
+    return batch
+
+async def iter_batched_calls(api_url : str, items : Union[Iterable[T], AsyncIterable[T]], calls : Calls, batch_size : Optional[int] = 100, max_workers : Optional[int] = 4, max_retries : Optional[int] = 3, retry_backoff : Optional[float] = 0.5, session : Optional[aiohttp.ClientSession] = None) -> AsyncIterator[Tuple[T, Any]]:
+    """
+    The asyncio counterpart of `harmony.bulk.iter_batched_calls`.
+
+    Parameters
+    ----------
+    api_url : str
+    items : Iterable or AsyncIterable
+    calls : Callable[[list], list[tuple[str, BaseModel]]]
+        The (method, parameters) pairs of the calls for a batch of items, one per item
+    batch_size : int, optional
+        The number of calls per batch request; defaults to 100
+    max_workers : int, optional
+        The maximum number of batches in flight at once; defaults to 4
+    max_retries : int, optional
+        How many times to retry a failing call before giving up; defaults to 3
+    retry_backoff : float, optional
+        The delay before the first retry in seconds, doubled on each further retry; defaults to 0.5
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : AsyncIterator[tuple]
+        The (item, result) pairs
+
+    Raises
+    ------
+    HarmonyNodeError, aiohttp.ClientError: If a call still fails after `max_retries` retries
+    """
+    items = items.__aiter__() if hasattr(items, "__aiter__") else iter(items)
+    pending = {}
+    chunks : Dict[int, _Chunk] = {}
+    next_chunk = 0
+    next_yield = 0
+    exhausted = False
+    delayed : List[Tuple[float, int, List[int], int]] = []
+
+    def submit(index : int, positions : List[int], attempt : int) -> None:
+        batch = [chunks[index].items[i] for i in positions]
+        task = asyncio.ensure_future(_fetch_batch(api_url, calls(batch), session))
+        pending[task] = (index, positions, attempt)
+
+    def retry(index : int, positions : List[int], attempt : int) -> None:
+        heapq.heappush(delayed, (time.monotonic() + retry_backoff * 2 ** (attempt - 1), index, positions, attempt))
+
+    try:
+        while True:
+            while delayed and delayed[0][0] <= time.monotonic() and len(pending) < max_workers:
+                submit(*heapq.heappop(delayed)[1:])
+            while not exhausted and len(pending) < max_workers and len(chunks) < 2 * max_workers:
+                batch = await _take(items, batch_size)
+                if not batch:
+                    exhausted = True
+                    break
+                chunks[next_chunk] = _Chunk(batch)
+                submit(next_chunk, list(range(len(batch))), 0)
+                next_chunk += 1
+            if not pending and not delayed:
+                break
+            # With every slot taken, a retry that is due waits for a batch to finish
+            timeout = max(delayed[0][0] - time.monotonic(), 0) if delayed and len(pending) < max_workers else None
+            if not pending:
+                await asyncio.sleep(timeout)
+                continue
+            finished, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                index, positions, attempt = pending.pop(task)
+                chunk = chunks[index]
+                try:
+                    results = task.result()
+                except (HarmonyNodeError, aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                    if attempt >= max_retries:
+                        raise
+                    retry(index, positions, attempt + 1)
+                    continue
+                failed = []
+                for position, result in zip(positions, results):
+                    if isinstance(result, HarmonyNodeError):
+                        if attempt >= max_retries:
+                            raise result
+                        failed.append(position)
+                    else:
+                        chunk.results[position] = result
+                        chunk.missing -= 1
+                if failed:
+                    retry(index, failed, attempt + 1)
+            while next_yield in chunks and chunks[next_yield].missing == 0:
+                chunk = chunks.pop(next_yield)
+                for pair in zip(chunk.items, chunk.results):
+                    yield pair
+                next_yield += 1
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,138 @@
+import asyncio
+import weakref
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+import aiohttp
+
+from ..utils.codec import loads
+from ..utils.communication import _breaker, _circuit_open, _retries, _retry_policy, _status_error
+from ..utils.transport import TransportConfig, default_transport
+
+_default_sessions : "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[TransportConfig, aiohttp.ClientSession, AsyncIterator[None]]]" = weakref.WeakKeyDictionary()
+
+async def _post(session : aiohttp.ClientSession, url : str, headers : Dict[str, str], data : Union[str, Dict[str, Any]], timeout : aiohttp.ClientTimeout) -> Tuple[int, Optional[str], bytes]:
+    async with session.post(url, headers=headers, data=data, timeout=timeout) as resp:
+        return resp.status, resp.headers.get("Retry-After"), await resp.read()
+
+async def post_request(url : str, data : Union[str, Dict[str, Any]], session : Optional[aiohttp.ClientSession] = None) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Post a request to the url with the given data,
+    optionally using a provided session.
+
+    Unlike the blocking `post_request` this returns the decoded json body,
+    since the response of an aiohttp request can't be read after the request is released.
+    Timeouts, retries and circuit breaking work the same way.
+
+    Parameters
+    ----------
+    url: str
+        The url to post to.
+    data: dict[str, Any], str
+        The json data to include in the post request.
+    session: aiohttp.ClientSession, optional
+        The persistent session to use, if None is provided
+        the `default_session` of the running event loop is used.
+
+    Raises
+    ------
+    CircuitOpenError: If the node failed too often recently to be called
+    HarmonyNodeError: If the node still responds with an HTTP error status after retrying
+    aiohttp.ClientError, asyncio.TimeoutError: If the node still can't be reached after retrying
+    """
+    if session is None:
+        session = await default_session()
+    headers = {
+            'Content-Type': 'application/json'
+    }
+    policy = _retry_policy(session)
+    breaker = _breaker(url, session)
+    retries = _retries(policy, data, session)
+    timeout = aiohttp.ClientTimeout(sock_connect=policy.connect_timeout, sock_read=policy.read_timeout)
+    if breaker is not None and not breaker.allow():
+        raise _circuit_open(url)
+    attempt = 0
+    while True:
+        retry_after = None
+        try:
+            status, retry_after, body = await _post(session, url, headers, data, timeout)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt >= retries:
+                if breaker is not None:
+                    breaker.failure()
+                raise
+        else:
+            failed = policy.retry_status(status)
+            if not failed:
+                payload = loads(body)
+                if attempt >= retries or not policy.retry_error(payload):
+                    if breaker is not None:
+                        breaker.success()
+                    return payload
+            elif attempt >= retries:
+                if breaker is not None:
+                    breaker.failure()
+                raise _status_error(url, status)
+        await asyncio.sleep(policy.delay(attempt, retry_after))
+        attempt += 1
+
+async def _close_on_shutdown(session : aiohttp.ClientSession) -> AsyncIterator[None]:
+    try:
+        yield
+    finally:
+        await session.close()
+
+async def default_session() -> aiohttp.ClientSession:
+    """
+    The session shared by every call made without one on the running event loop, such as
+    the module level functions called without a `session`.
+
+    It is created on first use with the config set by `harmony.utils.transport.set_default_transport`,
+    and replaced once another one is set. It is closed when the loop shuts down its async generators,
+    as `asyncio.run` does before returning; a loop closed without doing so leaves it open.
+
+    Returns
+    -------
+    aiohttp.ClientSession
+    """
+    loop = asyncio.get_running_loop()
+    config = default_transport()
+    entry = _default_sessions.get(loop)
+    if entry is not None and entry[0] is config and not entry[1].closed:
+        return entry[1]
+    session = create_session(transport=config)
+    # The loop closes the async generators it has seen when it shuts down, and with them the session
+    closer = _close_on_shutdown(session)
+    await closer.__anext__()
+    _default_sessions[loop] = (config, session, closer)
+    if entry is not None:
+        await entry[2].aclose()
+    return session
+
+def create_session(pool_size : Optional[int] = 100, pool_size_per_host : Optional[int] = 0, keepalive_timeout : Optional[float] = 30.0, transport : Optional[TransportConfig] = None) -> aiohttp.ClientSession:
+    """
+    Create a session backed by a pool of keep-alive connections.
+
+    Must be called from within a running event loop.
+
+    Parameters
+    ----------
+    pool_size : int, optional
+        The maximum number of open connections, defaults to 100
+    pool_size_per_host : int, optional
+        The maximum number of open connections to a single host, 0 for no limit, defaults to 0
+    keepalive_timeout : float, optional
+        How long to keep an idle connection open in seconds, defaults to 30
+    transport : TransportConfig, optional
+        Takes the place of the other parameters if passed. aiohttp always sets TCP_NODELAY
+        and only speaks HTTP/1.1, so `tcp_nodelay` and `http2` are ignored.
+
+    Returns
+    -------
+    aiohttp.ClientSession
+    """
+    if transport is not None:
+        if not transport.keepalive:
+            return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=transport.max_connections, limit_per_host=transport.max_connections_per_host, force_close=True))
+        pool_size, pool_size_per_host, keepalive_timeout = transport.max_connections, transport.max_connections_per_host, transport.keepalive_timeout
+    connector = aiohttp.TCPConnector(limit=pool_size, limit_per_host=pool_size_per_host, keepalive_timeout=keepalive_timeout)
+    return aiohttp.ClientSession(connector=connector)
@@ -0,0 +1,70 @@
+from typing import Optional
+
+import aiohttp
+
+from ..models import (
+    HashParameters,
+    GetCXReceiptByHashResponse,
+    GetPendingCXReceiptsResponse,
+    ResendCXResponse
+)
+
+from .endpoints.transaction import (
+    getCXReceiptByHash,
+    getPendingCXReceipts,
+    resendCX
+)
+
+async def get_cx_receipt_by_hash(api_url : str, cross_shard_receipt_hash : str, session : Optional[aiohttp.ClientSession] = None) -> GetCXReceiptByHashResponse:
+    """
+    Get the cx receipt by hash.
+
+    Note: Query the CX receipt hash on the receiving shard endpoint
+
+    Parameters
+    ----------
+    api_url : str
+    cross_shard_receipt_hash : str
+        The hash of the cross shard receipt
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : CXReceipt
+    """
+    params = HashParameters(hash=cross_shard_receipt_hash)
+    return await getCXReceiptByHash(api_url, params, session)
+
+async def get_pending_cx_receipts(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetPendingCXReceiptsResponse:
+    """
+    Get the currently pending cx receipts.
+
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : list[PendingCXReceipt]
+    """
+    return await getPendingCXReceipts(api_url, session)
+
+async def resend_cx_receipt(api_url : str, cross_shard_receipt_hash : str, session : Optional[aiohttp.ClientSession] = None) -> ResendCXResponse:
+    """
+    Use this API call to resend the cross shard receipt to the receiving shard to re-process if the transaction did not pay out 
+
+    Parameters
+    ----------
+    api_url : str
+    cross_shard_receipt_hash : str
+        The hash of the cross shard receipt
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : bool
+        True if the resend was successful
+    """
+    params = HashParameters(hash=cross_shard_receipt_hash)
+    return await resendCX(api_url, params, session)
\ No newline at end of file
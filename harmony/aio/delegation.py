@@ -0,0 +1,70 @@
+from typing import Optional
+
+import aiohttp
+
+from ..models import (
+    AddressParameters,
+    AddressBlockNumberParameters,
+    DelegationListResponse
+)
+
+from .endpoints.staking import (
+    getDelegationsByDelegator,
+    getDelegationsByDelegatorByBlockNumber,
+    getDelegationsByValidator
+)
+
+async def get_delegations_by_delegator(api_url : str, address : str, session : Optional[aiohttp.ClientSession] = None) -> DelegationListResponse:
+    """
+    Get delegations by delegator address
+
+    Parameters
+    -----------
+    api_url : str
+    address : str
+        The delegator address
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : List[Delegation]
+    """
+    params = AddressParameters(address=address)
+    return await getDelegationsByDelegator(api_url, params, session)
+
+async def get_delegations_by_delegator_by_block_number(api_url : str, address : str, block_number : int, session : Optional[aiohttp.ClientSession] = None) -> DelegationListResponse:
+    """
+    Get delegations by delegator address and block number
+
+    Parameters
+    -----------
+    api_url : str
+    address : str
+        The delegator address
+    block_number : int
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : List[Delegation]
+    """
+    params = AddressBlockNumberParameters(address=address, block_number=block_number)
+    return await getDelegationsByDelegatorByBlockNumber(api_url, params, session)
+
+async def get_delegations_by_validator(api_url : str, address : str, session : Optional[aiohttp.ClientSession] = None) -> DelegationListResponse:
+    """
+    Get delegations by validator address
+
+    Parameters
+    -----------
+    api_url : str
+    address : str
+        The validator address
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : List[Delegation]
+    """
+    params = AddressParameters(address=address)
+    return await getDelegationsByValidator(api_url, params, session)
\ No newline at end of file
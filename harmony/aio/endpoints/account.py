@@ -0,0 +1,84 @@
+from typing import Optional, Union
+
+import aiohttp
+
+from ...utils.communication import build_response, format_api_data
+from ..communication import post_request
+
+from ...models import (
+    AddressParameters,
+    AddressBlockNumberParameters,
+    BalanceResponse,
+    TransactionsCountParameters,
+    TransactionCountResponse,
+    TransactionsHashListResponse,
+    TransactionsHistoryParameters,
+    TransactionListResponse,
+    StakingTransactionListResponse
+
+)
+
+async def getBalance(api_url : str, params : AddressParameters, session : Optional[aiohttp.ClientSession] = None) -> BalanceResponse:
+    """
+    params: AddressParameters
+    result: BalanceResponse
+    method: hmyv2_getBalance
+    """
+    data = format_api_data("hmyv2_getBalance", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(BalanceResponse, resp, session)
+
+async def getBalanceByBlockNumber(api_url : str, params : AddressBlockNumberParameters, session : Optional[aiohttp.ClientSession] = None) -> BalanceResponse:
+    """
+    params: AddressBlockNumberParameters
+    result: BalanceResponse
+    method: hmyv2_getBalanceByBlockNumber
+    """
+    data = format_api_data("hmyv2_getBalanceByBlockNumber", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(BalanceResponse, resp, session)
+
+async def getStakingTransactionsCount(api_url : str, params : TransactionsCountParameters, session : Optional[aiohttp.ClientSession] = None) -> TransactionCountResponse:
+    """
+    params: TransactionsCountParameters
+    result: TransactionCountResponse
+    method: hmyv2_getStakingTransactionsCount
+    """
+    data = format_api_data("hmyv2_getStakingTransactionsCount", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(TransactionCountResponse, resp, session)
+
+async def getStakingTransactionsHistory(api_url : str, params : TransactionsHistoryParameters, session : Optional[aiohttp.ClientSession] = None) -> Union[TransactionsHashListResponse, StakingTransactionListResponse]:
+    """
+    params: TransactionsHistoryParameters
+    result: TransactionsHashListResponse or StakingTransactionListResponse
+    method: hmyv2_getStakingTransactionsHistory
+    """
+    data = format_api_data("hmyv2_getStakingTransactionsHistory", params)
+    resp = await post_request(api_url, data, session)
+    
+    if params.obj.fullTx:
+        return build_response(StakingTransactionListResponse, resp, session)
+    return build_response(TransactionsHashListResponse, resp, session)
+
+async def getTransactionsCount(api_url : str, params : TransactionsCountParameters, session : Optional[aiohttp.ClientSession] = None) -> TransactionCountResponse:
+    """
+    params: TransactionsCountParameters
+    result: TransactionCountResponse
+    method: hmyv2_getTransactionsCount
+    """
+    data = format_api_data("hmyv2_getTransactionsCount", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(TransactionCountResponse, resp, session)
+
+async def getTransactionsHistory(api_url : str, params : TransactionsHistoryParameters, session : Optional[aiohttp.ClientSession] = None) -> Union[TransactionsHashListResponse, TransactionListResponse]:
+    """
+    params: TransactionsHistoryParameters
+    result: TransactionsHashListResponse or TransactionListResponse
+    method: hmyv2_getTransactionsHistory
+    """
+    data = format_api_data("hmyv2_getTransactionsHistory", params)
+    resp = await post_request(api_url, data, session)
+    if params.obj.fullTx:
+        return build_response(TransactionListResponse, resp, session)
+    return build_response(TransactionsHashListResponse, resp, session)
\ No newline at end of file
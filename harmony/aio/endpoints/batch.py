@@ -0,0 +1,23 @@
+from typing import List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+import aiohttp
+
+from ...utils.communication import build_response, format_batch_api_data, match_batch_response
+from ...endpoints.batch import response_model
+from ..communication import post_request
+
+from ...models import BaseResponse
+
+async def batch_call(api_url : str, calls : Sequence[Tuple[str, Optional[BaseModel]]], session : Optional[aiohttp.ClientSession] = None) -> List[BaseResponse]:
+    """
+    params: list of (method, parameters) pairs
+    result: one response per call, in the order of the calls
+    method: JSON-RPC 2.0 batch
+    """
+    if not calls:
+        return []
+    data = format_batch_api_data(calls)
+    resp = await post_request(api_url, data, session)
+    payloads = match_batch_response(resp, len(calls))
+    return [build_response(response_model(method, params), payload, session) for (method, params), payload in zip(calls, payloads)]
@@ -0,0 +1,304 @@
+from typing import Optional
+
+import aiohttp
+
+from ...utils.communication import build_response, format_api_data
+from ..communication import post_request
+
+from ...models import (
+    BlockResponse,
+    BlockListResponse,
+    BlockNumberResponse,
+    GetCirculatingSupplyResponse,
+    GetEpochResponse,
+    GetLastCrossLinksResponse,
+    GetLeaderResponse,
+    GasPriceResponse,
+    GetShardingStructureResponse,
+    GetTotalSupplyResponse,
+    EphochNumberParameters,
+    GetValidatorsResponse,
+    BLSKeyListResponse,
+    GetCurrentBadBlocksResponse,
+    GetNodeMetadataResponse,
+    ProtocolVersionResponse,
+    PeerCountResponse,
+    BlockListParams,
+    GetBlockByNumberParameters,
+    GetBlockByHashParameters,
+    AddressListResponse,
+    BlockNumberParameters,
+    BLSKeyListResponse,
+    BlockNumberParameters,
+    TransactionCountResponse,
+    BlockNumberParameters,
+    HeaderResponse,
+    GetLatestChainHeadersResponse,
+    HashParameters
+)
+
+#Network
+
+async def blockNumber(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> BlockNumberResponse:
+    """
+    params: None
+    result: BlockNumberResponse
+    method: hmyv2_blockNumber
+    """
+    data = format_api_data("hmyv2_blockNumber", None)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(BlockNumberResponse, resp, session)
+
+async def getCirculatingSupply(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetCirculatingSupplyResponse:
+    """
+    params: None
+    result: GetCirculatingSupplyResponse
+    method: hmyv2_getCirculatingSupply
+    """
+    data = format_api_data("hmyv2_getCirculatingSupply", None)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(GetCirculatingSupplyResponse, resp, session)
+
+async def getEpoch(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetEpochResponse:
+    """
+    params: None
+    result: GetEpochResponse
+    method: hmyv2_getEpoch
+    """
+    data = format_api_data("hmyv2_getEpoch", None)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(GetEpochResponse, resp, session)
+
+async def getLastCrossLinks(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetLastCrossLinksResponse:
+    """
+    params: None
+    result: GetLastCrossLinksResponse
+    method: hmyv2_getLastCrossLinks
+    """
+    data = format_api_data("hmyv2_getLastCrossLinks", None)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(GetLastCrossLinksResponse, resp, session)
+
+async def getLeader(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetLeaderResponse:
+    """
+    params: None
+    result: GetLeaderResponse
+    method: hmyv2_getLeader
+    """
+    data = format_api_data("hmyv2_getLeader", None)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(GetLeaderResponse, resp, session)
+
+async def gasPrice(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GasPriceResponse:
+    """
+    params: None
+    result: GasPriceResponse
+    method: hmyv2_gasPrice
+    """
+    data = format_api_data("hmyv2_gasPrice", None)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(GasPriceResponse, resp, session)
+
+async def getShardingStructure(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetShardingStructureResponse:
+    """
+    params: GetShardingStructureParameters
+    result: GetShardingStructureResponse
+    method: hmyv2_getShardingStructure
+    """
+    data = format_api_data("hmyv2_getShardingStructure", None)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(GetShardingStructureResponse, resp, session)
+
+async def getTotalSupply(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetTotalSupplyResponse:
+    """
+    params: None
+    result: GetTotalSupplyResponse
+    method: hmyv2_getTotalSupply
+    """
+    data = format_api_data("hmyv2_getTotalSupply", None)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(GetTotalSupplyResponse, resp, session)
+
+async def getValidators(api_url : str, params : EphochNumberParameters, session : Optional[aiohttp.ClientSession] = None) -> GetValidatorsResponse:
+    """
+    params: EphochNumberParameters
+    result: GetValidatorsResponse
+    method: hmyv2_getValidators
+    """
+    data = format_api_data("hmyv2_getValidators", params)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(GetValidatorsResponse, resp, session)
+
+async def getValidatorKeys(api_url : str, params : EphochNumberParameters, session : Optional[aiohttp.ClientSession] = None) -> BLSKeyListResponse:
+    """
+    params: EphochNumberParameters
+    result: BLSKeyListResponse
+    method: hmyv2_getValidatorKeys
+    """
+    data = format_api_data("hmyv2_getValidatorKeys", params)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(BLSKeyListResponse, resp, session)
+
+#Node
+
+async def getCurrentBadBlocks(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetCurrentBadBlocksResponse:
+    """
+    params: None
+    result: GetCurrentBadBlocksResponse
+    method: hmyv2_getCurrentBadBlocks
+    
+    NOTE: known issues with RPC not returning correctly
+    """
+    data = format_api_data("hmyv2_getCurrentBadBlocks", None)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(GetCurrentBadBlocksResponse, resp, session)
+
+async def getNodeMetadata(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetNodeMetadataResponse:
+    """
+    params: None
+    result: GetNodeMetadataResponse
+    method: hmyv2_getNodeMetadata
+    """
+    data = format_api_data("hmyv2_getNodeMetadata", None)
+    resp = await post_request(api_url, data, session)
+    return build_response(GetNodeMetadataResponse, resp, session)
+
+async def protocolVersion(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> ProtocolVersionResponse:
+    """
+    params: None
+    result: ProtocolVersionResponse
+    method: hmyv2_protocolVersion
+    """
+    data = format_api_data("hmyv2_protocolVersion", None)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(ProtocolVersionResponse, resp, session)
+
+async def peerCount(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> PeerCountResponse:
+    """
+    params: None
+    result: PeerCountResponse
+    method: net_peerCount
+    """
+    data = format_api_data("net_peerCount", None)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(PeerCountResponse, resp, session)
+
+#Blocks
+
+async def getBlocks(api_url : str, params : BlockListParams, session : Optional[aiohttp.ClientSession] = None) -> BlockListResponse:
+    """
+    params: BlockListParams
+    result: BlockListResponse
+    method: hmyv2_getBlocks
+    """
+    data = format_api_data("hmyv2_getBlocks", params)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(BlockListResponse, resp, session)
+
+async def getBlockByNumber(api_url : str, params : GetBlockByNumberParameters, session : Optional[aiohttp.ClientSession] = None) -> BlockResponse:
+    """
+    params: GetBlockByNumberParameters
+    result: BlockResponse
+    method: hmyv2_getBlockByNumber
+    """
+    data = format_api_data("hmyv2_getBlockByNumber", params)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(BlockResponse, resp, session)
+
+async def getBlockByHash(api_url : str, params : GetBlockByHashParameters, session : Optional[aiohttp.ClientSession] = None) -> BlockResponse:
+    """
+    params: GetBlockByHashParameters
+    result: BlockResponse
+    method: hmyv2_getBlockByHash
+    """
+    data = format_api_data("hmyv2_getBlockByHash", params)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(BlockResponse, resp, session)
+
+async def getBlockSigners(api_url : str, params : BlockListParams, session : Optional[aiohttp.ClientSession] = None) -> AddressListResponse:
+    """
+    params: BlockListParams
+    result: AddressListResponse
+    method: hmyv2_getBlockSigners
+    """
+    data = format_api_data("hmyv2_getBlockSigners", params)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(AddressListResponse, resp, session)
+
+async def getBlockSignersKeys(api_url : str, params : BlockNumberParameters, session : Optional[aiohttp.ClientSession] = None) -> BLSKeyListResponse:
+    """
+    params: BlockNumberParameters
+    result: BLSKeyListResponse
+    method: hmyv2_getBlockSignersKeys
+    """
+    data = format_api_data("hmyv2_getBlockSignersKeys", params)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(BLSKeyListResponse, resp, session)
+
+async def getBlockTransactionCountByNumber(api_url : str, params : BlockNumberParameters, session : Optional[aiohttp.ClientSession] = None) -> TransactionCountResponse:
+    """
+    params: BlockNumberParameters
+    result: TransactionCountResponse
+    method: hmyv2_getBlockTransactionCountByNumber
+    """
+    data = format_api_data("hmyv2_getBlockTransactionCountByNumber", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(TransactionCountResponse, resp, session)
+
+async def getBlockTransactionCountByHash(api_url : str, params : HashParameters, session : Optional[aiohttp.ClientSession] = None) -> TransactionCountResponse:
+    """
+    params: HashParameters
+    result: TransactionCountResponse
+    method: hmyv2_getBlockTransactionCountByHash
+    """
+    data = format_api_data("hmyv2_getBlockTransactionCountByHash", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(TransactionCountResponse, resp, session)
+
+async def getHeaderByNumber(api_url : str, params : BlockNumberParameters, session : Optional[aiohttp.ClientSession] = None) -> HeaderResponse:
+    """
+    params: BlockNumberParameters
+    result: HeaderResponse
+    method: hmyv2_getHeaderByNumber
+    """
+    data = format_api_data("hmyv2_getHeaderByNumber", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(HeaderResponse, resp, session)
+
+async def getLatestChainHeaders(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetLatestChainHeadersResponse:
+    """
+    params: None
+    result: GetLatestChainHeadersResponse
+    method: hmyv2_getLatestChainHeaders
+    """
+    data = format_api_data("hmyv2_getLatestChainHeaders", None)
+    resp = await post_request(api_url, data, session)
+    return build_response(GetLatestChainHeadersResponse, resp, session)
+
+async def latestHeader(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> HeaderResponse:
+    """
+    params: None
+    result: HeaderResponse
+    method: hmyv2_latestHeader
+    """
+    data = format_api_data("hmyv2_latestHeader", None)
+    resp = await post_request(api_url, data, session)
+    return build_response(HeaderResponse, resp, session)
@@ -0,0 +1,57 @@
+from typing import Optional
+
+import aiohttp
+
+from ...utils.communication import build_response, format_api_data
+from ..communication import post_request
+
+from ...models import (
+    CallParameters,
+    CallResponse,
+    EstimateGasResponse,
+    GetCodeParameters,
+    GetCodeResponse,
+    GetStorageAtParameters,
+    GetStorageAtResponse
+)
+
+async def call_(api_url : str, params : CallParameters, session : Optional[aiohttp.ClientSession] = None) -> CallResponse:
+    """
+    params: CallParameters
+    result: CallResponse
+    method: hmyv2_call
+    """
+    data = format_api_data("hmyv2_call", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(CallResponse, resp, session)
+
+async def estimateGas(api_url : str, params : CallParameters, session : Optional[aiohttp.ClientSession] = None) -> EstimateGasResponse:
+    """
+    params: CallParameters
+    result: EstimateGasResponse
+    method: hmyv2_estimateGas
+    """
+    data = format_api_data("hmyv2_estimateGas", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(EstimateGasResponse, resp, session)
+
+async def getCode(api_url : str, params : GetCodeParameters, session : Optional[aiohttp.ClientSession] = None) -> GetCodeResponse:
+    """
+    params: GetCodeParameters
+    result: GetCodeResponse
+    method: hmyv2_getCode
+    """
+    data = format_api_data("hmyv2_getCode", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(CallResponse, resp, session)
+
+
+async def getStorageAt(api_url : str, params : GetStorageAtParameters, session : Optional[aiohttp.ClientSession] = None) -> GetStorageAtResponse:
+    """
+    params: GetStorageAtParameters
+    result: GetStorageAtResponse
+    method: hmyv2_getStorageAt
+    """
+    data = format_api_data("hmyv2_getStorageAt", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(GetStorageAtResponse, resp, session)
@@ -0,0 +1,148 @@
+from typing import Optional
+
+import aiohttp
+
+from ...utils.communication import build_response, format_api_data
+from ..communication import post_request
+
+from ...models import (
+    AddressBlockNumberParameters,
+    AddressListResponse,
+    AddressParameters,
+    DelegationListResponse,
+    GetAllValidatorInformationParameters,
+    GetAllValidatorInformationByBlockNumberParameters,
+    GetCurrentUtilityMetricsResponse,
+    GetMedianRawStakeSnapshotResponse,
+    GetStakingNetworkInfoResponse,
+    GetSuperCommitteesResponse,
+    ValidatorInformationResponse,
+    ValidatorInformationListResponse
+)
+
+#Delegation
+
+async def getDelegationsByDelegator(api_url : str, params : AddressParameters, session : Optional[aiohttp.ClientSession] = None) -> DelegationListResponse:
+    """
+    params: AddressParameters
+    result: DelegationListResponse
+    method: hmyv2_getDelegationsByDelegator
+    """
+    data = format_api_data("hmyv2_getDelegationsByDelegator", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(DelegationListResponse, resp, session)
+
+async def getDelegationsByDelegatorByBlockNumber(api_url : str, params : AddressBlockNumberParameters, session : Optional[aiohttp.ClientSession] = None) -> DelegationListResponse:
+    """
+    params: AddressBlockNumberParameters
+    result: DelegationListResponse
+    method: hmyv2_getDelegationsByDelegatorByBlockNumber
+    """
+    data = format_api_data("hmyv2_getDelegationsByDelegatorByBlockNumber", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(DelegationListResponse, resp, session)
+
+async def getDelegationsByValidator(api_url : str, params : AddressParameters, session : Optional[aiohttp.ClientSession] = None) -> DelegationListResponse:
+    """
+    params: AddressParameters
+    result: DelegationListResponse
+    method: hmyv2_getDelegationsByValidator
+    """
+    data = format_api_data("hmyv2_getDelegationsByValidator", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(DelegationListResponse, resp, session)
+
+#Validator
+
+async def getAllValidatorAddresses(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> AddressListResponse:
+    """
+    params: None
+    result: AddressListResponse
+    method: hmyv2_getAllValidatorAddresses
+    """
+    data = format_api_data("hmyv2_getAllValidatorAddresses", None)
+    resp = await post_request(api_url, data, session)
+    return build_response(AddressListResponse, resp, session)
+
+async def getAllValidatorInformation(api_url : str, params : GetAllValidatorInformationParameters, session : Optional[aiohttp.ClientSession] = None) -> ValidatorInformationListResponse:
+    """
+    params: GetAllValidatorInformationParameters
+    result: ValidatorInformationListResponse
+    method: hmyv2_getAllValidatorInformation
+    """
+    data = format_api_data("hmyv2_getAllValidatorInformation", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(ValidatorInformationListResponse, resp, session)
+
+async def getAllValidatorInformationByBlockNumber(api_url : str, params : GetAllValidatorInformationByBlockNumberParameters, session : Optional[aiohttp.ClientSession] = None) -> ValidatorInformationListResponse:
+    """
+    params: GetAllValidatorInformationByBlockNumberParameters
+    result: ValidatorInformationListResponse
+    method: hmyv2_getAllValidatorInformationByBlockNumber
+    """
+    data = format_api_data("hmyv2_getAllValidatorInformationByBlockNumber", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(ValidatorInformationListResponse, resp, session)
+
+async def getElectedValidatorAddresses(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> AddressListResponse:
+    """
+    params: None
+    result: AddressListResponse
+    method: hmyv2_getElectedValidatorAddresses
+    """
+    data = format_api_data("hmyv2_getElectedValidatorAddresses", None)
+    resp = await post_request(api_url, data, session)
+    return build_response(AddressListResponse, resp, session)
+
+
+async def getValidatorInformation(api_url : str, params : AddressParameters, session : Optional[aiohttp.ClientSession] = None) -> ValidatorInformationResponse:
+    """
+    params: AddressParameters
+    result: ValidatorInformationResponse
+    method: hmyv2_getValidatorInformation
+    """
+    data = format_api_data("hmyv2_getValidatorInformation", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(ValidatorInformationResponse, resp, session)
+
+#Network
+
+async def getCurrentUtilityMetrics(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetCurrentUtilityMetricsResponse:
+    """
+    params: None
+    result: GetCurrentUtilityMetricsResponse
+    method: hmyv2_getCurrentUtilityMetrics
+    """
+    data = format_api_data("hmyv2_getCurrentUtilityMetrics", None)
+    resp = await post_request(api_url, data, session)
+    return build_response(GetCurrentUtilityMetricsResponse, resp, session)
+
+async def getMedianRawStakeSnapshot(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetMedianRawStakeSnapshotResponse:
+    """
+    params: None
+    result: GetMedianRawStakeSnapshotResponse
+    method: hmyv2_getMedianRawStakeSnapshot
+    """
+    data = format_api_data("hmyv2_getMedianRawStakeSnapshot", None)
+    resp = await post_request(api_url, data, session)
+    return build_response(GetMedianRawStakeSnapshotResponse, resp, session)
+
+async def getStakingNetworkInfo(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetStakingNetworkInfoResponse:
+    """
+    params: None
+    result: GetStakingNetworkInfoResponse
+    method: hmyv2_getStakingNetworkInfo
+    """
+    data = format_api_data("hmyv2_getStakingNetworkInfo", None)
+    resp = await post_request(api_url, data, session)
+    return build_response(GetStakingNetworkInfoResponse, resp, session)
+
+async def getSuperCommittees(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetSuperCommitteesResponse:
+    """
+    params: None
+    result: GetSuperCommitteesResponse
+    method: hmyv2_getSuperCommittees
+    """
+    data = format_api_data("hmyv2_getSuperCommittees", None)
+    resp = await post_request(api_url, data, session)
+    return build_response(GetSuperCommitteesResponse, resp, session)
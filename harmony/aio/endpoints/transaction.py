@@ -0,0 +1,209 @@
+from typing import Optional
+
+import aiohttp
+
+from ...utils.communication import build_response, format_api_data
+from ..communication import post_request
+
+from ...models import (
+    HashParameters,
+    GetCXReceiptByHashResponse,
+    GetPendingCXReceiptsResponse,
+    ResendCXResponse,
+    GetPoolStatsResponse,
+    GetCurrentStakingErrorSinkResponse,
+    BlockNumberAndIndexParameters,
+    HashAndIndexParameters,
+    RawTransactionParameters,
+    SendRawStakingTransactionResponse,
+    GetCurrentTransactionErrorSinkResponse,
+    GetTransactionReceiptParameters,
+    GetTransactionReceiptResponse,
+    SendRawTransactionResponse,
+    StakingTransactionResponse,
+    StakingTransactionListResponse,
+    TransactionResponse,
+    TransactionListResponse
+)
+
+#Cross shard
+
+async def getCXReceiptByHash(api_url : str, params : HashParameters, session : Optional[aiohttp.ClientSession] = None) -> GetCXReceiptByHashResponse:
+    """
+    params: HashParameters
+    result: GetCXReceiptByHashResponse
+    method: hmyv2_getCXReceiptByHash
+    """
+    data = format_api_data("hmyv2_getCXReceiptByHash", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(GetCXReceiptByHashResponse, resp, session)
+
+
+async def getPendingCXReceipts(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetPendingCXReceiptsResponse:
+    """
+    params: None
+    result: GetPendingCXReceiptsResponse
+    method: hmyv2_getPendingCXReceipts
+    """
+    data = format_api_data("hmyv2_getPendingCXReceipts", None)
+    resp = await post_request(api_url, data, session)
+    return build_response(GetPendingCXReceiptsResponse, resp, session)
+
+
+async def resendCX(api_url : str, params : HashParameters, session : Optional[aiohttp.ClientSession] = None) -> ResendCXResponse:
+    """
+    params: HashParameters
+    result: ResendCXResponse
+    method: hmyv2_resendCX
+    """
+    data = format_api_data("hmyv2_resendCX", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(ResendCXResponse, resp, session)
+
+#Transaction Pool
+
+async def getPoolStats(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetPoolStatsResponse:
+    """
+    params: None
+    result: GetPoolStatsResponse
+    method: hmyv2_getPoolStats
+    """
+    data = format_api_data("hmyv2_getPoolStats", None)
+    resp = await post_request(api_url, data, session)
+    
+    return build_response(GetPoolStatsResponse, resp, session)
+
+async def pendingStakingTransactions(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> StakingTransactionListResponse:
+    """
+    params: None
+    result: StakingTransactionListResponse
+    method: hmyv2_pendingStakingTransactions
+    """
+    data = format_api_data("hmyv2_pendingStakingTransactions", None)
+    resp = await post_request(api_url, data, session)
+    return build_response(StakingTransactionListResponse, resp, session)
+
+async def pendingTransactions(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> TransactionListResponse:
+    """
+    params: None
+    result: TransactionListResponse
+    method: hmyv2_pendingTransactions
+    """
+    data = format_api_data("hmyv2_pendingTransactions", None)
+    resp = await post_request(api_url, data, session)
+    return build_response(TransactionListResponse, resp, session)
+
+#Staking
+
+async def getCurrentStakingErrorSink(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetCurrentStakingErrorSinkResponse:
+    """
+    params: None
+    result: GetCurrentStakingErrorSinkResponse
+    method: hmyv2_getCurrentStakingErrorSink
+    """
+    data = format_api_data("hmyv2_getCurrentStakingErrorSink", None)
+    resp = await post_request(api_url, data, session)
+    return build_response(GetCurrentStakingErrorSinkResponse, resp, session)
+
+async def getStakingTransactionByBlockNumberAndIndex(api_url : str, params : BlockNumberAndIndexParameters, session : Optional[aiohttp.ClientSession] = None) -> StakingTransactionResponse:
+    """
+    params: BlockNumberAndIndexParameters
+    result: StakingTransactionResponse
+    method: hmyv2_getStakingTransactionByBlockNumberAndIndex
+    """
+    data = format_api_data("hmyv2_getStakingTransactionByBlockNumberAndIndex", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(StakingTransactionResponse, resp, session)
+
+async def getStakingTransactionByBlockHashAndIndex(api_url : str, params : HashAndIndexParameters, session : Optional[aiohttp.ClientSession] = None) -> StakingTransactionResponse:
+    """
+    params: HashAndIndexParameters
+    result: StakingTransactionResponse
+    method: hmyv2_getStakingTransactionByBlockHashAndIndex
+    """
+    data = format_api_data("hmyv2_getStakingTransactionByBlockHashAndIndex", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(StakingTransactionResponse, resp, session)
+
+async def getStakingTransactionByHash(api_url : str, params : HashParameters, session : Optional[aiohttp.ClientSession] = None) -> StakingTransactionResponse:
+    """
+    params: HashParameters
+    result: StakingTransactionResponse
+    method: hmyv2_getStakingTransactionByHash
+    """
+    data = format_api_data("hmyv2_getStakingTransactionByHash", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(StakingTransactionResponse, resp, session)
+
+async def sendRawStakingTransaction(api_url : str, params : RawTransactionParameters, session : Optional[aiohttp.ClientSession] = None) -> SendRawStakingTransactionResponse:
+    """
+    params: RawTransactionParameters
+    result: SendRawStakingTransactionResponse
+    method: hmyv2_sendRawStakingTransaction
+    """
+    data = format_api_data("hmyv2_sendRawStakingTransaction", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(SendRawStakingTransactionResponse, resp, session)
+
+#Transfer
+
+async def getCurrentTransactionErrorSink(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetCurrentTransactionErrorSinkResponse:
+    """
+    params: None
+    result: GetCurrentTransactionErrorSinkResponse
+    method: hmyv2_getCurrentTransactionErrorSink
+    """
+    data = format_api_data("hmyv2_getCurrentTransactionErrorSink", None)
+    resp = await post_request(api_url, data, session)
+    return build_response(GetCurrentTransactionErrorSinkResponse, resp, session)
+
+async def getTransactionByBlockHashAndIndex(api_url : str, params : HashAndIndexParameters, session : Optional[aiohttp.ClientSession] = None) -> TransactionResponse:
+    """
+    params: HashAndIndexParameters
+    result: TransactionResponse
+    method: hmyv2_getTransactionByBlockHashAndIndex
+    """
+    data = format_api_data("hmyv2_getTransactionByBlockHashAndIndex", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(TransactionResponse, resp, session)
+
+async def getTransactionByBlockNumberAndIndex(api_url : str, params : BlockNumberAndIndexParameters, session : Optional[aiohttp.ClientSession] = None) -> TransactionResponse:
+    """
+    params: BlockNumberAndIndexParameters
+    result: TransactionResponse
+    method: hmyv2_getTransactionByBlockNumberAndIndex
+    """
+    data = format_api_data("hmyv2_getTransactionByBlockNumberAndIndex", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(TransactionResponse, resp, session)
+
+async def getTransactionByHash(api_url : str, params : HashParameters, session : Optional[aiohttp.ClientSession] = None) -> TransactionResponse:
+    """
+    params: HashParameters
+    result: TransactionResponse
+    method: hmyv2_getTransactionByHash
+    """
+    data = format_api_data("hmyv2_getTransactionByHash", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(TransactionResponse, resp, session)
+
+async def getTransactionReceipt(api_url : str, params : GetTransactionReceiptParameters, session : Optional[aiohttp.ClientSession] = None) -> GetTransactionReceiptResponse:
+    """
+    params: GetTransactionReceiptParameters
+    result: GetTransactionReceiptResponse
+    method: hmyv2_getTransactionReceipt
+    """
+    data = format_api_data("hmyv2_getTransactionReceipt", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(GetTransactionReceiptResponse, resp, session)
+
+async def sendRawTransaction(api_url : str, params : RawTransactionParameters, session : Optional[aiohttp.ClientSession] = None) -> SendRawTransactionResponse:
+    """
+    params: RawTransactionParameters
+    result: SendRawTransactionResponse
+    method: hmyv2_sendRawTransaction
+    """
+    data = format_api_data("hmyv2_sendRawTransaction", params)
+    resp = await post_request(api_url, data, session)
+    return build_response(SendRawTransactionResponse, resp, session)
+    
@@ -0,0 +1,93 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+
+import aiohttp
+
+from .account import get_staking_transactions_count, get_staking_transactions_history, get_transactions_count, get_transactions_history
+from ..history import _Deduplicator, _item_key, _page_items, _raise_for_error
+from ..models import SortOrder, StakingTransaction, Transaction, TransactionType
+
+async def _fetch_count(api_url : str, address : str, transaction_type : TransactionType, staking : bool, session : Optional[aiohttp.ClientSession]) -> int:
+    count = get_staking_transactions_count if staking else get_transactions_count
+    resp = await count(api_url, address, transaction_type, session)
+    _raise_for_error(resp)
+    return resp.result
+
+async def _fetch_page(api_url : str, address : str, page_index : int, page_size : int, include_full_transaction_data : bool, transaction_type : TransactionType, sort_order : SortOrder, staking : bool, session : Optional[aiohttp.ClientSession]) -> List[Any]:
+    history = get_staking_transactions_history if staking else get_transactions_history
+    resp = await history(api_url, address, page_index, page_size, include_full_transaction_data, transaction_type, sort_order, session)
+    _raise_for_error(resp)
+    return _page_items(resp.result)
+
+async def iter_transactions_history(api_url : str, address : str, include_full_transaction_data : Optional[bool] = False, transaction_type : Optional[TransactionType] = "ALL", sort_order : Optional[SortOrder] = "ASC", staking : Optional[bool] = False, page_size : Optional[int] = 1000, max_workers : Optional[int] = 4, session : Optional[aiohttp.ClientSession] = None) -> AsyncIterator[Union[str, Transaction, StakingTransaction]]:
+    """
+    The asyncio counterpart of `harmony.history.iter_transactions_history`.
+
+    Parameters
+    ----------
+    api_url : str
+    address : str
+        The wallet address
+    include_full_transaction_data : bool, optional
+        If true yield the whole transaction objects instead of the hashes, defaults to False
+    transaction_type : str, optional
+        Either 'SENT', 'RECEIVED', 'ALL', defaults to 'ALL'
+    sort_order : str, optional
+        How to sort based on timestamp, either 'ASC' or 'DESC', defaults to 'ASC'
+    staking : bool, optional
+        Whether to get the staking transactions instead, defaults to False
+    page_size : int, optional
+        The number of transactions per page, defaults to 1000
+    max_workers : int, optional
+        The maximum number of pages in flight at once; defaults to 4
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : AsyncIterator[str] or AsyncIterator[Transaction] or AsyncIterator[StakingTransaction]
+
+    Raises
+    ------
+    HarmonyNodeError, aiohttp.ClientError: If fetching the count or a page fails
+    """
+    n_pages = (await _fetch_count(api_url, address, transaction_type, staking, session) + page_size - 1) // page_size
+    opts = (page_size, include_full_transaction_data, transaction_type, sort_order, staking, session)
+    seen = _Deduplicator(2 * page_size)
+    pending = {}
+    arrived : Dict[int, List[Any]] = {}
+    next_page = 0
+    next_yield = 0
+    last_page : Optional[int] = None
+
+    def submit(page_index : int) -> None:
+        pending[asyncio.ensure_future(_fetch_page(api_url, address, page_index, *opts))] = page_index
+
+    try:
+        if n_pages == 0:
+            submit(0)
+            next_page = 1
+        while last_page is None or next_yield <= last_page:
+            while len(pending) < max_workers and next_page < n_pages and len(arrived) < 2 * max_workers:
+                submit(next_page)
+                next_page += 1
+            if pending:
+                finished, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    page_index = pending.pop(task)
+                    items = task.result()
+                    arrived[page_index] = items
+                    if page_index >= n_pages - 1 and last_page is None:
+                        if len(items) < page_size:
+                            last_page = page_index
+                        elif page_index + 1 >= next_page:
+                            # The history grew since it was counted
+                            submit(page_index + 1)
+                            next_page = page_index + 2
+            while next_yield in arrived:
+                for item in arrived.pop(next_yield):
+                    if seen.add(_item_key(item)):
+                        yield item
+                next_yield += 1
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,82 @@
+from typing import Optional
+
+import aiohttp
+
+from ..models import (
+    GetCurrentBadBlocksResponse,
+    GetNodeMetadataResponse,
+    PeerCountResponse,
+    ProtocolVersionResponse
+)
+
+from .endpoints.blockchain import (
+    getCurrentBadBlocks,
+    getNodeMetadata,
+    peerCount,
+    protocolVersion
+)
+
+async def get_current_bad_blocks(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetCurrentBadBlocksResponse:
+    """
+    Get the bad blocks currently in the node memory
+
+    NOTE: Known issues with RPC not returning correctly
+
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : list[str]
+        List of bad block hashes in memory
+    """
+    return await getCurrentBadBlocks(api_url, session)
+
+async def get_node_metadata(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetNodeMetadataResponse:
+    """
+    Get metadata about the node
+
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : NodeMetadata
+    """
+    return await getNodeMetadata(api_url, session)
+
+async def get_peer_count(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> PeerCountResponse:
+    """
+    Get the number of peers on the network.
+
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : str
+        The number of peers represented as a hex string
+    """
+    return await peerCount(api_url, session)
+
+async def get_protocol_version(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> ProtocolVersionResponse:
+    """
+    Get the protocol version
+
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : int
+        The protocol version
+    """
+    return await protocolVersion(api_url, session)
\ No newline at end of file
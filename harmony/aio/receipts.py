@@ -0,0 +1,86 @@
+import collections
+from typing import AsyncIterable, AsyncIterator, Deque, Iterable, List, Optional, Tuple, Union
+
+import aiohttp
+
+from .bulk import iter_batched_calls
+from ..models import Block, TransactionReceipt
+from ..receipts import _receipt_calls, _transaction_hashes
+
+async def iter_receipts(api_url : str, transaction_hashes : Union[Iterable[str], AsyncIterable[str]], batch_size : Optional[int] = 100, max_workers : Optional[int] = 4, max_retries : Optional[int] = 3, retry_backoff : Optional[float] = 0.5, session : Optional[aiohttp.ClientSession] = None) -> AsyncIterator[Optional[TransactionReceipt]]:
+    """
+    The asyncio counterpart of `harmony.receipts.iter_receipts`.
+
+    Parameters
+    ----------
+    api_url : str
+    transaction_hashes : Iterable[str] or AsyncIterable[str]
+    batch_size : int, optional
+        The number of calls per batch request; defaults to 100
+    max_workers : int, optional
+        The maximum number of batches in flight at once; defaults to 4
+    max_retries : int, optional
+        How many times to retry a failing call before giving up; defaults to 3
+    retry_backoff : float, optional
+        The delay before the first retry in seconds, doubled on each further retry; defaults to 0.5
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : AsyncIterator[TransactionReceipt]
+        The receipts in the order of the hashes, None for the transactions the node doesn't know
+
+    Raises
+    ------
+    HarmonyNodeError, aiohttp.ClientError: If a call still fails after `max_retries` retries
+    """
+    async for _, receipt in iter_batched_calls(api_url, transaction_hashes, _receipt_calls, batch_size, max_workers, max_retries, retry_backoff, session):
+        yield receipt
+
+async def iter_block_receipts(api_url : str, blocks : AsyncIterable[Block], batch_size : Optional[int] = 100, max_workers : Optional[int] = 4, max_retries : Optional[int] = 3, retry_backoff : Optional[float] = 0.5, session : Optional[aiohttp.ClientSession] = None) -> AsyncIterator[Tuple[Block, List[Optional[TransactionReceipt]]]]:
+    """
+    The asyncio counterpart of `harmony.receipts.iter_block_receipts`.
+
+    Parameters
+    ----------
+    api_url : str
+    blocks : AsyncIterable[Block]
+    batch_size : int, optional
+        The number of calls per batch request; defaults to 100
+    max_workers : int, optional
+        The maximum number of batches in flight at once; defaults to 4
+    max_retries : int, optional
+        How many times to retry a failing call before giving up; defaults to 3
+    retry_backoff : float, optional
+        The delay before the first retry in seconds, doubled on each further retry; defaults to 0.5
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : AsyncIterator[tuple[Block, list[TransactionReceipt]]]
+        Each block with the receipts of its transactions, in order
+
+    Raises
+    ------
+    HarmonyNodeError, aiohttp.ClientError: If a call still fails after `max_retries` retries
+    """
+    queued : Deque[Tuple[Block, int]] = collections.deque()
+
+    async def hashes() -> AsyncIterator[str]:
+        async for block in blocks:
+            block_hashes = _transaction_hashes(block)
+            queued.append((block, len(block_hashes)))
+            for transaction_hash in block_hashes:
+                yield transaction_hash
+
+    receipts : List[Optional[TransactionReceipt]] = []
+    async for receipt in iter_receipts(api_url, hashes(), batch_size, max_workers, max_retries, retry_backoff, session):
+        # The block of the receipt was queued before its hash was read, so any block ahead of it is complete
+        while queued[0][1] == len(receipts):
+            yield queued.popleft()[0], receipts
+            receipts = []
+        receipts.append(receipt)
+    while queued:
+        block, count = queued.popleft()
+        yield block, receipts[:count]
+        receipts = receipts[count:]
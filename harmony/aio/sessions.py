@@ -0,0 +1,299 @@
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import aiohttp
+
+from ..pool import NON_IDEMPOTENT_METHODS, Endpoint, EndpointPool, HedgePolicy
+from ..utils.communication import _methods, format_api_data
+from ..utils.ratelimit import RateLimiter
+from ..utils.resilience import CircuitBreakers, RetryPolicy
+from ..utils.sessions import _archival, _ok
+
+class BufferedResponse(object):
+
+    def __init__(self, body : bytes, status : Optional[int] = 200, headers : Optional[Dict[str, str]] = None) -> None:
+        """
+        A response whose body was already read, standing in for an `aiohttp.ClientResponse`
+        so it can be handed to several callers, or built without a request.
+
+        Parameters
+        ----------
+        body : bytes
+        status : int, optional
+            The http status; defaults to 200
+        headers : dict, optional
+        """
+        self._body = body
+        self.status = status
+        self.headers = headers if headers is not None else {}
+
+    async def read(self) -> bytes:
+        return self._body
+
+class PendingRequest(object):
+
+    def __init__(self, coro) -> None:
+        """
+        What the `post` of the session wrappers returns: an async context manager
+        that awaits the coroutine producing the `BufferedResponse` on entry.
+        """
+        self._coro = coro
+
+    async def __aenter__(self) -> BufferedResponse:
+        return await self._coro
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+class SessionWrapper(object):
+
+    def __init__(self, session : aiohttp.ClientSession) -> None:
+        """
+        The asyncio counterpart of `harmony.utils.sessions.SessionWrapper`, standing in for
+        an `aiohttp.ClientSession` where the endpoint functions take one.
+
+        Anything that isn't overridden is passed through to the wrapped session,
+        and wrappers can be stacked on top of each other.
+
+        Parameters
+        ----------
+        session : aiohttp.ClientSession
+            The session to wrap
+        """
+        self._session = session
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        return self._session
+
+    def __getattr__(self, name : str) -> Any:
+        return getattr(self._session, name)
+
+    def post(self, url : str, **kwargs) -> Any:
+        return self._session.post(url, **kwargs)
+
+class ResilientSession(SessionWrapper):
+
+    def __init__(self, retry_policy : RetryPolicy, session : aiohttp.ClientSession) -> None:
+        """
+        The asyncio counterpart of `harmony.utils.sessions.ResilientSession`.
+
+        Parameters
+        ----------
+        retry_policy : RetryPolicy
+        session : aiohttp.ClientSession
+            The session to wrap
+        """
+        super().__init__(session)
+        self.retry_policy = retry_policy
+        self.breakers = CircuitBreakers(retry_policy)
+
+class TrustedSession(SessionWrapper):
+    """
+    Marks the session as talking to a trusted node, so the endpoint functions
+    build the response models without validating them.
+    """
+
+    trusted = True
+
+class CoalescingSession(SessionWrapper):
+
+    def __init__(self, session : aiohttp.ClientSession) -> None:
+        """
+        Share one network call between identical requests that are in flight at the same time.
+
+        The asyncio counterpart of `harmony.utils.sessions.CoalescingSession`.
+        Tasks posting a request that is already in flight wait for it and get the same response body.
+
+        Parameters
+        ----------
+        session : aiohttp.ClientSession
+            The session to wrap
+        """
+        super().__init__(session)
+        self._inflight : Dict[Tuple[str, Any], asyncio.Future] = {}
+        self.coalesced = 0
+
+    async def _fetch(self, url : str, data : Optional[Union[str, Dict[str, Any]]], kwargs : Dict[str, Any]) -> BufferedResponse:
+        async with self._session.post(url, data=data, **kwargs) as resp:
+            return BufferedResponse(await resp.read(), resp.status, dict(resp.headers))
+
+    async def _post(self, url : str, data : Optional[Union[str, Dict[str, Any]]], kwargs : Dict[str, Any]) -> BufferedResponse:
+        key = (url, data if isinstance(data, (str, bytes)) else json.dumps(data, sort_keys=True))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(url, data, kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def post(self, url : str, data : Optional[Union[str, Dict[str, Any]]] = None, **kwargs) -> PendingRequest:
+        return PendingRequest(self._post(url, data, kwargs))
+
+class RateLimitedSession(SessionWrapper):
+
+    def __init__(self, rate_limiter : RateLimiter, session : aiohttp.ClientSession) -> None:
+        """
+        The asyncio counterpart of `harmony.utils.sessions.RateLimitedSession`.
+
+        Tasks wait for the limits without blocking the event loop, and the limiter
+        can be shared with blocking clients in other threads.
+
+        Parameters
+        ----------
+        rate_limiter : RateLimiter
+        session : aiohttp.ClientSession
+            The session to wrap
+        """
+        super().__init__(session)
+        self._rate_limiter = rate_limiter
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self._rate_limiter
+
+    async def _post(self, url : str, data : Optional[Union[str, Dict[str, Any]]], kwargs : Dict[str, Any]) -> BufferedResponse:
+        gates = await self._rate_limiter.acquire_async(url, _methods(data))
+        try:
+            async with self._session.post(url, data=data, **kwargs) as resp:
+                shared = BufferedResponse(await resp.read(), resp.status, dict(resp.headers))
+        except BaseException:
+            self._rate_limiter.release(gates)
+            raise
+        self._rate_limiter.release(gates, shared.status, shared.headers.get("Retry-After"))
+        return shared
+
+    def post(self, url : str, data : Optional[Union[str, Dict[str, Any]]] = None, **kwargs) -> PendingRequest:
+        return PendingRequest(self._post(url, data, kwargs))
+
+class PooledSession(SessionWrapper):
+
+    def __init__(self, pool : EndpointPool, session : aiohttp.ClientSession, hedging : Optional[HedgePolicy] = None) -> None:
+        """
+        The asyncio counterpart of `harmony.utils.sessions.PooledSession`.
+
+        When a call is hedged, the request that loses is cancelled. Calls that submit transactions
+        are only sent to another node on an `aiohttp.ClientConnectorError`.
+
+        Parameters
+        ----------
+        pool : EndpointPool
+        session : aiohttp.ClientSession
+            The session to wrap
+        hedging : HedgePolicy, optional
+            When to hedge slow reads, if None is provided they never are.
+        """
+        super().__init__(session)
+        self._pool = pool
+        self._hedging = hedging
+
+    @property
+    def pool(self) -> EndpointPool:
+        return self._pool
+
+    @property
+    def hedging(self) -> Optional[HedgePolicy]:
+        return self._hedging
+
+    async def discover_capabilities(self) -> None:
+        """
+        Ask the nodes that aren't known to be archival or not.
+        """
+        async def ask(endpoint : Endpoint) -> None:
+            try:
+                async with self._session.post(endpoint.url, headers={"Content-Type" : "application/json"}, data=format_api_data("hmyv2_getNodeMetadata", None)) as resp:
+                    self._pool.set_archival(endpoint, _archival(await resp.read()))
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                self._pool.set_archival(endpoint, None)
+        await asyncio.gather(*[ask(endpoint) for endpoint in self._pool.unknown_capabilities()])
+
+    async def _send(self, endpoint : Endpoint, method : Optional[str], data : Any, kwargs : Dict[str, Any]) -> BufferedResponse:
+        start = time.monotonic()
+        try:
+            async with self._session.post(endpoint.url, data=data, **kwargs) as resp:
+                shared = BufferedResponse(await resp.read(), resp.status, dict(resp.headers))
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self._pool.record(endpoint, time.monotonic() - start, False)
+            raise
+        except asyncio.CancelledError:
+            self._pool.release(endpoint)
+            raise
+        elapsed = time.monotonic() - start
+        ok = _ok(shared.status)
+        self._pool.record(endpoint, elapsed, ok)
+        if ok and self._hedging is not None:
+            self._hedging.observe(method, elapsed)
+        return shared
+
+    async def _hedged(self, endpoint : Endpoint, delay : float, archival : bool, tried : List[Endpoint], method : str, data : Any, kwargs : Dict[str, Any]) -> Tuple[Optional[BufferedResponse], Optional[Exception]]:
+        tasks = [asyncio.ensure_future(self._send(endpoint, method, data, kwargs))]
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            second = self._pool.select(archival, tried) or self._pool.select(archival)
+            if second is not None:
+                if second is not endpoint:
+                    tried.append(second)
+                tasks.append(asyncio.ensure_future(self._send(second, method, data, kwargs)))
+        result, error = None, None
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        result = task.result()
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                        error = err
+                        continue
+                    if _ok(result.status):
+                        self._hedging.record(method, len(tasks) > 1, task is not tasks[0])
+                        return result, None
+        finally:
+            for task in pending:
+                task.cancel()
+        self._hedging.record(method, len(tasks) > 1, False)
+        return result, error
+
+    async def _post(self, data : Optional[Union[str, Dict[str, Any]]], kwargs : Dict[str, Any]) -> BufferedResponse:
+        methods = _methods(data)
+        archival = self._pool.needs_archival(methods)
+        if archival and self._pool.unknown_capabilities():
+            await self.discover_capabilities()
+        method = methods[0] if len(methods) == 1 else None
+        writes = any(m in NON_IDEMPOTENT_METHODS for m in methods)
+        delay = self._hedging.delay(method) if self._hedging is not None else None
+        tried : List[Endpoint] = []
+        resp, error = None, None
+        while True:
+            endpoint = self._pool.select(archival, tried)
+            if endpoint is None:
+                break
+            tried.append(endpoint)
+            if delay is not None:
+                attempt, err = await self._hedged(endpoint, delay, archival, tried, method, data, kwargs)
+            else:
+                try:
+                    attempt, err = await self._send(endpoint, method, data, kwargs), None
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    attempt, err = None, e
+                if self._hedging is not None and self._hedging.hedges(method):
+                    self._hedging.record(method, False, False)
+            if attempt is None:
+                error = err
+                # Only a request that never reached the node can't have been accepted by it
+                if writes and not isinstance(err, aiohttp.ClientConnectorError):
+                    break
+                continue
+            resp = attempt
+            if _ok(resp.status) or writes:
+                return resp
+        if resp is not None:
+            return resp
+        raise error
+
+    def post(self, url : str, data : Optional[Union[str, Dict[str, Any]]] = None, **kwargs) -> PendingRequest:
+        return PendingRequest(self._post(data, kwargs))
@@ -0,0 +1,173 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, TypeVar
+
+import aiohttp
+
+from .api import AsyncHarmonyAPI
+from ..exceptions import HarmonyNodeError
+from ..models import Transaction
+
+T = TypeVar("T")
+
+class AsyncShardedHarmonyAPI(object):
+
+    def __init__(self, api_url : str, shard_urls : Optional[Dict[int, str]] = None, pool_size : Optional[int] = 100, coalesce_requests : Optional[bool] = False, trusted : Optional[bool] = False) -> None:
+        """
+        The asyncio counterpart of `harmony.sharded.ShardedHarmonyAPI`.
+
+        The shards are discovered from the sharding structure of the node at `api_url`
+        on first use, unless their urls are given.
+
+        Parameters
+        ----------
+        api_url : str
+            The url of a node on any shard
+        shard_urls : dict[int, str], optional
+            The http url of each shard id, discovered from `api_url` if none are passed
+        pool_size : int, optional
+            The maximum number of open connections per shard; defaults to 100
+        coalesce_requests : bool, optional
+            See `AsyncHarmonyAPI`; defaults to False
+        trusted : bool, optional
+            See `AsyncHarmonyAPI`; defaults to False
+        """
+        self._api_url = api_url
+        self._options = {"pool_size" : pool_size, "coalesce_requests" : coalesce_requests, "trusted" : trusted}
+        self._shards : Optional[Dict[int, AsyncHarmonyAPI]] = None
+        if shard_urls is not None:
+            self._shards = self._clients(shard_urls)
+        self._discovering : Optional[asyncio.Lock] = None
+
+    def _clients(self, shard_urls : Dict[int, str]) -> Dict[int, AsyncHarmonyAPI]:
+        return {shard_id : AsyncHarmonyAPI(url, **self._options) for shard_id, url in sorted(shard_urls.items())}
+
+    async def shards(self) -> Dict[int, AsyncHarmonyAPI]:
+        """
+        The client of each shard, by shard id.
+        """
+        if self._shards is None:
+            if self._discovering is None:
+                self._discovering = asyncio.Lock()
+            async with self._discovering:
+                if self._shards is None:
+                    async with AsyncHarmonyAPI(self._api_url, **self._options) as api:
+                        structure = await api.sharding_structure()
+                    self._shards = self._clients({shard.shardID : shard.http for shard in structure})
+        return self._shards
+
+    @property
+    def url(self) -> str:
+        return self._api_url
+
+    async def close(self) -> None:
+        """
+        Close the session of every shard.
+        """
+        if self._shards is not None:
+            await asyncio.gather(*[api.close() for api in self._shards.values()])
+
+    async def __aenter__(self) -> "AsyncShardedHarmonyAPI":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def map(self, fn : Callable[[AsyncHarmonyAPI], Awaitable[T]], shard_ids : Optional[Iterable[int]] = None) -> Dict[int, T]:
+        """
+        Await `fn` with the client of each shard concurrently.
+
+        Parameters
+        ----------
+        fn : Callable[[AsyncHarmonyAPI], Awaitable]
+        shard_ids : list[int], optional
+            The shards to call it on, defaults to all of them
+
+        Returns
+        -------
+        dict[int, Any]
+            The result of each shard, by shard id
+        """
+        shards = await self.shards()
+        shard_ids = list(shards) if shard_ids is None else list(shard_ids)
+        results = await asyncio.gather(*[fn(shards[shard_id]) for shard_id in shard_ids])
+        return dict(zip(shard_ids, results))
+
+    async def current_block_numbers(self) -> Dict[int, int]:
+        """
+        Get the head of every shard.
+
+        Returns
+        -------
+        dict[int, int]
+            The current block number, by shard id
+        """
+        return await self.map(lambda api: api.current_block_number())
+
+    async def get_account_balances(self, address : str) -> Dict[int, int]:
+        """
+        Get the balance of an account on every shard.
+
+        Parameters
+        ----------
+        address : str
+
+        Returns
+        -------
+        dict[int, int]
+            The balance, by shard id
+        """
+        return await self.map(lambda api: api.get_account_balance(address))
+
+    async def get_account_balance(self, address : str) -> int:
+        """
+        Get the balance of an account summed over every shard.
+
+        Parameters
+        ----------
+        address : str
+
+        Returns
+        -------
+        int
+        """
+        return sum((await self.get_account_balances(address)).values())
+
+    async def get_transaction(self, transaction_hash : str) -> Optional[Transaction]:
+        """
+        Look the transaction up on every shard at once, returning as soon as one of them has it.
+
+        The shard it is on is in `Transaction.shardID`.
+
+        Parameters
+        ----------
+        transaction_hash : str
+
+        Returns
+        -------
+        Transaction or None
+            None if no shard knows of the transaction
+
+        Raises
+        ------
+        HarmonyNodeError: If the transaction wasn't found and a shard responded with an error
+        """
+        shards = await self.shards()
+        pending = {asyncio.ensure_future(api.get_transaction(transaction_hash)) for api in shards.values()}
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        transaction = task.result()
+                    except (HarmonyNodeError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        error = e
+                        continue
+                    if transaction is not None:
+                        return transaction
+        finally:
+            for task in pending:
+                task.cancel()
+        if error is not None:
+            raise error
+        return None
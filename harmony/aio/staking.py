@@ -0,0 +1,110 @@
+from typing import Optional
+
+import aiohttp
+
+from ..models import (
+    BlockNumberAndIndexParameters,
+    GetCurrentStakingErrorSinkResponse,
+    HashParameters,
+    HashAndIndexParameters,
+    RawTransactionParameters,
+    SendRawStakingTransactionResponse,
+    StakingTransactionResponse
+)
+
+from .endpoints.transaction import (
+    getCurrentStakingErrorSink,
+    getStakingTransactionByBlockHashAndIndex,
+    getStakingTransactionByBlockNumberAndIndex,
+    getStakingTransactionByHash,
+    sendRawStakingTransaction    
+)
+
+async def get_current_staking_error_sink(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetCurrentStakingErrorSinkResponse:
+    """
+    Get the current staking errors
+    
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : list[StakingError]
+    """
+    return await getCurrentStakingErrorSink(api_url, session)
+
+async def get_staking_transaction_by_block_number_and_index(api_url : str, block_number : int, index : int, session : Optional[aiohttp.ClientSession] = None) -> StakingTransactionResponse:
+    """
+    Get the staking transaction by block number and index
+
+    Parameters
+    ----------
+    api_url : str
+    block_number : int
+    index : int
+        staking transaction index
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : StakingTransaction
+    """
+    params = BlockNumberAndIndexParameters(block_number=block_number, index=index)
+    return await getStakingTransactionByBlockNumberAndIndex(api_url, params, session)
+
+async def get_staking_transaction_by_block_hash_and_index(api_url : str, block_hash : str, index : int, session : Optional[aiohttp.ClientSession] = None) -> StakingTransactionResponse:
+    """
+    Get the staking transaction by block hash and index
+
+    Parameters
+    ----------
+    api_url : str
+    block_hash : str
+    index : int
+        staking transaction index
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : StakingTransaction
+    """
+    params = HashAndIndexParameters(hash=block_hash, index=index)
+    return await getStakingTransactionByBlockNumberAndIndex(api_url, params, session)
+
+async def get_staking_transaction_by_hash(api_url : str, staking_transaction_hash : str, session : Optional[aiohttp.ClientSession] = None) -> StakingTransactionResponse:
+    """
+    Get the staking transaction by its hash
+
+    Parameters
+    ----------
+    api_url : str
+    staking_transaction_hash : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : StakingTransaction
+    """
+    params = HashParameters(hash=staking_transaction_hash)
+    return await getStakingTransactionByHash(api_url, params, session)
+
+async def send_raw_staking_transaction(api_url : str, staking_transaction_hex : str, session : Optional[aiohttp.ClientSession] = None) -> StakingTransactionResponse:
+    """
+    Send the raw staking transaction
+
+    Parameters
+    ----------
+    api_url : str
+    staking_transaction_hex : str
+        Hex representation of signed staking transaction
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : str
+        The staking transaction hash if it was successfully added to the pool
+    """
+    params = RawTransactionParameters(transaction_hex=staking_transaction_hex)
+    return await sendRawStakingTransaction(api_url, params, session)
@@ -0,0 +1,77 @@
+from typing import Optional
+
+import aiohttp
+
+from ..models import (
+    GetCurrentUtilityMetricsResponse,
+    GetMedianRawStakeSnapshotResponse,
+    GetStakingNetworkInfoResponse,
+    GetSuperCommitteesResponse
+)
+
+from .endpoints.staking import (
+    getCurrentUtilityMetrics,
+    getMedianRawStakeSnapshot,
+    getStakingNetworkInfo,
+    getSuperCommittees
+)
+
+async def get_current_utility_metrics(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetCurrentUtilityMetricsResponse:
+    """
+    Get the current utility metrics
+
+    Parameters
+    ----------
+    api_url: str
+    session: aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : UtilityMetrics
+    """
+    return await getCurrentUtilityMetrics(api_url, session)
+
+async def get_median_raw_stake_snapshot(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetMedianRawStakeSnapshotResponse:
+    """
+    Get the median raw stake snapshot
+
+    Parameters
+    ----------
+    api_url: str
+    session: aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : MedianRawStakeSnapshot
+    """
+    return await getMedianRawStakeSnapshot(api_url, session)
+
+async def get_staking_network_info(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetStakingNetworkInfoResponse:
+    """
+    Get information about the staking network.
+
+    Parameters
+    ----------
+    api_url: str
+    session: aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : StakingNetworkInfo
+    """
+    return await getStakingNetworkInfo(api_url, session)
+
+async def get_super_committees(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetSuperCommitteesResponse:
+    """
+    Get information about the current and previously elected super committees.
+
+    Parameters
+    ----------
+    api_url: str
+    session: aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : SuperCommittees
+    """
+    return await getSuperCommittees(api_url, session)
\ No newline at end of file
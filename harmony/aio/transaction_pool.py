@@ -0,0 +1,60 @@
+from typing import Optional
+
+import aiohttp
+
+from ..models import (
+    GetPoolStatsResponse,
+    StakingTransactionListResponse,
+    TransactionListResponse
+)
+
+from .endpoints.transaction import (
+    getPoolStats,
+    pendingStakingTransactions,
+    pendingTransactions
+)
+
+async def get_pool_stats(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetPoolStatsResponse:
+    """
+    Get stats on the transaction pool.
+
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : PoolStats
+    """
+    return await getPoolStats(api_url, session)
+
+async def get_pending_staking_transactions(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> StakingTransactionListResponse:
+    """
+    Get the staking transactions pending in the pool.
+
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : list[StakingTransaction]
+    """
+    return await pendingStakingTransactions(api_url, session)
+
+async def get_pending_transactions(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> TransactionListResponse:
+    """
+    Get the transactions pending in the pool.
+
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : list[Transaction]
+    """
+    return await pendingTransactions(api_url, session)
\ No newline at end of file
@@ -0,0 +1,130 @@
+from typing import Optional
+
+import aiohttp
+
+from ..models import (
+    BlockNumberAndIndexParameters,
+    GetCurrentTransactionErrorSinkResponse,
+    GetTransactionReceiptParameters,
+    GetTransactionReceiptResponse,
+    HashParameters,
+    HashAndIndexParameters,
+    RawTransactionParameters,
+    SendRawTransactionResponse,
+    TransactionResponse
+)
+
+from .endpoints.transaction import (
+    getCurrentTransactionErrorSink,
+    getTransactionByBlockHashAndIndex,
+    getTransactionByBlockNumberAndIndex,
+    getTransactionByHash,
+    getTransactionReceipt,
+    sendRawTransaction    
+)
+
+async def get_current_transaction_error_sink(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> GetCurrentTransactionErrorSinkResponse:
+    """
+    Get the current transaction errors
+    
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : list[TransactionError]
+    """
+    return await getCurrentTransactionErrorSink(api_url, session)
+
+async def get_transaction_by_block_number_and_index(api_url : str, block_number : int, index : int, session : Optional[aiohttp.ClientSession] = None) -> TransactionResponse:
+    """
+    Get the transaction by block number and index
+
+    Parameters
+    ----------
+    api_url : str
+    block_number : int
+    index : int
+        transaction index
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : Transaction
+    """
+    params = BlockNumberAndIndexParameters(block_number=block_number, index=index)
+    return await getTransactionByBlockNumberAndIndex(api_url, params, session)
+
+async def get_transaction_by_block_hash_and_index(api_url : str, block_hash : str, index : int, session : Optional[aiohttp.ClientSession] = None) -> TransactionResponse:
+    """
+    Get the transaction by block hash and index
+
+    Parameters
+    ----------
+    api_url : str
+    block_hash : str
+    index : int
+        transaction index
+    session : aiohttp.ClientSession, optieronal
+
+    Returns
+    -------
+    result : Transaction
+    """
+    params = HashAndIndexParameters(hash=block_hash, index=index)
+    return await getTransactionByBlockNumberAndIndex(api_url, params, session)
+
+async def get_transaction_by_hash(api_url : str, transaction_hash : str, session : Optional[aiohttp.ClientSession] = None) -> TransactionResponse:
+    """
+    Get the transaction by its hash
+
+    Parameters
+    ----------
+    api_url : str
+    transaction_hash : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : Transaction
+    """
+    params = HashParameters(hash=transaction_hash)
+    return await getTransactionByHash(api_url, params, session)
+
+async def get_transaction_receipt(api_url : str, transaction_hash : str, session : Optional[aiohttp.ClientSession] = None) -> GetTransactionReceiptResponse:
+    """
+    Get the receipt of the transaction by its hash
+
+    Parameters
+    ----------
+    api_url : str
+    transaction_hash : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : TransactionReceipt
+    """
+    params = GetTransactionReceiptParameters(receipt=transaction_hash)
+    return await getTransactionReceipt(api_url, params, session)
+
+async def send_raw_transaction(api_url : str, transaction_hex : str, session : Optional[aiohttp.ClientSession] = None) -> TransactionResponse:
+    """
+    Send the raw transaction
+
+    Parameters
+    ----------
+    api_url : str
+    transaction_hex : str
+        Hex representation of signed transaction
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : str
+        The transaction hash if it was successfully added to the pool
+    """
+    params = RawTransactionParameters(transaction_hex=transaction_hex)
+    return await sendRawTransaction(api_url, params, session)
@@ -0,0 +1,110 @@
+from typing import Optional
+
+import aiohttp
+
+from ..models import (
+    AddressListResponse,
+    AddressParameters,
+    GetAllValidatorInformationParameters,
+    GetAllValidatorInformationByBlockNumberParameters,
+    ValidatorInformationListResponse,
+    ValidatorInformationResponse
+)
+
+from .endpoints.staking import (
+    getAllValidatorAddresses,
+    getAllValidatorInformation,
+    getAllValidatorInformationByBlockNumber,
+    getElectedValidatorAddresses,
+    getValidatorInformation
+)
+
+async def get_all_validator_addresses(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> AddressListResponse:
+    """
+    Get all the wallet address of all the validators
+
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : list[str]
+        List of validator wallet addresses
+    """
+    return await getAllValidatorAddresses(api_url, session)
+
+async def get_all_validator_information(api_url : str, page_number : Optional[int] = -1, session : Optional[aiohttp.ClientSession] = None) -> ValidatorInformationListResponse:
+    """
+    Get the information about all the validators.
+
+    Parameters
+    ----------
+    api_url : str
+    page_number : int, optional
+        The page to request (100 results per page), -1 gives all validators, defautls to -1
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    --------
+    result : list[ValidatorInformation]
+        List of ValidatorInformation objects
+    """
+    params = GetAllValidatorInformationParameters(page_number=page_number)
+    return await getAllValidatorInformation(api_url, params, session)
+
+async def get_all_validator_information_by_block_number(api_url : str, block_number : int, page_number : Optional[int] = -1, session : Optional[aiohttp.ClientSession] = None) -> ValidatorInformationListResponse:
+    """
+    Get the information about all the validators by block number.
+
+    Parameters
+    ----------
+    api_url : str
+    block_number : int
+        The block number
+    page_number : int, optional
+        The page to request (100 results per page), -1 gives all validators, defautls to -1
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    --------
+    result : list[ValidatorInformation]
+        List of ValidatorInformation objects
+    """
+    params = GetAllValidatorInformationByBlockNumberParameters(page_number=page_number, block_number=block_number)
+    return await getAllValidatorInformationByBlockNumber(api_url, params, session)
+
+async def get_all_elected_validator_addresses(api_url : str, session : Optional[aiohttp.ClientSession] = None) -> AddressListResponse:
+    """
+    Get all the wallet address of all the elected validators
+
+    Parameters
+    ----------
+    api_url : str
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : list[str]
+        List of validator wallet addresses
+    """
+    return await getElectedValidatorAddresses(api_url, session)
+
+async def get_validator_information(api_url : str, address : str, session : Optional[aiohttp.ClientSession] = None) -> ValidatorInformationResponse:
+    """
+    Get the information about a given validator wallet address
+
+    Parameters
+    ----------
+    api_url : str
+    address : str
+        The wallet address of the validator to get information about
+    session : aiohttp.ClientSession, optional
+
+    Returns
+    -------
+    result : ValidatorInfomration
+    """
+    params = AddressParameters(address=address)
+    return await getValidatorInformation(api_url, params, session)
\ No newline at end of file
@@ -0,0 +1,388 @@
+import asyncio
+import itertools
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Union
+
+import aiohttp
+
+from .sessions import BufferedResponse, PendingRequest
+from ..exceptions import HarmonyNodeError
+from ..utils.codec import dumps, loads
+
+_CLOSED = object()
+
+class Subscription(object):
+
+    def __init__(self, client : "WebSocketClient", params : List[Any], namespace : str, queue_size : int) -> None:
+        """
+        A stream of notifications from an `eth_subscribe` style subscription.
+
+        Iterate over it with `async for` to receive the `result` of each notification,
+        the iteration ends when the subscription is cancelled or the client is closed.
+        Created by `WebSocketClient.subscribe`.
+
+        If notifications arrive faster than they are consumed, the oldest ones are dropped
+        once `queue_size` are waiting, and counted in `dropped`.
+        """
+        self._client = client
+        self._params = params
+        self._namespace = namespace
+        self._queue : asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.id : Optional[str] = None
+        self.dropped = 0
+
+    @property
+    def params(self) -> List[Any]:
+        return self._params
+
+    def _put(self, item : Any) -> None:
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(item)
+
+    async def unsubscribe(self) -> None:
+        """
+        Cancel the subscription on the node and end the iteration.
+        """
+        await self._client._unsubscribe(self)
+
+    async def get(self) -> Any:
+        """
+        Wait for the next notification.
+
+        Raises
+        ------
+        StopAsyncIteration: If the subscription was cancelled or the client closed
+        """
+        item = await self._queue.get()
+        if item is _CLOSED:
+            self._queue.put_nowait(_CLOSED)
+            raise StopAsyncIteration
+        return item
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self
+
+    async def __anext__(self) -> Any:
+        return await self.get()
+
+class WebSocketClient(object):
+
+    def __init__(self, ws_url : str, session : Optional[aiohttp.ClientSession] = None, heartbeat : Optional[float] = 30.0, reconnect : Optional[bool] = True, max_reconnect_delay : Optional[float] = 30.0, queue_size : Optional[int] = 1000) -> None:
+        """
+        JSON-RPC over one persistent websocket connection to a node.
+
+        Calls made at the same time are multiplexed over the connection and matched back up
+        by their id, and `eth_subscribe` style subscriptions (newHeads, logs, newPendingTransactions)
+        are delivered as `Subscription` streams.
+
+        If the connection drops, calls in flight fail with `aiohttp.ClientConnectionError`, and
+        when `reconnect` is set the client reconnects with exponential backoff and renews its
+        subscriptions. Notifications sent while disconnected are lost.
+
+        The websocket url of each shard is in `ShardingStructure.ws`, and the node must be started with `--ws`.
+        Use `WebSocketSession` to make the calls of `AsyncHarmonyAPI` over the connection.
+
+        Parameters
+        ----------
+        ws_url : str
+            The websocket url of the node, e.g. wss://ws.s0.t.hmny.io
+        session : aiohttp.ClientSession, optional
+            The session to open the connection with, if none is passed
+            one is created and closed along with the client.
+        heartbeat : float, optional
+            Seconds between pings, used to detect a dead connection; defaults to 30
+        reconnect : bool, optional
+            Whether to reconnect after the connection drops; defaults to True
+        max_reconnect_delay : float, optional
+            The longest wait between reconnection attempts in seconds; defaults to 30
+        queue_size : int, optional
+            The most notifications to buffer per subscription; defaults to 1000
+        """
+        self._ws_url = ws_url
+        self._session = session
+        self._owns_session = session is None
+        self._heartbeat = heartbeat
+        self._reconnect = reconnect
+        self._max_reconnect_delay = max_reconnect_delay
+        self._queue_size = queue_size
+        self._ws : Optional[aiohttp.ClientWebSocketResponse] = None
+        self._reader : Optional[asyncio.Task] = None
+        self._connected : Optional[asyncio.Event] = None
+        self._ids = itertools.count(1)
+        self._pending : Dict[int, asyncio.Future] = {}
+        self._starting : Dict[int, Subscription] = {}
+        self._subscriptions : Dict[str, Subscription] = {}
+        self._closed = False
+
+    @property
+    def url(self) -> str:
+        return self._ws_url
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None and not self._ws.closed
+
+    async def connect(self) -> "WebSocketClient":
+        """
+        Open the connection, if it isn't open already.
+        """
+        if self._connected is None:
+            self._connected = asyncio.Event()
+        if self._reader is None:
+            await self._open()
+            self._reader = asyncio.ensure_future(self._read_forever())
+        return self
+
+    async def _open(self) -> None:
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        self._ws = await self._session.ws_connect(self._ws_url, heartbeat=self._heartbeat)
+        self._connected.set()
+
+    async def close(self) -> None:
+        """
+        Close the connection, ending every subscription.
+        """
+        self._closed = True
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            self._reader = None
+        if self._ws is not None:
+            await self._ws.close()
+        self._fail_pending()
+        for subscription in self._subscriptions.values():
+            subscription._put(_CLOSED)
+        self._subscriptions.clear()
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "WebSocketClient":
+        return await self.connect()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _fail_pending(self) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(aiohttp.ClientConnectionError("The websocket connection to {} was closed".format(self._ws_url)))
+
+    def _dispatch(self, message : Dict[str, Any]) -> None:
+        future = self._pending.pop(message.get("id"), None)
+        if future is not None:
+            # Register a new subscription before reading on, since its first
+            # notifications can arrive right behind the response
+            subscription = self._starting.pop(message.get("id"), None)
+            if subscription is not None and message.get("result") is not None:
+                subscription.id = message["result"]
+                self._subscriptions[subscription.id] = subscription
+            if not future.done():
+                future.set_result(message)
+            return
+        if str(message.get("method", "")).endswith("_subscription"):
+            params = message.get("params") or {}
+            subscription = self._subscriptions.get(params.get("subscription"))
+            if subscription is not None:
+                subscription._put(params.get("result"))
+
+    async def _read(self) -> None:
+        async for msg in self._ws:
+            if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                payload = loads(msg.data)
+                for message in payload if isinstance(payload, list) else [payload]:
+                    self._dispatch(message)
+            elif msg.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                break
+
+    async def _read_forever(self) -> None:
+        delay = 0.5
+        while True:
+            try:
+                await self._read()
+            except (aiohttp.ClientError, ValueError):
+                pass
+            self._connected.clear()
+            self._fail_pending()
+            if self._closed or not self._reconnect:
+                for subscription in self._subscriptions.values():
+                    subscription._put(_CLOSED)
+                self._subscriptions.clear()
+                return
+            while True:
+                try:
+                    await self._open()
+                    break
+                except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self._max_reconnect_delay)
+            delay = 0.5
+            asyncio.ensure_future(self._resubscribe())
+
+    async def _resubscribe(self) -> None:
+        subscriptions, self._subscriptions = list(self._subscriptions.values()), {}
+        for subscription in subscriptions:
+            try:
+                await self._start(subscription)
+            except (aiohttp.ClientError, HarmonyNodeError):
+                subscription._put(_CLOSED)
+
+    async def request(self, payload : Dict[str, Any], subscription : Optional[Subscription] = None) -> Dict[str, Any]:
+        """
+        Send a JSON-RPC request and wait for the response.
+
+        The id of the payload is replaced by one unique to the connection.
+
+        Returns
+        -------
+        dict
+            The decoded response
+        """
+        if self._reader is None:
+            await self.connect()
+        if self._reader.done():
+            raise aiohttp.ClientConnectionError("The websocket connection to {} was closed".format(self._ws_url))
+        await self._connected.wait()
+        request_id = next(self._ids)
+        payload = dict(payload, id=request_id)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        if subscription is not None:
+            self._starting[request_id] = subscription
+        try:
+            await self._ws.send_str(dumps(payload))
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+            self._starting.pop(request_id, None)
+
+    def _result(self, resp : Dict[str, Any]) -> Any:
+        error = resp.get("error")
+        if error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(error.get("code"), error.get("message")))
+        return resp.get("result")
+
+    async def call(self, method : str, params : Optional[Sequence[Any]] = None) -> Any:
+        """
+        Call a JSON-RPC method over the connection.
+
+        Parameters
+        ----------
+        method : str
+        params : list, optional
+
+        Returns
+        -------
+        Any
+            The result of the call
+
+        Raises
+        ------
+        HarmonyNodeError: If the node responds with an error
+        aiohttp.ClientConnectionError: If the connection drops before the response arrives
+        """
+        return self._result(await self.request({"jsonrpc" : "2.0", "method" : method, "params" : list(params or [])}))
+
+    async def subscribe(self, kind : str, *params : Any, namespace : Optional[str] = "eth") -> Subscription:
+        """
+        Start a subscription.
+
+        Parameters
+        ----------
+        kind : str
+            'newHeads', 'logs' or 'newPendingTransactions'
+        params : Any
+            Any further parameters of the subscription, e.g. the filter of 'logs'
+        namespace : str, optional
+            The namespace of the subscribe method; defaults to 'eth'
+
+        Returns
+        -------
+        Subscription
+        """
+        subscription = Subscription(self, [kind, *params], namespace, self._queue_size)
+        await self._start(subscription)
+        return subscription
+
+    async def _start(self, subscription : Subscription) -> None:
+        payload = {"jsonrpc" : "2.0", "method" : "{}_subscribe".format(subscription._namespace), "params" : subscription.params}
+        self._result(await self.request(payload, subscription))
+
+    async def _unsubscribe(self, subscription : Subscription) -> None:
+        if self._subscriptions.pop(subscription.id, None) is None:
+            return
+        subscription._put(_CLOSED)
+        if self.connected:
+            await self.call("{}_unsubscribe".format(subscription._namespace), [subscription.id])
+
+    async def new_heads(self) -> Subscription:
+        """
+        Subscribe to the header of every new block.
+        """
+        return await self.subscribe("newHeads")
+
+    async def logs(self, address : Optional[Union[str, List[str]]] = None, topics : Optional[List[Optional[Union[str, List[str]]]]] = None) -> Subscription:
+        """
+        Subscribe to the logs of new blocks that match the filter.
+
+        Parameters
+        ----------
+        address : str or list[str], optional
+            The contract address(es) to include logs of, in hex
+        topics : list, optional
+            The topics to match, by position; None matches any topic and a list matches any of its topics
+        """
+        log_filter : Dict[str, Any] = {}
+        if address is not None:
+            log_filter["address"] = address
+        if topics is not None:
+            log_filter["topics"] = topics
+        return await self.subscribe("logs", log_filter)
+
+    async def pending_transactions(self) -> Subscription:
+        """
+        Subscribe to the hashes of the transactions entering the pool of the node.
+        """
+        return await self.subscribe("newPendingTransactions")
+
+class WebSocketSession(object):
+
+    def __init__(self, client : WebSocketClient) -> None:
+        """
+        Stands in for an `aiohttp.ClientSession` where the endpoint functions take one,
+        sending every request over the websocket connection of the client instead.
+
+        e.g. `AsyncHarmonyAPI(client.url, session=WebSocketSession(client))`
+
+        Parameters
+        ----------
+        client : WebSocketClient
+        """
+        self._client = client
+
+    @property
+    def client(self) -> WebSocketClient:
+        return self._client
+
+    async def _post(self, data : Union[str, bytes, Dict[str, Any], List[Dict[str, Any]]]) -> BufferedResponse:
+        payload = loads(data) if isinstance(data, (str, bytes)) else data
+        if isinstance(payload, list):
+            responses = await asyncio.gather(*[self._client.request(call) for call in payload])
+            for call, resp in zip(payload, responses):
+                resp["id"] = call.get("id")
+            return BufferedResponse(dumps(list(responses)).encode("utf-8"))
+        resp = await self._client.request(payload)
+        resp["id"] = payload.get("id")
+        return BufferedResponse(dumps(resp).encode("utf-8"))
+
+    def post(self, url : str, data : Optional[Union[str, Dict[str, Any]]] = None, **kwargs) -> PendingRequest:
+        return PendingRequest(self._post(data))
+
+    async def close(self) -> None:
+        await self._client.close()
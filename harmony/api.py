@@ -1,5 +1,6 @@
-from typing import List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
+from pydantic import BaseModel
 import requests
 
 from pyrosetta.api import RosettaAPIExt
@@ -23,6 +24,7 @@ from .models import (
     SuperCommittees,
     Transaction,
     TransactionError,
+    TransactionReceipt,
     TransactionType,
     UtilityMetrics,
     ValidatorIDs,
@@ -30,38 +32,105 @@ from .models import (
 )
 
 from . import account as act
+from . import balances as bal
 from . import blockchain_network as bc_net
 from . import blocks as blk
+from . import block_range as blk_range
 from . import cross_shard as cx
 from . import delegation as dlg
+from . import history as hist
 from . import node
+from . import receipts as rcpt
 from . import smart_contract as sc
 from . import staking as stk
 from . import staking_network as stk_net
 from . import transaction_pool as tx_pool
 from . import transfer as tx
 from . import validator as val
-
-class HarmonyNodeError(Exception):
-    pass
+from .endpoints.batch import batch_call
+from .block_range import AdaptiveChunkSize
+from .cache import BlockCache, ResponseCache, TTLCache
+from .exceptions import HarmonyNodeError
+from .pool import EndpointPool, HedgePolicy
+from .utils.ratelimit import RateLimiter
+from .utils.resilience import DEFAULT_RETRY_POLICY, RetryPolicy
+from .utils.sessions import CachingSession, CoalescingSession, PooledSession, RateLimitedSession, ResilientSession, TrustedSession
+from .index import TransactionIndex
+from .utils.transport import TransportConfig, create_session
 
 class HarmonyAPI(object):
 
-    def __init__(self, api_url : str, local_rosetta_url : Optional[str] = None,  session : Optional[requests.Session] = None) -> None:
+    def __init__(self, api_url : Union[str, Sequence[str], EndpointPool], local_rosetta_url : Optional[str] = None,  session : Optional[requests.Session] = None, block_cache : Optional[BlockCache] = None, response_cache : Optional[ResponseCache] = None, state_cache : Optional[TTLCache] = None, coalesce_requests : Optional[bool] = False, trusted : Optional[bool] = False, hedging : Optional[HedgePolicy] = None, retry_policy : Optional[RetryPolicy] = None, rate_limiter : Optional[RateLimiter] = None, transport : Optional[TransportConfig] = None, transaction_index : Optional[TransactionIndex] = None) -> None:
         """
         Parameters
         ----------
-        api_url : str
-            The url where the node is located
+        api_url : str, list[str] or EndpointPool
+            The url where the node is located. Given several urls, or an `EndpointPool`, of nodes
+            on the same shard, each call is routed to the node with the best recent latency and
+            error rate, failing over to the others (see `harmony.pool.EndpointPool`).
         rosetta_url : str, optional
             The url to the rosetta api
         sessions : requests.Session, optional
             An already existing requests sesion. If none is passed
             a session will be created for this object.
-        """
+        block_cache : BlockCache, optional
+            A cache for finalized blocks, headers, signers and transaction counts.
+            If none is passed, blocks are fetched from the node on every call.
+        response_cache : ResponseCache, optional
+            A persistent cache for the results of calls that can't change,
+            e.g. blocks, transactions by hash, receipts and balances at a block number.
+        state_cache : TTLCache, optional
+            A short lived cache for volatile chain state such as the gas price,
+            block number and epoch. If none is passed, they are fetched on every call.
+        coalesce_requests : bool, optional
+            Whether identical requests made at the same time from different threads
+            should share one network call; defaults to False
+        trusted : bool, optional
+            Whether the node is trusted, in which case responses are built into models
+            without validating them; defaults to False
+        hedging : HedgePolicy, optional
+            When to send a duplicate of a slow read to a second node and take whichever
+            answers first (see `harmony.pool.HedgePolicy`). If none is passed, reads are never hedged.
+        retry_policy : RetryPolicy, optional
+            The timeouts, retries and circuit breakers of the requests (see `harmony.utils.resilience.RetryPolicy`).
+            If none is passed, `DEFAULT_RETRY_POLICY` is used. Either way the client keeps circuit breakers of its own.
+        rate_limiter : RateLimiter, optional
+            The rate and concurrency limits of the calls to each node (see `harmony.utils.ratelimit.RateLimiter`),
+            which can be shared with other clients. If none is passed, calls aren't limited.
+        transport : TransportConfig, optional
+            The connection pool of the session created when none is passed
+            (see `harmony.utils.transport.TransportConfig`), defaults to the one set with `set_default_transport`.
+        transaction_index : TransactionIndex, optional
+            A local index of the transactions of the shard (see `harmony.index.TransactionIndex`).
+            Transactions are looked up in it before asking the node, and account transaction
+            histories and counts are answered from it once it is complete and no more
+            than its `max_lag` blocks behind the node. The head of the node is the one the
+            index's follower last saw, or else `current_block_number`, cached by `state_cache`.
+        """
+        self._transaction_index = transaction_index
+        self._endpoint_pool = None
+        if not isinstance(api_url, str):
+            self._endpoint_pool = api_url if isinstance(api_url, EndpointPool) else EndpointPool(api_url)
+            api_url = self._endpoint_pool.urls[0]
+        elif hedging is not None:
+            self._endpoint_pool = EndpointPool([api_url])
+        self._hedging = hedging
         self._api_url = api_url
+        self._block_cache = block_cache
+        self._state_cache = state_cache
         if session is None:
-            session = requests.Session()
+            session = create_session(transport)
+        if rate_limiter is not None:
+            session = RateLimitedSession(rate_limiter, session)
+        if self._endpoint_pool is not None:
+            session = PooledSession(self._endpoint_pool, session, self._hedging)
+        if coalesce_requests:
+            session = CoalescingSession(session)
+        if response_cache is not None:
+            session = CachingSession(response_cache, session)
+        if trusted:
+            session = TrustedSession(session)
+        session = ResilientSession(retry_policy if retry_policy is not None else DEFAULT_RETRY_POLICY, session)
         self._session = session
         if local_rosetta_url:
             self._rosetta_api = RosettaAPIExt(local_rosetta_url)
@@ -81,6 +150,18 @@ class HarmonyAPI(object):
     def url(self) -> str:
         return self._api_url
 
+    @property
+    def endpoint_pool(self) -> Optional[EndpointPool]:
+        return self._endpoint_pool
+
+    @property
+    def block_cache(self) -> Optional[BlockCache]:
+        return self._block_cache
+
+    @property
+    def state_cache(self) -> Optional[TTLCache]:
+        return self._state_cache
+
     def node_metadata(self) -> NodeMetadata:
         """
         Get metadata about the node.
@@ -89,6 +170,11 @@ class HarmonyAPI(object):
         -------
         NodeMetadata
         """
+        if self._state_cache is not None:
+            return self._state_cache.fetch("node_metadata", self._fetch_node_metadata)
+        return self._fetch_node_metadata()
+
+    def _fetch_node_metadata(self) -> NodeMetadata:
         resp = node.get_node_metadata(self.url, self.session)
         if resp.error is not None:
             raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
@@ -143,6 +229,11 @@ class HarmonyAPI(object):
         -------
         int
         """
+        if self._state_cache is not None:
+            return self._state_cache.fetch("current_gas_price", self._fetch_current_gas_price)
+        return self._fetch_current_gas_price()
+
+    def _fetch_current_gas_price(self) -> int:
         resp = bc_net.get_current_gas_price(self.url, self.session)
         if resp.error is not None:
             raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
@@ -182,6 +273,11 @@ class HarmonyAPI(object):
         -------
         int
         """
+        if self._state_cache is not None:
+            return self._state_cache.fetch("current_block_number", self._fetch_current_block_number)
+        return self._fetch_current_block_number()
+
+    def _fetch_current_block_number(self) -> int:
         resp = bc_net.current_block_number(self.url, self.session)
         if resp.error is not None:
             raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
@@ -208,6 +304,11 @@ class HarmonyAPI(object):
         -------
         list[ShardingStructure]
         """
+        if self._state_cache is not None:
+            return self._state_cache.fetch("sharding_structure", self._fetch_sharding_structure)
+        return self._fetch_sharding_structure()
+
+    def _fetch_sharding_structure(self) -> List[ShardingStructure]:
         resp = bc_net.get_sharding_structure(self.url, self.session)
         if resp.error is not None:
             raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
@@ -234,11 +335,30 @@ class HarmonyAPI(object):
         -------
         int
         """
+        if self._state_cache is not None:
+            return self._state_cache.fetch("current_epoch", self._fetch_current_epoch, self._seconds_until_next_epoch)
+        return self._fetch_current_epoch()
+
+    def _fetch_current_epoch(self) -> int:
         resp = bc_net.get_epoch(self.url, self.session)
         if resp.error is not None:
             raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
         return resp.result
 
+    def _seconds_until_next_epoch(self, epoch : int) -> float:
+        """
+        Estimate how long the epoch lasts from the last block of the epoch and the current block number.
+        Falls back to the time to live configured for the epoch if they aren't available.
+        """
+        try:
+            info = self.staking_network_info()
+            block_number = self.current_block_number()
+        except (HarmonyNodeError, requests.RequestException):
+            return self._state_cache.ttl("current_epoch")
+        if info is None or block_number is None:
+            return self._state_cache.ttl("current_epoch")
+        return max(1, info.epoch_last_block - block_number) * self._state_cache.block_time
+
     def validators_by_epoch(self, epoch_number : int, as_pubkeys : Optional[bool] = False) -> Union[ValidatorIDs, List[str]]:
         """
         Get the validators for a given epoch
@@ -282,6 +402,11 @@ class HarmonyAPI(object):
         -------
         StakingNetworkInfo
         """
+        if self._state_cache is not None:
+            return self._state_cache.fetch("staking_network_info", self._fetch_staking_network_info)
+        return self._fetch_staking_network_info()
+
+    def _fetch_staking_network_info(self) -> StakingNetworkInfo:
         resp = stk_net.get_staking_network_info(self.url, self.session)
         if resp.error is not None:
             raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
@@ -380,12 +505,18 @@ class HarmonyAPI(object):
         -------
         Header
         """
+        if block_number is not None and self._block_cache is not None:
+            cached = self._block_cache.get(("header",), block_number)
+            if cached is not None:
+                return cached
         if block_number is not None:
             resp = blk.get_block_header_by_number(self.url, block_number, self.session)
         else:
             resp = blk.get_latest_block_header(self.url, self.session)
         if resp.error is not None:
             raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        if self._block_cache is not None and resp.result is not None:
+            self._block_cache.put(("header",), resp.result, resp.result.blockNumber, resp.result.blockHash)
         return resp.result
     
     def get_block(self, block_number : Optional[int] = None, block_hash : Optional[str] = None, include_full_transaction_data : Optional[bool] = False, include_regular_transactions : Optional[bool] = False, include_staking_transactions : Optional[bool] = False) -> Block:
@@ -420,12 +551,19 @@ class HarmonyAPI(object):
         if block_number is not None and block_hash is not None:
             raise ValueError("Both `block_number` and `block_hash` can't be passed at once. Choose one.")
     
+        key = ("block", include_full_transaction_data, include_regular_transactions, include_staking_transactions)
+        if self._block_cache is not None:
+            cached = self._block_cache.get(key, block_number, block_hash)
+            if cached is not None:
+                return cached
         if block_number is not None:
             resp = blk.get_block_by_number(self.url, block_number, include_full_transaction_data, include_regular_transactions, include_staking_transactions, self.session)
         else:
             resp = blk.get_block_by_hash(self.url, block_hash, include_full_transaction_data, include_regular_transactions, include_staking_transactions, self.session)
         if resp.error is not None:
             raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        if self._block_cache is not None and resp.result is not None:
+            self._block_cache.put(key, resp.result, resp.result.number, resp.result.hash_)
         return resp.result
 
     def get_block_signers(self, block_number : int, as_pubkeys : Optional[bool] = False) -> List[str]:
@@ -444,12 +582,19 @@ class HarmonyAPI(object):
         list[str]
             List of signer addresses, unless as_pubkeys is True, then list of public keys
         """
+        key = ("signers", bool(as_pubkeys))
+        if self._block_cache is not None:
+            cached = self._block_cache.get(key, block_number)
+            if cached is not None:
+                return cached
         if as_pubkeys:
             resp = blk.get_block_signers_keys(self.url, block_number, self.session)
         else:
             resp = blk.get_block_signers(self.url, block_number, self.session)
         if resp.error is not None:
             raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        if self._block_cache is not None and resp.result is not None:
+            self._block_cache.put(key, resp.result, block_number)
         return resp.result
 
     def get_transaction_count_on_block(self, block_number : Optional[int] = None, block_hash : Optional[str] = None) -> int:
@@ -478,18 +623,26 @@ class HarmonyAPI(object):
         if block_number is not None and block_hash is not None:
             raise ValueError("Both `block_number` and `block_hash` can't be passed at once. Choose one.")
         
+        if self._block_cache is not None:
+            cached = self._block_cache.get(("transaction_count",), block_number, block_hash)
+            if cached is not None:
+                return cached
         if block_number is not None:
             resp = blk.get_block_transaction_count_by_number(self.url, block_number, self.session)
         else:
             resp = blk.get_block_transaction_count_by_hash(self.url, block_hash, self.session)
         if resp.error is not None:
             raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        if self._block_cache is not None and resp.result is not None and block_number is not None:
+            self._block_cache.put(("transaction_count",), resp.result, block_number)
         return resp.result
 
     def get_blocks(self, starting_block_number : int, ending_block_number : int, include_signer_addresses : Optional[bool] = False, include_transactions : Optional[bool] = False, include_staking_transactions : Optional[bool] = False, session : Optional[requests.Session] = None) -> List[Block]:
         """
         Get the blocks between the starting and ending block number
 
+        The whole range is fetched in a single call, see `iter_blocks` for large ranges.
+
         Parameters
         ----------
         starting_block_number : int
@@ -512,6 +665,107 @@ class HarmonyAPI(object):
             raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
         return resp.result
 
+    def iter_blocks(self, starting_block_number : int, ending_block_number : int, include_signer_addresses : Optional[bool] = False, include_transactions : Optional[bool] = False, include_staking_transactions : Optional[bool] = False, max_workers : Optional[int] = 4, max_retries : Optional[int] = 3, chunk_size : Optional[AdaptiveChunkSize] = None) -> Iterator[Block]:
+        """
+        Iterate over the blocks between the starting and ending block number.
+
+        Unlike `get_blocks`, the range is split into chunks that are fetched concurrently,
+        which keeps large ranges with full transaction data from timing out.
+        The chunk size adapts to the observed latency and payload size.
+
+        Parameters
+        ----------
+        starting_block_number : int
+            The block number of the first block in the range
+        ending_block_number : int
+            The block number of the last block in the range
+        include_signer_addresses : bool, optional
+            Whether to include the wallet addresses of the block signers; defaults to False
+        include_transactions : bool, optional
+            Whether to include the full transaction data on the block; defaults to False
+        include_staking_transactions : bool, optional
+            Whether to include the full staking transaction data on the block; defaults to False
+        max_workers : int, optional
+            The maximum number of chunks fetched at once; defaults to 4
+        max_retries : int, optional
+            How many times to retry a failing chunk; defaults to 3
+        chunk_size : AdaptiveChunkSize, optional
+            The chunk sizing policy, defaults to AdaptiveChunkSize()
+
+        Returns
+        -------
+        Iterator[Block]
+            The blocks, in order
+        """
+        return blk_range.iter_blocks_from_range(self.url, starting_block_number, ending_block_number, include_signer_addresses, include_transactions, include_staking_transactions, max_workers, max_retries, chunk_size=chunk_size, session=self.session)
+
+    def iter_log_candidate_blocks(self, starting_block_number : int, ending_block_number : int, addresses : Optional[Union[str, List[str]]] = None, topics : Optional[List[Optional[Union[str, List[str]]]]] = None, batch_size : Optional[int] = 1000, max_workers : Optional[int] = 4, chunk_size : Optional[AdaptiveChunkSize] = None) -> Iterator[Block]:
+        """
+        Iterate over the blocks between the starting and ending block number whose logs bloom
+        may hold a log from the addresses with the topics, so that only their receipts need fetching.
+        Requires numpy.
+
+        Blooms have false positives, so some candidates may hold no matching log,
+        but the blocks left out hold none.
+
+        Parameters
+        ----------
+        starting_block_number : int
+            The block number of the first block in the range
+        ending_block_number : int
+            The block number of the last block in the range
+        addresses : str or list[str], optional
+            The contract addresses, as hex or bech32; defaults to any address
+        topics : list[str or list[str] or None], optional
+            The topics by position, each either a topic, a list of alternative topics,
+            or None for any topic; defaults to any topics
+        batch_size : int, optional
+            How many blooms to test at once; defaults to 1000
+        max_workers : int, optional
+            The maximum number of chunks fetched at once; defaults to 4
+        chunk_size : AdaptiveChunkSize, optional
+            The chunk sizing policy, defaults to AdaptiveChunkSize()
+
+        Returns
+        -------
+        Iterator[Block]
+            The candidate blocks, in order
+        """
+        from . import bloom
+        return bloom.iter_candidate_blocks(self.url, starting_block_number, ending_block_number, bloom.LogFilter(addresses, topics), batch_size, max_workers, chunk_size=chunk_size, session=self.session)
+
+    def export_blocks(self, starting_block_number : int, ending_block_number : int, directory : str, file_format : Optional[str] = "parquet", row_group_size : Optional[int] = 100000, max_workers : Optional[int] = 4) -> Dict[str, str]:
+        """
+        Export the blocks between the starting and ending block number, with their full transaction data,
+        to separate blocks, transactions and staking_transactions tables.
+
+        Requires pyarrow. The range is streamed, so memory use is bounded by the row group size
+        rather than the length of the range.
+
+        Parameters
+        ----------
+        starting_block_number : int
+            The block number of the first block in the range
+        ending_block_number : int
+            The block number of the last block in the range
+        directory : str
+            The directory to write the tables to
+        file_format : str, optional
+            'parquet' or 'arrow' (the Arrow IPC file format); defaults to 'parquet'
+        row_group_size : int, optional
+            The number of rows per row group; defaults to 100000
+        max_workers : int, optional
+            The maximum number of chunks fetched at once; defaults to 4
+
+        Returns
+        -------
+        dict[str, str]
+            The path of each table
+        """
+        from .export import export_block_range
+        writers = export_block_range(self.url, starting_block_number, ending_block_number, directory, file_format, row_group_size, max_workers=max_workers, session=self.session)
+        return {name : writer.path for name, writer in writers.items()}
+
     def get_account_balance(self, address : str, block_number : Optional[int] = None) -> int:
         """
         Get the balance of an account.
@@ -534,6 +788,61 @@ class HarmonyAPI(object):
             raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
         return resp.result
 
+    def iter_account_balances(self, addresses : Iterable[str], block_number : Optional[int] = None, batch_size : Optional[int] = 100, max_workers : Optional[int] = 4) -> Iterator[Tuple[str, int]]:
+        """
+        Get the balance of many accounts, with the calls sent in concurrent batches
+        and failed calls retried (see `harmony.balances.iter_balances`).
+
+        Parameters
+        ----------
+        addresses : Iterable[str]
+            The wallet addresses, read lazily
+        block_number : int, optional
+            The block to get the balances at, defaults to the latest block
+        batch_size : int, optional
+            The number of calls per batch request; defaults to 100
+        max_workers : int, optional
+            The maximum number of batches in flight at once; defaults to 4
+
+        Returns
+        -------
+        Iterator[tuple[str, int]]
+            The (address, balance) pairs, in the order of the addresses
+        """
+        return bal.iter_balances(self.url, addresses, block_number, batch_size, max_workers, session=self.session)
+
+    def export_account_balances(self, addresses : Iterable[str], path : str, block_number : Optional[int] = None, file_format : Optional[str] = "parquet", row_group_size : Optional[int] = 100000, batch_size : Optional[int] = 100, max_workers : Optional[int] = 4) -> str:
+        """
+        Write the balance of many accounts at a block to an address, blockNumber, balance table.
+
+        Requires pyarrow. The balances are streamed, so memory use is bounded by the row group size
+        rather than the number of addresses.
+
+        Parameters
+        ----------
+        addresses : Iterable[str]
+            The wallet addresses, read lazily
+        path : str
+            The file to write the table to
+        block_number : int, optional
+            The block to get the balances at, defaults to the latest block
+        file_format : str, optional
+            'parquet' or 'arrow' (the Arrow IPC file format); defaults to 'parquet'
+        row_group_size : int, optional
+            The number of rows per row group; defaults to 100000
+        batch_size : int, optional
+            The number of calls per batch request; defaults to 100
+        max_workers : int, optional
+            The maximum number of batches in flight at once; defaults to 4
+
+        Returns
+        -------
+        str
+            The path of the table
+        """
+        from .export import export_balance_snapshot
+        return export_balance_snapshot(self.url, addresses, path, block_number, file_format, row_group_size, batch_size=batch_size, max_workers=max_workers, session=self.session).path
+
     def get_account_staking_transaction_count(self, address : str, transaction_type : Optional[TransactionType] = "ALL") -> int:
         """
         Get the number of staking transactions on the account
@@ -581,6 +890,18 @@ class HarmonyAPI(object):
             raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
         return resp.result
 
+    def _answers_from_index(self) -> bool:
+        index = self._transaction_index
+        if index is None or not index.complete:
+            return False
+        if index.max_lag is None:
+            return True
+        # The head seen by the index's follower, or else the cached one, saves asking the node on every call
+        head = index.head
+        if head is None:
+            head = self.current_block_number()
+        return index.lag(head) <= index.max_lag
+
     def get_account_transaction_count(self, address : str, transaction_type : Optional[TransactionType] = "ALL") -> int:
         """
         Get the number of transactions on the account
@@ -595,6 +916,8 @@ class HarmonyAPI(object):
         -------
         int
         """
+        if self._answers_from_index():
+            return self._transaction_index.transaction_count(address, transaction_type)
         resp = act.get_transactions_count(self.url, address, transaction_type, self.session)
         if resp.error is not None:
             raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
@@ -623,10 +946,69 @@ class HarmonyAPI(object):
         -------
         list[str] or list[StakingTransaction]
         """
+        if self._answers_from_index():
+            hashes = self._transaction_index.transaction_history(address, page_index, page_size, transaction_type, sort_order)
+            return {"transactions" : self._transaction_index.transactions(hashes) if include_full_transaction_data else hashes}
         resp = act.get_transactions_history(self.url, address, page_index, page_size, include_full_transaction_data, transaction_type, sort_order, self.session)
         if resp.error is not None:
             raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
         return resp.result
+
+    def iter_account_transaction_history(self, address : str, include_full_transaction_data : Optional[bool] = False, transaction_type : Optional[TransactionType] = "ALL", sort_order : Optional[SortOrder] = "ASC", page_size : Optional[int] = 1000, max_workers : Optional[int] = 4) -> Iterator[Union[str, Transaction]]:
+        """
+        Iterate over the whole transaction history of the account, with the pages fetched concurrently.
+
+        Unlike `get_account_transaction_history`, the pages are sized from the transaction count
+        of the account and fetched for you, and transactions that arrive during the scan
+        don't come up twice (see `harmony.history.iter_transactions_history`).
+
+        Parameters
+        ----------
+        address: str
+            The wallet address
+        include_full_transaction_data: bool, optional
+            If true yield the whole transaction objects instead of the hashes, defaults to False
+        transaction_type: str, optional
+            Either 'SENT', 'RECEIVED', 'ALL', defaults to 'ALL'
+        sort_order: str, optional
+            How to sort based on timestamp, either 'ASC' or 'DESC', defaults to 'ASC'
+        page_size: int, optional
+            The number of transactions per page, defaults to 1000
+        max_workers : int, optional
+            The maximum number of pages fetched at once; defaults to 4
+
+        Returns
+        -------
+        Iterator[str] or Iterator[Transaction]
+        """
+        return hist.iter_transactions_history(self.url, address, include_full_transaction_data, transaction_type, sort_order, False, page_size, max_workers, self.session)
+
+    def iter_account_staking_transaction_history(self, address : str, include_full_transaction_data : Optional[bool] = False, transaction_type : Optional[TransactionType] = "ALL", sort_order : Optional[SortOrder] = "ASC", page_size : Optional[int] = 1000, max_workers : Optional[int] = 4) -> Iterator[Union[str, StakingTransaction]]:
+        """
+        Iterate over the whole staking transaction history of the account, with the pages fetched concurrently.
+
+        See `iter_account_transaction_history`.
+
+        Parameters
+        ----------
+        address: str
+            The wallet address
+        include_full_transaction_data: bool, optional
+            If true yield the whole transaction objects instead of the hashes, defaults to False
+        transaction_type: str, optional
+            Either 'SENT', 'RECEIVED', 'ALL', defaults to 'ALL'
+        sort_order: str, optional
+            How to sort based on timestamp, either 'ASC' or 'DESC', defaults to 'ASC'
+        page_size: int, optional
+            The number of transactions per page, defaults to 1000
+        max_workers : int, optional
+            The maximum number of pages fetched at once; defaults to 4
+
+        Returns
+        -------
+        Iterator[str] or Iterator[StakingTransaction]
+        """
+        return hist.iter_transactions_history(self.url, address, include_full_transaction_data, transaction_type, sort_order, True, page_size, max_workers, self.session)
     
     def current_transaction_error_sink(self) -> List[TransactionError]:
         """
@@ -653,11 +1035,93 @@ class HarmonyAPI(object):
         --------
         Transaction
         """
+        if self._transaction_index is not None:
+            indexed = self._transaction_index.get_transaction(transaction_hash)
+            if indexed is not None:
+                return indexed
         resp = tx.get_transaction_by_hash(self.url, transaction_hash, self.session)
         if resp.error is not None:
             raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
         return resp.result
     
+    def get_transaction_receipt(self, transaction_hash : str) -> TransactionReceipt:
+        """
+        Get the receipt of the transaction by its hash.
+
+        Parameters
+        ----------
+        transaction_hash : str
+
+        Returns
+        --------
+        TransactionReceipt
+        """
+        resp = tx.get_transaction_receipt(self.url, transaction_hash, self.session)
+        if resp.error is not None:
+            raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+        return resp.result
+
+    def iter_transaction_receipts(self, transaction_hashes : Iterable[str], batch_size : Optional[int] = 100, max_workers : Optional[int] = 4) -> Iterator[Optional[TransactionReceipt]]:
+        """
+        Get the receipts of many transactions, with the calls sent in concurrent batches
+        (see `harmony.receipts.iter_receipts`).
+
+        Parameters
+        ----------
+        transaction_hashes : Iterable[str]
+        batch_size : int, optional
+            The number of calls per batch request; defaults to 100
+        max_workers : int, optional
+            The maximum number of batches in flight at once; defaults to 4
+
+        Returns
+        -------
+        Iterator[TransactionReceipt]
+            The receipts in the order of the hashes, None for the transactions the node doesn't know
+        """
+        return rcpt.iter_receipts(self.url, transaction_hashes, batch_size, max_workers, session=self.session)
+
+    def iter_block_receipts(self, starting_block_number : int, ending_block_number : int, batch_size : Optional[int] = 100, max_workers : Optional[int] = 4) -> Iterator[Tuple[Block, List[Optional[TransactionReceipt]]]]:
+        """
+        Get the receipts of the transactions of the blocks between the starting and ending block number,
+        with the calls sent in concurrent batches that span block boundaries.
+
+        To only fetch the receipts of the blocks that may hold some logs, pass the blocks of
+        `iter_log_candidate_blocks` to `harmony.receipts.iter_block_receipts` instead.
+
+        Parameters
+        ----------
+        starting_block_number : int
+            The block number of the first block in the range
+        ending_block_number : int
+            The block number of the last block in the range
+        batch_size : int, optional
+            The number of calls per batch request; defaults to 100
+        max_workers : int, optional
+            The maximum number of block chunks and of batches in flight at once; defaults to 4
+
+        Returns
+        -------
+        Iterator[tuple[Block, list[TransactionReceipt]]]
+            Each block with the receipts of its transactions, in order
+        """
+        blocks = self.iter_blocks(starting_block_number, ending_block_number, max_workers=max_workers)
+        return rcpt.iter_block_receipts(self.url, blocks, batch_size, max_workers, session=self.session)
+
+    def get_block_receipts(self, block_number : int) -> List[Optional[TransactionReceipt]]:
+        """
+        Get the receipts of the transactions of the block, in order.
+
+        Parameters
+        ----------
+        block_number : int
+
+        Returns
+        -------
+        list[TransactionReceipt]
+        """
+        return next(self.iter_block_receipts(block_number, block_number))[1]
+
     def get_transaction_by_block(self, transaction_index : int, block_number : Optional[int] = None, block_hash : Optional[str] = None) -> Transaction:
         """
         Get the transaction by the block specifier
@@ -893,7 +1357,27 @@ class HarmonyAPI(object):
             resp = val.get_all_validator_information(self.url, page_number, self.session)
         if resp.error is not None:
             raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
-        
+        return resp.result
+
+    def validator_stats(self, page_number : Optional[int] = -1, block_number : Optional[int] = None) -> "ValidatorStats":
+        """
+        Get detailed information about all the validators, flattened into NumPy arrays
+        for computing aggregates. Requires numpy.
+
+        Parameters
+        ----------
+        page_number : int, optional
+            The page number of validators to get (100 results per page)
+            with -1 getting all results, defaults to -1
+        block_number : int, optional
+            The block number to optionally filter on
+
+        Returns
+        -------
+        ValidatorStats
+        """
+        from .validator_stats import ValidatorStats
+        return ValidatorStats(self.get_all_validator_information(page_number, block_number))
 
     def get_cx_reciept(self, cx_receipt_hash : str) -> CXReceipt:
         """
@@ -1049,6 +1533,40 @@ class HarmonyAPI(object):
         if resp.error is not None:
             raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
         return resp.result
+
+    def batch(self, calls : Sequence[Tuple[str, Optional[BaseModel]]], batch_size : Optional[int] = 100, return_errors : Optional[bool] = False) -> List[Any]:
+        """
+        Make many calls to the node using JSON-RPC batch requests.
+
+        The calls are split into batches of `batch_size`, and each batch is sent as a single request.
+
+        Parameters
+        ----------
+        calls : list[tuple[str, BaseModel or None]]
+            The (method, parameters) pairs to call, e.g. ("hmyv2_getBalance", AddressParameters(address=address))
+        batch_size : int, optional
+            The maximum number of calls to send in a single request; defaults to 100
+        return_errors : bool, optional
+            If True, a call the node responds to with an error gets a HarmonyNodeError in its place
+            in the results instead of it being raised; defaults to False
+
+        Returns
+        -------
+        list[Any]
+            The result of each call, in the order of the calls
+        """
+        calls = list(calls)
+        results = []
+        for i in range(0, len(calls), batch_size):
+            for resp in batch_call(self.url, calls[i:i + batch_size], self.session):
+                if resp.error is not None:
+                    err = HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+                    if not return_errors:
+                        raise err
+                    results.append(err)
+                else:
+                    results.append(resp.result)
+        return results
     
 
     
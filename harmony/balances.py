@@ -0,0 +1,48 @@
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+
+from .bulk import iter_batched_calls
+from .models import AddressBlockNumberParameters, AddressParameters
+
+def _balance_calls(addresses : List[str], block_number : Optional[int]) -> List[Tuple[str, Any]]:
+    if block_number is None:
+        return [("hmyv2_getBalance", AddressParameters(address=address)) for address in addresses]
+    return [("hmyv2_getBalanceByBlockNumber", AddressBlockNumberParameters(address=address, block_number=block_number)) for address in addresses]
+
+def iter_balances(api_url : str, addresses : Iterable[str], block_number : Optional[int] = None, batch_size : Optional[int] = 100, max_workers : Optional[int] = 4, max_retries : Optional[int] = 3, retry_backoff : Optional[float] = 0.5, session : Optional[requests.Session] = None) -> Iterator[Tuple[str, int]]:
+    """
+    Get the balance of many addresses, with the calls sent in concurrent JSON-RPC batches.
+
+    The addresses are read lazily, so at most about `2 * max_workers * batch_size` of them are held
+    in memory, and the balances are yielded in the order of the addresses as soon as
+    every batch before them has arrived. Batches that fail are retried after a backoff, and only
+    the calls of a batch the node answered with an error are sent again.
+
+    Parameters
+    ----------
+    api_url : str
+    addresses : Iterable[str]
+        The wallet addresses
+    block_number : int, optional
+        The block to get the balances at, defaults to the latest block
+    batch_size : int, optional
+        The number of calls per batch request; defaults to 100
+    max_workers : int, optional
+        The maximum number of batches in flight at once; defaults to 4
+    max_retries : int, optional
+        How many times to retry a failing call before giving up; defaults to 3
+    retry_backoff : float, optional
+        The delay before the first retry in seconds, doubled on each further retry; defaults to 0.5
+    session : requests.Session, optional
+
+    Returns
+    -------
+    result : Iterator[tuple[str, int]]
+        The (address, balance) pairs
+
+    Raises
+    ------
+    HarmonyNodeError, requests.RequestException: If a call still fails after `max_retries` retries
+    """
+    return iter_batched_calls(api_url, addresses, lambda batch: _balance_calls(batch, block_number), batch_size, max_workers, max_retries, retry_backoff, session)
@@ -0,0 +1,179 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from .blocks import get_blocks_from_range
+from .exceptions import BlockGapError, HarmonyNodeError
+from .models import Block
+
+class AdaptiveChunkSize(object):
+
+    def __init__(self, initial : Optional[int] = 50, minimum : Optional[int] = 1, maximum : Optional[int] = 1000, target_seconds : Optional[float] = 2.0, target_bytes : Optional[int] = 4 * 1024 * 1024) -> None:
+        """
+        Picks how many blocks to request at once from the latency and
+        payload size observed on the chunks fetched so far.
+
+        The size moves towards the number of blocks expected to take `target_seconds`
+        and weigh `target_bytes`, whichever is smaller, but at most doubles per observation.
+
+        Parameters
+        ----------
+        initial : int, optional
+            The size of the first chunks, defaults to 50
+        minimum : int, optional
+            The smallest chunk size, defaults to 1
+        maximum : int, optional
+            The largest chunk size, defaults to 1000
+        target_seconds : float, optional
+            The latency to aim for per chunk, defaults to 2 seconds
+        target_bytes : int, optional
+            The payload size to aim for per chunk, defaults to 4 MiB
+        """
+        self._minimum = minimum
+        self._maximum = maximum
+        self._target_seconds = target_seconds
+        self._target_bytes = target_bytes
+        self._size = max(minimum, min(maximum, initial))
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def observe(self, n_blocks : int, seconds : float, n_bytes : int) -> None:
+        """
+        Update the chunk size with the measurements of a fetched chunk.
+
+        Parameters
+        ----------
+        n_blocks : int
+            The number of blocks in the chunk
+        seconds : float
+            How long the chunk took to fetch
+        n_bytes : int
+            The size of the blocks in the chunk in bytes
+        """
+        if n_blocks <= 0:
+            return
+        ideal = float(self._maximum)
+        if seconds > 0:
+            ideal = min(ideal, self._target_seconds * n_blocks / seconds)
+        if n_bytes > 0:
+            ideal = min(ideal, self._target_bytes * n_blocks / n_bytes)
+        ideal = min(ideal, 2 * self._size)
+        self._size = int(max(self._minimum, min(self._maximum, ideal)))
+
+    def shrink(self) -> None:
+        """
+        Halve the chunk size, used after a chunk failed.
+        """
+        self._size = max(self._minimum, self._size // 2)
+
+def _check_chunk(blocks : List[Block], starting_block_number : int, ending_block_number : int) -> None:
+    """
+    Raise if the node left out blocks of the chunk, as it does for the blocks past its head.
+    """
+    if [b.number for b in blocks] != list(range(starting_block_number, ending_block_number + 1)):
+        raise BlockGapError("Expected blocks {} to {} from the node, got {} blocks".format(starting_block_number, ending_block_number, len(blocks)))
+
+def _fetch_chunk(api_url : str, starting_block_number : int, ending_block_number : int, include_signer_addresses : bool, include_transactions : bool, include_staking_transactions : bool, delay : float, session : Optional[requests.Session]) -> Tuple[List[Block], float, int]:
+    if delay > 0:
+        time.sleep(delay)
+    start = time.monotonic()
+    resp = get_blocks_from_range(api_url, starting_block_number, ending_block_number, include_signer_addresses, include_transactions, include_staking_transactions, session)
+    elapsed = time.monotonic() - start
+    if resp.error is not None:
+        raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+    blocks = resp.result or []
+    _check_chunk(blocks, starting_block_number, ending_block_number)
+    return blocks, elapsed, sum(b.size for b in blocks)
+
+def iter_blocks_from_range(api_url : str, starting_block_number : int, ending_block_number : int, include_signer_addresses : Optional[bool] = False, include_transactions : Optional[bool] = False, include_staking_transactions : Optional[bool] = False, max_workers : Optional[int] = 4, max_retries : Optional[int] = 3, retry_backoff : Optional[float] = 0.5, chunk_size : Optional[AdaptiveChunkSize] = None, session : Optional[requests.Session] = None) -> Iterator[Block]:
+    """
+    Get the blocks in the given range, split into chunks that are fetched concurrently.
+
+    Blocks are yielded in order as soon as every chunk before them has arrived.
+    A failed chunk is split in half and retried after a backoff, and so is a chunk
+    the node left blocks out of, so no block of the range is silently skipped.
+
+    Parameters
+    ----------
+    api_url : str
+    starting_block_number : int
+        The block number of the first block in the range
+    ending_block_number : int
+        The block number of the last block in the range
+    include_signer_addresses : bool, optional
+        Whether to include the wallet addresses of the block signers; defaults to False
+    include_transactions : bool, optional
+        Whether to include the full transaction data on the block; defaults to False
+    include_staking_transactions : bool, optional
+        Whether to include the full staking transaction data on the block; defaults to False
+    max_workers : int, optional
+        The maximum number of chunks in flight at once; defaults to 4
+    max_retries : int, optional
+        How many times to retry a failing chunk before giving up; defaults to 3
+    retry_backoff : float, optional
+        The delay before the first retry in seconds, doubled on each further retry; defaults to 0.5
+    chunk_size : AdaptiveChunkSize, optional
+        The chunk sizing policy, defaults to AdaptiveChunkSize()
+    session : requests.Session, optional
+
+    Returns
+    -------
+    result : Iterator[Block]
+
+    Raises
+    ------
+    HarmonyNodeError, requests.RequestException: If a chunk still fails after `max_retries` retries
+    BlockGapError: If the node still leaves out blocks of a chunk after `max_retries` retries,
+        e.g. because the range goes past the head of the chain
+    """
+    if chunk_size is None:
+        chunk_size = AdaptiveChunkSize()
+    opts = (include_signer_addresses, include_transactions, include_staking_transactions)
+    pending = {}
+    arrived : Dict[int, Tuple[int, List[Block]]] = {}
+    next_start = starting_block_number
+    next_yield = starting_block_number
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+
+    def submit(start : int, end : int, attempt : int) -> None:
+        delay = retry_backoff * 2 ** (attempt - 1) if attempt else 0
+        future = pool.submit(_fetch_chunk, api_url, start, end, *opts, delay, session)
+        pending[future] = (start, end, attempt)
+
+    try:
+        while next_yield <= ending_block_number:
+            while len(pending) < max_workers and next_start <= ending_block_number and len(arrived) < 2 * max_workers:
+                end = min(ending_block_number, next_start + chunk_size.size - 1)
+                submit(next_start, end, 0)
+                next_start = end + 1
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                start, end, attempt = pending.pop(future)
+                try:
+                    blocks, seconds, n_bytes = future.result()
+                except (HarmonyNodeError, requests.RequestException, ValueError):
+                    if attempt >= max_retries:
+                        raise
+                    chunk_size.shrink()
+                    if end > start:
+                        middle = (start + end) // 2
+                        submit(start, middle, attempt + 1)
+                        submit(middle + 1, end, attempt + 1)
+                    else:
+                        submit(start, end, attempt + 1)
+                    continue
+                chunk_size.observe(len(blocks), seconds, n_bytes)
+                arrived[start] = (end, blocks)
+            while next_yield in arrived:
+                end, blocks = arrived.pop(next_yield)
+                for block in blocks:
+                    yield block
+                next_yield = end + 1
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
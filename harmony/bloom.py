@@ -0,0 +1,207 @@
+import functools
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import requests
+
+from .block_range import AdaptiveChunkSize, iter_blocks_from_range
+from .models import Block
+
+BLOOM_BYTES = 256
+
+_MASK = (1 << 64) - 1
+
+_ROUND_CONSTANTS = [
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008
+]
+
+# The rotation of the lane at x + 5 * y
+_ROTATIONS = [0, 1, 62, 28, 27, 36, 44, 6, 55, 20, 3, 10, 43, 25, 39, 41, 45, 15, 21, 8, 18, 2, 61, 56, 14]
+
+_BECH32_CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+
+def _rotate(lane : int, n : int) -> int:
+    return ((lane << n) | (lane >> (64 - n))) & _MASK if n else lane
+
+def _keccak_f(state : List[int]) -> List[int]:
+    for constant in _ROUND_CONSTANTS:
+        c = [state[x] ^ state[x + 5] ^ state[x + 10] ^ state[x + 15] ^ state[x + 20] for x in range(5)]
+        d = [c[(x - 1) % 5] ^ _rotate(c[(x + 1) % 5], 1) for x in range(5)]
+        b = [0] * 25
+        for i in range(25):
+            x, y = i % 5, i // 5
+            b[y + 5 * ((2 * x + 3 * y) % 5)] = _rotate(state[i] ^ d[x], _ROTATIONS[i])
+        state = [b[i] ^ (~b[(i + 1) % 5 + i - i % 5] & b[(i + 2) % 5 + i - i % 5]) for i in range(25)]
+        state[0] ^= constant
+    return state
+
+def keccak256(data : bytes) -> bytes:
+    """
+    The Keccak-256 hash of the data, as used by the EVM (not the standardized SHA3-256).
+
+    A plain Python implementation, meant for hashing the few items of a filter, not bulk data.
+    """
+    rate = 136
+    padded = bytearray(data) + b"\x01" + bytes(-(len(data) + 1) % rate)
+    padded[-1] |= 0x80
+    state = [0] * 25
+    for offset in range(0, len(padded), rate):
+        for i in range(rate // 8):
+            state[i] ^= int.from_bytes(padded[offset + 8 * i:offset + 8 * i + 8], "little")
+        state = _keccak_f(state)
+    return b"".join(lane.to_bytes(8, "little") for lane in state[:4])
+
+def _to_bytes(value : Union[str, bytes]) -> bytes:
+    """
+    The bytes of a hex string, or of the 20 byte address behind a bech32 'one1...' address.
+    """
+    if isinstance(value, bytes):
+        return value
+    value = value.lower()
+    if value.startswith("0x"):
+        return bytes.fromhex(value[2:])
+    _, data = value.rsplit("1", 1)
+    acc, bits, out = 0, 0, bytearray()
+    # The last 6 characters are the checksum
+    for char in data[:-6]:
+        acc = (acc << 5) | _BECH32_CHARSET.index(char)
+        bits += 5
+        if bits >= 8:
+            bits -= 8
+            out.append((acc >> bits) & 0xFF)
+    return bytes(out)
+
+@functools.lru_cache(maxsize=4096)
+def bloom_bits(item : Union[str, bytes]) -> Tuple[Tuple[int, int], ...]:
+    """
+    The three bits an item sets in a 2048 bit logs bloom, as (byte index, bit mask) pairs.
+
+    Parameters
+    ----------
+    item : str or bytes
+        A contract address, as hex or bech32, or a 32 byte hex topic
+    """
+    digest = keccak256(_to_bytes(item))
+    bits = []
+    for i in (0, 2, 4):
+        bit = ((digest[i] << 8) | digest[i + 1]) & 2047
+        bits.append((BLOOM_BYTES - 1 - bit // 8, 1 << (bit % 8)))
+    return tuple(bits)
+
+def decode_blooms(blooms : Sequence[str]) -> np.ndarray:
+    """
+    Decode the hex logs blooms of a batch of blocks into an (n, 256) uint8 array.
+
+    A bloom that isn't 256 bytes decodes to all bits set, so that it is never ruled out.
+    """
+    full = "f" * (2 * BLOOM_BYTES)
+    digits = []
+    for bloom in blooms:
+        bloom = bloom[2:] if bloom.startswith("0x") else bloom
+        digits.append(bloom if len(bloom) == 2 * BLOOM_BYTES else full)
+    return np.frombuffer(bytes.fromhex("".join(digits)), dtype=np.uint8).reshape(len(digits), BLOOM_BYTES)
+
+class LogFilter(object):
+
+    def __init__(self, addresses : Optional[Union[str, Sequence[str]]] = None, topics : Optional[Sequence[Optional[Union[str, Sequence[str]]]]] = None) -> None:
+        """
+        Log criteria tested against the logs blooms of blocks, with the semantics of `eth_getLogs`:
+        a log matches if it was emitted by one of the addresses, and for each position of `topics`,
+        its topic is one of the alternatives given there.
+
+        A bloom can't tell which log set which bits or at which position a topic was, and has
+        false positives, so a block that matches may hold no matching log; but a block that
+        doesn't match holds none, and its receipts never need to be fetched.
+
+        Parameters
+        ----------
+        addresses : str or list[str], optional
+            The contract addresses, as hex or bech32; defaults to any address
+        topics : list[str or list[str] or None], optional
+            The topics by position, each either a topic, a list of alternative topics,
+            or None for any topic; defaults to any topics
+        """
+        groups = []
+        if addresses:
+            groups.append([addresses] if isinstance(addresses, str) else list(addresses))
+        for topic in topics or []:
+            if topic:
+                groups.append([topic] if isinstance(topic, (str, bytes)) else list(topic))
+        self._groups = []
+        for items in groups:
+            bits = np.array([bloom_bits(item) for item in items], dtype=np.int64)
+            self._groups.append((bits[:, :, 0], bits[:, :, 1].astype(np.uint8)))
+
+    def match(self, blooms : np.ndarray) -> np.ndarray:
+        """
+        Which of the decoded blooms, from `decode_blooms`, may hold a matching log.
+
+        Returns
+        -------
+        numpy.ndarray
+            A boolean mask, one entry per bloom
+        """
+        mask = np.ones(len(blooms), dtype=bool)
+        for byte_indices, bit_masks in self._groups:
+            # (n, alternatives, 3): an alternative is in the bloom if all three of its bits are set
+            selected = blooms[:, byte_indices]
+            mask &= ((selected & bit_masks) == bit_masks).all(axis=2).any(axis=1)
+        return mask
+
+    def filter_blocks(self, blocks : Sequence[Block]) -> List[Block]:
+        """
+        The blocks whose logs bloom may hold a matching log.
+        """
+        if not blocks:
+            return []
+        mask = self.match(decode_blooms([block.logsBloom for block in blocks]))
+        return [block for block, keep in zip(blocks, mask) if keep]
+
+def _batches(blocks : Iterable[Block], batch_size : int) -> Iterator[List[Block]]:
+    batch = []
+    for block in blocks:
+        batch.append(block)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def iter_candidate_blocks(api_url : str, starting_block_number : int, ending_block_number : int, log_filter : LogFilter, batch_size : Optional[int] = 1000, max_workers : Optional[int] = 4, max_retries : Optional[int] = 3, chunk_size : Optional[AdaptiveChunkSize] = None, session : Optional[requests.Session] = None) -> Iterator[Block]:
+    """
+    Iterate over the blocks of the range whose logs bloom may hold a log matching the filter.
+
+    The blocks are fetched without their transactions, concurrently, and their blooms are tested
+    `batch_size` blocks at a time.
+
+    Parameters
+    ----------
+    api_url : str
+    starting_block_number : int
+        The block number of the first block in the range
+    ending_block_number : int
+        The block number of the last block in the range
+    log_filter : LogFilter
+    batch_size : int, optional
+        How many blocks to test at once; defaults to 1000
+    max_workers : int, optional
+        The maximum number of chunks fetched at once; defaults to 4
+    max_retries : int, optional
+        How many times to retry a failing chunk; defaults to 3
+    chunk_size : AdaptiveChunkSize, optional
+        The chunk sizing policy, defaults to AdaptiveChunkSize()
+    session : requests.Session, optional
+
+    Returns
+    -------
+    Iterator[Block]
+        The candidate blocks, in order
+    """
+    blocks = iter_blocks_from_range(api_url, starting_block_number, ending_block_number, max_workers=max_workers, max_retries=max_retries, chunk_size=chunk_size, session=session)
+    for batch in _batches(blocks, batch_size):
+        yield from log_filter.filter_blocks(batch)
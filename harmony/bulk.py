@@ -0,0 +1,143 @@
+import heapq
+import itertools
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel
+import requests
+
+from .endpoints.batch import batch_call
+from .exceptions import HarmonyNodeError
+
+T = TypeVar("T")
+
+Calls = Callable[[List[T]], List[Tuple[str, Optional[BaseModel]]]]
+
+def _node_error(error : Dict[str, Any]) -> HarmonyNodeError:
+    return HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(error["code"], error["message"]))
+
+def _fetch_batch(api_url : str, calls : List[Tuple[str, Optional[BaseModel]]], session : Optional[requests.Session]) -> List[Any]:
+    """
+    The result of each call, or the error the node answered with.
+    """
+    return [_node_error(resp.error) if resp.error is not None else resp.result for resp in batch_call(api_url, calls, session)]
+
+class _Chunk(object):
+
+    def __init__(self, items : List[Any]) -> None:
+        self.items = items
+        self.results : List[Any] = [None] * len(items)
+        self.missing = len(items)
+
+def iter_batched_calls(api_url : str, items : Iterable[T], calls : Calls, batch_size : Optional[int] = 100, max_workers : Optional[int] = 4, max_retries : Optional[int] = 3, retry_backoff : Optional[float] = 0.5, session : Optional[requests.Session] = None) -> Iterator[Tuple[T, Any]]:
+    """
+    Make one call per item, with the calls sent in concurrent JSON-RPC batches.
+
+    The items are read lazily, so at most about `2 * max_workers * batch_size` of them are held
+    in memory, and the results are yielded in the order of the items as soon as
+    every batch before them has arrived. Batches that fail are retried after a backoff, and only
+    the calls of a batch the node answered with an error are sent again. The backoff is waited out
+    without holding one of the `max_workers` slots.
+
+    Retries happen at two levels. Each batch request goes through `post_request`, which retries it
+    on timeouts, connection errors, 5xx/429 statuses and transient JSON-RPC errors as the `RetryPolicy`
+    of the session says (twice with `DEFAULT_RETRY_POLICY`, never through a `PooledSession`, which
+    fails over instead). Whatever still fails after that, the whole batch or the calls the node answered
+    with an error, is sent again here up to `max_retries` times, so a call is sent at most
+    `(max_retries + 1) * (retry_policy.max_retries + 1)` times. To leave retrying to this function alone,
+    pass a session with `RetryPolicy(max_retries=0)` (see `harmony.utils.sessions.ResilientSession`).
+
+    Parameters
+    ----------
+    api_url : str
+    items : Iterable
+    calls : Callable[[list], list[tuple[str, BaseModel]]]
+        The (method, parameters) pairs of the calls for a batch of items, one per item
+    batch_size : int, optional
+        The number of calls per batch request; defaults to 100
+    max_workers : int, optional
+        The maximum number of batches in flight at once; defaults to 4
+    max_retries : int, optional
+        How many times to retry a failing call before giving up; defaults to 3
+    retry_backoff : float, optional
+        The delay before the first retry in seconds, doubled on each further retry; defaults to 0.5
+    session : requests.Session, optional
+
+    Returns
+    -------
+    result : Iterator[tuple]
+        The (item, result) pairs
+
+    Raises
+    ------
+    HarmonyNodeError, requests.RequestException: If a call still fails after `max_retries` retries
+    """
+    items = iter(items)
+    pending = {}
+    chunks : Dict[int, _Chunk] = {}
+    next_chunk = 0
+    next_yield = 0
+    exhausted = False
+    # The (due time, chunk index, positions, attempt) of the retries waiting out their backoff
+    delayed : List[Tuple[float, int, List[int], int]] = []
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+
+    def submit(index : int, positions : List[int], attempt : int) -> None:
+        batch = [chunks[index].items[i] for i in positions]
+        future = pool.submit(_fetch_batch, api_url, calls(batch), session)
+        pending[future] = (index, positions, attempt)
+
+    def retry(index : int, positions : List[int], attempt : int) -> None:
+        heapq.heappush(delayed, (time.monotonic() + retry_backoff * 2 ** (attempt - 1), index, positions, attempt))
+
+    try:
+        while True:
+            while delayed and delayed[0][0] <= time.monotonic() and len(pending) < max_workers:
+                submit(*heapq.heappop(delayed)[1:])
+            while not exhausted and len(pending) < max_workers and len(chunks) < 2 * max_workers:
+                batch = list(itertools.islice(items, batch_size))
+                if not batch:
+                    exhausted = True
+                    break
+                chunks[next_chunk] = _Chunk(batch)
+                submit(next_chunk, list(range(len(batch))), 0)
+                next_chunk += 1
+            if not pending and not delayed:
+                break
+            # With every slot taken, a retry that is due waits for a batch to finish
+            timeout = max(delayed[0][0] - time.monotonic(), 0) if delayed and len(pending) < max_workers else None
+            if not pending:
+                time.sleep(timeout)
+                continue
+            finished, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index, positions, attempt = pending.pop(future)
+                chunk = chunks[index]
+                try:
+                    results = future.result()
+                except (HarmonyNodeError, requests.RequestException, ValueError):
+                    if attempt >= max_retries:
+                        raise
+                    retry(index, positions, attempt + 1)
+                    continue
+                failed = []
+                for position, result in zip(positions, results):
+                    if isinstance(result, HarmonyNodeError):
+                        if attempt >= max_retries:
+                            raise result
+                        failed.append(position)
+                    else:
+                        chunk.results[position] = result
+                        chunk.missing -= 1
+                if failed:
+                    retry(index, failed, attempt + 1)
+            while next_yield in chunks and chunks[next_yield].missing == 0:
+                chunk = chunks.pop(next_yield)
+                for pair in zip(chunk.items, chunk.results):
+                    yield pair
+                next_yield += 1
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
@@ -0,0 +1,386 @@
+import asyncio
+import inspect
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Union
+
+class BlockCache(object):
+
+    def __init__(self, max_blocks : Optional[int] = 1024) -> None:
+        """
+        An in memory cache of data about finalized blocks.
+
+        Blocks on Harmony are final once committed, so anything fetched about a block
+        by its number or hash never goes stale. Entries are kept per block number, with
+        the block hash pointing at the same entry, and the least recently used blocks
+        are evicted once more than `max_blocks` blocks are cached.
+
+        The cache is safe to share between threads. Cached models are shared between
+        callers and should not be modified.
+
+        Parameters
+        ----------
+        max_blocks : int, optional
+            The maximum number of blocks to keep data for; defaults to 1024
+        """
+        self._max_blocks = max_blocks
+        self._entries : "OrderedDict[int, Dict[Hashable, Any]]" = OrderedDict()
+        self._numbers : Dict[str, int] = {}
+        self._hashes : Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _resolve(self, block_number : Optional[int], block_hash : Optional[str]) -> Optional[int]:
+        if block_number is not None:
+            return block_number
+        if block_hash is not None:
+            return self._numbers.get(block_hash)
+        return None
+
+    def get(self, key : Hashable, block_number : Optional[int] = None, block_hash : Optional[str] = None) -> Optional[Any]:
+        """
+        Get a cached value about the block with the given number or hash.
+
+        Parameters
+        ----------
+        key : Hashable
+            What is cached about the block, e.g. ("header",)
+        block_number : int, optional
+        block_hash : str, optional
+
+        Returns
+        -------
+        Any
+            The cached value, or None if it is not cached
+        """
+        with self._lock:
+            number = self._resolve(block_number, block_hash)
+            entry = self._entries.get(number)
+            if entry is None or key not in entry:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(number)
+            self.hits += 1
+            return entry[key]
+
+    def put(self, key : Hashable, value : Any, block_number : int, block_hash : Optional[str] = None) -> None:
+        """
+        Cache a value about the block with the given number.
+
+        Parameters
+        ----------
+        key : Hashable
+            What is cached about the block, e.g. ("header",)
+        value : Any
+        block_number : int
+        block_hash : str, optional
+            The hash of the block, so the value can be looked up by hash as well
+        """
+        with self._lock:
+            entry = self._entries.get(block_number)
+            if entry is None:
+                entry = self._entries[block_number] = {}
+            self._entries.move_to_end(block_number)
+            entry[key] = value
+            if block_hash is not None:
+                self._numbers[block_hash] = block_number
+                self._hashes[block_number] = block_hash
+            while len(self._entries) > self._max_blocks:
+                evicted, _ = self._entries.popitem(last=False)
+                evicted_hash = self._hashes.pop(evicted, None)
+                if evicted_hash is not None:
+                    self._numbers.pop(evicted_hash, None)
+
+    def discard(self, block_number : int) -> None:
+        """
+        Drop everything cached about the block with the given number.
+        """
+        with self._lock:
+            self._entries.pop(block_number, None)
+            block_hash = self._hashes.pop(block_number, None)
+            if block_hash is not None:
+                self._numbers.pop(block_hash, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._numbers.clear()
+            self._hashes.clear()
+
+IMMUTABLE_METHODS = frozenset((
+    "hmyv2_getBlocks",
+    "hmyv2_getBlockByNumber",
+    "hmyv2_getBlockByHash",
+    "hmyv2_getBlockSigners",
+    "hmyv2_getBlockSignersKeys",
+    "hmyv2_getBlockTransactionCountByNumber",
+    "hmyv2_getBlockTransactionCountByHash",
+    "hmyv2_getHeaderByNumber",
+    "hmyv2_getTransactionByHash",
+    "hmyv2_getTransactionByBlockNumberAndIndex",
+    "hmyv2_getTransactionByBlockHashAndIndex",
+    "hmyv2_getStakingTransactionByHash",
+    "hmyv2_getStakingTransactionByBlockNumberAndIndex",
+    "hmyv2_getStakingTransactionByBlockHashAndIndex",
+    "hmyv2_getTransactionReceipt",
+    "hmyv2_getCXReceiptByHash",
+    "hmyv2_getBalanceByBlockNumber",
+    "hmyv2_getDelegationsByDelegatorByBlockNumber",
+    "hmyv2_getAllValidatorInformationByBlockNumber"
+))
+
+_ZERO_HASH = "0x" + "0" * 64
+
+def is_final(method : str, params : Any, result : Any) -> bool:
+    """
+    Check that a result can no longer change.
+
+    Nothing is known about a block past the head of the chain yet, and
+    a transaction still in the pool has no block.
+    """
+    if result is None:
+        return False
+    if method == "hmyv2_getBlocks":
+        return isinstance(result, list) and len(result) == params[1] - params[0] + 1
+    if isinstance(result, dict) and "blockHash" in result:
+        return result.get("blockNumber") is not None and result["blockHash"] != _ZERO_HASH
+    return True
+
+class ResponseCache(object):
+
+    def __init__(self, path : str, methods : Optional[frozenset] = IMMUTABLE_METHODS, namespace : Optional[str] = None) -> None:
+        """
+        A SQLite backed cache of the results of RPC calls that can't change,
+        which survives process restarts.
+
+        Results are keyed by the method and its canonicalized parameters. Since the same
+        call has different results on different networks, keys are namespaced by the url
+        the call is sent to, unless a `namespace` shared between the urls is given.
+
+        The cache is safe to share between threads, and between processes using the same file.
+
+        Parameters
+        ----------
+        path : str
+            The path to the SQLite database file, ':memory:' for a cache that isn't persisted
+        methods : frozenset[str], optional
+            The methods to cache results for, defaults to IMMUTABLE_METHODS
+        namespace : str, optional
+            The namespace for the keys, defaults to the url of each call
+        """
+        self._methods = methods
+        self._namespace = namespace
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, method TEXT NOT NULL, result TEXT NOT NULL, created REAL NOT NULL)")
+        self.hits = 0
+        self.misses = 0
+
+    def cacheable(self, method : str) -> bool:
+        return method in self._methods
+
+    def key(self, url : str, method : str, params : Any) -> str:
+        namespace = self._namespace if self._namespace is not None else url
+        return "{}|{}|{}".format(namespace, method, json.dumps(params, sort_keys=True, separators=(",", ":")))
+
+    def get(self, url : str, method : str, params : Any) -> Optional[str]:
+        """
+        Get the cached json encoded result of the call.
+
+        Returns
+        -------
+        str
+            The json encoded result, or None if it is not cached
+        """
+        key = self.key(url, method, params)
+        with self._lock:
+            row = self._conn.execute("SELECT result FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def put(self, url : str, method : str, params : Any, result : Any) -> bool:
+        """
+        Cache the result of the call, if it is final.
+
+        Returns
+        -------
+        bool
+            Whether the result was cached
+        """
+        if not self.cacheable(method) or not is_final(method, params, result):
+            return False
+        key = self.key(url, method, params)
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)", (key, method, json.dumps(result), time.time()))
+        return True
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+DEFAULT_TTLS = {
+    "current_block_number" : 1.0,
+    "current_gas_price" : 10.0,
+    "node_metadata" : 60.0,
+    "sharding_structure" : 3600.0,
+    "staking_network_info" : 10.0,
+    "current_epoch" : 60.0
+}
+
+class TTLCache(object):
+
+    def __init__(self, ttls : Optional[Dict[str, float]] = None, block_time : Optional[float] = 2.0) -> None:
+        """
+        An in memory cache of volatile chain state that expires after a time to live per key.
+
+        Refreshes are single flight: while a key is being fetched, other callers
+        asking for it wait for that fetch instead of making their own.
+        This holds for threads with `fetch` and for asyncio tasks with `afetch`.
+
+        Parameters
+        ----------
+        ttls : dict[str, float], optional
+            The time to live in seconds per key, updating DEFAULT_TTLS
+        block_time : float, optional
+            The expected time between blocks in seconds, used to estimate
+            when the current epoch ends; defaults to 2
+        """
+        self._ttls = dict(DEFAULT_TTLS)
+        if ttls is not None:
+            self._ttls.update(ttls)
+        self._block_time = block_time
+        self._values : Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self._key_locks : Dict[Hashable, threading.Lock] = {}
+        self._inflight : Dict[Hashable, "asyncio.Future"] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def block_time(self) -> float:
+        return self._block_time
+
+    def ttl(self, key : Hashable) -> float:
+        return self._ttls.get(key, 0.0)
+
+    def get(self, key : Hashable) -> Optional[Any]:
+        """
+        Get the cached value, or None if it isn't cached or has expired.
+        """
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                self.hits += 1
+                return entry[0]
+            return None
+
+    def put(self, key : Hashable, value : Any, ttl : Optional[float] = None) -> None:
+        """
+        Cache the value for `ttl` seconds, defaulting to the time to live configured for the key.
+        """
+        ttl = self.ttl(key) if ttl is None else ttl
+        with self._lock:
+            self._values[key] = (value, time.monotonic() + ttl)
+
+    def invalidate(self, key : Optional[Hashable] = None) -> None:
+        """
+        Drop the cached value of the key, or of every key if None is given.
+        """
+        with self._lock:
+            if key is None:
+                self._values.clear()
+            else:
+                self._values.pop(key, None)
+
+    def fetch(self, key : Hashable, fetch : Callable[[], Any], ttl : Optional[Callable[[Any], float]] = None) -> Any:
+        """
+        Get the cached value, fetching it if it isn't cached or has expired.
+
+        Parameters
+        ----------
+        key : Hashable
+        fetch : Callable[[], Any]
+            Gets the current value
+        ttl : Callable[[Any], float], optional
+            Computes the time to live from the fetched value,
+            defaults to the time to live configured for the key
+
+        Returns
+        -------
+        Any
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self.get(key)
+            if value is not None:
+                return value
+            self.misses += 1
+            value = fetch()
+            self.put(key, value, ttl(value) if ttl is not None else None)
+            return value
+
+    async def afetch(self, key : Hashable, fetch : Callable[[], Awaitable[Any]], ttl : Optional[Callable[[Any], Union[float, Awaitable[float]]]] = None) -> Any:
+        """
+        Get the cached value, fetching it if it isn't cached or has expired.
+
+        The asyncio counterpart of `fetch`.
+
+        Parameters
+        ----------
+        key : Hashable
+        fetch : Callable[[], Awaitable[Any]]
+            Gets the current value
+        ttl : Callable[[Any], float], optional
+            Computes the time to live from the fetched value, may be a coroutine function,
+            defaults to the time to live configured for the key
+
+        Returns
+        -------
+        Any
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            self.misses += 1
+            value = await fetch()
+            seconds = ttl(value) if ttl is not None else None
+            if inspect.isawaitable(seconds):
+                seconds = await seconds
+            self.put(key, value, seconds)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
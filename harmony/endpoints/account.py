@@ -2,7 +2,8 @@ from typing import Optional, Union
 
 import requests
 
-from ..utils.communication import format_api_data, post_request
+from ..utils.communication import build_response, format_api_data, post_request
+from ..utils.codec import loads
 
 from ..models import (
     AddressParameters,
@@ -25,7 +26,7 @@ def getBalance(api_url : str, params : AddressParameters, session : Optional[req
     """
     data = format_api_data("hmyv2_getBalance", params)
     resp = post_request(api_url, data, session)
-    return BalanceResponse(**resp.json())
+    return build_response(BalanceResponse, loads(resp.content), session)
 
 def getBalanceByBlockNumber(api_url : str, params : AddressBlockNumberParameters, session : Optional[requests.Session] = None) -> BalanceResponse:
     """
@@ -35,7 +36,7 @@ def getBalanceByBlockNumber(api_url : str, params : AddressBlockNumberParameters
     """
     data = format_api_data("hmyv2_getBalanceByBlockNumber", params)
     resp = post_request(api_url, data, session)
-    return BalanceResponse(**resp.json())
+    return build_response(BalanceResponse, loads(resp.content), session)
 
 def getStakingTransactionsCount(api_url : str, params : TransactionsCountParameters, session : Optional[requests.Session] = None) -> TransactionCountResponse:
     """
@@ -45,7 +46,7 @@ def getStakingTransactionsCount(api_url : str, params : TransactionsCountParamet
     """
     data = format_api_data("hmyv2_getStakingTransactionsCount", params)
     resp = post_request(api_url, data, session)
-    return TransactionCountResponse(**resp.json())
+    return build_response(TransactionCountResponse, loads(resp.content), session)
 
 def getStakingTransactionsHistory(api_url : str, params : TransactionsHistoryParameters, session : Optional[requests.Session] = None) -> Union[TransactionsHashListResponse, StakingTransactionListResponse]:
     """
@@ -57,8 +58,8 @@ def getStakingTransactionsHistory(api_url : str, params : TransactionsHistoryPar
     resp = post_request(api_url, data, session)
     
     if params.obj.fullTx:
-        return StakingTransactionListResponse(**resp.json())
-    return TransactionsHashListResponse(**resp.json())
+        return build_response(StakingTransactionListResponse, loads(resp.content), session)
+    return build_response(TransactionsHashListResponse, loads(resp.content), session)
 
 def getTransactionsCount(api_url : str, params : TransactionsCountParameters, session : Optional[requests.Session] = None) -> TransactionCountResponse:
     """
@@ -68,7 +69,7 @@ def getTransactionsCount(api_url : str, params : TransactionsCountParameters, se
     """
     data = format_api_data("hmyv2_getTransactionsCount", params)
     resp = post_request(api_url, data, session)
-    return TransactionCountResponse(**resp.json())
+    return build_response(TransactionCountResponse, loads(resp.content), session)
 
 def getTransactionsHistory(api_url : str, params : TransactionsHistoryParameters, session : Optional[requests.Session] = None) -> Union[TransactionsHashListResponse, TransactionListResponse]:
     """
@@ -79,5 +80,5 @@ def getTransactionsHistory(api_url : str, params : TransactionsHistoryParameters
     data = format_api_data("hmyv2_getTransactionsHistory", params)
     resp = post_request(api_url, data, session)
     if params.obj.fullTx:
-        return TransactionListResponse(**resp.json())
-    return TransactionsHashListResponse(**resp.json())
\ No newline at end of file
+        return build_response(TransactionListResponse, loads(resp.content), session)
+    return build_response(TransactionsHashListResponse, loads(resp.content), session)
\ No newline at end of file
@@ -0,0 +1,158 @@
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+import requests
+
+from ..utils.communication import build_response, format_batch_api_data, match_batch_response, post_request
+from ..utils.codec import loads
+
+from ..models import (
+    AddressListResponse,
+    BalanceResponse,
+    BaseResponse,
+    BlockListResponse,
+    BlockNumberResponse,
+    BlockResponse,
+    BLSKeyListResponse,
+    CallResponse,
+    DelegationListResponse,
+    EstimateGasResponse,
+    GasPriceResponse,
+    GetCirculatingSupplyResponse,
+    GetCodeResponse,
+    GetCurrentBadBlocksResponse,
+    GetCurrentStakingErrorSinkResponse,
+    GetCurrentTransactionErrorSinkResponse,
+    GetCurrentUtilityMetricsResponse,
+    GetCXReceiptByHashResponse,
+    GetEpochResponse,
+    GetLastCrossLinksResponse,
+    GetLatestChainHeadersResponse,
+    GetLeaderResponse,
+    GetMedianRawStakeSnapshotResponse,
+    GetNodeMetadataResponse,
+    GetPendingCXReceiptsResponse,
+    GetPoolStatsResponse,
+    GetShardingStructureResponse,
+    GetStakingNetworkInfoResponse,
+    GetStorageAtResponse,
+    GetSuperCommitteesResponse,
+    GetTotalSupplyResponse,
+    GetTransactionReceiptResponse,
+    GetValidatorsResponse,
+    HeaderResponse,
+    PeerCountResponse,
+    ProtocolVersionResponse,
+    ResendCXResponse,
+    SendRawStakingTransactionResponse,
+    SendRawTransactionResponse,
+    StakingTransactionListResponse,
+    StakingTransactionResponse,
+    TransactionCountResponse,
+    TransactionListResponse,
+    TransactionResponse,
+    TransactionsHashListResponse,
+    ValidatorInformationListResponse,
+    ValidatorInformationResponse
+)
+
+RESPONSE_MODELS : Dict[str, Type[BaseResponse]] = {
+    #Account
+    "hmyv2_getBalance" : BalanceResponse,
+    "hmyv2_getBalanceByBlockNumber" : BalanceResponse,
+    "hmyv2_getStakingTransactionsCount" : TransactionCountResponse,
+    "hmyv2_getTransactionsCount" : TransactionCountResponse,
+    #Network
+    "hmyv2_blockNumber" : BlockNumberResponse,
+    "hmyv2_getCirculatingSupply" : GetCirculatingSupplyResponse,
+    "hmyv2_getEpoch" : GetEpochResponse,
+    "hmyv2_getLastCrossLinks" : GetLastCrossLinksResponse,
+    "hmyv2_getLeader" : GetLeaderResponse,
+    "hmyv2_gasPrice" : GasPriceResponse,
+    "hmyv2_getShardingStructure" : GetShardingStructureResponse,
+    "hmyv2_getTotalSupply" : GetTotalSupplyResponse,
+    "hmyv2_getValidators" : GetValidatorsResponse,
+    "hmyv2_getValidatorKeys" : BLSKeyListResponse,
+    #Node
+    "hmyv2_getCurrentBadBlocks" : GetCurrentBadBlocksResponse,
+    "hmyv2_getNodeMetadata" : GetNodeMetadataResponse,
+    "hmyv2_protocolVersion" : ProtocolVersionResponse,
+    "net_peerCount" : PeerCountResponse,
+    #Blocks
+    "hmyv2_getBlocks" : BlockListResponse,
+    "hmyv2_getBlockByNumber" : BlockResponse,
+    "hmyv2_getBlockByHash" : BlockResponse,
+    "hmyv2_getBlockSigners" : AddressListResponse,
+    "hmyv2_getBlockSignersKeys" : BLSKeyListResponse,
+    "hmyv2_getBlockTransactionCountByNumber" : TransactionCountResponse,
+    "hmyv2_getBlockTransactionCountByHash" : TransactionCountResponse,
+    "hmyv2_getHeaderByNumber" : HeaderResponse,
+    "hmyv2_getLatestChainHeaders" : GetLatestChainHeadersResponse,
+    "hmyv2_latestHeader" : HeaderResponse,
+    #Smart contract
+    "hmyv2_call" : CallResponse,
+    "hmyv2_estimateGas" : EstimateGasResponse,
+    "hmyv2_getCode" : GetCodeResponse,
+    "hmyv2_getStorageAt" : GetStorageAtResponse,
+    #Staking
+    "hmyv2_getDelegationsByDelegator" : DelegationListResponse,
+    "hmyv2_getDelegationsByDelegatorByBlockNumber" : DelegationListResponse,
+    "hmyv2_getDelegationsByValidator" : DelegationListResponse,
+    "hmyv2_getAllValidatorAddresses" : AddressListResponse,
+    "hmyv2_getAllValidatorInformation" : ValidatorInformationListResponse,
+    "hmyv2_getAllValidatorInformationByBlockNumber" : ValidatorInformationListResponse,
+    "hmyv2_getElectedValidatorAddresses" : AddressListResponse,
+    "hmyv2_getValidatorInformation" : ValidatorInformationResponse,
+    "hmyv2_getCurrentUtilityMetrics" : GetCurrentUtilityMetricsResponse,
+    "hmyv2_getMedianRawStakeSnapshot" : GetMedianRawStakeSnapshotResponse,
+    "hmyv2_getStakingNetworkInfo" : GetStakingNetworkInfoResponse,
+    "hmyv2_getSuperCommittees" : GetSuperCommitteesResponse,
+    #Cross shard
+    "hmyv2_getCXReceiptByHash" : GetCXReceiptByHashResponse,
+    "hmyv2_getPendingCXReceipts" : GetPendingCXReceiptsResponse,
+    "hmyv2_resendCX" : ResendCXResponse,
+    #Transaction Pool
+    "hmyv2_getPoolStats" : GetPoolStatsResponse,
+    "hmyv2_pendingStakingTransactions" : StakingTransactionListResponse,
+    "hmyv2_pendingTransactions" : TransactionListResponse,
+    #Staking transactions
+    "hmyv2_getCurrentStakingErrorSink" : GetCurrentStakingErrorSinkResponse,
+    "hmyv2_getStakingTransactionByBlockNumberAndIndex" : StakingTransactionResponse,
+    "hmyv2_getStakingTransactionByBlockHashAndIndex" : StakingTransactionResponse,
+    "hmyv2_getStakingTransactionByHash" : StakingTransactionResponse,
+    "hmyv2_sendRawStakingTransaction" : SendRawStakingTransactionResponse,
+    #Transfer
+    "hmyv2_getCurrentTransactionErrorSink" : GetCurrentTransactionErrorSinkResponse,
+    "hmyv2_getTransactionByBlockHashAndIndex" : TransactionResponse,
+    "hmyv2_getTransactionByBlockNumberAndIndex" : TransactionResponse,
+    "hmyv2_getTransactionByHash" : TransactionResponse,
+    "hmyv2_getTransactionReceipt" : GetTransactionReceiptResponse,
+    "hmyv2_sendRawTransaction" : SendRawTransactionResponse
+}
+
+def response_model(method : str, params : Optional[BaseModel] = None) -> Type[BaseResponse]:
+    """
+    Get the response model that the result of the method is parsed into.
+
+    The history methods answer with full transactions or only their hashes
+    depending on the `fullTx` flag of the parameters.
+    Unknown methods fall back to `BaseResponse`.
+    """
+    if method == "hmyv2_getTransactionsHistory":
+        return TransactionListResponse if params.obj.fullTx else TransactionsHashListResponse
+    if method == "hmyv2_getStakingTransactionsHistory":
+        return StakingTransactionListResponse if params.obj.fullTx else TransactionsHashListResponse
+    return RESPONSE_MODELS.get(method, BaseResponse)
+
+def batch_call(api_url : str, calls : Sequence[Tuple[str, Optional[BaseModel]]], session : Optional[requests.Session] = None) -> List[BaseResponse]:
+    """
+    params: list of (method, parameters) pairs
+    result: one response per call, in the order of the calls
+    method: JSON-RPC 2.0 batch
+    """
+    if not calls:
+        return []
+    data = format_batch_api_data(calls)
+    resp = post_request(api_url, data, session)
+    payloads = match_batch_response(loads(resp.content), len(calls))
+    return [build_response(response_model(method, params), payload, session) for (method, params), payload in zip(calls, payloads)]
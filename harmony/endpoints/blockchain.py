@@ -2,7 +2,8 @@ from typing import Optional
 
 import requests
 
-from ..utils.communication import format_api_data, post_request
+from ..utils.communication import build_response, format_api_data, post_request
+from ..utils.codec import loads
 
 from ..models import (
     BlockResponse,
@@ -47,7 +48,7 @@ def blockNumber(api_url : str, session : Optional[requests.Session] = None) -> B
     data = format_api_data("hmyv2_blockNumber", None)
     resp = post_request(api_url, data, session)
     
-    return BlockNumberResponse(**resp.json())
+    return build_response(BlockNumberResponse, loads(resp.content), session)
 
 def getCirculatingSupply(api_url : str, session : Optional[requests.Session] = None) -> GetCirculatingSupplyResponse:
     """
@@ -58,7 +59,7 @@ def getCirculatingSupply(api_url : str, session : Optional[requests.Session] = N
     data = format_api_data("hmyv2_getCirculatingSupply", None)
     resp = post_request(api_url, data, session)
     
-    return GetCirculatingSupplyResponse(**resp.json())
+    return build_response(GetCirculatingSupplyResponse, loads(resp.content), session)
 
 def getEpoch(api_url : str, session : Optional[requests.Session] = None) -> GetEpochResponse:
     """
@@ -69,7 +70,7 @@ def getEpoch(api_url : str, session : Optional[requests.Session] = None) -> GetE
     data = format_api_data("hmyv2_getEpoch", None)
     resp = post_request(api_url, data, session)
     
-    return GetEpochResponse(**resp.json())
+    return build_response(GetEpochResponse, loads(resp.content), session)
 
 def getLastCrossLinks(api_url : str, session : Optional[requests.Session] = None) -> GetLastCrossLinksResponse:
     """
@@ -80,7 +81,7 @@ def getLastCrossLinks(api_url : str, session : Optional[requests.Session] = None
     data = format_api_data("hmyv2_getLastCrossLinks", None)
     resp = post_request(api_url, data, session)
     
-    return GetLastCrossLinksResponse(**resp.json())
+    return build_response(GetLastCrossLinksResponse, loads(resp.content), session)
 
 def getLeader(api_url : str, session : Optional[requests.Session] = None) -> GetLeaderResponse:
     """
@@ -91,7 +92,7 @@ def getLeader(api_url : str, session : Optional[requests.Session] = None) -> Get
     data = format_api_data("hmyv2_getLeader", None)
     resp = post_request(api_url, data, session)
     
-    return GetLeaderResponse(**resp.json())
+    return build_response(GetLeaderResponse, loads(resp.content), session)
 
 def gasPrice(api_url : str, session : Optional[requests.Session] = None) -> GasPriceResponse:
     """
@@ -102,7 +103,7 @@ def gasPrice(api_url : str, session : Optional[requests.Session] = None) -> GasP
     data = format_api_data("hmyv2_gasPrice", None)
     resp = post_request(api_url, data, session)
     
-    return GasPriceResponse(**resp.json())
+    return build_response(GasPriceResponse, loads(resp.content), session)
 
 def getShardingStructure(api_url : str, session : Optional[requests.Session] = None) -> GetShardingStructureResponse:
     """
@@ -113,7 +114,7 @@ def getShardingStructure(api_url : str, session : Optional[requests.Session] = N
     data = format_api_data("hmyv2_getShardingStructure", None)
     resp = post_request(api_url, data, session)
     
-    return GetShardingStructureResponse(**resp.json())
+    return build_response(GetShardingStructureResponse, loads(resp.content), session)
 
 def getTotalSupply(api_url : str, session : Optional[requests.Session] = None) -> GetTotalSupplyResponse:
     """
@@ -124,7 +125,7 @@ def getTotalSupply(api_url : str, session : Optional[requests.Session] = None) -
     data = format_api_data("hmyv2_getTotalSupply", None)
     resp = post_request(api_url, data, session)
     
-    return GetTotalSupplyResponse(**resp.json())
+    return build_response(GetTotalSupplyResponse, loads(resp.content), session)
 
 def getValidators(api_url : str, params : EphochNumberParameters, session : Optional[requests.Session] = None) -> GetValidatorsResponse:
     """
@@ -135,7 +136,7 @@ def getValidators(api_url : str, params : EphochNumberParameters, session : Opti
     data = format_api_data("hmyv2_getValidators", params)
     resp = post_request(api_url, data, session)
     
-    return GetValidatorsResponse(**resp.json())
+    return build_response(GetValidatorsResponse, loads(resp.content), session)
 
 def getValidatorKeys(api_url : str, params : EphochNumberParameters, session : Optional[requests.Session] = None) -> BLSKeyListResponse:
     """
@@ -146,7 +147,7 @@ def getValidatorKeys(api_url : str, params : EphochNumberParameters, session : O
     data = format_api_data("hmyv2_getValidatorKeys", params)
     resp = post_request(api_url, data, session)
     
-    return BLSKeyListResponse(**resp.json())
+    return build_response(BLSKeyListResponse, loads(resp.content), session)
 
 #Node
 
@@ -161,7 +162,7 @@ def getCurrentBadBlocks(api_url : str, session : Optional[requests.Session] = No
     data = format_api_data("hmyv2_getCurrentBadBlocks", None)
     resp = post_request(api_url, data, session)
     
-    return GetCurrentBadBlocksResponse(**resp.json())
+    return build_response(GetCurrentBadBlocksResponse, loads(resp.content), session)
 
 def getNodeMetadata(api_url : str, session : Optional[requests.Session] = None) -> GetNodeMetadataResponse:
     """
@@ -171,7 +172,7 @@ def getNodeMetadata(api_url : str, session : Optional[requests.Session] = None)
     """
     data = format_api_data("hmyv2_getNodeMetadata", None)
     resp = post_request(api_url, data, session)
-    return GetNodeMetadataResponse(**resp.json())
+    return build_response(GetNodeMetadataResponse, loads(resp.content), session)
 
 def protocolVersion(api_url : str, session : Optional[requests.Session] = None) -> ProtocolVersionResponse:
     """
@@ -182,7 +183,7 @@ def protocolVersion(api_url : str, session : Optional[requests.Session] = None)
     data = format_api_data("hmyv2_protocolVersion", None)
     resp = post_request(api_url, data, session)
     
-    return ProtocolVersionResponse(**resp.json())
+    return build_response(ProtocolVersionResponse, loads(resp.content), session)
 
 def peerCount(api_url : str, session : Optional[requests.Session] = None) -> PeerCountResponse:
     """
@@ -193,7 +194,7 @@ def peerCount(api_url : str, session : Optional[requests.Session] = None) -> Pee
     data = format_api_data("net_peerCount", None)
     resp = post_request(api_url, data, session)
     
-    return PeerCountResponse(**resp.json())
+    return build_response(PeerCountResponse, loads(resp.content), session)
 
 #Blocks
 
@@ -206,7 +207,7 @@ def getBlocks(api_url : str, params : BlockListParams, session : Optional[reques
     data = format_api_data("hmyv2_getBlocks", params)
     resp = post_request(api_url, data, session)
     
-    return BlockListResponse(**resp.json())
+    return build_response(BlockListResponse, loads(resp.content), session)
 
 def getBlockByNumber(api_url : str, params : GetBlockByNumberParameters, session : Optional[requests.Session] = None) -> BlockResponse:
     """
@@ -217,7 +218,7 @@ def getBlockByNumber(api_url : str, params : GetBlockByNumberParameters, session
     data = format_api_data("hmyv2_getBlockByNumber", params)
     resp = post_request(api_url, data, session)
     
-    return BlockResponse(**resp.json())
+    return build_response(BlockResponse, loads(resp.content), session)
 
 def getBlockByHash(api_url : str, params : GetBlockByHashParameters, session : Optional[requests.Session] = None) -> BlockResponse:
     """
@@ -228,7 +229,7 @@ def getBlockByHash(api_url : str, params : GetBlockByHashParameters, session : O
     data = format_api_data("hmyv2_getBlockByHash", params)
     resp = post_request(api_url, data, session)
     
-    return BlockResponse(**resp.json())
+    return build_response(BlockResponse, loads(resp.content), session)
 
 def getBlockSigners(api_url : str, params : BlockListParams, session : Optional[requests.Session] = None) -> AddressListResponse:
     """
@@ -239,7 +240,7 @@ def getBlockSigners(api_url : str, params : BlockListParams, session : Optional[
     data = format_api_data("hmyv2_getBlockSigners", params)
     resp = post_request(api_url, data, session)
     
-    return AddressListResponse(**resp.json())
+    return build_response(AddressListResponse, loads(resp.content), session)
 
 def getBlockSignersKeys(api_url : str, params : BlockNumberParameters, session : Optional[requests.Session] = None) -> BLSKeyListResponse:
     """
@@ -250,7 +251,7 @@ def getBlockSignersKeys(api_url : str, params : BlockNumberParameters, session :
     data = format_api_data("hmyv2_getBlockSignersKeys", params)
     resp = post_request(api_url, data, session)
     
-    return BLSKeyListResponse(**resp.json())
+    return build_response(BLSKeyListResponse, loads(resp.content), session)
 
 def getBlockTransactionCountByNumber(api_url : str, params : BlockNumberParameters, session : Optional[requests.Session] = None) -> TransactionCountResponse:
     """
@@ -260,7 +261,7 @@ def getBlockTransactionCountByNumber(api_url : str, params : BlockNumberParamete
     """
     data = format_api_data("hmyv2_getBlockTransactionCountByNumber", params)
     resp = post_request(api_url, data, session)
-    return TransactionCountResponse(**resp.json())
+    return build_response(TransactionCountResponse, loads(resp.content), session)
 
 def getBlockTransactionCountByHash(api_url : str, params : HashParameters, session : Optional[requests.Session] = None) -> TransactionCountResponse:
     """
@@ -270,7 +271,7 @@ def getBlockTransactionCountByHash(api_url : str, params : HashParameters, sessi
     """
     data = format_api_data("hmyv2_getBlockTransactionCountByHash", params)
     resp = post_request(api_url, data, session)
-    return TransactionCountResponse(**resp.json())
+    return build_response(TransactionCountResponse, loads(resp.content), session)
 
 def getHeaderByNumber(api_url : str, params : BlockNumberParameters, session : Optional[requests.Session] = None) -> HeaderResponse:
     """
@@ -280,7 +281,7 @@ def getHeaderByNumber(api_url : str, params : BlockNumberParameters, session : O
     """
     data = format_api_data("hmyv2_getHeaderByNumber", params)
     resp = post_request(api_url, data, session)
-    return HeaderResponse(**resp.json())
+    return build_response(HeaderResponse, loads(resp.content), session)
 
 def getLatestChainHeaders(api_url : str, session : Optional[requests.Session] = None) -> GetLatestChainHeadersResponse:
     """
@@ -290,7 +291,7 @@ def getLatestChainHeaders(api_url : str, session : Optional[requests.Session] =
     """
     data = format_api_data("hmyv2_getLatestChainHeaders", None)
     resp = post_request(api_url, data, session)
-    return GetLatestChainHeadersResponse(**resp.json())
+    return build_response(GetLatestChainHeadersResponse, loads(resp.content), session)
 
 def latestHeader(api_url : str, session : Optional[requests.Session] = None) -> HeaderResponse:
     """
@@ -300,4 +301,4 @@ def latestHeader(api_url : str, session : Optional[requests.Session] = None) ->
     """
     data = format_api_data("hmyv2_latestHeader", None)
     resp = post_request(api_url, data, session)
-    return HeaderResponse(**resp.json())
+    return build_response(HeaderResponse, loads(resp.content), session)
@@ -2,7 +2,8 @@ from typing import Optional
 
 import requests
 
-from ..utils.communication import format_api_data, post_request
+from ..utils.communication import build_response, format_api_data, post_request
+from ..utils.codec import loads
 
 from ..models import (
     CallParameters,
@@ -22,7 +23,7 @@ def call_(api_url : str, params : CallParameters, session : Optional[requests.Se
     """
     data = format_api_data("hmyv2_call", params)
     resp = post_request(api_url, data, session)
-    return CallResponse(**resp.json())
+    return build_response(CallResponse, loads(resp.content), session)
 
 def estimateGas(api_url : str, params : CallParameters, session : Optional[requests.Session] = None) -> EstimateGasResponse:
     """
@@ -32,7 +33,7 @@ def estimateGas(api_url : str, params : CallParameters, session : Optional[reque
     """
     data = format_api_data("hmyv2_estimateGas", params)
     resp = post_request(api_url, data, session)
-    return EstimateGasResponse(**resp.json())
+    return build_response(EstimateGasResponse, loads(resp.content), session)
 
 def getCode(api_url : str, params : GetCodeParameters, session : Optional[requests.Session] = None) -> GetCodeResponse:
     """
@@ -42,7 +43,7 @@ def getCode(api_url : str, params : GetCodeParameters, session : Optional[reques
     """
     data = format_api_data("hmyv2_getCode", params)
     resp = post_request(api_url, data, session)
-    return CallResponse(**resp.json())
+    return build_response(CallResponse, loads(resp.content), session)
 
 
 def getStorageAt(api_url : str, params : GetStorageAtParameters, session : Optional[requests.Session] = None) -> GetStorageAtResponse:
@@ -53,4 +54,4 @@ def getStorageAt(api_url : str, params : GetStorageAtParameters, session : Optio
     """
     data = format_api_data("hmyv2_getStorageAt", params)
     resp = post_request(api_url, data, session)
-    return GetStorageAtResponse(**resp.json())
+    return build_response(GetStorageAtResponse, loads(resp.content), session)
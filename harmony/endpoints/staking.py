@@ -2,7 +2,8 @@ from typing import Optional
 
 import requests
 
-from ..utils.communication import format_api_data, post_request
+from ..utils.communication import build_response, format_api_data, post_request
+from ..utils.codec import loads
 
 from ..models import (
     AddressBlockNumberParameters,
@@ -29,7 +30,7 @@ def getDelegationsByDelegator(api_url : str, params : AddressParameters, session
     """
     data = format_api_data("hmyv2_getDelegationsByDelegator", params)
     resp = post_request(api_url, data, session)
-    return DelegationListResponse(**resp.json())
+    return build_response(DelegationListResponse, loads(resp.content), session)
 
 def getDelegationsByDelegatorByBlockNumber(api_url : str, params : AddressBlockNumberParameters, session : Optional[requests.Session] = None) -> DelegationListResponse:
     """
@@ -39,7 +40,7 @@ def getDelegationsByDelegatorByBlockNumber(api_url : str, params : AddressBlockN
     """
     data = format_api_data("hmyv2_getDelegationsByDelegatorByBlockNumber", params)
     resp = post_request(api_url, data, session)
-    return DelegationListResponse(**resp.json())
+    return build_response(DelegationListResponse, loads(resp.content), session)
 
 def getDelegationsByValidator(api_url : str, params : AddressParameters, session : Optional[requests.Session] = None) -> DelegationListResponse:
     """
@@ -49,7 +50,7 @@ def getDelegationsByValidator(api_url : str, params : AddressParameters, session
     """
     data = format_api_data("hmyv2_getDelegationsByValidator", params)
     resp = post_request(api_url, data, session)
-    return DelegationListResponse(**resp.json())
+    return build_response(DelegationListResponse, loads(resp.content), session)
 
 #Validator
 
@@ -61,7 +62,7 @@ def getAllValidatorAddresses(api_url : str, session : Optional[requests.Session]
     """
     data = format_api_data("hmyv2_getAllValidatorAddresses", None)
     resp = post_request(api_url, data, session)
-    return AddressListResponse(**resp.json())
+    return build_response(AddressListResponse, loads(resp.content), session)
 
 def getAllValidatorInformation(api_url : str, params : GetAllValidatorInformationParameters, session : Optional[requests.Session] = None) -> ValidatorInformationListResponse:
     """
@@ -71,7 +72,7 @@ def getAllValidatorInformation(api_url : str, params : GetAllValidatorInformatio
     """
     data = format_api_data("hmyv2_getAllValidatorInformation", params)
     resp = post_request(api_url, data, session)
-    return ValidatorInformationListResponse(**resp.json())
+    return build_response(ValidatorInformationListResponse, loads(resp.content), session)
 
 def getAllValidatorInformationByBlockNumber(api_url : str, params : GetAllValidatorInformationByBlockNumberParameters, session : Optional[requests.Session] = None) -> ValidatorInformationListResponse:
     """
@@ -81,7 +82,7 @@ def getAllValidatorInformationByBlockNumber(api_url : str, params : GetAllValida
     """
     data = format_api_data("hmyv2_getAllValidatorInformationByBlockNumber", params)
     resp = post_request(api_url, data, session)
-    return ValidatorInformationListResponse(**resp.json())
+    return build_response(ValidatorInformationListResponse, loads(resp.content), session)
 
 def getElectedValidatorAddresses(api_url : str, session : Optional[requests.Session] = None) -> AddressListResponse:
     """
@@ -91,7 +92,7 @@ def getElectedValidatorAddresses(api_url : str, session : Optional[requests.Sess
     """
     data = format_api_data("hmyv2_getElectedValidatorAddresses", None)
     resp = post_request(api_url, data, session)
-    return AddressListResponse(**resp.json())
+    return build_response(AddressListResponse, loads(resp.content), session)
 
 
 def getValidatorInformation(api_url : str, params : AddressParameters, session : Optional[requests.Session] = None) -> ValidatorInformationResponse:
@@ -102,9 +103,7 @@ def getValidatorInformation(api_url : str, params : AddressParameters, session :
     """
     data = format_api_data("hmyv2_getValidatorInformation", params)
     resp = post_request(api_url, data, session)
-    import json
-    print(json.dumps(resp.json()['result'], indent=2))
-    return ValidatorInformationResponse(**resp.json())
+    return build_response(ValidatorInformationResponse, loads(resp.content), session)
 
 #Network
 
@@ -116,7 +115,7 @@ def getCurrentUtilityMetrics(api_url : str, session : Optional[requests.Session]
     """
     data = format_api_data("hmyv2_getCurrentUtilityMetrics", None)
     resp = post_request(api_url, data, session)
-    return GetCurrentUtilityMetricsResponse(**resp.json())
+    return build_response(GetCurrentUtilityMetricsResponse, loads(resp.content), session)
 
 def getMedianRawStakeSnapshot(api_url : str, session : Optional[requests.Session] = None) -> GetMedianRawStakeSnapshotResponse:
     """
@@ -126,7 +125,7 @@ def getMedianRawStakeSnapshot(api_url : str, session : Optional[requests.Session
     """
     data = format_api_data("hmyv2_getMedianRawStakeSnapshot", None)
     resp = post_request(api_url, data, session)
-    return GetMedianRawStakeSnapshotResponse(**resp.json())
+    return build_response(GetMedianRawStakeSnapshotResponse, loads(resp.content), session)
 
 def getStakingNetworkInfo(api_url : str, session : Optional[requests.Session] = None) -> GetStakingNetworkInfoResponse:
     """
@@ -136,7 +135,7 @@ def getStakingNetworkInfo(api_url : str, session : Optional[requests.Session] =
     """
     data = format_api_data("hmyv2_getStakingNetworkInfo", None)
     resp = post_request(api_url, data, session)
-    return GetStakingNetworkInfoResponse(**resp.json())
+    return build_response(GetStakingNetworkInfoResponse, loads(resp.content), session)
 
 def getSuperCommittees(api_url : str, session : Optional[requests.Session] = None) -> GetSuperCommitteesResponse:
     """
@@ -146,4 +145,4 @@ def getSuperCommittees(api_url : str, session : Optional[requests.Session] = Non
     """
     data = format_api_data("hmyv2_getSuperCommittees", None)
     resp = post_request(api_url, data, session)
-    return GetSuperCommitteesResponse(**resp.json())
+    return build_response(GetSuperCommitteesResponse, loads(resp.content), session)
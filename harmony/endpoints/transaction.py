@@ -2,7 +2,8 @@ from typing import Optional
 
 import requests
 
-from ..utils.communication import format_api_data, post_request
+from ..utils.communication import build_response, format_api_data, post_request
+from ..utils.codec import loads
 
 from ..models import (
     HashParameters,
@@ -35,7 +36,7 @@ def getCXReceiptByHash(api_url : str, params : HashParameters, session : Optiona
     """
     data = format_api_data("hmyv2_getCXReceiptByHash", params)
     resp = post_request(api_url, data, session)
-    return GetCXReceiptByHashResponse(**resp.json())
+    return build_response(GetCXReceiptByHashResponse, loads(resp.content), session)
 
 
 def getPendingCXReceipts(api_url : str, session : Optional[requests.Session] = None) -> GetPendingCXReceiptsResponse:
@@ -46,7 +47,7 @@ def getPendingCXReceipts(api_url : str, session : Optional[requests.Session] = N
     """
     data = format_api_data("hmyv2_getPendingCXReceipts", None)
     resp = post_request(api_url, data, session)
-    return GetPendingCXReceiptsResponse(**resp.json())
+    return build_response(GetPendingCXReceiptsResponse, loads(resp.content), session)
 
 
 def resendCX(api_url : str, params : HashParameters, session : Optional[requests.Session] = None) -> ResendCXResponse:
@@ -57,7 +58,7 @@ def resendCX(api_url : str, params : HashParameters, session : Optional[requests
     """
     data = format_api_data("hmyv2_resendCX", params)
     resp = post_request(api_url, data, session)
-    return ResendCXResponse(**resp.json())
+    return build_response(ResendCXResponse, loads(resp.content), session)
 
 #Transaction Pool
 
@@ -70,7 +71,7 @@ def getPoolStats(api_url : str, session : Optional[requests.Session] = None) ->
     data = format_api_data("hmyv2_getPoolStats", None)
     resp = post_request(api_url, data, session)
     
-    return GetPoolStatsResponse(**resp.json())
+    return build_response(GetPoolStatsResponse, loads(resp.content), session)
 
 def pendingStakingTransactions(api_url : str, session : Optional[requests.Session] = None) -> StakingTransactionListResponse:
     """
@@ -80,7 +81,7 @@ def pendingStakingTransactions(api_url : str, session : Optional[requests.Sessio
     """
     data = format_api_data("hmyv2_pendingStakingTransactions", None)
     resp = post_request(api_url, data, session)
-    return StakingTransactionListResponse(**resp.json())
+    return build_response(StakingTransactionListResponse, loads(resp.content), session)
 
 def pendingTransactions(api_url : str, session : Optional[requests.Session] = None) -> TransactionListResponse:
     """
@@ -90,7 +91,7 @@ def pendingTransactions(api_url : str, session : Optional[requests.Session] = No
     """
     data = format_api_data("hmyv2_pendingTransactions", None)
     resp = post_request(api_url, data, session)
-    return TransactionListResponse(**resp.json())
+    return build_response(TransactionListResponse, loads(resp.content), session)
 
 #Staking
 
@@ -102,7 +103,7 @@ def getCurrentStakingErrorSink(api_url : str, session : Optional[requests.Sessio
     """
     data = format_api_data("hmyv2_getCurrentStakingErrorSink", None)
     resp = post_request(api_url, data, session)
-    return GetCurrentStakingErrorSinkResponse(**resp.json())
+    return build_response(GetCurrentStakingErrorSinkResponse, loads(resp.content), session)
 
 def getStakingTransactionByBlockNumberAndIndex(api_url : str, params : BlockNumberAndIndexParameters, session : Optional[requests.Session] = None) -> StakingTransactionResponse:
     """
@@ -112,7 +113,7 @@ def getStakingTransactionByBlockNumberAndIndex(api_url : str, params : BlockNumb
     """
     data = format_api_data("hmyv2_getStakingTransactionByBlockNumberAndIndex", params)
     resp = post_request(api_url, data, session)
-    return StakingTransactionResponse(**resp.json())
+    return build_response(StakingTransactionResponse, loads(resp.content), session)
 
 def getStakingTransactionByBlockHashAndIndex(api_url : str, params : HashAndIndexParameters, session : Optional[requests.Session] = None) -> StakingTransactionResponse:
     """
@@ -122,7 +123,7 @@ def getStakingTransactionByBlockHashAndIndex(api_url : str, params : HashAndInde
     """
     data = format_api_data("hmyv2_getStakingTransactionByBlockHashAndIndex", params)
     resp = post_request(api_url, data, session)
-    return StakingTransactionResponse(**resp.json())
+    return build_response(StakingTransactionResponse, loads(resp.content), session)
 
 def getStakingTransactionByHash(api_url : str, params : HashParameters, session : Optional[requests.Session] = None) -> StakingTransactionResponse:
     """
@@ -132,7 +133,7 @@ def getStakingTransactionByHash(api_url : str, params : HashParameters, session
     """
     data = format_api_data("hmyv2_getStakingTransactionByHash", params)
     resp = post_request(api_url, data, session)
-    return StakingTransactionResponse(**resp.json())
+    return build_response(StakingTransactionResponse, loads(resp.content), session)
 
 def sendRawStakingTransaction(api_url : str, params : RawTransactionParameters, session : Optional[requests.Session] = None) -> SendRawStakingTransactionResponse:
     """
@@ -142,7 +143,7 @@ def sendRawStakingTransaction(api_url : str, params : RawTransactionParameters,
     """
     data = format_api_data("hmyv2_sendRawStakingTransaction", params)
     resp = post_request(api_url, data, session)
-    return SendRawStakingTransactionResponse(**resp.json())
+    return build_response(SendRawStakingTransactionResponse, loads(resp.content), session)
 
 #Transfer
 
@@ -154,7 +155,7 @@ def getCurrentTransactionErrorSink(api_url : str, session : Optional[requests.Se
     """
     data = format_api_data("hmyv2_getCurrentTransactionErrorSink", None)
     resp = post_request(api_url, data, session)
-    return GetCurrentTransactionErrorSinkResponse(**resp.json())
+    return build_response(GetCurrentTransactionErrorSinkResponse, loads(resp.content), session)
 
 def getTransactionByBlockHashAndIndex(api_url : str, params : HashAndIndexParameters, session : Optional[requests.Session] = None) -> TransactionResponse:
     """
@@ -164,7 +165,7 @@ def getTransactionByBlockHashAndIndex(api_url : str, params : HashAndIndexParame
     """
     data = format_api_data("hmyv2_getTransactionByBlockHashAndIndex", params)
     resp = post_request(api_url, data, session)
-    return TransactionResponse(**resp.json())
+    return build_response(TransactionResponse, loads(resp.content), session)
 
 def getTransactionByBlockNumberAndIndex(api_url : str, params : BlockNumberAndIndexParameters, session : Optional[requests.Session] = None) -> TransactionResponse:
     """
@@ -174,7 +175,7 @@ def getTransactionByBlockNumberAndIndex(api_url : str, params : BlockNumberAndIn
     """
     data = format_api_data("hmyv2_getTransactionByBlockNumberAndIndex", params)
     resp = post_request(api_url, data, session)
-    return TransactionResponse(**resp.json())
+    return build_response(TransactionResponse, loads(resp.content), session)
 
 def getTransactionByHash(api_url : str, params : HashParameters, session : Optional[requests.Session] = None) -> TransactionResponse:
     """
@@ -184,7 +185,7 @@ def getTransactionByHash(api_url : str, params : HashParameters, session : Optio
     """
     data = format_api_data("hmyv2_getTransactionByHash", params)
     resp = post_request(api_url, data, session)
-    return TransactionResponse(**resp.json())
+    return build_response(TransactionResponse, loads(resp.content), session)
 
 def getTransactionReceipt(api_url : str, params : GetTransactionReceiptParameters, session : Optional[requests.Session] = None) -> GetTransactionReceiptResponse:
     """
@@ -194,7 +195,7 @@ def getTransactionReceipt(api_url : str, params : GetTransactionReceiptParameter
     """
     data = format_api_data("hmyv2_getTransactionReceipt", params)
     resp = post_request(api_url, data, session)
-    return GetTransactionReceiptResponse(**resp.json())
+    return build_response(GetTransactionReceiptResponse, loads(resp.content), session)
 
 def sendRawTransaction(api_url : str, params : RawTransactionParameters, session : Optional[requests.Session] = None) -> SendRawTransactionResponse:
     """
@@ -204,5 +205,5 @@ def sendRawTransaction(api_url : str, params : RawTransactionParameters, session
     """
     data = format_api_data("hmyv2_sendRawTransaction", params)
     resp = post_request(api_url, data, session)
-    return SendRawTransactionResponse(**resp.json())
+    return build_response(SendRawTransactionResponse, loads(resp.content), session)
     
@@ -0,0 +1,11 @@
+class HarmonyNodeError(Exception):
+    pass
+
+class ChainReorgError(Exception):
+    pass
+
+class CircuitOpenError(HarmonyNodeError):
+    pass
+
+class BlockGapError(HarmonyNodeError):
+    pass
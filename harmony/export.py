@@ -0,0 +1,273 @@
+import os
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import requests
+
+from .balances import iter_balances
+from .block_range import AdaptiveChunkSize, iter_blocks_from_range
+from .models import Block
+from .utils.codec import dumps
+
+BLOCK_SCHEMA = pa.schema([
+    ("number", pa.int64()),
+    ("hash", pa.string()),
+    ("parentHash", pa.string()),
+    ("epoch", pa.int64()),
+    ("viewID", pa.int64()),
+    ("timestamp", pa.timestamp("s", tz="UTC")),
+    ("miner", pa.string()),
+    ("gasLimit", pa.int64()),
+    ("gasUsed", pa.int64()),
+    ("size", pa.int64()),
+    ("transactionCount", pa.int32()),
+    ("stakingTransactionCount", pa.int32()),
+    ("extraData", pa.string()),
+    ("logsBloom", pa.string()),
+    ("mixHash", pa.string()),
+    ("stateRoot", pa.string()),
+    ("receiptsRoot", pa.string()),
+    ("transactionsRoot", pa.string())
+])
+
+TRANSACTION_SCHEMA = pa.schema([
+    ("blockNumber", pa.int64()),
+    ("blockHash", pa.string()),
+    ("transactionIndex", pa.int32()),
+    ("hash", pa.string()),
+    ("ethHash", pa.string()),
+    ("from", pa.string()),
+    ("to", pa.string()),
+    ("shardID", pa.int32()),
+    ("toShardID", pa.int32()),
+    # Amounts in Atto overflow 64 bit integers
+    ("value", pa.string()),
+    ("gas", pa.int64()),
+    ("gasPrice", pa.int64()),
+    ("nonce", pa.int64()),
+    ("input", pa.string()),
+    ("timestamp", pa.timestamp("s", tz="UTC"))
+])
+
+STAKING_TRANSACTION_SCHEMA = pa.schema([
+    ("blockNumber", pa.int64()),
+    ("blockHash", pa.string()),
+    ("transactionIndex", pa.int32()),
+    ("hash", pa.string()),
+    ("type", pa.string()),
+    ("from", pa.string()),
+    ("gas", pa.int64()),
+    ("gasPrice", pa.int64()),
+    ("nonce", pa.int64()),
+    ("timestamp", pa.timestamp("s", tz="UTC")),
+    # The fields of the message depend on the type of staking transaction
+    ("msg", pa.string())
+])
+
+BALANCE_SCHEMA = pa.schema([
+    ("address", pa.string()),
+    ("blockNumber", pa.int64()),
+    # In Atto, which overflows 64 bit integers
+    ("balance", pa.string())
+])
+
+FILE_FORMATS = {
+    "parquet" : ".parquet",
+    "arrow" : ".arrow"
+}
+
+def _block_row(block : Block) -> Tuple[Any, ...]:
+    return (
+        block.number, block.hash_, block.parentHash, block.epoch, block.viewID, block.timestamp, block.miner,
+        block.gasLimit, block.gasUsed, block.size, len(block.transactions), len(block.stakingTransactions),
+        block.extraData, block.logsBloom, block.mixHash, block.stateRoot, block.receiptsRoot, block.transactionsRoot
+    )
+
+def _transaction_row(tx : Dict[str, Any]) -> Tuple[Any, ...]:
+    value = tx.get("value")
+    return (
+        tx.get("blockNumber"), tx.get("blockHash"), tx.get("transactionIndex"), tx.get("hash"), tx.get("ethHash"),
+        tx.get("from"), tx.get("to"), tx.get("shardID"), tx.get("toShardID"), None if value is None else str(value),
+        tx.get("gas"), tx.get("gasPrice"), tx.get("nonce"), tx.get("input"), tx.get("timestamp")
+    )
+
+def _staking_transaction_row(tx : Dict[str, Any]) -> Tuple[Any, ...]:
+    msg = tx.get("msg")
+    return (
+        tx.get("blockNumber"), tx.get("blockHash"), tx.get("transactionIndex"), tx.get("hash"), tx.get("type"),
+        tx.get("from"), tx.get("gas"), tx.get("gasPrice"), tx.get("nonce"), tx.get("timestamp"),
+        None if msg is None else dumps(msg)
+    )
+
+class TableWriter(object):
+
+    def __init__(self, path : str, schema : pa.Schema, file_format : Optional[str] = "parquet", row_group_size : Optional[int] = 100000, compression : Optional[str] = "zstd") -> None:
+        """
+        Write rows to an Arrow IPC or Parquet file, one row group at a time.
+
+        At most `row_group_size` rows are held in memory before they are written out.
+
+        Parameters
+        ----------
+        path : str
+        schema : pyarrow.Schema
+            The columns of the table, rows are tuples in the same order
+        file_format : str, optional
+            'parquet' or 'arrow' (the Arrow IPC file format); defaults to 'parquet'
+        row_group_size : int, optional
+            The number of rows per row group; defaults to 100000
+        compression : str, optional
+            The compression codec; defaults to 'zstd'
+        """
+        if file_format not in FILE_FORMATS:
+            raise ValueError("Unknown file format {}, expected one of {}".format(file_format, ", ".join(FILE_FORMATS)))
+        self._path = path
+        self._schema = schema
+        self._row_group_size = row_group_size
+        self._columns : List[List[Any]] = [[] for _ in schema]
+        self._buffered = 0
+        self.rows = 0
+        if file_format == "parquet":
+            self._writer = pq.ParquetWriter(path, schema, compression=compression)
+        else:
+            self._writer = pa.ipc.new_file(path, schema, options=pa.ipc.IpcWriteOptions(compression=compression))
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def append(self, row : Tuple[Any, ...]) -> None:
+        for column, value in zip(self._columns, row):
+            column.append(value)
+        self._buffered += 1
+        if self._buffered >= self._row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write the buffered rows out as a row group.
+        """
+        if not self._buffered:
+            return
+        arrays = [pa.array(column, type=field.type) for column, field in zip(self._columns, self._schema)]
+        self._writer.write_batch(pa.record_batch(arrays, schema=self._schema))
+        self.rows += self._buffered
+        self._columns = [[] for _ in self._schema]
+        self._buffered = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._writer.close()
+
+    def __enter__(self) -> "TableWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def export_blocks(blocks : Iterable[Block], directory : str, file_format : Optional[str] = "parquet", row_group_size : Optional[int] = 100000, compression : Optional[str] = "zstd") -> Dict[str, TableWriter]:
+    """
+    Write blocks to separate blocks, transactions and staking_transactions tables in `directory`.
+
+    The blocks are consumed as they come, and at most `row_group_size` rows per table
+    are held in memory, so arbitrarily long ranges can be exported.
+    Transactions are read straight from the json of the block, without building their models.
+
+    Parameters
+    ----------
+    blocks : Iterable[Block]
+        The blocks to export, with full transaction data for the transaction tables to be filled in
+    directory : str
+        The directory to write blocks, transactions and staking_transactions files to
+    file_format : str, optional
+        'parquet' or 'arrow' (the Arrow IPC file format); defaults to 'parquet'
+    row_group_size : int, optional
+        The number of rows per row group; defaults to 100000
+    compression : str, optional
+        The compression codec; defaults to 'zstd'
+
+    Returns
+    -------
+    dict[str, TableWriter]
+        The closed writer of each table, with the path and number of rows written
+    """
+    if file_format not in FILE_FORMATS:
+        raise ValueError("Unknown file format {}, expected one of {}".format(file_format, ", ".join(FILE_FORMATS)))
+    os.makedirs(directory, exist_ok=True)
+    tables : List[Tuple[str, pa.Schema]] = [("blocks", BLOCK_SCHEMA), ("transactions", TRANSACTION_SCHEMA), ("staking_transactions", STAKING_TRANSACTION_SCHEMA)]
+    writers = {}
+    try:
+        for name, schema in tables:
+            writers[name] = TableWriter(os.path.join(directory, name + FILE_FORMATS[file_format]), schema, file_format, row_group_size, compression)
+        for block in blocks:
+            writers["blocks"].append(_block_row(block))
+            for tx in block.transactions.raw:
+                if isinstance(tx, dict):
+                    writers["transactions"].append(_transaction_row(tx))
+            for tx in block.stakingTransactions.raw:
+                if isinstance(tx, dict):
+                    writers["staking_transactions"].append(_staking_transaction_row(tx))
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return writers
+
+def export_block_range(api_url : str, starting_block_number : int, ending_block_number : int, directory : str, file_format : Optional[str] = "parquet", row_group_size : Optional[int] = 100000, compression : Optional[str] = "zstd", max_workers : Optional[int] = 4, chunk_size : Optional[AdaptiveChunkSize] = None, session : Optional[requests.Session] = None) -> Dict[str, TableWriter]:
+    """
+    Fetch the blocks in the given range with their full transaction data
+    and write them to separate blocks, transactions and staking_transactions tables in `directory`.
+
+    See `export_blocks` and `harmony.block_range.iter_blocks_from_range`.
+
+    Returns
+    -------
+    dict[str, TableWriter]
+        The closed writer of each table, with the path and number of rows written
+    """
+    blocks = iter_blocks_from_range(api_url, starting_block_number, ending_block_number, False, True, True, max_workers, chunk_size=chunk_size, session=session)
+    return export_blocks(blocks, directory, file_format, row_group_size, compression)
+
+def export_balances(balances : Iterable[Tuple[str, int]], path : str, block_number : Optional[int] = None, file_format : Optional[str] = "parquet", row_group_size : Optional[int] = 100000, compression : Optional[str] = "zstd") -> TableWriter:
+    """
+    Write (address, balance) pairs to an address, blockNumber, balance table at `path`.
+
+    The pairs are consumed as they come, see `export_blocks`.
+
+    Parameters
+    ----------
+    balances : Iterable[tuple[str, int]]
+        The balances to export, e.g. from `harmony.balances.iter_balances`
+    path : str
+    block_number : int, optional
+        The block the balances are at, null in the table if None; defaults to None
+    file_format : str, optional
+        'parquet' or 'arrow' (the Arrow IPC file format); defaults to 'parquet'
+    row_group_size : int, optional
+        The number of rows per row group; defaults to 100000
+    compression : str, optional
+        The compression codec; defaults to 'zstd'
+
+    Returns
+    -------
+    TableWriter
+        The closed writer, with the path and number of rows written
+    """
+    with TableWriter(path, BALANCE_SCHEMA, file_format, row_group_size, compression) as writer:
+        for address, balance in balances:
+            writer.append((address, block_number, str(balance)))
+    return writer
+
+def export_balance_snapshot(api_url : str, addresses : Iterable[str], path : str, block_number : Optional[int] = None, file_format : Optional[str] = "parquet", row_group_size : Optional[int] = 100000, compression : Optional[str] = "zstd", batch_size : Optional[int] = 100, max_workers : Optional[int] = 4, session : Optional[requests.Session] = None) -> TableWriter:
+    """
+    Fetch the balance of each address at the block and write them to a table at `path`.
+
+    See `export_balances` and `harmony.balances.iter_balances`.
+
+    Returns
+    -------
+    TableWriter
+        The closed writer, with the path and number of rows written
+    """
+    balances = iter_balances(api_url, addresses, block_number, batch_size, max_workers, session=session)
+    return export_balances(balances, path, block_number, file_format, row_group_size, compression)
@@ -0,0 +1,343 @@
+import asyncio
+import collections
+import json
+import os
+import time
+from typing import AsyncIterator, Callable, Deque, Iterator, List, Optional, Tuple
+
+import requests
+
+from .exceptions import BlockGapError, ChainReorgError, HarmonyNodeError
+from .models import Block
+
+class FileCheckpoint(object):
+
+    def __init__(self, path : str) -> None:
+        """
+        Keep the number and hash of the last processed block in a json file.
+
+        Parameters
+        ----------
+        path : str
+        """
+        self._path = path
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def load(self) -> Optional[Tuple[int, str]]:
+        try:
+            with open(self._path) as fh:
+                data = json.load(fh)
+        except FileNotFoundError:
+            return None
+        return data["number"], data["hash"]
+
+    def save(self, number : int, block_hash : str) -> None:
+        tmp_path = self._path + ".tmp"
+        with open(tmp_path, "w") as fh:
+            json.dump({"number" : number, "hash" : block_hash}, fh)
+        os.replace(tmp_path, self._path)
+
+class AdaptivePolling(object):
+
+    def __init__(self, initial_interval : Optional[float] = 2.0, minimum : Optional[float] = 0.1, maximum : Optional[float] = 30.0, alpha : Optional[float] = 0.2) -> None:
+        """
+        Picks how long to wait before polling for the next block.
+
+        The block interval is estimated from the timestamps of the blocks seen so far, and
+        the next poll is timed for when the next block is expected. If the block is late,
+        polls start at `minimum` apart and back off exponentially up to the block interval.
+
+        Parameters
+        ----------
+        initial_interval : float, optional
+            The block interval to assume before any blocks are seen, defaults to 2 seconds
+        minimum : float, optional
+            The shortest delay between polls, defaults to 0.1 seconds
+        maximum : float, optional
+            The longest delay between polls, defaults to 30 seconds
+        alpha : float, optional
+            The weight of the latest block interval in the moving average, defaults to 0.2
+        """
+        self._interval = initial_interval
+        self._minimum = minimum
+        self._maximum = maximum
+        self._alpha = alpha
+        self._last_timestamp : Optional[int] = None
+        self._last_arrival : Optional[float] = None
+        self._waited = False
+        self._misses = 0
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    def observe(self, block_timestamp : int, view_change : Optional[bool] = False) -> None:
+        """
+        Record that a new block with the given unix timestamp arrived.
+
+        The time to a block that took a view change is left out of the block interval,
+        since it includes the timeout of the failed leader.
+        """
+        if self._last_timestamp is not None and block_timestamp > self._last_timestamp and not view_change:
+            self._interval += self._alpha * (block_timestamp - self._last_timestamp - self._interval)
+        self._last_timestamp = block_timestamp
+        self._last_arrival = time.monotonic()
+        self._waited = False
+        self._misses = 0
+
+    def delay(self) -> float:
+        """
+        How long to wait before the next poll, after a poll found no new block.
+        """
+        if self._last_arrival is not None and not self._waited:
+            self._waited = True
+            wait = self._interval - (time.monotonic() - self._last_arrival)
+            if wait > self._minimum:
+                return min(wait, self._maximum)
+        backoff = self._minimum * 2 ** min(self._misses, 32)
+        self._misses += 1
+        return min(backoff, max(self._interval, self._minimum), self._maximum)
+
+class BlockFollower(object):
+
+    def __init__(self, api, start : Optional[int] = None, include_transactions : Optional[bool] = False, include_staking_transactions : Optional[bool] = False, batch_size : Optional[int] = 50, confirmations : Optional[int] = 0, checkpoint : Optional[FileCheckpoint] = None, checkpoint_every : Optional[int] = 100, reorg_depth : Optional[int] = 128, on_reorg : Optional[Callable[[int, List[int]], None]] = None, polling : Optional[AdaptivePolling] = None, max_retries : Optional[int] = 5) -> None:
+        """
+        Follow the head of the chain, yielding every block once it is `confirmations` deep.
+
+        Iterate over it for a `HarmonyAPI`, or `async for` over it for an `AsyncHarmonyAPI`.
+        Blocks are fetched in batches of up to `batch_size` when the follower is behind, and
+        the head is polled adaptively once it has caught up (see `AdaptivePolling`).
+
+        The blocks the node returns must follow on from the last block without gaps. The blocks
+        before a skipped one are yielded, and a poll that doesn't return the next block at all
+        counts as a failed poll, and is retried like one.
+
+        Every block is checked to be the child of the block before it. If it isn't, the follower
+        walks back to the last block the node still agrees on, calls `on_reorg` with its number and
+        the numbers of the dropped blocks, and continues from there, yielding the replacements.
+
+        The last processed block is saved to the checkpoint (a block counts as processed once the
+        consumer asks for the next one), and following resumes after it when the checkpoint exists.
+
+        Parameters
+        ----------
+        api : HarmonyAPI or AsyncHarmonyAPI
+        start : int, optional
+            The first block to yield, defaults to the checkpoint or else the current head
+        include_transactions : bool, optional
+            Whether to include the full transaction data on the blocks; defaults to False
+        include_staking_transactions : bool, optional
+            Whether to include the full staking transaction data on the blocks; defaults to False
+        batch_size : int, optional
+            The most blocks to fetch at once; defaults to 50
+        confirmations : int, optional
+            How many blocks deep a block must be before it is yielded; defaults to 0,
+            since blocks on Harmony are final once committed
+        checkpoint : FileCheckpoint, optional
+            Where to persist the last processed block, any object with the same load and save methods works
+        checkpoint_every : int, optional
+            Save the checkpoint at least every this many blocks, and whenever the follower has caught up;
+            defaults to 100
+        reorg_depth : int, optional
+            How many recent block hashes to keep for finding the common ancestor; defaults to 128
+        on_reorg : Callable[[int, list[int]], None], optional
+            Called with the number of the common ancestor and the numbers of the dropped blocks
+        polling : AdaptivePolling, optional
+            The polling policy, defaults to AdaptivePolling()
+        max_retries : int, optional
+            How many consecutive failed polls to tolerate before raising; defaults to 5
+
+        Raises
+        ------
+        ChainReorgError: If no common ancestor is found within `reorg_depth` blocks
+        BlockGapError: If the node still skips blocks after `max_retries` polls
+        """
+        self._api = api
+        self._start = start
+        self._opts = (False, include_transactions, include_staking_transactions)
+        self._batch_size = batch_size
+        self._confirmations = confirmations
+        self._checkpoint = checkpoint
+        self._checkpoint_every = checkpoint_every
+        self._recent : Deque[Tuple[int, str]] = collections.deque(maxlen=reorg_depth)
+        self._on_reorg = on_reorg
+        self._polling = polling if polling is not None else AdaptivePolling()
+        self._max_retries = max_retries
+        self._next : Optional[int] = None
+        self._saved : Optional[int] = None
+        self._view : Optional[int] = None
+        self._head : Optional[int] = None
+
+    @property
+    def next_block_number(self) -> Optional[int]:
+        return self._next
+
+    @property
+    def head(self) -> Optional[int]:
+        """
+        The head of the chain at the last poll, None before the first one.
+        """
+        return self._head
+
+    @property
+    def polling(self) -> AdaptivePolling:
+        return self._polling
+
+    def _resume(self, head : int) -> None:
+        saved = self._checkpoint.load() if self._checkpoint is not None else None
+        if saved is not None:
+            self._recent.append(saved)
+            self._next = saved[0] + 1
+            self._saved = saved[0]
+        elif self._start is not None:
+            self._next = self._start
+        else:
+            self._next = max(0, head - self._confirmations)
+
+    def _target(self, head : int) -> Optional[Tuple[int, int]]:
+        last = head - self._confirmations
+        if last < self._next:
+            return None
+        return self._next, min(last, self._next + self._batch_size - 1)
+
+    def _contiguous(self, blocks : List[Block]) -> List[Block]:
+        """
+        The blocks up to the first one the node skipped, raising if it skipped the next block.
+        """
+        for i, block in enumerate(blocks):
+            if block.number != self._next + i:
+                if i == 0:
+                    raise BlockGapError("Expected block {} from the node, got block {}".format(self._next, block.number))
+                return blocks[:i]
+        return blocks
+
+    def _continues(self, block : Block) -> bool:
+        if self._recent and self._recent[-1][0] == block.number - 1:
+            return block.parentHash == self._recent[-1][1]
+        return True
+
+    def _processed(self, block : Block, caught_up : bool) -> None:
+        self._recent.append((block.number, block.hash_))
+        self._next = block.number + 1
+        # Consecutive blocks are one view apart unless the leader failed and the validators changed views
+        self._polling.observe(block.timestamp, self._view is not None and block.viewID > self._view + 1)
+        self._view = block.viewID
+        if self._checkpoint is not None and (caught_up or self._saved is None or block.number - self._saved >= self._checkpoint_every):
+            self._checkpoint.save(block.number, block.hash_)
+            self._saved = block.number
+
+    def _rewind(self, ancestor : int) -> bool:
+        dropped = []
+        while self._recent and self._recent[-1][0] > ancestor:
+            dropped.append(self._recent.pop()[0])
+        if not dropped:
+            return False
+        dropped.reverse()
+        self._next = ancestor + 1
+        self._view = None
+        if self._on_reorg is not None:
+            self._on_reorg(ancestor, dropped)
+        return True
+
+    def _discard(self, number : int) -> None:
+        block_cache = getattr(self._api, "block_cache", None)
+        if block_cache is not None:
+            block_cache.discard(number)
+
+    def _no_ancestor(self) -> ChainReorgError:
+        oldest = self._recent[0][0] if self._recent else self._next
+        return ChainReorgError("No common ancestor with the node within the last {} blocks, before block {}".format(len(self._recent), oldest))
+
+    def _find_ancestor(self) -> int:
+        for number, block_hash in reversed(self._recent):
+            self._discard(number)
+            if self._api.block_header(number).blockHash == block_hash:
+                return number
+        raise self._no_ancestor()
+
+    def _poll(self) -> Tuple[int, Optional[List[Block]]]:
+        """
+        Fetch the blocks after the last one, or None if the follower rewound past a reorg instead.
+        """
+        head = self._head = self._api.current_block_number()
+        if self._next is None:
+            self._resume(head)
+        target = self._target(head)
+        if target is None:
+            return head, []
+        blocks = self._contiguous(self._api.get_blocks(*target, *self._opts))
+        if blocks and not self._continues(blocks[0]):
+            return head, None if self._rewind(self._find_ancestor()) else []
+        return head, blocks
+
+    def __iter__(self) -> Iterator[Block]:
+        failures = 0
+        while True:
+            try:
+                head, blocks = self._poll()
+                failures = 0
+            except (HarmonyNodeError, requests.RequestException):
+                failures += 1
+                if failures > self._max_retries:
+                    raise
+                time.sleep(self._polling.delay())
+                continue
+            if blocks is None:
+                continue
+            for i, block in enumerate(blocks):
+                # A block that doesn't follow on from the one before it is left for the next poll to rewind
+                if not self._continues(block):
+                    break
+                yield block
+                self._processed(block, i == len(blocks) - 1 and block.number >= head - self._confirmations)
+            else:
+                if blocks:
+                    continue
+            time.sleep(self._polling.delay())
+
+    async def _poll_async(self) -> Tuple[int, Optional[List[Block]]]:
+        head = self._head = await self._api.current_block_number()
+        if self._next is None:
+            self._resume(head)
+        target = self._target(head)
+        if target is None:
+            return head, []
+        blocks = self._contiguous(await self._api.get_blocks(*target, *self._opts))
+        if blocks and not self._continues(blocks[0]):
+            return head, None if self._rewind(await self._find_ancestor_async()) else []
+        return head, blocks
+
+    async def __aiter__(self) -> AsyncIterator[Block]:
+        import aiohttp
+        failures = 0
+        while True:
+            try:
+                head, blocks = await self._poll_async()
+                failures = 0
+            except (HarmonyNodeError, aiohttp.ClientError, asyncio.TimeoutError):
+                failures += 1
+                if failures > self._max_retries:
+                    raise
+                await asyncio.sleep(self._polling.delay())
+                continue
+            if blocks is None:
+                continue
+            for i, block in enumerate(blocks):
+                if not self._continues(block):
+                    break
+                yield block
+                self._processed(block, i == len(blocks) - 1 and block.number >= head - self._confirmations)
+            else:
+                if blocks:
+                    continue
+            await asyncio.sleep(self._polling.delay())
+
+    async def _find_ancestor_async(self) -> int:
+        for number, block_hash in reversed(self._recent):
+            self._discard(number)
+            if (await self._api.block_header(number)).blockHash == block_hash:
+                return number
+        raise self._no_ancestor()
@@ -0,0 +1,149 @@
+import collections
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Deque, Dict, Hashable, Iterator, List, Optional, Set, Union
+
+import requests
+
+from .account import get_staking_transactions_count, get_staking_transactions_history, get_transactions_count, get_transactions_history
+from .exceptions import HarmonyNodeError
+from .models import SortOrder, StakingTransaction, Transaction, TransactionType
+
+def _raise_for_error(resp : Any) -> None:
+    if resp.error is not None:
+        raise HarmonyNodeError("The Node responded with the following error.\nCode {}: {}".format(resp.error["code"], resp.error["message"]))
+
+def _page_items(result : Any) -> List[Any]:
+    if result is None:
+        return []
+    if isinstance(result, dict):
+        return [item for items in result.values() for item in items]
+    return list(result)
+
+def _item_key(item : Any) -> Hashable:
+    """
+    The identity of a transaction in the history: its hash, or where it was included
+    for staking transactions, which don't carry their hash.
+    """
+    if isinstance(item, str):
+        return item
+    transaction_hash = getattr(item, "hash_", None)
+    if transaction_hash is not None:
+        return transaction_hash
+    return (item.blockHash, item.transactionIndex)
+
+class _Deduplicator(object):
+
+    def __init__(self, window : int) -> None:
+        """
+        Remembers the keys of the last `window` transactions yielded.
+        """
+        self._window = window
+        self._order : Deque[Hashable] = collections.deque()
+        self._seen : Set[Hashable] = set()
+
+    def add(self, key : Hashable) -> bool:
+        """
+        Whether the key is new, remembering it if so.
+        """
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        self._order.append(key)
+        if len(self._order) > self._window:
+            self._seen.discard(self._order.popleft())
+        return True
+
+def _fetch_count(api_url : str, address : str, transaction_type : TransactionType, staking : bool, session : Optional[requests.Session]) -> int:
+    count = get_staking_transactions_count if staking else get_transactions_count
+    resp = count(api_url, address, transaction_type, session)
+    _raise_for_error(resp)
+    return resp.result
+
+def _fetch_page(api_url : str, address : str, page_index : int, page_size : int, include_full_transaction_data : bool, transaction_type : TransactionType, sort_order : SortOrder, staking : bool, session : Optional[requests.Session]) -> List[Any]:
+    history = get_staking_transactions_history if staking else get_transactions_history
+    resp = history(api_url, address, page_index, page_size, include_full_transaction_data, transaction_type, sort_order, session)
+    _raise_for_error(resp)
+    return _page_items(resp.result)
+
+def iter_transactions_history(api_url : str, address : str, include_full_transaction_data : Optional[bool] = False, transaction_type : Optional[TransactionType] = "ALL", sort_order : Optional[SortOrder] = "ASC", staking : Optional[bool] = False, page_size : Optional[int] = 1000, max_workers : Optional[int] = 4, session : Optional[requests.Session] = None) -> Iterator[Union[str, Transaction, StakingTransaction]]:
+    """
+    Get the whole transaction history of the wallet, with the pages fetched concurrently.
+
+    The number of pages is sized from the transaction count of the wallet. Transactions are
+    yielded in `sort_order` as soon as every page before them has arrived.
+
+    Transactions arriving during the scan shift the pages: with 'DESC' the transactions at the
+    end of each page come back again at the start of the next, which are skipped, and pages past
+    the expected last one are fetched until one isn't full, which also picks up new transactions
+    with 'ASC'. Repeats are recognized as long as fewer than `page_size` transactions arrive during the scan.
+
+    Parameters
+    ----------
+    api_url : str
+    address : str
+        The wallet address
+    include_full_transaction_data : bool, optional
+        If true yield the whole transaction objects instead of the hashes, defaults to False
+    transaction_type : str, optional
+        Either 'SENT', 'RECEIVED', 'ALL', defaults to 'ALL'
+    sort_order : str, optional
+        How to sort based on timestamp, either 'ASC' or 'DESC', defaults to 'ASC'
+    staking : bool, optional
+        Whether to get the staking transactions instead, defaults to False
+    page_size : int, optional
+        The number of transactions per page, defaults to 1000
+    max_workers : int, optional
+        The maximum number of pages in flight at once; defaults to 4
+    session : requests.Session, optional
+
+    Returns
+    -------
+    result : Iterator[str] or Iterator[Transaction] or Iterator[StakingTransaction]
+
+    Raises
+    ------
+    HarmonyNodeError, requests.RequestException: If fetching the count or a page fails
+    """
+    n_pages = (_fetch_count(api_url, address, transaction_type, staking, session) + page_size - 1) // page_size
+    opts = (page_size, include_full_transaction_data, transaction_type, sort_order, staking, session)
+    seen = _Deduplicator(2 * page_size)
+    pending = {}
+    arrived : Dict[int, List[Any]] = {}
+    next_page = 0
+    next_yield = 0
+    last_page : Optional[int] = None
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+
+    def submit(page_index : int) -> None:
+        pending[pool.submit(_fetch_page, api_url, address, page_index, *opts)] = page_index
+
+    try:
+        if n_pages == 0:
+            submit(0)
+            next_page = 1
+        while last_page is None or next_yield <= last_page:
+            while len(pending) < max_workers and next_page < n_pages and len(arrived) < 2 * max_workers:
+                submit(next_page)
+                next_page += 1
+            if pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    page_index = pending.pop(future)
+                    items = future.result()
+                    arrived[page_index] = items
+                    if page_index >= n_pages - 1 and last_page is None:
+                        if len(items) < page_size:
+                            last_page = page_index
+                        elif page_index + 1 >= next_page:
+                            # The history grew since it was counted
+                            submit(page_index + 1)
+                            next_page = page_index + 2
+            while next_yield in arrived:
+                for item in arrived.pop(next_yield):
+                    if seen.add(_item_key(item)):
+                        yield item
+                next_yield += 1
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
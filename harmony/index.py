@@ -0,0 +1,335 @@
+import sqlite3
+import threading
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .follower import BlockFollower
+from .models import Block, SortOrder, StakingTransaction, Transaction, TransactionType
+from .utils.codec import dumps, loads
+
+SENT = 1
+RECEIVED = 2
+
+DIRECTIONS = {
+    "ALL" : SENT | RECEIVED,
+    "SENT" : SENT,
+    "RECEIVED" : RECEIVED
+}
+
+class TransactionLocation(NamedTuple):
+    block_number : int
+    block_hash : str
+    transaction_index : int
+    staking : bool
+
+def _value(value : Any) -> Any:
+    # TransactionType and SortOrder are str enums
+    return getattr(value, "value", value)
+
+def _accounts(tx : Dict[str, Any], staking : bool) -> Dict[str, int]:
+    """
+    The addresses a transaction belongs to in the history, with whether they sent or received it.
+    """
+    accounts : Dict[str, int] = {}
+    sender = tx.get("from")
+    if sender:
+        accounts[sender] = SENT
+    if staking:
+        msg = tx.get("msg") or {}
+        receivers = [msg.get("validatorAddress"), msg.get("delegatorAddress")]
+    else:
+        receivers = [tx.get("to")]
+    for receiver in receivers:
+        if receiver:
+            accounts[receiver] = accounts.get(receiver, 0) | RECEIVED
+    return accounts
+
+class TransactionIndex(object):
+
+    def __init__(self, path : str, history_from : Optional[int] = 0, max_lag : Optional[int] = 5) -> None:
+        """
+        A SQLite backed index of the transactions in the blocks of one shard, built from the block stream,
+        of the transactions of each account, the transactions of each block, and where each transaction is.
+
+        Fill it with `sync` and keep it up to date with `follow`. The index doubles as the checkpoint
+        of the `BlockFollower` used by `follow`, so following resumes after the last indexed block,
+        and blocks dropped by a reorg are removed from it.
+
+        Passed to `HarmonyAPI`, transactions are looked up in the index before asking the node,
+        and account histories are answered from it once it covers every block since `history_from`,
+        as long as its last block is at most `max_lag` blocks behind the head of the node. While the
+        index is followed, the head its follower last saw is used, so the node isn't asked for it.
+
+        The index is safe to share between threads, and between processes using the same file.
+
+        Parameters
+        ----------
+        path : str
+            The path to the SQLite database file, ':memory:' for an index that isn't persisted
+        history_from : int, optional
+            The first block of the account histories answered from the index; defaults to 0,
+            so only an index synced from the genesis block answers them
+        max_lag : int, optional
+            How many blocks the index may be behind the head of the node and still answer account histories;
+            defaults to 5. None answers them however far behind the index is, e.g. for an index that is
+            known to be kept up to date, or when stale answers are acceptable.
+        """
+        self._history_from = history_from
+        self._max_lag = max_lag
+        self._following : Optional[BlockFollower] = None
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS blocks (number INTEGER PRIMARY KEY, hash TEXT NOT NULL)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS transactions (hash TEXT PRIMARY KEY, eth_hash TEXT, block_number INTEGER NOT NULL, block_hash TEXT NOT NULL, position INTEGER NOT NULL, staking INTEGER NOT NULL, data TEXT NOT NULL)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS transactions_block ON transactions (block_number, staking, position)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS transactions_eth_hash ON transactions (eth_hash)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS account_transactions (address TEXT NOT NULL, staking INTEGER NOT NULL, block_number INTEGER NOT NULL, position INTEGER NOT NULL, direction INTEGER NOT NULL, hash TEXT NOT NULL, PRIMARY KEY (address, staking, block_number, position)) WITHOUT ROWID")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS account_transactions_block ON account_transactions (block_number)")
+
+    def _first_block(self) -> Optional[int]:
+        return self._conn.execute("SELECT MIN(number) FROM blocks").fetchone()[0]
+
+    @property
+    def first_block(self) -> Optional[int]:
+        """
+        The number of the first indexed block, None if the index is empty.
+        """
+        with self._lock:
+            return self._first_block()
+
+    @property
+    def last_block(self) -> Optional[int]:
+        """
+        The number of the last indexed block, None if the index is empty.
+        """
+        loaded = self.load()
+        return loaded[0] if loaded is not None else None
+
+    @property
+    def max_lag(self) -> Optional[int]:
+        return self._max_lag
+
+    @property
+    def head(self) -> Optional[int]:
+        """
+        The head of the chain at the last poll of the follower of `follow` or `afollow`,
+        None when the index isn't being followed.
+        """
+        following = self._following
+        return following.head if following is not None else None
+
+    def lag(self, head : int) -> Optional[int]:
+        """
+        How many blocks the index is behind the given head of the chain, None if the index is empty.
+        """
+        last = self.last_block
+        return head - last if last is not None else None
+
+    @property
+    def complete(self) -> bool:
+        """
+        Whether the index covers every block since `history_from`, and can answer account histories.
+        """
+        first = self.first_block
+        return first is not None and first <= self._history_from
+
+    def load(self) -> Optional[Tuple[int, str]]:
+        """
+        The number and hash of the last indexed block, as the checkpoint of a `BlockFollower`.
+        """
+        with self._lock:
+            return self._conn.execute("SELECT number, hash FROM blocks ORDER BY number DESC LIMIT 1").fetchone()
+
+    def save(self, number : int, block_hash : str) -> None:
+        """
+        Blocks are committed as they are added, so there is nothing left to save.
+        """
+
+    def _rows(self, block : Block) -> Tuple[List[Tuple[Any, ...]], List[Tuple[Any, ...]]]:
+        transactions, accounts = [], []
+        for staking, raw in ((0, block.transactions.raw), (1, block.stakingTransactions.raw)):
+            for position, tx in enumerate(raw):
+                if not isinstance(tx, dict) or not tx.get("hash"):
+                    continue
+                position = tx.get("transactionIndex", position)
+                transactions.append((tx["hash"], tx.get("ethHash"), block.number, block.hash_, position, staking, dumps(tx)))
+                for address, direction in _accounts(tx, staking).items():
+                    accounts.append((address, staking, block.number, position, direction, tx["hash"]))
+        return transactions, accounts
+
+    def add_blocks(self, blocks : Iterable[Block]) -> int:
+        """
+        Index the transactions of the blocks, which need their full transaction data,
+        in a single database transaction. Blocks that are already indexed are replaced.
+
+        Returns
+        -------
+        int
+            The number of blocks added
+        """
+        rows = [(block, *self._rows(block)) for block in blocks]
+        with self._lock, self._conn:
+            for block, transactions, accounts in rows:
+                self._remove(block.number, block.number)
+                self._conn.execute("INSERT INTO blocks VALUES (?, ?)", (block.number, block.hash_))
+                self._conn.executemany("INSERT OR REPLACE INTO transactions VALUES (?, ?, ?, ?, ?, ?, ?)", transactions)
+                self._conn.executemany("INSERT OR REPLACE INTO account_transactions VALUES (?, ?, ?, ?, ?, ?)", accounts)
+        return len(rows)
+
+    def add_block(self, block : Block) -> None:
+        self.add_blocks([block])
+
+    def _remove(self, start : int, end : Optional[int] = None) -> None:
+        end = end if end is not None else 2 ** 63 - 1
+        for table, column in (("blocks", "number"), ("transactions", "block_number"), ("account_transactions", "block_number")):
+            self._conn.execute("DELETE FROM {} WHERE {} BETWEEN ? AND ?".format(table, column), (start, end))
+
+    def remove_blocks(self, start : int) -> None:
+        """
+        Drop the blocks from `start` on, e.g. after a reorg.
+        """
+        with self._lock, self._conn:
+            self._remove(start)
+
+    def transaction_location(self, transaction_hash : str) -> Optional[TransactionLocation]:
+        """
+        Where the transaction is, by its hash or Ethereum hash, None if it isn't indexed.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT block_number, block_hash, position, staking FROM transactions WHERE hash = ? OR eth_hash = ?", (transaction_hash, transaction_hash)).fetchone()
+        if row is None:
+            return None
+        return TransactionLocation(row[0], row[1], row[2], bool(row[3]))
+
+    def _data(self, transaction_hash : str, staking : int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM transactions WHERE (hash = ? OR eth_hash = ?) AND staking = ?", (transaction_hash, transaction_hash, staking)).fetchone()
+        return loads(row[0]) if row is not None else None
+
+    def get_transaction(self, transaction_hash : str) -> Optional[Transaction]:
+        """
+        The transaction by its hash or Ethereum hash, None if it isn't indexed.
+        """
+        data = self._data(transaction_hash, 0)
+        return Transaction(**data) if data is not None else None
+
+    def get_staking_transaction(self, transaction_hash : str) -> Optional[StakingTransaction]:
+        """
+        The staking transaction by its hash, None if it isn't indexed.
+        """
+        data = self._data(transaction_hash, 1)
+        return StakingTransaction(**data) if data is not None else None
+
+    def block_transactions(self, block_number : int, staking : Optional[bool] = False) -> List[str]:
+        """
+        The hashes of the (staking) transactions in the block, in order.
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT hash FROM transactions WHERE block_number = ? AND staking = ? ORDER BY position", (block_number, int(staking))).fetchall()
+        return [row[0] for row in rows]
+
+    def transaction_count(self, address : str, transaction_type : Optional[TransactionType] = "ALL", staking : Optional[bool] = False) -> int:
+        """
+        The number of (staking) transactions of the account, like `hmyv2_getTransactionsCount`.
+        """
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM account_transactions WHERE address = ? AND staking = ? AND direction & ?", (address, int(staking), DIRECTIONS[_value(transaction_type)])).fetchone()[0]
+
+    def transaction_history(self, address : str, page_index : Optional[int] = 0, page_size : Optional[int] = 1000, transaction_type : Optional[TransactionType] = "ALL", sort_order : Optional[SortOrder] = "ASC", staking : Optional[bool] = False) -> List[str]:
+        """
+        A page of the hashes of the (staking) transactions of the account, like `hmyv2_getTransactionsHistory`.
+        """
+        order = "DESC" if _value(sort_order) == "DESC" else "ASC"
+        query = "SELECT hash FROM account_transactions WHERE address = ? AND staking = ? AND direction & ? ORDER BY block_number {0}, position {0} LIMIT ? OFFSET ?".format(order)
+        with self._lock:
+            rows = self._conn.execute(query, (address, int(staking), DIRECTIONS[_value(transaction_type)], page_size, page_index * page_size)).fetchall()
+        return [row[0] for row in rows]
+
+    def transactions(self, transaction_hashes : Iterable[str]) -> List[Transaction]:
+        """
+        The indexed transactions among the hashes, in the same order.
+        """
+        found = [self.get_transaction(transaction_hash) for transaction_hash in transaction_hashes]
+        return [transaction for transaction in found if transaction is not None]
+
+    def sync(self, api, start : Optional[int] = 0, end : Optional[int] = None, max_workers : Optional[int] = 4, commit_every : Optional[int] = 1000) -> Optional[int]:
+        """
+        Index the blocks after the last indexed one, up to `end`, fetching them concurrently.
+
+        Parameters
+        ----------
+        api : HarmonyAPI
+        start : int, optional
+            The first block to index if the index is empty; defaults to 0
+        end : int, optional
+            The last block to index, defaults to the current head
+        max_workers : int, optional
+            The maximum number of chunks of blocks fetched at once; defaults to 4
+        commit_every : int, optional
+            How many blocks to add per database transaction; defaults to 1000
+
+        Returns
+        -------
+        int or None
+            The number of the last indexed block
+        """
+        last = self.last_block
+        first = last + 1 if last is not None else start
+        if end is None:
+            end = api.current_block_number()
+        if first > end:
+            return last
+        batch = []
+        for block in api.iter_blocks(first, end, False, True, True, max_workers):
+            batch.append(block)
+            if len(batch) >= commit_every:
+                self.add_blocks(batch)
+                batch = []
+        self.add_blocks(batch)
+        return self.last_block
+
+    def _follower(self, api, on_reorg : Optional[Callable[[int, List[int]], None]], kwargs : Dict[str, Any]) -> BlockFollower:
+        def reorg(ancestor : int, dropped : List[int]) -> None:
+            self.remove_blocks(ancestor + 1)
+            if on_reorg is not None:
+                on_reorg(ancestor, dropped)
+        return BlockFollower(api, include_transactions=True, include_staking_transactions=True, checkpoint=self, on_reorg=reorg, **kwargs)
+
+    def follow(self, api, on_reorg : Optional[Callable[[int, List[int]], None]] = None, **kwargs) -> Iterator[Block]:
+        """
+        Follow the head of the chain with a `BlockFollower`, indexing every block before yielding it.
+
+        Parameters
+        ----------
+        api : HarmonyAPI
+        on_reorg : Callable[[int, list[int]], None], optional
+            Called after the blocks dropped by a reorg are removed from the index, see `BlockFollower`
+        **kwargs
+            The other parameters of `BlockFollower`
+        """
+        follower = self._following = self._follower(api, on_reorg, kwargs)
+        try:
+            for block in follower:
+                self.add_block(block)
+                yield block
+        finally:
+            if self._following is follower:
+                self._following = None
+
+    async def afollow(self, api, on_reorg : Optional[Callable[[int, List[int]], None]] = None, **kwargs) -> AsyncIterator[Block]:
+        """
+        The asyncio counterpart of `follow`, for an `AsyncHarmonyAPI`.
+        """
+        follower = self._following = self._follower(api, on_reorg, kwargs)
+        try:
+            async for block in follower:
+                self.add_block(block)
+                yield block
+        finally:
+            if self._following is follower:
+                self._following = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,84 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Type, Union
+
+from pydantic import BaseModel
+
+class LazyModelList(Sequence):
+
+    model : Type[BaseModel] = BaseModel
+
+    def __init__(self, raw : List[Any], build : Optional[Callable[[Dict[str, Any]], BaseModel]] = None) -> None:
+        """
+        A list of json objects that are only built into `model` when they are accessed.
+
+        Items that aren't json objects, e.g. transaction hashes, are returned as they are.
+        Built items are kept, so each one is built at most once.
+
+        Parameters
+        ----------
+        raw : list
+            The decoded json of the items
+        build : Callable[[dict], BaseModel], optional
+            Builds an item, defaults to validating it with `model`
+        """
+        self._raw = raw
+        self._build = build
+        self._built : List[Any] = [None] * len(raw)
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def __modify_schema__(cls, field_schema : Dict[str, Any]) -> None:
+        field_schema.update(type="array", items={"type" : "object"})
+
+    @classmethod
+    def validate(cls, value : Any) -> "LazyModelList":
+        if isinstance(value, cls):
+            return value
+        if not isinstance(value, list):
+            raise TypeError("list required")
+        return cls(value)
+
+    @property
+    def raw(self) -> List[Any]:
+        """
+        The decoded json of the items, without building any of them.
+        """
+        return self._raw
+
+    def _item(self, index : int) -> Any:
+        item = self._built[index]
+        if item is None:
+            raw = self._raw[index]
+            if not isinstance(raw, dict):
+                return raw
+            item = self._build(raw) if self._build is not None else self.model(**raw)
+            self._built[index] = item
+        return item
+
+    def __getitem__(self, index : Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(len(self._raw)))]
+        if index < 0:
+            index += len(self._raw)
+        if not 0 <= index < len(self._raw):
+            raise IndexError("list index out of range")
+        return self._item(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self._raw)):
+            yield self._item(index)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __eq__(self, other : Any) -> bool:
+        if isinstance(other, LazyModelList):
+            return self._raw == other._raw
+        if isinstance(other, list):
+            return self._raw == other or list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return "{}({} items)".format(type(self).__name__, len(self._raw))
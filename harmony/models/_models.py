@@ -1,9 +1,12 @@
+import warnings
 from enum import Enum
 
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from pydantic import BaseModel, Field
 
+from ._lazy import LazyModelList
+
 class BaseRequest(BaseModel):
     jsonrpc : Optional[str] = Field("2.0", description="The JSON-RPC version.")
     id_ : Optional[int] = Field(1, description="The request id, useful for asynchronous requests.", alias="id")
@@ -510,8 +513,8 @@ class GetTransactionReceiptRequest(BaseRequest):
 class TransactionReceipt(BaseModel):
     blockHash : str = Field(..., description="Block hash")
     blockNumber : int = Field(..., description="Block number")
-    contractAddress : str = Field(..., description="Smart contract address")
-    culmulativeGasUsed : int = Field(..., description="Gas used for transaction")
+    contractAddress : Optional[str] = Field(None, description="Smart contract address, if the transaction created one")
+    cumulativeGasUsed : int = Field(..., description="Gas used in the block up to and including the transaction")
     from_ : str = Field(..., description="Sender wallet address", alias="from")
     gasUsed : int = Field(..., description="Gas used for the transaction")
     logs : List[Any] = Field(..., description="Array")
@@ -520,7 +523,15 @@ class TransactionReceipt(BaseModel):
     status : int = Field(..., description="Status of transaction (0: pending, 1: success)")
     to : str = Field(..., description="Receiver wallet address")
     transactionHash : str = Field(..., description="Transaction hash")
-    transactionIndex : str = Field(..., description="Transaction index within block")
+    transactionIndex : int = Field(..., description="Transaction index within block")
+
+    @property
+    def culmulativeGasUsed(self) -> int:
+        """
+        Deprecated, misspelled name of `cumulativeGasUsed`.
+        """
+        warnings.warn("TransactionReceipt.culmulativeGasUsed is deprecated, use cumulativeGasUsed", DeprecationWarning, stacklevel=2)
+        return self.cumulativeGasUsed
 
 class GetTransactionReceiptResponse(BaseResponse):
     result : Optional[TransactionReceipt] = Field(None, description="Object")
@@ -700,6 +711,12 @@ class GetBlocksRequest(BaseRequest):
     params : Tuple[int, int, BlocksListConfig]
     method : str = "hmyv2_getBlocks"
 
+class TransactionList(LazyModelList):
+    model = Transaction
+
+class StakingTransactionList(LazyModelList):
+    model = StakingTransaction
+
 class Block(BaseModel):
     difficulty : int = Field(..., description="Unused, legacy from Eth")
     epoch : int = Field(..., description="Epoch number of block")
@@ -715,17 +732,23 @@ class Block(BaseModel):
     parentHash : str = Field(..., description="Hash of parent block")
     receiptsRoot : str = Field(..., description="Hash of transaction receipt root")
     size : int = Field(..., description="Block size in bytes")
-    stakingTransactions : List[Dict[str, Any]] = Field(..., description="List of staking transactions finalized in this block")
+    stakingTransactions : StakingTransactionList = Field(..., description="List of staking transactions finalized in this block, built when accessed")
     stateRoot : str = Field(..., description="Hash of state root")
     timestamp : int = Field(..., description="Unix timestamp of the block")
-    transactions : List[Dict[str, Any]] = Field(..., description="List of transactions finalized in this block")
+    transactions : TransactionList = Field(..., description="List of transactions finalized in this block, built when accessed")
     transactionsRoot : str = Field(..., description="Hash of transactios root")
     uncles : List[Dict[str, Any]] = Field(..., description="Unused, legacy from Eth")
     viewID : int = Field(..., description="View ID")
 
+    class Config:
+        json_encoders = {LazyModelList : lambda items: items.raw}
+
 
 class BlockListResponse(BaseResponse):
     result : Optional[List[Block]] = Field(None, description="List of blocks")
+
+    class Config:
+        json_encoders = {LazyModelList : lambda items: items.raw}
     
 class BlockConfig(BaseModel):
     fullTx : bool = Field(..., description="Include full transaction data")
@@ -743,6 +766,9 @@ class GetBlockByNumberRequest(BaseRequest):
 class BlockResponse(BaseResponse):
     result : Optional[Block] = Field(None, description="Block Object")
 
+    class Config:
+        json_encoders = {LazyModelList : lambda items: items.raw}
+
 class GetBlockByHashParameters(BaseModel):
     hash_ : str = Field(..., description="Block hash", alias="hash")
     block_config : BlockConfig = Field(..., description="BlockConfig Object")
@@ -0,0 +1,302 @@
+import collections
+import threading
+import time
+from typing import Deque, Dict, Iterable, List, Optional, Sequence
+
+ARCHIVAL_METHODS = frozenset([
+    "hmyv2_getBalanceByBlockNumber",
+    "hmyv2_getAllValidatorInformationByBlockNumber",
+    "hmyv2_getDelegationsByDelegatorByBlockNumber"
+])
+
+class Endpoint(object):
+
+    def __init__(self, url : str) -> None:
+        """
+        The health and latency of one node in an `EndpointPool`.
+
+        Parameters
+        ----------
+        url : str
+        """
+        self.url = url
+        self.latency : Optional[float] = None
+        self.error_rate = 0.0
+        self.failures = 0
+        self.inflight = 0
+        self.ejected_until = 0.0
+        self.ejections = 0
+        self.archival : Optional[bool] = None
+        self.checked_at : Optional[float] = None
+
+    @property
+    def ejected(self) -> bool:
+        return self.ejected_until > 0
+
+    def score(self, error_penalty : float) -> float:
+        """
+        The expected cost of sending the next call here, lower is better.
+
+        Nodes without a latency yet score 0, so every node is tried early on.
+        """
+        return (self.latency or 0.0) * (1 + self.inflight) * (1 + error_penalty * self.error_rate)
+
+    def __repr__(self) -> str:
+        return "Endpoint({!r}, latency={}, error_rate={:.2f}, ejected={})".format(self.url, self.latency, self.error_rate, self.ejected)
+
+class EndpointPool(object):
+
+    def __init__(self, urls : Sequence[str], alpha : Optional[float] = 0.2, error_penalty : Optional[float] = 10.0, max_failures : Optional[int] = 3, eject_seconds : Optional[float] = 10.0, max_eject_seconds : Optional[float] = 300.0, archival_methods : Optional[Iterable[str]] = ARCHIVAL_METHODS) -> None:
+        """
+        A set of nodes serving the same shard, with calls routed to the one
+        expected to answer fastest.
+
+        Each node keeps an exponentially weighted moving average of its latency and error rate,
+        and calls go to the lowest `latency * (1 + in flight) * (1 + error_penalty * error rate)`.
+
+        A node that fails `max_failures` calls in a row is ejected for `eject_seconds`,
+        after which it is probed back in with a single call. A failed probe ejects it again
+        for twice as long, up to `max_eject_seconds`. If every node is ejected, the one
+        due back first is used anyway.
+
+        Calls to `archival_methods`, which read historical state, are only routed to archival nodes
+        (see `NodeMetadata.is_archival`), as long as any of them are archival.
+
+        The pool is safe to share between threads.
+
+        Parameters
+        ----------
+        urls : list[str]
+            The urls of the nodes
+        alpha : float, optional
+            The weight of the latest call in the moving averages; defaults to 0.2
+        error_penalty : float, optional
+            How much the error rate weighs against latency; defaults to 10
+        max_failures : int, optional
+            How many calls in a row can fail before a node is ejected; defaults to 3
+        eject_seconds : float, optional
+            How long a node is ejected for the first time; defaults to 10 seconds
+        max_eject_seconds : float, optional
+            The longest a node is ejected for; defaults to 300 seconds
+        archival_methods : list[str], optional
+            The methods that need an archival node, defaults to the `*ByBlockNumber` state lookups
+        """
+        if not urls:
+            raise ValueError("At least one endpoint url is required")
+        self._endpoints = [Endpoint(url) for url in urls]
+        self._alpha = alpha
+        self._error_penalty = error_penalty
+        self._max_failures = max_failures
+        self._eject_seconds = eject_seconds
+        self._max_eject_seconds = max_eject_seconds
+        self._archival_methods = frozenset(archival_methods)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._endpoints)
+
+    @property
+    def endpoints(self) -> List[Endpoint]:
+        return list(self._endpoints)
+
+    @property
+    def urls(self) -> List[str]:
+        return [endpoint.url for endpoint in self._endpoints]
+
+    def needs_archival(self, methods : Iterable[str]) -> bool:
+        """
+        Whether any of the methods reads historical state.
+        """
+        return any(method in self._archival_methods for method in methods)
+
+    def unknown_capabilities(self) -> List[Endpoint]:
+        """
+        The nodes that aren't known to be archival or not, and weren't asked recently.
+        """
+        now = time.monotonic()
+        return [endpoint for endpoint in self._endpoints if endpoint.archival is None and (endpoint.checked_at is None or now - endpoint.checked_at >= self._eject_seconds)]
+
+    def select(self, archival : Optional[bool] = False, exclude : Optional[Iterable[Endpoint]] = ()) -> Optional[Endpoint]:
+        """
+        Pick the node for the next call and count the call as in flight on it.
+        Report how it went with `record`.
+
+        Parameters
+        ----------
+        archival : bool, optional
+            Whether the call needs an archival node; defaults to False
+        exclude : list[Endpoint], optional
+            Nodes not to pick, e.g. the ones a call already failed on
+
+        Returns
+        -------
+        Endpoint or None
+            None if every node is excluded
+        """
+        exclude = set(id(endpoint) for endpoint in exclude)
+        now = time.monotonic()
+        with self._lock:
+            candidates = [endpoint for endpoint in self._endpoints if id(endpoint) not in exclude]
+            if archival and any(endpoint.archival for endpoint in candidates):
+                candidates = [endpoint for endpoint in candidates if endpoint.archival]
+            if not candidates:
+                return None
+            available = [endpoint for endpoint in candidates if endpoint.ejected_until <= now]
+            if available:
+                endpoint = min(available, key=lambda e: e.score(self._error_penalty))
+            else:
+                endpoint = min(candidates, key=lambda e: e.ejected_until)
+            if endpoint.ejected:
+                # Hold the others back until the probe comes back
+                endpoint.ejected_until = now + self._eject_period(endpoint)
+            endpoint.inflight += 1
+            return endpoint
+
+    def _eject_period(self, endpoint : Endpoint) -> float:
+        return min(self._eject_seconds * 2 ** min(max(endpoint.ejections - 1, 0), 16), self._max_eject_seconds)
+
+    def record(self, endpoint : Endpoint, seconds : float, ok : bool) -> None:
+        """
+        Report how a call picked by `select` went.
+
+        Parameters
+        ----------
+        endpoint : Endpoint
+        seconds : float
+            How long the call took
+        ok : bool
+            Whether the node answered, errors returned by the node itself count as answers
+        """
+        with self._lock:
+            endpoint.inflight = max(0, endpoint.inflight - 1)
+            endpoint.error_rate += self._alpha * ((0.0 if ok else 1.0) - endpoint.error_rate)
+            if ok:
+                endpoint.latency = seconds if endpoint.latency is None else endpoint.latency + self._alpha * (seconds - endpoint.latency)
+                endpoint.failures = 0
+                endpoint.ejections = 0
+                endpoint.ejected_until = 0.0
+                return
+            endpoint.failures += 1
+            if endpoint.ejected or endpoint.failures >= self._max_failures:
+                endpoint.ejections += 1
+                endpoint.ejected_until = time.monotonic() + self._eject_period(endpoint)
+
+    def release(self, endpoint : Endpoint) -> None:
+        """
+        Give back a call picked by `select` that was abandoned, without counting how it went.
+        """
+        with self._lock:
+            endpoint.inflight = max(0, endpoint.inflight - 1)
+
+    def set_archival(self, endpoint : Endpoint, archival : Optional[bool]) -> None:
+        """
+        Record whether the node is archival, None if asking it failed.
+        """
+        with self._lock:
+            endpoint.archival = archival
+            endpoint.checked_at = time.monotonic()
+
+NON_IDEMPOTENT_METHODS = frozenset([
+    "hmyv2_sendRawTransaction",
+    "hmyv2_sendRawStakingTransaction",
+    "hmyv2_resendCX"
+])
+
+class HedgePolicy(object):
+
+    def __init__(self, percentile : Optional[float] = 95.0, window : Optional[int] = 200, min_samples : Optional[int] = 20, min_delay : Optional[float] = 0.01, methods : Optional[Iterable[str]] = None, max_workers : Optional[int] = 32) -> None:
+        """
+        When to send a duplicate of a slow call to a second node, and take whichever answers first.
+
+        A call is hedged once it has taken longer than the `percentile` of the recent latencies of
+        its method, so about `100 - percentile` percent of calls are sent twice. Methods are only
+        hedged once `min_samples` of their latencies are known.
+
+        Only reads are hedged, calls that submit transactions never are.
+
+        Parameters
+        ----------
+        percentile : float, optional
+            The percentile of recent latency after which a call is hedged; defaults to 95
+        window : int, optional
+            How many recent latencies of each method to keep; defaults to 200
+        min_samples : int, optional
+            How many latencies of a method are needed before it is hedged; defaults to 20
+        min_delay : float, optional
+            The shortest time to wait before hedging in seconds; defaults to 0.01
+        methods : list[str], optional
+            The methods to hedge, defaults to every method that only reads
+        max_workers : int, optional
+            The most threads used to send hedged calls of the blocking client, which can't cancel
+            the request that loses. While they are all busy calls aren't hedged; defaults to 32
+        """
+        self._percentile = percentile
+        self._window = window
+        self._min_samples = min_samples
+        self._min_delay = min_delay
+        self._methods = None if methods is None else frozenset(methods) - NON_IDEMPOTENT_METHODS
+        self.max_workers = max_workers
+        self._latencies : Dict[str, Deque[float]] = {}
+        self._counts : Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def hedges(self, method : Optional[str]) -> bool:
+        """
+        Whether calls to the method may be hedged.
+        """
+        if method is None or method in NON_IDEMPOTENT_METHODS:
+            return False
+        return self._methods is None or method in self._methods
+
+    def delay(self, method : Optional[str]) -> Optional[float]:
+        """
+        How long to wait for a call to the method before hedging it, None if it isn't hedged.
+        """
+        if not self.hedges(method):
+            return None
+        with self._lock:
+            latencies = self._latencies.get(method)
+            if latencies is None or len(latencies) < self._min_samples:
+                return None
+            ordered = sorted(latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self._percentile / 100))
+        return max(ordered[index], self._min_delay)
+
+    def _count(self, method : str, name : str) -> None:
+        counts = self._counts.setdefault(method, {"calls" : 0, "hedged" : 0, "hedge_won" : 0})
+        counts[name] += 1
+
+    def observe(self, method : Optional[str], seconds : float) -> None:
+        """
+        Record the latency of a successful call.
+        """
+        if method is None:
+            return
+        with self._lock:
+            latencies = self._latencies.get(method)
+            if latencies is None:
+                latencies = self._latencies[method] = collections.deque(maxlen=self._window)
+            latencies.append(seconds)
+
+    def record(self, method : str, hedged : bool, hedge_won : bool) -> None:
+        """
+        Count a call that could have been hedged, whether it was, and whether the hedge answered first.
+        """
+        with self._lock:
+            self._count(method, "calls")
+            if hedged:
+                self._count(method, "hedged")
+            if hedge_won:
+                self._count(method, "hedge_won")
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        The number of calls, hedged calls and calls the hedge answered first per method,
+        along with the hedge rate and the current hedging delay.
+        """
+        with self._lock:
+            counts = {method : dict(c) for method, c in self._counts.items()}
+        for method, c in counts.items():
+            c["hedge_rate"] = c["hedged"] / c["calls"] if c["calls"] else 0.0
+            c["delay"] = self.delay(method)
+        return counts
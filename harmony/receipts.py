@@ -0,0 +1,104 @@
+import collections
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+
+from .bulk import iter_batched_calls
+from .models import Block, GetTransactionReceiptParameters, TransactionReceipt
+
+def _receipt_calls(transaction_hashes : List[str]) -> List[Tuple[str, Any]]:
+    return [("hmyv2_getTransactionReceipt", GetTransactionReceiptParameters(receipt=transaction_hash)) for transaction_hash in transaction_hashes]
+
+def _transaction_hashes(block : Block) -> List[str]:
+    # Blocks fetched without their full transaction data only hold the hashes
+    return [tx if isinstance(tx, str) else tx["hash"] for tx in block.transactions.raw]
+
+def iter_receipts(api_url : str, transaction_hashes : Iterable[str], batch_size : Optional[int] = 100, max_workers : Optional[int] = 4, max_retries : Optional[int] = 3, retry_backoff : Optional[float] = 0.5, session : Optional[requests.Session] = None) -> Iterator[Optional[TransactionReceipt]]:
+    """
+    Get the receipts of many transactions, with the calls sent in concurrent JSON-RPC batches,
+    see `harmony.bulk.iter_batched_calls`.
+
+    Parameters
+    ----------
+    api_url : str
+    transaction_hashes : Iterable[str]
+    batch_size : int, optional
+        The number of calls per batch request; defaults to 100
+    max_workers : int, optional
+        The maximum number of batches in flight at once; defaults to 4
+    max_retries : int, optional
+        How many times to retry a failing call before giving up; defaults to 3
+    retry_backoff : float, optional
+        The delay before the first retry in seconds, doubled on each further retry; defaults to 0.5
+    session : requests.Session, optional
+
+    Returns
+    -------
+    result : Iterator[TransactionReceipt]
+        The receipts in the order of the hashes, None for the transactions the node doesn't know
+
+    Raises
+    ------
+    HarmonyNodeError, requests.RequestException: If a call still fails after `max_retries` retries
+    """
+    for _, receipt in iter_batched_calls(api_url, transaction_hashes, _receipt_calls, batch_size, max_workers, max_retries, retry_backoff, session):
+        yield receipt
+
+def _group_by_block(blocks : Iterable[Block], receipts_of : Callable[[Iterator[str]], Iterable[Optional[TransactionReceipt]]]) -> Iterator[Tuple[Block, List[Optional[TransactionReceipt]]]]:
+    """
+    Pair each block with the receipts of its transactions, given a function
+    that maps the transaction hashes to their receipts in order.
+    """
+    queued : Deque[Tuple[Block, int]] = collections.deque()
+
+    def hashes() -> Iterator[str]:
+        for block in blocks:
+            block_hashes = _transaction_hashes(block)
+            queued.append((block, len(block_hashes)))
+            yield from block_hashes
+
+    receipts : List[Optional[TransactionReceipt]] = []
+    for receipt in receipts_of(hashes()):
+        # The block of the receipt was queued before its hash was read, so any block ahead of it is complete
+        while queued[0][1] == len(receipts):
+            yield queued.popleft()[0], receipts
+            receipts = []
+        receipts.append(receipt)
+    while queued:
+        block, count = queued.popleft()
+        yield block, receipts[:count]
+        receipts = receipts[count:]
+
+def iter_block_receipts(api_url : str, blocks : Iterable[Block], batch_size : Optional[int] = 100, max_workers : Optional[int] = 4, max_retries : Optional[int] = 3, retry_backoff : Optional[float] = 0.5, session : Optional[requests.Session] = None) -> Iterator[Tuple[Block, List[Optional[TransactionReceipt]]]]:
+    """
+    Get the receipts of the transactions of many blocks, with the calls sent in concurrent
+    JSON-RPC batches that span block boundaries.
+
+    The blocks only need the hashes of their transactions, e.g. from `iter_blocks_from_range`
+    or `harmony.bloom.iter_candidate_blocks`, and are read lazily.
+    The receipts of staking transactions aren't fetched.
+
+    Parameters
+    ----------
+    api_url : str
+    blocks : Iterable[Block]
+    batch_size : int, optional
+        The number of calls per batch request; defaults to 100
+    max_workers : int, optional
+        The maximum number of batches in flight at once; defaults to 4
+    max_retries : int, optional
+        How many times to retry a failing call before giving up; defaults to 3
+    retry_backoff : float, optional
+        The delay before the first retry in seconds, doubled on each further retry; defaults to 0.5
+    session : requests.Session, optional
+
+    Returns
+    -------
+    result : Iterator[tuple[Block, list[TransactionReceipt]]]
+        Each block with the receipts of its transactions, in order
+
+    Raises
+    ------
+    HarmonyNodeError, requests.RequestException: If a call still fails after `max_retries` retries
+    """
+    return _group_by_block(blocks, lambda transaction_hashes: iter_receipts(api_url, transaction_hashes, batch_size, max_workers, max_retries, retry_backoff, session))
@@ -0,0 +1,194 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Optional, TypeVar
+
+import requests
+
+from .api import HarmonyAPI
+from .exceptions import HarmonyNodeError
+from .models import ShardingStructure, Transaction
+from .utils.transport import TransportConfig, create_session
+
+T = TypeVar("T")
+
+class ShardedHarmonyAPI(object):
+
+    def __init__(self, api_url : str, shard_urls : Optional[Dict[int, str]] = None, max_workers : Optional[int] = None, session_factory : Optional[Callable[[], requests.Session]] = None, coalesce_requests : Optional[bool] = False, trusted : Optional[bool] = False, transport : Optional[TransportConfig] = None) -> None:
+        """
+        One `HarmonyAPI` per shard, with queries fanned out to every shard concurrently
+        and the results merged.
+
+        The shards are discovered from the sharding structure of the node at `api_url`,
+        unless their urls are given.
+
+        Parameters
+        ----------
+        api_url : str
+            The url of a node on any shard
+        shard_urls : dict[int, str], optional
+            The http url of each shard id, discovered from `api_url` if none are passed
+        max_workers : int, optional
+            The most requests in flight at once, defaults to one per shard
+        session_factory : Callable[[], requests.Session], optional
+            Creates the session of each shard, defaults to `create_session` with `transport`
+        coalesce_requests : bool, optional
+            See `HarmonyAPI`; defaults to False
+        trusted : bool, optional
+            See `HarmonyAPI`; defaults to False
+        transport : TransportConfig, optional
+            See `HarmonyAPI`
+        """
+        self._api_url = api_url
+        self._session_factory = session_factory if session_factory is not None else lambda: create_session(transport)
+        self._options = {"coalesce_requests" : coalesce_requests, "trusted" : trusted}
+        if shard_urls is None:
+            shard_urls = {shard.shardID : shard.http for shard in self._discover()}
+        self._shards = {shard_id : self._client(url) for shard_id, url in sorted(shard_urls.items())}
+        self._pool = ThreadPoolExecutor(max_workers=max_workers or len(self._shards))
+
+    def _client(self, url : str) -> HarmonyAPI:
+        return HarmonyAPI(url, session=self._session_factory(), **self._options)
+
+    def _discover(self) -> List[ShardingStructure]:
+        api = self._client(self._api_url)
+        try:
+            return api.sharding_structure()
+        finally:
+            api.session.close()
+
+    @property
+    def url(self) -> str:
+        return self._api_url
+
+    @property
+    def shards(self) -> Dict[int, HarmonyAPI]:
+        return self._shards
+
+    @property
+    def shard_ids(self) -> List[int]:
+        return list(self._shards)
+
+    def shard(self, shard_id : int) -> HarmonyAPI:
+        """
+        The client of the given shard.
+
+        Raises
+        ------
+        KeyError: If there is no such shard
+        """
+        return self._shards[shard_id]
+
+    def close(self) -> None:
+        """
+        Shut down the worker threads and close the session of every shard.
+        """
+        self._pool.shutdown(wait=False)
+        for api in self._shards.values():
+            api.session.close()
+
+    def __enter__(self) -> "ShardedHarmonyAPI":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def map(self, fn : Callable[[HarmonyAPI], T], shard_ids : Optional[Iterable[int]] = None) -> Dict[int, T]:
+        """
+        Call `fn` with the client of each shard concurrently.
+
+        Parameters
+        ----------
+        fn : Callable[[HarmonyAPI], Any]
+        shard_ids : list[int], optional
+            The shards to call it on, defaults to all of them
+
+        Returns
+        -------
+        dict[int, Any]
+            The result of each shard, by shard id
+
+        Raises
+        ------
+        The exception raised by `fn` for the first of the shards it failed on, in the order of `shard_ids`,
+        once every call has finished
+        """
+        shard_ids = self.shard_ids if shard_ids is None else list(shard_ids)
+        futures = {shard_id : self._pool.submit(fn, self._shards[shard_id]) for shard_id in shard_ids}
+        wait(futures.values())
+        return {shard_id : future.result() for shard_id, future in futures.items()}
+
+    def current_block_numbers(self) -> Dict[int, int]:
+        """
+        Get the head of every shard.
+
+        Returns
+        -------
+        dict[int, int]
+            The current block number, by shard id
+        """
+        return self.map(lambda api: api.current_block_number())
+
+    def get_account_balances(self, address : str) -> Dict[int, int]:
+        """
+        Get the balance of an account on every shard.
+
+        Parameters
+        ----------
+        address : str
+
+        Returns
+        -------
+        dict[int, int]
+            The balance, by shard id
+        """
+        return self.map(lambda api: api.get_account_balance(address))
+
+    def get_account_balance(self, address : str) -> int:
+        """
+        Get the balance of an account summed over every shard.
+
+        Parameters
+        ----------
+        address : str
+
+        Returns
+        -------
+        int
+        """
+        return sum(self.get_account_balances(address).values())
+
+    def get_transaction(self, transaction_hash : str) -> Optional[Transaction]:
+        """
+        Look the transaction up on every shard at once, returning as soon as one of them has it.
+
+        The shard it is on is in `Transaction.shardID`.
+
+        Parameters
+        ----------
+        transaction_hash : str
+
+        Returns
+        -------
+        Transaction or None
+            None if no shard knows of the transaction
+
+        Raises
+        ------
+        HarmonyNodeError: If the transaction wasn't found and a shard responded with an error
+        """
+        pending = {self._pool.submit(api.get_transaction, transaction_hash) for api in self._shards.values()}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    transaction = future.result()
+                except (HarmonyNodeError, requests.RequestException) as e:
+                    error = e
+                    continue
+                if transaction is not None:
+                    for other in pending:
+                        other.cancel()
+                    return transaction
+        if error is not None:
+            raise error
+        return None
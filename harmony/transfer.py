@@ -5,6 +5,8 @@ import requests
 from .models import (
     BlockNumberAndIndexParameters,
     GetCurrentTransactionErrorSinkResponse,
+    GetTransactionReceiptParameters,
+    GetTransactionReceiptResponse,
     HashParameters,
     HashAndIndexParameters,
     RawTransactionParameters,
@@ -17,6 +19,7 @@ from .endpoints.transaction import (
     getTransactionByBlockHashAndIndex,
     getTransactionByBlockNumberAndIndex,
     getTransactionByHash,
+    getTransactionReceipt,
     sendRawTransaction    
 )
 
@@ -90,6 +93,23 @@ def get_transaction_by_hash(api_url : str, transaction_hash : str, session : Opt
     params = HashParameters(hash=transaction_hash)
     return getTransactionByHash(api_url, params, session)
 
+def get_transaction_receipt(api_url : str, transaction_hash : str, session : Optional[requests.Session] = None) -> GetTransactionReceiptResponse:
+    """
+    Get the receipt of the transaction by its hash
+
+    Parameters
+    ----------
+    api_url : str
+    transaction_hash : str
+    session : requests.Session, optional
+
+    Returns
+    -------
+    result : TransactionReceipt
+    """
+    params = GetTransactionReceiptParameters(receipt=transaction_hash)
+    return getTransactionReceipt(api_url, params, session)
+
 def send_raw_transaction(api_url : str, transaction_hex : str, session : Optional[requests.Session] = None) -> TransactionResponse:
     """
     Send the raw transaction
@@ -0,0 +1,95 @@
+import json
+import re
+from functools import partial
+from typing import Any, Callable, Optional, Tuple, Union
+
+# Amounts in Atto routinely exceed 64 bits, which orjson can't represent
+_LONG_NUMBER = re.compile(rb"\d{20}")
+_LONG_NUMBER_TEXT = re.compile(r"\d{20}")
+
+def _json() -> Tuple[Callable[[Any], str], Callable[[Union[bytes, str]], Any]]:
+    return partial(json.dumps, separators=(",", ":")), json.loads
+
+def _ujson() -> Tuple[Callable[[Any], str], Callable[[Union[bytes, str]], Any]]:
+    import ujson
+    return (lambda obj: ujson.dumps(obj, ensure_ascii=False)), ujson.loads
+
+def _orjson() -> Tuple[Callable[[Any], str], Callable[[Union[bytes, str]], Any]]:
+    import orjson
+    json_dumps, json_loads = _json()
+
+    def dumps(obj : Any) -> str:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            return json_dumps(obj)
+
+    def loads(data : Union[bytes, str]) -> Any:
+        pattern = _LONG_NUMBER_TEXT if isinstance(data, str) else _LONG_NUMBER
+        if pattern.search(data) is not None:
+            return json_loads(data)
+        return orjson.loads(data)
+
+    return dumps, loads
+
+BACKENDS = {
+    "ujson" : _ujson,
+    "orjson" : _orjson,
+    "json" : _json
+}
+
+_backend = None
+_dumps = partial(json.dumps, separators=(",", ":"))
+_loads = json.loads
+
+def use_backend(name : Optional[str] = None) -> str:
+    """
+    Pick the library used to encode requests and decode responses.
+
+    Parameters
+    ----------
+    name : str, optional
+        One of 'ujson', 'orjson' or 'json'. If None is provided, the first
+        installed one is used, in that order, with the standard library as the fallback.
+        orjson can't represent integers over 64 bits, so payloads with such numbers
+        are handed to the standard library instead.
+
+    Returns
+    -------
+    str
+        The name of the backend in use
+
+    Raises
+    ------
+    ImportError: If the requested backend isn't installed
+    ValueError: If the backend is unknown
+    """
+    global _backend, _dumps, _loads
+    if name is None:
+        for candidate in BACKENDS:
+            try:
+                return use_backend(candidate)
+            except ImportError:
+                continue
+    if name not in BACKENDS:
+        raise ValueError("Unknown json backend {}, expected one of {}".format(name, ", ".join(BACKENDS)))
+    _dumps, _loads = BACKENDS[name]()
+    _backend = name
+    return name
+
+def backend() -> str:
+    return _backend
+
+def dumps(obj : Any) -> str:
+    """
+    Encode the object as compact json.
+    """
+    return _dumps(obj)
+
+def loads(data : Union[bytes, str]) -> Any:
+    """
+    Decode json, straight from the bytes of a response body where possible.
+    """
+    return _loads(data)
+
+use_backend()
@@ -1,13 +1,61 @@
 import json
-from typing import Any, Dict, Optional, Union
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 from pydantic import BaseModel
 import requests
 
+from ..exceptions import CircuitOpenError, HarmonyNodeError
+from .codec import dumps, loads
+from .construct import construct_model
+from .resilience import DEFAULT_RETRY_POLICY, CircuitBreaker, RetryPolicy
+from .transport import default_session
+
+ResponseModel = TypeVar("ResponseModel", bound=BaseModel)
+
+def _methods(data : Optional[Union[str, bytes, Dict[str, Any], List[Dict[str, Any]]]]) -> List[str]:
+    try:
+        request = json.loads(data) if isinstance(data, (str, bytes)) else data
+    except ValueError:
+        return []
+    calls = request if isinstance(request, list) else [request]
+    return [call.get("method") for call in calls if isinstance(call, dict)]
+
+def _retry_policy(session : Any) -> RetryPolicy:
+    policy = getattr(session, "retry_policy", None)
+    return policy if policy is not None else DEFAULT_RETRY_POLICY
+
+def _pooled(session : Any) -> bool:
+    # Pooled sessions fail over to other nodes and eject failing ones themselves
+    return getattr(session, "pool", None) is not None
+
+def _breaker(url : str, session : Any) -> Optional[CircuitBreaker]:
+    breakers = getattr(session, "breakers", None)
+    if breakers is None or _pooled(session):
+        return None
+    return breakers.get(url)
+
+def _retries(policy : RetryPolicy, data : Any, session : Any) -> int:
+    return 0 if _pooled(session) else policy.retries(_methods(data))
+
+def _circuit_open(url : str) -> CircuitOpenError:
+    return CircuitOpenError("The circuit to {} is open after repeated failures, not calling it until it is reset".format(url))
+
+def _status_error(url : str, status : int) -> HarmonyNodeError:
+    return HarmonyNodeError("The Node at {} responded with HTTP status {}".format(url, status))
+
 def post_request(url : str, data : Union[str, Dict[str, Any]], session : Optional[requests.Session] = None) -> requests.Response:
     """
     Post a request to the url with the given data,
     optionally using a provided session.
+
+    The request is made with the timeouts of the retry policy of the session
+    (see `harmony.utils.sessions.ResilientSession`), or else of `DEFAULT_RETRY_POLICY`,
+    and reads are retried on timeouts, connection errors, 5xx/429 statuses and
+    transient JSON-RPC errors, unless the session fails over between nodes itself.
+    The circuit breaker of the url, if the session has one, counts the call as one
+    failure once it has failed for good.
+
     Parameters
     ----------
     url: str
@@ -16,18 +64,63 @@ def post_request(url : str, data : Union[str, Dict[str, Any]], session : Optiona
         The json data to include in the post request.
     session: requests.Session, optional
         The persistent session to use, if None is provided
-        a new one will be created and destroyed for theha
-        individual call.
+        the shared `harmony.utils.transport.default_session` is used.
+
+    Raises
+    ------
+    CircuitOpenError: If the node failed too often recently to be called
+    HarmonyNodeError: If the node still responds with an HTTP error status after retrying
+    requests.RequestException: If the node still can't be reached after retrying
     """
     headers = {
             'Content-Type': 'application/json'
     }
-    if session is not None:
-        return session.post(url, headers=headers, data=data)
-    return requests.post(url, headers=headers, data=data)
+    policy = _retry_policy(session)
+    breaker = _breaker(url, session)
+    retries = _retries(policy, data, session)
+    if session is None:
+        session = default_session()
+    if breaker is not None and not breaker.allow():
+        raise _circuit_open(url)
+    attempt = 0
+    while True:
+        retry_after = None
+        try:
+            resp = session.post(url, headers=headers, data=data, timeout=policy.timeout)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt >= retries:
+                if breaker is not None:
+                    breaker.failure()
+                raise
+        else:
+            failed = policy.retry_status(resp.status_code)
+            if not failed:
+                if attempt >= retries or b'"error"' not in resp.content or not policy.retry_error(loads(resp.content)):
+                    if breaker is not None:
+                        breaker.success()
+                    return resp
+            elif attempt >= retries:
+                if breaker is not None:
+                    breaker.failure()
+                raise _status_error(url, resp.status_code)
+            else:
+                retry_after = resp.headers.get("Retry-After")
+        time.sleep(policy.delay(attempt, retry_after))
+        attempt += 1
 
+def build_response(model : Type[ResponseModel], data : Dict[str, Any], session : Optional[requests.Session] = None) -> ResponseModel:
+    """
+    Build the response model from the decoded json body.
 
-def format_api_data(method : str, param_model : Optional[BaseModel], request_id : Optional[str] = "1", jsonrpc : Optional[str] = "2.0") -> str:
+    If the session is marked as `trusted` (see `harmony.utils.sessions.TrustedSession`)
+    the model is built without validation.
+    """
+    if getattr(session, "trusted", False):
+        return construct_model(model, data)
+    return model(**data)
+
+
+def _api_payload(method : str, param_model : Optional[BaseModel], request_id : Optional[Union[int, str]] = "1", jsonrpc : Optional[str] = "2.0") -> Dict[str, Any]:
     data = {}
     data["id"] = request_id
     data["jsonrpc"] = jsonrpc
@@ -36,4 +129,58 @@ def format_api_data(method : str, param_model : Optional[BaseModel], request_id
         data["params"] = []
     else:
         data["params"] = list(param_model.dict().values())
-    return json.dumps(data)
\ No newline at end of file
+    return data
+
+def format_api_data(method : str, param_model : Optional[BaseModel], request_id : Optional[str] = "1", jsonrpc : Optional[str] = "2.0") -> str:
+    return dumps(_api_payload(method, param_model, request_id, jsonrpc))
+
+def format_batch_api_data(calls : Sequence[Tuple[str, Optional[BaseModel]]], jsonrpc : Optional[str] = "2.0") -> str:
+    """
+    Format a JSON-RPC 2.0 batch request.
+
+    Each call is given the id of its position in `calls` (starting at 1),
+    which is what `match_batch_response` uses to line the responses back up.
+
+    Parameters
+    ----------
+    calls : list[tuple[str, BaseModel or None]]
+        The (method, parameters) pairs to include in the batch.
+    jsonrpc : str, optional
+        The JSON-RPC version, defaults to '2.0'
+
+    Returns
+    -------
+    str
+    """
+    return dumps([_api_payload(method, params, i, jsonrpc) for i, (method, params) in enumerate(calls, 1)])
+
+def match_batch_response(payload : Union[List[Dict[str, Any]], Dict[str, Any]], n_calls : int, jsonrpc : Optional[str] = "2.0") -> List[Dict[str, Any]]:
+    """
+    Order the raw responses of a batch request by the id they were sent with.
+
+    JSON-RPC servers are free to answer a batch in any order. If the node rejects the
+    whole batch it answers with a single error object, which is repeated for every call.
+    Calls the node did not answer get an internal error in their place.
+
+    Parameters
+    ----------
+    payload : list[dict] or dict
+        The decoded body of the batch response.
+    n_calls : int
+        The number of calls in the batch request.
+
+    Returns
+    -------
+    list[dict]
+        One response object per call, in the order the calls were made.
+    """
+    if isinstance(payload, dict):
+        return [dict(payload, id=i) for i in range(1, n_calls + 1)]
+    by_id = {}
+    for item in payload:
+        try:
+            by_id[int(item.get("id"))] = item
+        except (TypeError, ValueError):
+            continue
+    missing = {"code" : -32603, "message" : "No response for the request in the batch"}
+    return [by_id.get(i, {"jsonrpc" : jsonrpc, "id" : i, "error" : missing}) for i in range(1, n_calls + 1)]
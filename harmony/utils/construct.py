@@ -0,0 +1,73 @@
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_SINGLETON, SHAPE_LIST, SHAPE_SEQUENCE, SHAPE_SET, SHAPE_MAPPING, SHAPE_DICT
+
+from ..models import LazyModelList
+
+Model = TypeVar("Model", bound=BaseModel)
+
+_SHAPES_OF_ITEMS = (SHAPE_LIST, SHAPE_SEQUENCE, SHAPE_SET)
+_SHAPES_OF_VALUES = (SHAPE_MAPPING, SHAPE_DICT)
+
+_plans : Dict[Type[BaseModel], List[Tuple[str, str, int, Optional[Type[BaseModel]], bool, Any]]] = {}
+
+def _plan(model : Type[BaseModel]) -> List[Tuple[str, str, int, Optional[Type[BaseModel]], bool, Any]]:
+    plan = _plans.get(model)
+    if plan is None:
+        plan = []
+        for name, field in model.__fields__.items():
+            inner = field.type_ if isinstance(field.type_, type) and issubclass(field.type_, (BaseModel, LazyModelList)) else None
+            plan.append((name, field.alias, field.shape, inner, field.required, field))
+        _plans[model] = plan
+    return plan
+
+def _value(shape : int, inner : Type[BaseModel], value : Any) -> Any:
+    if issubclass(inner, LazyModelList):
+        return inner(value, partial(construct_model, inner.model)) if isinstance(value, list) else value
+    if shape == SHAPE_SINGLETON and isinstance(value, dict):
+        return construct_model(inner, value)
+    if shape in _SHAPES_OF_ITEMS and isinstance(value, list):
+        return [construct_model(inner, item) if isinstance(item, dict) else item for item in value]
+    if shape in _SHAPES_OF_VALUES and isinstance(value, dict):
+        return {key : construct_model(inner, item) if isinstance(item, dict) else item for key, item in value.items()}
+    return value
+
+def construct_model(model : Type[Model], data : Dict[str, Any]) -> Model:
+    """
+    Build the model, and any models nested in it, from trusted data without validating it.
+
+    Unlike `BaseModel.construct` the nested models are built as well, so the result can be
+    used just like a validated one, but values are kept as they were decoded, e.g. numbers
+    the node sends as strings aren't converted to int.
+
+    Parameters
+    ----------
+    model : Type[BaseModel]
+    data : dict
+        The decoded json, keyed by the field aliases
+
+    Returns
+    -------
+    BaseModel
+    """
+    values = {}
+    fields_set = set()
+    for name, alias, shape, inner, required, field in _plan(model):
+        if alias in data:
+            value = data[alias]
+        elif name in data:
+            value = data[name]
+        else:
+            if not required:
+                values[name] = field.get_default()
+            continue
+        if inner is not None and value is not None:
+            value = _value(shape, inner, value)
+        values[name] = value
+        fields_set.add(name)
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__fields_set__", fields_set)
+    return instance
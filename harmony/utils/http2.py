@@ -0,0 +1,60 @@
+from typing import Optional, Tuple, Union
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .transport import TransportConfig
+
+def _timeout(timeout : Optional[Union[float, Tuple[Optional[float], Optional[float]]]]) -> httpx.Timeout:
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+class HTTP2Adapter(BaseAdapter):
+
+    def __init__(self, config : TransportConfig) -> None:
+        """
+        Send the requests of a `requests.Session` over HTTP/2 with httpx, so calls to a node
+        in parallel threads share one multiplexed connection.
+
+        Requires httpx with its http2 extra (`pip install httpx[http2]`).
+        TLS verification is always on, the `verify` and `cert` of requests are ignored.
+
+        Parameters
+        ----------
+        config : TransportConfig
+        """
+        super().__init__()
+        self.transport = config
+        limits = httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_connections_per_host if config.keepalive else 0,
+            keepalive_expiry=config.keepalive_timeout
+        )
+        transport = httpx.HTTPTransport(http2=True, limits=limits, socket_options=config.socket_options())
+        self._client = httpx.Client(transport=transport)
+
+    def send(self, request : requests.PreparedRequest, stream : bool = False, timeout : Optional[Union[float, Tuple[Optional[float], Optional[float]]]] = None, verify : bool = True, cert : Optional[str] = None, proxies : Optional[dict] = None) -> requests.Response:
+        try:
+            resp = self._client.request(request.method, request.url, headers=dict(request.headers), content=request.body, timeout=_timeout(timeout))
+        except httpx.ConnectTimeout as e:
+            raise requests.ConnectTimeout(e, request=request)
+        except httpx.TimeoutException as e:
+            raise requests.ReadTimeout(e, request=request)
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(e, request=request)
+        response = requests.Response()
+        response.status_code = resp.status_code
+        response.headers = CaseInsensitiveDict(resp.headers)
+        response._content = resp.content
+        response.encoding = resp.encoding
+        response.reason = resp.reason_phrase
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        self._client.close()
@@ -0,0 +1,306 @@
+import asyncio
+import collections
+import threading
+import time
+from typing import Callable, Deque, Dict, Iterable, List, Mapping, Optional, Tuple
+
+HEAVY_METHODS = frozenset([
+    "hmyv2_getAllValidatorInformation",
+    "hmyv2_getAllValidatorInformationByBlockNumber",
+    "hmyv2_getBlocks",
+    "hmyv2_getTransactionsHistory",
+    "hmyv2_getStakingTransactionsHistory",
+    "hmyv2_getSuperCommittees",
+    "hmyv2_getDelegationsByValidator",
+    "hmyv2_getValidators"
+])
+
+class Limit(object):
+
+    def __init__(self, rate : Optional[float] = 10.0, burst : Optional[int] = 20, max_in_flight : Optional[int] = 16) -> None:
+        """
+        How fast and how many calls at once may go to a node.
+
+        Parameters
+        ----------
+        rate : float, optional
+            The sustained calls per second, None for no limit; defaults to 10
+        burst : int, optional
+            How many calls may be made at once after a quiet period; defaults to 20
+        max_in_flight : int, optional
+            The most calls waiting on the node at once, None for no limit; defaults to 16
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+
+DEFAULT_CLASS_LIMITS = {
+    "heavy" : Limit(rate=1.0, burst=2, max_in_flight=2)
+}
+
+class TokenBucket(object):
+
+    def __init__(self, rate : float, burst : int, decrease : Optional[float] = 0.5, min_rate : Optional[float] = 0.1, recovery : Optional[float] = 0.05) -> None:
+        """
+        A token bucket refilled at `rate` tokens per second, holding at most `burst`.
+
+        Tokens are reserved rather than waited for, so the bucket can go into debt and every
+        caller is told how long to wait for its turn, which works the same for threads and tasks.
+
+        The rate adapts to the node: it is multiplied by `decrease` whenever the node answers with
+        429, and grows back by `recovery` times the configured rate with every successful call.
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self._decrease = decrease
+        self._min_rate = min(min_rate, rate)
+        self._recovery = recovery
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now : float) -> None:
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, cost : Optional[float] = 1.0) -> float:
+        """
+        Take `cost` tokens, returning how many seconds to wait before using them.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._refill(now)
+            self._tokens -= min(cost, self.burst)
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def throttle(self, retry_after : Optional[float] = None) -> None:
+        """
+        Slow down after the node answered with 429, pausing for `retry_after` seconds if it asked to.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._refill(now)
+            self.rate = max(self._min_rate, self.rate * self._decrease)
+            if retry_after is not None:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+    def recover(self) -> None:
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self._recovery * self.max_rate)
+
+class ConcurrencyLimit(object):
+
+    def __init__(self, limit : int) -> None:
+        """
+        A semaphore that both threads and asyncio tasks can wait on, granting slots in order.
+        """
+        self._limit = limit
+        self._active = 0
+        self._waiters : Deque[Callable[[], None]] = collections.deque()
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    def _try_acquire(self, waiter : Optional[Callable[[], None]] = None) -> bool:
+        with self._lock:
+            if self._active < self._limit and not self._waiters:
+                self._active += 1
+                return True
+            if waiter is not None:
+                self._waiters.append(waiter)
+            return False
+
+    def acquire(self) -> None:
+        event = threading.Event()
+        if not self._try_acquire(event.set):
+            event.wait()
+
+    async def acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def grant() -> None:
+            if future.cancelled():
+                self.release()
+            else:
+                future.set_result(None)
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(grant)
+
+        if self._try_acquire(wake):
+            return
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove(wake)
+                    waiting = True
+                except ValueError:
+                    waiting = False
+            if not waiting and future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """
+        Hand the slot to the next waiter, or free it.
+        """
+        with self._lock:
+            if self._waiters:
+                wake = self._waiters.popleft()
+            else:
+                self._active -= 1
+                return
+        wake()
+
+class _Gate(object):
+
+    def __init__(self, limit : Limit) -> None:
+        self.bucket = TokenBucket(limit.rate, limit.burst) if limit.rate is not None else None
+        self.concurrency = ConcurrencyLimit(limit.max_in_flight) if limit.max_in_flight is not None else None
+
+def _retry_after(value : Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+class RateLimiter(object):
+
+    def __init__(self, default : Optional[Limit] = None, endpoints : Optional[Mapping[str, Limit]] = None, classes : Optional[Mapping[str, Limit]] = None, method_classes : Optional[Mapping[str, str]] = None) -> None:
+        """
+        Client side rate and concurrency limits, per node and per class of method.
+
+        Every request to a node waits for a token of the node's bucket and a free slot of its
+        `max_in_flight`, and requests of a method class with a limit of its own (by default the
+        'heavy' methods, like getAllValidatorInformation and getBlocks) wait on that limit too.
+        Batch requests take a token per call.
+
+        When a node answers with 429 its rates are halved and its buckets paused for as long
+        as the node asks for, then grow back with every successful call.
+
+        A limiter can be shared between clients, threads and asyncio tasks,
+        see `harmony.utils.sessions.RateLimitedSession`.
+
+        Parameters
+        ----------
+        default : Limit, optional
+            The limit of every node without one of its own, defaults to `Limit()`
+        endpoints : dict[str, Limit], optional
+            The limits of particular nodes, by url
+        classes : dict[str, Limit], optional
+            The extra limits per node of each class of method, defaults to `DEFAULT_CLASS_LIMITS`
+        method_classes : dict[str, str], optional
+            The class of each method, defaults to 'heavy' for `HEAVY_METHODS`
+        """
+        self._default = default if default is not None else Limit()
+        self._endpoints = dict(endpoints or {})
+        self._classes = dict(classes if classes is not None else DEFAULT_CLASS_LIMITS)
+        self._method_classes = dict(method_classes) if method_classes is not None else {method : "heavy" for method in HEAVY_METHODS}
+        self._gates : Dict[Tuple[str, Optional[str]], _Gate] = {}
+        self._lock = threading.Lock()
+
+    def method_class(self, method : str) -> Optional[str]:
+        return self._method_classes.get(method)
+
+    def _gate(self, url : str, method_class : Optional[str]) -> _Gate:
+        key = (url, method_class)
+        gate = self._gates.get(key)
+        if gate is None:
+            with self._lock:
+                gate = self._gates.get(key)
+                if gate is None:
+                    limit = self._endpoints.get(url, self._default) if method_class is None else self._classes[method_class]
+                    gate = self._gates[key] = _Gate(limit)
+        return gate
+
+    def gates(self, url : str, methods : Iterable[str]) -> List[Tuple[_Gate, int]]:
+        """
+        The gates a request to the url calling the methods has to pass, with the tokens it takes from each.
+        """
+        methods = list(methods)
+        gates = [(self._gate(url, None), max(1, len(methods)))]
+        counts : Dict[str, int] = collections.Counter(self.method_class(method) for method in methods)
+        for method_class, count in counts.items():
+            if method_class is not None and method_class in self._classes:
+                gates.append((self._gate(url, method_class), count))
+        return gates
+
+    def acquire(self, url : str, methods : Iterable[str]) -> List[Tuple[_Gate, int]]:
+        """
+        Block until the request may be sent, pass the result to `release` once it is done.
+        """
+        gates = self.gates(url, methods)
+        for gate, cost in gates:
+            if gate.bucket is not None:
+                wait = gate.bucket.reserve(cost)
+                if wait > 0:
+                    time.sleep(wait)
+        acquired = []
+        try:
+            for gate, cost in gates:
+                if gate.concurrency is not None:
+                    gate.concurrency.acquire()
+                    acquired.append((gate, cost))
+        except BaseException:
+            self._release_slots(acquired)
+            raise
+        return gates
+
+    async def acquire_async(self, url : str, methods : Iterable[str]) -> List[Tuple[_Gate, int]]:
+        """
+        The asyncio counterpart of `acquire`.
+        """
+        gates = self.gates(url, methods)
+        for gate, cost in gates:
+            if gate.bucket is not None:
+                wait = gate.bucket.reserve(cost)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+        acquired = []
+        try:
+            for gate, cost in gates:
+                if gate.concurrency is not None:
+                    await gate.concurrency.acquire_async()
+                    acquired.append((gate, cost))
+        except BaseException:
+            self._release_slots(acquired)
+            raise
+        return gates
+
+    def _release_slots(self, gates : List[Tuple[_Gate, int]]) -> None:
+        for gate, _ in gates:
+            if gate.concurrency is not None:
+                gate.concurrency.release()
+
+    def release(self, gates : List[Tuple[_Gate, int]], status : Optional[int] = None, retry_after : Optional[str] = None) -> None:
+        """
+        Free the slots taken by `acquire`, and adapt the rates to the status of the response.
+
+        Parameters
+        ----------
+        gates : list
+            What `acquire` returned
+        status : int, optional
+            The HTTP status of the response, None if there was none
+        retry_after : str, optional
+            The Retry-After header of the response
+        """
+        self._release_slots(gates)
+        for gate, _ in gates:
+            if gate.bucket is None:
+                continue
+            if status == 429:
+                gate.bucket.throttle(_retry_after(retry_after))
+            elif status is not None and status < 500:
+                gate.bucket.recover()
@@ -0,0 +1,215 @@
+import random
+import threading
+import time
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from ..pool import NON_IDEMPOTENT_METHODS
+
+# JSON-RPC errors worth retrying: -32005 is a rate limit, -32603 an internal error of the node.
+# -32000 is the catch-all server error, which mostly reports bad requests, so it isn't retried.
+TRANSIENT_ERROR_CODES = frozenset([-32005, -32603])
+
+def is_transient_error(error : Optional[Mapping[str, Any]], codes : Optional[Iterable[int]] = TRANSIENT_ERROR_CODES) -> bool:
+    """
+    Whether a JSON-RPC error returned by a node is likely to go away on retrying.
+
+    Parameters
+    ----------
+    error : dict
+        The `error` member of the response
+    codes : list[int], optional
+        The transient error codes, defaults to `TRANSIENT_ERROR_CODES`
+
+    Returns
+    -------
+    bool
+    """
+    if not isinstance(error, Mapping):
+        return False
+    return error.get("code") in codes
+
+class CircuitBreaker(object):
+
+    def __init__(self, failure_threshold : Optional[int] = 5, reset_seconds : Optional[float] = 30.0) -> None:
+        """
+        Fail fast while a node is down.
+
+        After `failure_threshold` failures in a row the circuit opens and calls are refused
+        for `reset_seconds`. Then a single trial call is let through (half open):
+        if it succeeds the circuit closes, otherwise it opens again.
+
+        Parameters
+        ----------
+        failure_threshold : int, optional
+            How many failures in a row open the circuit; defaults to 5
+        reset_seconds : float, optional
+            How long the circuit stays open; defaults to 30 seconds
+        """
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at : Optional[float] = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """
+        'closed', 'open' or 'half-open'.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._trial or time.monotonic() - self._opened_at >= self._reset_seconds:
+                return "half-open"
+            return "open"
+
+    def allow(self) -> bool:
+        """
+        Whether a call may go through now.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial or time.monotonic() - self._opened_at < self._reset_seconds:
+                return False
+            self._trial = True
+            return True
+
+    def success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self._failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial = False
+
+class RetryPolicy(object):
+
+    def __init__(self, connect_timeout : Optional[float] = 5.0, read_timeout : Optional[float] = 60.0, max_retries : Optional[int] = 2, backoff : Optional[float] = 0.25, max_backoff : Optional[float] = 8.0, retry_statuses : Optional[Iterable[int]] = (429, 500, 502, 503, 504), retry_error_codes : Optional[Iterable[int]] = TRANSIENT_ERROR_CODES, failure_threshold : Optional[int] = 5, reset_seconds : Optional[float] = 30.0) -> None:
+        """
+        How `post_request` deals with slow and failing nodes.
+
+        Every request gets the connect and read timeouts. Requests that time out, can't connect,
+        or get one of `retry_statuses` or a transient JSON-RPC error back are retried up to
+        `max_retries` times, after a random delay of up to `backoff * 2 ** attempt` seconds
+        (or as long as a 429 response asks for). Only reads are retried, calls that submit
+        transactions never are.
+
+        A `ResilientSession`, and so each `HarmonyAPI`, keeps a `CircuitBreaker` per url, so once
+        `failure_threshold` calls in a row to a node have failed, even after retrying, further calls
+        to it raise `CircuitOpenError` at once for `reset_seconds`. Calls made without one don't
+        get a breaker. Sessions that route between several nodes (see `harmony.utils.sessions.PooledSession`)
+        fail over and eject failing nodes themselves, so they get neither breakers nor retries.
+
+        Parameters
+        ----------
+        connect_timeout : float, optional
+            Seconds to wait for a connection, None to wait forever; defaults to 5
+        read_timeout : float, optional
+            Seconds to wait for the node between bytes of the response, None to wait forever; defaults to 60
+        max_retries : int, optional
+            How many times to retry a failed read; defaults to 2
+        backoff : float, optional
+            The longest delay before the first retry in seconds, doubled on each further retry; defaults to 0.25
+        max_backoff : float, optional
+            The longest delay before any retry in seconds; defaults to 8
+        retry_statuses : list[int], optional
+            The HTTP statuses to retry; defaults to 429, 500, 502, 503 and 504
+        retry_error_codes : list[int], optional
+            The JSON-RPC error codes to retry; defaults to `TRANSIENT_ERROR_CODES`
+        failure_threshold : int, optional
+            How many failed calls in a row open the circuit of a url, None for no circuit breaker; defaults to 5
+        reset_seconds : float, optional
+            How long the circuit of a url stays open; defaults to 30 seconds
+        """
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_retries = max_retries
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._retry_statuses = frozenset(retry_statuses)
+        self._retry_error_codes = frozenset(retry_error_codes)
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+
+    @property
+    def timeout(self) -> Tuple[Optional[float], Optional[float]]:
+        """
+        The (connect, read) timeout, as taken by `requests`.
+        """
+        return self.connect_timeout, self.read_timeout
+
+    def new_breaker(self) -> Optional[CircuitBreaker]:
+        """
+        A circuit breaker with the threshold and reset time of the policy, None if they are disabled.
+        """
+        if self._failure_threshold is None:
+            return None
+        return CircuitBreaker(self._failure_threshold, self._reset_seconds)
+
+    def retries(self, methods : Iterable[str]) -> int:
+        """
+        How many times a request calling the methods may be retried.
+        """
+        methods = list(methods)
+        if not methods or any(method in NON_IDEMPOTENT_METHODS for method in methods):
+            return 0
+        return self.max_retries
+
+    def retry_status(self, status : int) -> bool:
+        return status in self._retry_statuses
+
+    def retry_error(self, payload : Any) -> bool:
+        """
+        Whether the decoded response, or any response in a batch, is a transient JSON-RPC error.
+        """
+        items = payload if isinstance(payload, list) else [payload]
+        return any(isinstance(item, Mapping) and is_transient_error(item.get("error"), self._retry_error_codes) for item in items)
+
+    def delay(self, attempt : int, retry_after : Optional[str] = None) -> float:
+        """
+        How long to wait before retry number `attempt` (starting at 0), with full jitter.
+
+        Parameters
+        ----------
+        attempt : int
+        retry_after : str, optional
+            The Retry-After header of the response, in seconds
+        """
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), self._max_backoff)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self._max_backoff, self._backoff * 2 ** min(attempt, 32)))
+
+class CircuitBreakers(object):
+
+    def __init__(self, retry_policy : RetryPolicy) -> None:
+        """
+        The circuit breakers of the urls called through one session, created on first use.
+
+        Parameters
+        ----------
+        retry_policy : RetryPolicy
+        """
+        self._retry_policy = retry_policy
+        self._breakers : Dict[str, Optional[CircuitBreaker]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url : str) -> Optional[CircuitBreaker]:
+        """
+        The circuit breaker of the url, None if they are disabled.
+        """
+        with self._lock:
+            if url not in self._breakers:
+                self._breakers[url] = self._retry_policy.new_breaker()
+            return self._breakers[url]
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
@@ -0,0 +1,417 @@
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import requests
+from urllib3.exceptions import MaxRetryError, ProtocolError, ReadTimeoutError
+
+from ..cache import ResponseCache
+from ..pool import NON_IDEMPOTENT_METHODS, Endpoint, EndpointPool, HedgePolicy
+from .codec import loads
+from .communication import _methods, format_api_data
+from .ratelimit import RateLimiter
+from .resilience import CircuitBreakers, RetryPolicy
+from .transport import create_session
+
+def make_response(url : str, body : Union[bytes, str], status_code : Optional[int] = 200) -> requests.Response:
+    """
+    Build a response that didn't come from the network, e.g. one served from a cache.
+    """
+    resp = requests.Response()
+    resp._content = body.encode("utf-8") if isinstance(body, str) else body
+    resp.status_code = status_code
+    resp.url = url
+    resp.encoding = "utf-8"
+    resp.headers["Content-Type"] = "application/json"
+    return resp
+
+class SessionWrapper(object):
+
+    def __init__(self, session : Optional[requests.Session] = None) -> None:
+        """
+        Base class for objects that stand in for a `requests.Session` where the
+        endpoint functions take one, adding behaviour around `post`.
+
+        Anything that isn't overridden is passed through to the wrapped session,
+        and wrappers can be stacked on top of each other.
+
+        Parameters
+        ----------
+        session : requests.Session, optional
+            The session to wrap, if None is provided a new one is created.
+        """
+        if session is None:
+            session = create_session()
+        self._session = session
+
+    @property
+    def session(self) -> requests.Session:
+        return self._session
+
+    def __getattr__(self, name : str) -> Any:
+        return getattr(self._session, name)
+
+    def post(self, url : str, **kwargs) -> requests.Response:
+        return self._session.post(url, **kwargs)
+
+    def close(self) -> None:
+        self._session.close()
+
+class CachingSession(SessionWrapper):
+
+    def __init__(self, cache : ResponseCache, session : Optional[requests.Session] = None) -> None:
+        """
+        Serve the calls that `cache` knows to be immutable from it,
+        and store their results after they come back from the node.
+
+        Calls in a batch request are looked up one by one, and only the ones
+        that aren't cached are sent to the node.
+
+        Parameters
+        ----------
+        cache : ResponseCache
+        session : requests.Session, optional
+            The session to wrap, if None is provided a new one is created.
+        """
+        super().__init__(session)
+        self._cache = cache
+
+    @property
+    def cache(self) -> ResponseCache:
+        return self._cache
+
+    def _lookup(self, url : str, call : Dict[str, Any]) -> Optional[str]:
+        if not isinstance(call, dict) or not self._cache.cacheable(call.get("method")):
+            return None
+        result = self._cache.get(url, call["method"], call.get("params", []))
+        if result is None:
+            return None
+        return '{{"jsonrpc": "{}", "id": {}, "result": {}}}'.format(call.get("jsonrpc", "2.0"), json.dumps(call.get("id")), result)
+
+    def _store(self, url : str, call : Dict[str, Any], payload : Dict[str, Any]) -> None:
+        if isinstance(call, dict) and isinstance(payload, dict) and payload.get("error") is None:
+            self._cache.put(url, call.get("method"), call.get("params", []), payload.get("result"))
+
+    def post(self, url : str, data : Optional[Union[str, Dict[str, Any]]] = None, **kwargs) -> requests.Response:
+        try:
+            request = json.loads(data) if isinstance(data, (str, bytes)) else data
+        except ValueError:
+            request = None
+        if isinstance(request, dict):
+            cached = self._lookup(url, request)
+            if cached is not None:
+                return make_response(url, cached)
+            resp = self._session.post(url, data=data, **kwargs)
+            if resp.ok and self._cache.cacheable(request.get("method")):
+                try:
+                    self._store(url, request, loads(resp.content))
+                except ValueError:
+                    pass
+            return resp
+        if isinstance(request, list) and request:
+            return self._post_batch(url, request, kwargs)
+        return self._session.post(url, data=data, **kwargs)
+
+    def _post_batch(self, url : str, request : List[Dict[str, Any]], kwargs : Dict[str, Any]) -> requests.Response:
+        cached = [self._lookup(url, call) for call in request]
+        missing = [call for call, hit in zip(request, cached) if hit is None]
+        if not missing:
+            return make_response(url, "[" + ", ".join(cached) + "]")
+        resp = self._session.post(url, data=json.dumps(missing), **kwargs)
+        if len(missing) == len(request) and not resp.ok:
+            return resp
+        try:
+            payload = loads(resp.content)
+        except ValueError:
+            return resp
+        if not isinstance(payload, list):
+            return resp
+        by_id = {json.dumps(item.get("id")) : item for item in payload if isinstance(item, dict)}
+        for call in missing:
+            item = by_id.get(json.dumps(call.get("id")))
+            if item is not None:
+                self._store(url, call, item)
+        parts = [hit for hit in cached if hit is not None] + [json.dumps(item) for item in payload]
+        return make_response(url, "[" + ", ".join(parts) + "]", resp.status_code)
+
+class CoalescingSession(SessionWrapper):
+
+    def __init__(self, session : Optional[requests.Session] = None) -> None:
+        """
+        Share one network call between identical requests that are in flight at the same time.
+
+        When a thread posts a request that another thread is already waiting on,
+        it waits for that request instead of sending its own, and both get the same response.
+        Requests are identical when they have the same url and body, i.e. the same method and parameters.
+
+        Parameters
+        ----------
+        session : requests.Session, optional
+            The session to wrap, if None is provided a new one is created.
+        """
+        super().__init__(session)
+        self._lock = threading.Lock()
+        self._inflight : Dict[Tuple[str, Any], Future] = {}
+        self.coalesced = 0
+
+    def post(self, url : str, data : Optional[Union[str, Dict[str, Any]]] = None, **kwargs) -> requests.Response:
+        key = (url, data if isinstance(data, (str, bytes)) else json.dumps(data, sort_keys=True))
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+        try:
+            resp = self._session.post(url, data=data, **kwargs)
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        future.set_result(resp)
+        return resp
+
+def _archival(body : Union[bytes, str]) -> Optional[bool]:
+    try:
+        return bool(loads(body)["result"]["is-archival"])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+def _ok(status_code : int) -> bool:
+    return status_code < 500 and status_code != 429
+
+def _unsent(err : requests.RequestException) -> bool:
+    """
+    Whether the request failed before it reached the node, so sending it again can't run it twice.
+    """
+    reason = err.args[0] if err.args else None
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return isinstance(err, requests.ConnectionError) and not isinstance(reason, (ProtocolError, ReadTimeoutError, OSError))
+
+class PooledSession(SessionWrapper):
+
+    def __init__(self, pool : EndpointPool, session : Optional[requests.Session] = None, hedging : Optional[HedgePolicy] = None) -> None:
+        """
+        Send every request to a node of the pool instead of the url it is posted to,
+        failing over to the next best node when one can't be reached or answers with
+        a 5xx or 429 status.
+
+        Calls that submit transactions are only sent to another node when the connection
+        to the first one couldn't be made, since a node that timed out or failed may still
+        have accepted the transaction.
+
+        Before the first call that needs an archival node, the nodes are asked
+        whether they are archival through their metadata.
+
+        With a `HedgePolicy`, a read that is slower than usual is sent to a second node as well
+        (the same node if the pool has only one), and whichever answers first is returned.
+        The blocking session can't abort a request that is under way, so the slower one is
+        left to finish in the background, holding a thread and a connection until it does.
+        Hedged calls are sent from at most `HedgePolicy.max_workers` threads, counting those
+        left finishing; while they are all busy, calls are sent without a hedge.
+
+        Parameters
+        ----------
+        pool : EndpointPool
+        session : requests.Session, optional
+            The session to wrap, if None is provided a new one is created.
+        hedging : HedgePolicy, optional
+            When to hedge slow reads, if None is provided they never are.
+        """
+        super().__init__(session)
+        self._pool = pool
+        self._hedging = hedging
+        self._executor : Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def pool(self) -> EndpointPool:
+        return self._pool
+
+    @property
+    def hedging(self) -> Optional[HedgePolicy]:
+        return self._hedging
+
+    def discover_capabilities(self) -> None:
+        """
+        Ask the nodes that aren't known to be archival or not.
+        """
+        for endpoint in self._pool.unknown_capabilities():
+            try:
+                resp = self._session.post(endpoint.url, headers={"Content-Type" : "application/json"}, data=format_api_data("hmyv2_getNodeMetadata", None))
+            except requests.RequestException:
+                self._pool.set_archival(endpoint, None)
+                continue
+            self._pool.set_archival(endpoint, _archival(resp.content))
+
+    def _send(self, endpoint : Endpoint, method : Optional[str], data : Any, kwargs : Dict[str, Any]) -> requests.Response:
+        start = time.monotonic()
+        try:
+            resp = self._session.post(endpoint.url, data=data, **kwargs)
+        except requests.RequestException:
+            self._pool.record(endpoint, time.monotonic() - start, False)
+            raise
+        elapsed = time.monotonic() - start
+        ok = _ok(resp.status_code)
+        self._pool.record(endpoint, elapsed, ok)
+        if ok and self._hedging is not None:
+            self._hedging.observe(method, elapsed)
+        return resp
+
+    def _finished(self, future : Future) -> None:
+        with self._executor_lock:
+            self._in_flight -= 1
+
+    def _submit(self, *args) -> Optional[Future]:
+        with self._executor_lock:
+            # Queued calls would only be sent once a slower one finishes, so none are queued
+            if self._in_flight >= self._hedging.max_workers:
+                return None
+            self._in_flight += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._hedging.max_workers)
+        future = self._executor.submit(self._send, *args)
+        future.add_done_callback(self._finished)
+        return future
+
+    def _hedged(self, endpoint : Endpoint, delay : float, archival : bool, tried : List[Endpoint], method : str, data : Any, kwargs : Dict[str, Any]) -> Tuple[Optional[requests.Response], Optional[Exception]]:
+        first = self._submit(endpoint, method, data, kwargs)
+        if first is None:
+            self._hedging.record(method, False, False)
+            try:
+                return self._send(endpoint, method, data, kwargs), None
+            except requests.RequestException as err:
+                return None, err
+        futures = [first]
+        done, _ = wait(futures, timeout=delay)
+        if not done:
+            second = self._pool.select(archival, tried) or self._pool.select(archival)
+            hedge = self._submit(second, method, data, kwargs) if second is not None else None
+            if hedge is not None:
+                if second is not endpoint:
+                    tried.append(second)
+                futures.append(hedge)
+        resp, error = None, None
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    resp = future.result()
+                except requests.RequestException as err:
+                    error = err
+                    continue
+                if _ok(resp.status_code):
+                    for other in pending:
+                        other.cancel()
+                    self._hedging.record(method, len(futures) > 1, future is not futures[0])
+                    return resp, None
+        self._hedging.record(method, len(futures) > 1, False)
+        return resp, error
+
+    def post(self, url : str, data : Optional[Union[str, Dict[str, Any]]] = None, **kwargs) -> requests.Response:
+        methods = _methods(data)
+        archival = self._pool.needs_archival(methods)
+        if archival and self._pool.unknown_capabilities():
+            self.discover_capabilities()
+        method = methods[0] if len(methods) == 1 else None
+        writes = any(m in NON_IDEMPOTENT_METHODS for m in methods)
+        delay = self._hedging.delay(method) if self._hedging is not None else None
+        tried : List[Endpoint] = []
+        resp, error = None, None
+        while True:
+            endpoint = self._pool.select(archival, tried)
+            if endpoint is None:
+                break
+            tried.append(endpoint)
+            if delay is not None:
+                attempt, err = self._hedged(endpoint, delay, archival, tried, method, data, kwargs)
+            else:
+                try:
+                    attempt, err = self._send(endpoint, method, data, kwargs), None
+                except requests.RequestException as e:
+                    attempt, err = None, e
+                if self._hedging is not None and self._hedging.hedges(method):
+                    self._hedging.record(method, False, False)
+            if attempt is None:
+                error = err
+                if writes and not _unsent(err):
+                    break
+                continue
+            resp = attempt
+            if _ok(resp.status_code) or writes:
+                return resp
+        if resp is not None:
+            return resp
+        raise error
+
+class RateLimitedSession(SessionWrapper):
+
+    def __init__(self, rate_limiter : RateLimiter, session : Optional[requests.Session] = None) -> None:
+        """
+        Hold requests back until the rate and concurrency limits of `rate_limiter` allow them,
+        and slow down when a node answers with 429.
+
+        Wrap the session that talks to the nodes directly, below a `PooledSession`, so the
+        limits apply to each node of a pool. Sharing one `RateLimiter` between sessions
+        makes them share its limits.
+
+        Parameters
+        ----------
+        rate_limiter : RateLimiter
+        session : requests.Session, optional
+            The session to wrap, if None is provided a new one is created.
+        """
+        super().__init__(session)
+        self._rate_limiter = rate_limiter
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self._rate_limiter
+
+    def post(self, url : str, data : Optional[Union[str, Dict[str, Any]]] = None, **kwargs) -> requests.Response:
+        gates = self._rate_limiter.acquire(url, _methods(data))
+        try:
+            resp = self._session.post(url, data=data, **kwargs)
+        except BaseException:
+            self._rate_limiter.release(gates)
+            raise
+        self._rate_limiter.release(gates, resp.status_code, resp.headers.get("Retry-After"))
+        return resp
+
+class ResilientSession(SessionWrapper):
+
+    def __init__(self, retry_policy : RetryPolicy, session : Optional[requests.Session] = None) -> None:
+        """
+        Give the requests made through the session the timeouts and retries of `retry_policy`,
+        instead of those of `DEFAULT_RETRY_POLICY`, and circuit breakers of their own.
+
+        Parameters
+        ----------
+        retry_policy : RetryPolicy
+        session : requests.Session, optional
+            The session to wrap, if None is provided a new one is created.
+        """
+        super().__init__(session)
+        self.retry_policy = retry_policy
+        self.breakers = CircuitBreakers(retry_policy)
+
+class TrustedSession(SessionWrapper):
+    """
+    Marks the session as talking to a trusted node, so the endpoint functions
+    build the response models without validating them.
+
+    This skips the cost of validation on large responses such as lists of blocks
+    or validators, at the price of keeping values exactly as the node sent them.
+    """
+
+    trusted = True
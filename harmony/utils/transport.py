@@ -0,0 +1,145 @@
+import socket
+import threading
+from typing import List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+class TransportConfig(object):
+
+    def __init__(self, max_connections : Optional[int] = 100, max_connections_per_host : Optional[int] = 32, max_hosts : Optional[int] = 10, block : Optional[bool] = False, keepalive : Optional[bool] = True, keepalive_timeout : Optional[float] = 30.0, tcp_nodelay : Optional[bool] = True, http2 : Optional[bool] = False) -> None:
+        """
+        How the sessions created by `create_session` connect to the nodes.
+
+        Connections are kept alive and reused between calls, so only the first call to a node
+        pays for the TCP and TLS handshakes.
+
+        Parameters
+        ----------
+        max_connections : int, optional
+            The most open connections of an asyncio session; defaults to 100
+        max_connections_per_host : int, optional
+            The most connections kept open to a single node; defaults to 32
+        max_hosts : int, optional
+            How many nodes connections are kept open to by a blocking session; defaults to 10
+        block : bool, optional
+            Whether threads of a blocking session wait for a free connection once `max_connections_per_host`
+            are in use, rather than opening a connection that is closed after the call; defaults to False
+        keepalive : bool, optional
+            Whether to reuse connections between calls, and have the OS check idle ones are alive; defaults to True
+        keepalive_timeout : float, optional
+            How long an asyncio session keeps an idle connection open in seconds; defaults to 30
+        tcp_nodelay : bool, optional
+            Whether to send small requests at once instead of waiting to fill a packet (disables Nagle's algorithm); defaults to True
+        http2 : bool, optional
+            Whether blocking sessions speak HTTP/2, multiplexing calls to a node over one connection.
+            Requires httpx with its http2 extra. aiohttp only speaks HTTP/1.1, so asyncio sessions ignore it.
+            Defaults to False
+        """
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.max_hosts = max_hosts
+        self.block = block
+        self.keepalive = keepalive
+        self.keepalive_timeout = keepalive_timeout
+        self.tcp_nodelay = tcp_nodelay
+        self.http2 = http2
+
+    def socket_options(self) -> List[Tuple[int, int, int]]:
+        """
+        The socket options of each new connection, as taken by urllib3.
+        """
+        options = []
+        if self.tcp_nodelay:
+            options.append((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1))
+        if self.keepalive:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        return options
+
+class TunedAdapter(HTTPAdapter):
+
+    def __init__(self, config : TransportConfig) -> None:
+        """
+        An `HTTPAdapter` with the pool sizes and socket options of a `TransportConfig`.
+        """
+        self.transport = config
+        super().__init__(pool_connections=config.max_hosts, pool_maxsize=config.max_connections_per_host, pool_block=config.block)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        kwargs["socket_options"] = self.transport.socket_options()
+        super().init_poolmanager(*args, **kwargs)
+
+DEFAULT_TRANSPORT = TransportConfig()
+
+_default_transport = DEFAULT_TRANSPORT
+_default_session : Optional[requests.Session] = None
+_lock = threading.Lock()
+
+def create_session(config : Optional[TransportConfig] = None) -> requests.Session:
+    """
+    Create a session with the connection pool of the config.
+
+    A session can be shared between threads: each call takes a connection of the pool
+    for as long as it runs, and gives it back for the next call.
+
+    Parameters
+    ----------
+    config : TransportConfig, optional
+        Defaults to the config set with `set_default_transport`
+
+    Returns
+    -------
+    requests.Session
+
+    Raises
+    ------
+    ImportError: If the config asks for HTTP/2 and httpx isn't installed
+    """
+    if config is None:
+        config = _default_transport
+    session = requests.Session()
+    if config.http2:
+        from .http2 import HTTP2Adapter
+        adapter = HTTP2Adapter(config)
+    else:
+        adapter = TunedAdapter(config)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not config.keepalive:
+        session.headers["Connection"] = "close"
+    return session
+
+def default_session() -> requests.Session:
+    """
+    The session shared by every call made without one, such as the module level functions
+    called without a `session`. It is created on first use.
+    """
+    global _default_session
+    if _default_session is None:
+        with _lock:
+            if _default_session is None:
+                _default_session = create_session()
+    return _default_session
+
+def default_transport() -> TransportConfig:
+    """
+    The config set with `set_default_transport`, `DEFAULT_TRANSPORT` until then.
+    """
+    return _default_transport
+
+def set_default_transport(config : TransportConfig) -> None:
+    """
+    Set the config of the sessions created without one, and of the default session.
+    The current default session is closed and replaced on next use, as are the
+    default sessions of the asyncio functions (see `harmony.aio.communication.default_session`).
+
+    Parameters
+    ----------
+    config : TransportConfig
+    """
+    global _default_transport, _default_session
+    with _lock:
+        _default_transport = config
+        session, _default_session = _default_session, None
+    if session is not None:
+        session.close()
@@ -0,0 +1,165 @@
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .models import ValidatorInformation
+
+ATTO_PER_ONE = 1e18
+
+def _rate(value : str) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+class ValidatorStats(object):
+
+    def __init__(self, validator_information : Sequence[ValidatorInformation]) -> None:
+        """
+        The result of getAllValidatorInformation flattened into NumPy arrays, one entry per validator,
+        with the delegations stored CSR style: the delegations of validator `i` are
+        `delegation_indptr[i]:delegation_indptr[i + 1]` of the delegation arrays.
+
+        Amounts are converted from Atto to ONE as float64, which keeps about 15 significant digits.
+
+        Parameters
+        ----------
+        validator_information : list[ValidatorInformation]
+        """
+        infos = list(validator_information)
+        n = len(infos)
+        self.address = np.array([info.validator.address for info in infos], dtype=object)
+        self.name = np.array([info.validator.name for info in infos], dtype=object)
+        self.total_delegation = np.fromiter((info.total_delegation / ATTO_PER_ONE for info in infos), dtype=np.float64, count=n)
+        self.epos_winning_stake = np.fromiter((np.nan if info.epos_winning_stake is None else info.epos_winning_stake / ATTO_PER_ONE for info in infos), dtype=np.float64, count=n)
+        self.reward_accumulated = np.fromiter((info.lifetime.reward_accumulated / ATTO_PER_ONE for info in infos), dtype=np.float64, count=n)
+        self.apr = np.fromiter((info.lifetime.apr for info in infos), dtype=np.float64, count=n)
+        self.rate = np.fromiter((_rate(info.validator.rate) for info in infos), dtype=np.float64, count=n)
+        self.max_rate = np.fromiter((_rate(info.validator.max_rate) for info in infos), dtype=np.float64, count=n)
+        self.signed = np.fromiter((info.lifetime.blocks.signed for info in infos), dtype=np.int64, count=n)
+        self.to_sign = np.fromiter((info.lifetime.blocks.to_sign for info in infos), dtype=np.int64, count=n)
+        self.n_keys = np.fromiter((len(info.validator.bls_public_keys) for info in infos), dtype=np.int64, count=n)
+        self.in_committee = np.fromiter((info.currently_in_committee for info in infos), dtype=bool, count=n)
+        self.active = np.fromiter((info.active_status == "active" for info in infos), dtype=bool, count=n)
+        self.elected = np.fromiter((info.epos_status == "currently elected" for info in infos), dtype=bool, count=n)
+
+        counts = np.fromiter((len(info.validator.delegations) for info in infos), dtype=np.int64, count=n)
+        self.delegation_indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.delegation_indptr[1:])
+        m = int(self.delegation_indptr[-1])
+        delegations = [d for info in infos for d in info.validator.delegations]
+        self.delegator = np.array([d.delegator_address for d in delegations], dtype=object)
+        self.delegation_amount = np.fromiter((d.amount / ATTO_PER_ONE for d in delegations), dtype=np.float64, count=m)
+        self.delegation_reward = np.fromiter((d.reward / ATTO_PER_ONE for d in delegations), dtype=np.float64, count=m)
+        self.delegation_validator = np.repeat(np.arange(n), counts)
+
+    def __len__(self) -> int:
+        return len(self.address)
+
+    @property
+    def n_delegations(self) -> np.ndarray:
+        """
+        The number of delegations per validator.
+        """
+        return np.diff(self.delegation_indptr)
+
+    def signing_percentage(self) -> np.ndarray:
+        """
+        The share of blocks signed over the lifetime of each validator, NaN if it had none to sign.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.to_sign > 0, self.signed / self.to_sign, np.nan)
+
+    def delegated_per_validator(self) -> np.ndarray:
+        """
+        The sum of the delegations to each validator, in ONE.
+        """
+        return np.bincount(self.delegation_validator, weights=self.delegation_amount, minlength=len(self))
+
+    def unclaimed_rewards_per_validator(self) -> np.ndarray:
+        """
+        The sum of the unclaimed rewards of the delegators of each validator, in ONE.
+        """
+        return np.bincount(self.delegation_validator, weights=self.delegation_reward, minlength=len(self))
+
+    def self_delegation(self) -> np.ndarray:
+        """
+        The amount each validator delegated to itself, in ONE.
+        """
+        is_self = self.delegator == self.address[self.delegation_validator]
+        return np.bincount(self.delegation_validator[is_self], weights=self.delegation_amount[is_self], minlength=len(self))
+
+    def delegated_per_delegator(self) -> Dict[str, float]:
+        """
+        The sum of the delegations of each delegator over all validators, in ONE.
+        """
+        delegators, inverse = np.unique(self.delegator.astype(str), return_inverse=True)
+        totals = np.bincount(inverse, weights=self.delegation_amount, minlength=len(delegators))
+        return dict(zip(delegators.tolist(), totals.tolist()))
+
+    def apr_percentiles(self, q : Optional[Sequence[float]] = (5, 25, 50, 75, 95), mask : Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Percentiles of the lifetime APR, by default of the elected validators.
+
+        Parameters
+        ----------
+        q : list[float], optional
+            The percentiles to compute, between 0 and 100
+        mask : numpy.ndarray, optional
+            The validators to include, defaults to the elected ones
+        """
+        apr = self.apr[self.elected if mask is None else mask]
+        return np.nanpercentile(apr, q) if len(apr) else np.full(len(q), np.nan)
+
+    def stake_shares(self, mask : Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        The share of the total delegation held by each validator, by default among the elected ones, sorted descending.
+        """
+        stake = self.total_delegation[self.elected if mask is None else mask]
+        total = stake.sum()
+        if total <= 0:
+            return np.zeros(len(stake))
+        return np.sort(stake)[::-1] / total
+
+    def nakamoto_coefficient(self, threshold : Optional[float] = 1 / 3, mask : Optional[np.ndarray] = None) -> int:
+        """
+        The smallest number of validators that together hold more than `threshold` of the stake.
+        """
+        shares = self.stake_shares(mask)
+        if not len(shares):
+            return 0
+        return int(np.searchsorted(np.cumsum(shares), threshold, side="right") + 1)
+
+    def herfindahl_index(self, mask : Optional[np.ndarray] = None) -> float:
+        """
+        The sum of the squared stake shares, from 1 / n for an even spread to 1 for a single validator.
+        """
+        shares = self.stake_shares(mask)
+        return float(np.sum(shares ** 2))
+
+    def gini_coefficient(self, mask : Optional[np.ndarray] = None) -> float:
+        """
+        The Gini coefficient of the stake, from 0 for an even spread to 1 for a single validator.
+        """
+        stake = np.sort(self.total_delegation[self.elected if mask is None else mask])
+        n = len(stake)
+        if n == 0 or stake.sum() <= 0:
+            return 0.0
+        ranks = np.arange(1, n + 1)
+        return float(np.sum((2 * ranks - n - 1) * stake) / (n * stake.sum()))
+
+    def summary(self) -> Dict[str, float]:
+        """
+        The headline aggregates, as plain floats.
+        """
+        return {
+            "validators" : len(self),
+            "elected" : int(self.elected.sum()),
+            "delegations" : len(self.delegator),
+            "total_delegation" : float(self.total_delegation.sum()),
+            "median_apr" : float(self.apr_percentiles((50,))[0]),
+            "mean_signing_percentage" : float(np.nanmean(self.signing_percentage()[self.elected])) if self.elected.any() else np.nan,
+            "nakamoto_coefficient" : self.nakamoto_coefficient(),
+            "herfindahl_index" : self.herfindahl_index(),
+            "gini_coefficient" : self.gini_coefficient()
+        }
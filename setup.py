@@ -21,7 +21,12 @@ setuptools.setup(
         'typer[all]'
     ],
     extras_require = {
-        'dev' : ['datamodel-code-generator', 'sphinx', 'sphinx-rtd-theme', 'Pillow', 'pygments', 'm2r2', 'apispec', 'pytest']
+        'async' : ['aiohttp'],
+        'fast' : ['ujson'],
+        'export' : ['pyarrow'],
+        'stats' : ['numpy'],
+        'http2' : ['httpx[http2]'],
+        'dev' : ['datamodel-code-generator', 'sphinx', 'sphinx-rtd-theme', 'Pillow', 'pygments', 'm2r2', 'apispec', 'pytest', 'aiohttp']
     },
     entry_points = {
         'console_scripts' : ['harmony-cli=harmony.cli:main']
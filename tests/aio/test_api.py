@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from harmony.aio import AsyncHarmonyAPI
+from harmony.models import AddressParameters
+
+loop = asyncio.new_event_loop()
+
+def run(coro):
+    return loop.run_until_complete(coro)
+
+@pytest.fixture(scope="session")
+def API():
+    api = AsyncHarmonyAPI('https://rpc.s0.t.hmny.io/')
+    yield api
+    run(api.close())
+
+def test_node_metadata(API):
+    run(API.node_metadata())
+
+def test_current_block_number(API):
+    run(API.current_block_number())
+
+def test_get_block_block_number(API):
+    run(API.get_block(block_number=5))
+
+def test_get_blocks(API):
+    run(API.get_blocks(13, 14))
+
+def test_get_account_balance(API):
+    run(API.get_account_balance(address="one1wmudztmxynm38vkc3998fxkeymmczg6st7sf83"))
+
+def test_get_transaction(API):
+    run(API.get_transaction("0x2ea6a10e4c9680b59020ad7bab3b4d85df3d458aefb72630dc12019cc0c2c269"))
+
+def test_get_all_validator_information(API):
+    run(API.get_all_validator_information())
+
+def test_concurrent_calls(API):
+    async def get_blocks():
+        return await asyncio.gather(*[API.get_block(block_number=n) for n in range(5, 15)])
+    run(get_blocks())
+
+def test_batch(API):
+    run(API.batch([("hmyv2_blockNumber", None), ("hmyv2_getBalance", AddressParameters(address="one1wmudztmxynm38vkc3998fxkeymmczg6st7sf83"))]))
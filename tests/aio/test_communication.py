@@ -0,0 +1,60 @@
+import asyncio
+import json
+
+from aiohttp import web
+
+from harmony.aio import communication
+from harmony.utils import transport
+from harmony.utils.communication import format_api_data
+from harmony.utils.transport import TransportConfig
+
+async def node(request):
+    call = json.loads(await request.read())
+    return web.json_response({"jsonrpc" : "2.0", "id" : call["id"], "result" : 100})
+
+async def block_numbers(count):
+    app = web.Application()
+    app.router.add_post("/", node)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        return [(await communication.post_request("http://127.0.0.1:{}/".format(port), format_api_data("hmyv2_blockNumber", None)))["result"] for _ in range(count)]
+    finally:
+        await runner.cleanup()
+
+def created_sessions(monkeypatch):
+    sessions = []
+
+    def create_session(*args, **kwargs):
+        sessions.append(create(*args, **kwargs))
+        return sessions[-1]
+
+    create = communication.create_session
+    monkeypatch.setattr(communication, "create_session", create_session)
+    return sessions
+
+def test_calls_without_a_session_share_one_per_loop(monkeypatch):
+    sessions = created_sessions(monkeypatch)
+    assert asyncio.run(block_numbers(3)) == [100] * 3
+    assert len(sessions) == 1 and sessions[0].closed
+    assert asyncio.run(block_numbers(2)) == [100] * 2
+    assert len(sessions) == 2 and sessions[1].closed
+
+def test_default_session_follows_the_default_transport(monkeypatch):
+    sessions = created_sessions(monkeypatch)
+
+    async def main():
+        first = await communication.default_session()
+        assert await communication.default_session() is first
+        transport.set_default_transport(TransportConfig(max_connections=7))
+        second = await communication.default_session()
+        assert first.closed and second.connector.limit == 7
+
+    try:
+        asyncio.run(main())
+    finally:
+        transport.set_default_transport(transport.DEFAULT_TRANSPORT)
+    assert len(sessions) == 2 and all(session.closed for session in sessions)
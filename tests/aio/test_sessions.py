@@ -0,0 +1,53 @@
+import asyncio
+import json
+
+from harmony.aio.sessions import CoalescingSession
+
+class FakeResponse(object):
+
+    def __init__(self, body):
+        self.body = body
+        self.status = 200
+        self.headers = {"Content-Type" : "application/json"}
+
+    async def read(self):
+        return self.body
+
+class SlowRequest(object):
+
+    def __init__(self, data):
+        self.data = data
+
+    async def __aenter__(self):
+        await asyncio.sleep(0.05)
+        call = json.loads(self.data)
+        return FakeResponse(json.dumps({"jsonrpc" : "2.0", "id" : call["id"], "result" : call["params"]}).encode("utf-8"))
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+class SlowSession(object):
+
+    def __init__(self):
+        self.posted = []
+
+    def post(self, url, data=None, **kwargs):
+        self.posted.append(data)
+        return SlowRequest(data)
+
+async def _post(session, data):
+    async with session.post("http://localhost:9500", data=data) as resp:
+        return json.loads(await resp.read())
+
+def test_identical_requests_share_one_call():
+    session = CoalescingSession(SlowSession())
+    same = json.dumps({"jsonrpc" : "2.0", "id" : "1", "method" : "hmyv2_getTransactionByHash", "params" : ["0x01"]})
+    other = json.dumps({"jsonrpc" : "2.0", "id" : "1", "method" : "hmyv2_getTransactionByHash", "params" : ["0x02"]})
+
+    async def post_all():
+        return await asyncio.gather(*[_post(session, data) for data in [same] * 5 + [other]])
+
+    responses = asyncio.run(post_all())
+    assert len(session.session.posted) == 2
+    assert session.coalesced == 4
+    assert sorted(r["result"][0] for r in responses) == ["0x01"] * 5 + ["0x02"]
@@ -0,0 +1,59 @@
+import asyncio
+import json
+
+from aiohttp import web
+
+from harmony.aio import AsyncHarmonyAPI
+from harmony.aio.websocket import WebSocketClient, WebSocketSession
+
+def response(call):
+    result = 107 if call["method"] == "hmyv2_blockNumber" else call["params"][0]
+    return {"jsonrpc" : "2.0", "id" : call["id"], "result" : result}
+
+async def node(request):
+    ws = web.WebSocketResponse()
+    await ws.prepare(request)
+    buffered = []
+    async for msg in ws:
+        call = json.loads(msg.data)
+        if call["method"] == "eth_subscribe":
+            await ws.send_str(json.dumps({"jsonrpc" : "2.0", "id" : call["id"], "result" : "0xabc"}))
+            for number in range(3):
+                await ws.send_str(json.dumps({"jsonrpc" : "2.0", "method" : "eth_subscription", "params" : {"subscription" : "0xabc", "result" : {"number" : hex(number)}}}))
+        elif call["method"] == "eth_unsubscribe":
+            await ws.send_str(json.dumps({"jsonrpc" : "2.0", "id" : call["id"], "result" : True}))
+        else:
+            # Hold the calls back and answer every five in reverse, so the responses can only be matched up by id
+            buffered.append(call)
+            if len(buffered) == 5:
+                for call in reversed(buffered):
+                    await ws.send_str(json.dumps(response(call)))
+                buffered.clear()
+    return ws
+
+async def serve():
+    app = web.Application()
+    app.router.add_get("/", node)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, "ws://127.0.0.1:{}/".format(port)
+
+def test_subscription_and_multiplexed_calls():
+    async def main():
+        runner, url = await serve()
+        try:
+            async with WebSocketClient(url) as client:
+                heads = await client.new_heads()
+                assert [(await heads.get())["number"] for _ in range(3)] == ["0x0", "0x1", "0x2"]
+                assert await asyncio.gather(*[client.call("hmyv2_echo", [i]) for i in range(5)]) == list(range(5))
+                api = AsyncHarmonyAPI(url, session=WebSocketSession(client))
+                results = await asyncio.gather(api.current_block_number(), *[client.call("hmyv2_echo", [i]) for i in range(4)])
+                assert results == [107, 0, 1, 2, 3]
+                await heads.unsubscribe()
+                assert [head async for head in heads] == []
+        finally:
+            await runner.cleanup()
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+"""
+Fakes shared by the offline tests: block and transaction factories, and stand-ins for a requests session.
+"""
+import json
+import threading
+
+from harmony.exceptions import HarmonyNodeError
+from harmony.models import Block, Header
+from harmony.utils.sessions import make_response
+
+def make_block(number, **fields):
+    block = {
+        "difficulty" : 0, "epoch" : 0, "extraData" : "0x", "gasLimit" : 1, "gasUsed" : 0,
+        "hash" : "0x%064x" % number, "logsBloom" : "0x", "miner" : "one1", "mixHash" : "0x", "nonce" : 0,
+        "number" : number, "parentHash" : "0x%064x" % (number - 1), "receiptsRoot" : "0x", "size" : 600,
+        "stakingTransactions" : [], "stateRoot" : "0x", "timestamp" : number, "transactions" : [],
+        "transactionsRoot" : "0x", "uncles" : [], "viewID" : number
+    }
+    block.update(fields)
+    return block
+
+def make_transaction(block_number, index=0, **fields):
+    transaction = {
+        "blockHash" : "0x%064x" % block_number, "blockNumber" : block_number, "from" : "one1a", "to" : "one1b",
+        "timestamp" : block_number, "gas" : 21000, "gasPrice" : 1, "hash" : "0x%062x%02x" % (block_number, index),
+        "input" : "0x", "nonce" : index, "transactionIndex" : index, "value" : 1, "shardID" : 0, "toShardID" : 0
+    }
+    transaction.update(fields)
+    return transaction
+
+def result(request, value):
+    return {"jsonrpc" : "2.0", "id" : request["id"], "result" : value}
+
+def error(request, code, message):
+    return {"jsonrpc" : "2.0", "id" : request["id"], "error" : {"code" : code, "message" : message}}
+
+class FakeSession(object):
+
+    def __init__(self, respond):
+        """
+        Stands in for a requests session, answering each post with the json `respond(url, request)` returns,
+        given the decoded request, or raising what it raises. The (url, request) pairs are kept in `posted`.
+        """
+        self.respond = respond
+        self.posted = []
+        self._lock = threading.Lock()
+
+    def post(self, url, headers=None, data=None, **kwargs):
+        request = json.loads(data)
+        with self._lock:
+            self.posted.append((url, request))
+        return make_response(url, json.dumps(self.respond(url, request)))
+
+    def close(self):
+        pass
+
+class BlockRangeSession(FakeSession):
+
+    def __init__(self, fail_once=(), skip_once=(), block=make_block):
+        """
+        Answers hmyv2_getBlocks with `block(number)` for each number of the range,
+        and with an error the first time a range starting at one of `fail_once` is asked for.
+        The blocks of `skip_once` are left out of the first range they are asked for in.
+        """
+        super().__init__(self._blocks)
+        self.fail_once = set(fail_once)
+        self.skip_once = set(skip_once)
+        self.block = block
+        self.ranges = []
+
+    def _blocks(self, url, request):
+        start, end = request["params"][:2]
+        with self._lock:
+            self.ranges.append((start, end))
+            if start in self.fail_once:
+                self.fail_once.discard(start)
+                return error(request, -32000, "timeout")
+            skipped = self.skip_once.intersection(range(start, end + 1))
+            self.skip_once -= skipped
+        return result(request, [self.block(n) for n in range(start, end + 1) if n not in skipped])
+
+class FakeChain(object):
+
+    def __init__(self, head):
+        """
+        Stands in for a HarmonyAPI on a chain of `head` + 1 blocks, which can be grown or forked.
+        The blocks in `hidden` are left out of get_blocks, and block_header fails while `header_failures` is positive.
+        """
+        self.blocks = {}
+        self.block_cache = None
+        self.hidden = set()
+        self.header_failures = 0
+        self.grow(head + 1)
+
+    def _block(self, number, fork):
+        data = make_block(number)
+        data["hash"] = "0x%s%063x" % (fork, number)
+        parent = self.blocks.get(number - 1)
+        data["parentHash"] = parent.hash_ if parent is not None else "0x0"
+        return Block(**data)
+
+    def grow(self, count, fork="a"):
+        head = max(self.blocks, default=-1)
+        for n in range(head + 1, head + count + 1):
+            self.blocks[n] = self._block(n, fork)
+
+    def replace_from(self, number, fork):
+        head = max(self.blocks)
+        for n in range(number, head + 1):
+            del self.blocks[n]
+        for n in range(number, head + 1):
+            self.blocks[n] = self._block(n, fork)
+
+    def current_block_number(self):
+        return max(self.blocks)
+
+    def get_blocks(self, start, end, *opts):
+        return [self.blocks[n] for n in range(start, end + 1) if n in self.blocks and n not in self.hidden]
+
+    def block_header(self, number):
+        if self.header_failures > 0:
+            self.header_failures -= 1
+            raise HarmonyNodeError("The Node responded with the following error.\nCode -32000: timeout")
+        block = self.blocks[number]
+        return Header(blockHash=block.hash_, blockNumber=number, shardID=0, leader="", viewID=number, epoch=0, timestamp="", unixtime=0, lastCommitSig="", lastCommitBitmap="")
@@ -1,6 +1,8 @@
 import pytest
 
 from harmony.api import HarmonyAPI
+from harmony.cache import BlockCache, ResponseCache, TTLCache
+from harmony.models import AddressParameters
 
 @pytest.fixture(scope="session")
 def API():
@@ -155,3 +157,31 @@ def test_get_information_about_validator(API):
 
 def test_pending_cx_receipts(API):
     API.pending_cx_receipts()
+
+def test_batch(API):
+    API.batch([("hmyv2_blockNumber", None), ("hmyv2_getBalance", AddressParameters(address="one1wmudztmxynm38vkc3998fxkeymmczg6st7sf83"))])
+
+def test_iter_blocks(API):
+    list(API.iter_blocks(13, 140))
+
+def test_block_cache():
+    api = HarmonyAPI('https://rpc.s0.t.hmny.io/', block_cache=BlockCache())
+    assert api.get_block(block_number=5) is api.get_block(block_number=5)
+
+def test_response_cache(tmp_path):
+    api = HarmonyAPI('https://rpc.s0.t.hmny.io/', response_cache=ResponseCache(str(tmp_path / "responses.db")))
+    api.get_account_balance(address="one1wmudztmxynm38vkc3998fxkeymmczg6st7sf83" , block_number=8049136)
+    api.get_account_balance(address="one1wmudztmxynm38vkc3998fxkeymmczg6st7sf83" , block_number=8049136)
+    assert api.session.cache.hits == 1
+
+def test_state_cache():
+    api = HarmonyAPI('https://rpc.s0.t.hmny.io/', state_cache=TTLCache())
+    assert api.current_epoch() == api.current_epoch()
+    assert api.state_cache.hits >= 1
+
+def test_trusted():
+    api = HarmonyAPI('https://rpc.s0.t.hmny.io/', trusted=True)
+    assert api.get_blocks(13, 20) == HarmonyAPI('https://rpc.s0.t.hmny.io/').get_blocks(13, 20)
+
+def test_validator_stats(API):
+    assert len(API.validator_stats()) == len(API.get_all_validator_information())
@@ -0,0 +1,69 @@
+import json
+import threading
+
+import pytest
+import requests
+
+from harmony.balances import iter_balances
+from harmony.exceptions import HarmonyNodeError
+from harmony.utils.sessions import make_response
+
+def balance_of(address):
+    return int(address[4:]) * 10 ** 18
+
+class BalanceSession(object):
+
+    def __init__(self, fail_once=(), error_once=(), always_error=()):
+        self.fail_once = set(fail_once)
+        self.error_once = set(error_once)
+        self.always_error = set(always_error)
+        self.batches = []
+        self._lock = threading.Lock()
+
+    def post(self, url, headers=None, data=None, **kwargs):
+        calls = json.loads(data)
+        addresses = [call["params"][0] for call in calls]
+        with self._lock:
+            self.batches.append((calls[0]["method"], addresses))
+            if self.fail_once & set(addresses):
+                self.fail_once -= set(addresses)
+                raise requests.ConnectionError("reset")
+        payload = []
+        for call, address in zip(calls, addresses):
+            if address in self.always_error or address in self.error_once:
+                self.error_once.discard(address)
+                payload.append({"jsonrpc" : "2.0", "id" : call["id"], "error" : {"code" : -32000, "message" : "busy"}})
+            else:
+                payload.append({"jsonrpc" : "2.0", "id" : call["id"], "result" : balance_of(address)})
+        return make_response(url, json.dumps(payload[::-1]))
+
+def addresses(n):
+    return ("one1%d" % i for i in range(n))
+
+def test_balances_are_streamed_in_order():
+    session = BalanceSession()
+    balances = list(iter_balances("http://localhost:9500", addresses(1050), 12345, batch_size=100, max_workers=3, session=session))
+    assert balances == [(address, balance_of(address)) for address in addresses(1050)]
+    assert len(session.batches) == 11
+    assert {method for method, _ in session.batches} == {"hmyv2_getBalanceByBlockNumber"}
+
+def test_failed_batches_and_calls_are_retried():
+    session = BalanceSession(fail_once=["one1150"], error_once=["one17", "one18"])
+    balances = list(iter_balances("http://localhost:9500", addresses(300), batch_size=100, retry_backoff=0, session=session))
+    assert balances == [(address, balance_of(address)) for address in addresses(300)]
+    assert ("hmyv2_getBalance", ["one17", "one18"]) in session.batches
+
+def test_gives_up_after_max_retries():
+    session = BalanceSession(always_error=["one13"])
+    with pytest.raises(HarmonyNodeError):
+        list(iter_balances("http://localhost:9500", addresses(10), max_retries=2, retry_backoff=0, session=session))
+    assert session.batches[-1] == ("hmyv2_getBalance", ["one13"])
+
+def test_export_balance_snapshot(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    from harmony.export import export_balance_snapshot
+    writer = export_balance_snapshot("http://localhost:9500", addresses(250), str(tmp_path / "balances.parquet"), 777, row_group_size=100, session=BalanceSession())
+    table = pq.read_table(writer.path)
+    assert table.num_rows == 250
+    assert table.column("balance")[249].as_py() == str(balance_of("one1249"))
+    assert set(table.column("blockNumber").to_pylist()) == {777}
@@ -0,0 +1,27 @@
+from harmony.endpoints.batch import batch_call
+from harmony.models import AddressParameters, BalanceResponse, BlockNumberResponse
+
+from tests.fakes import FakeSession
+
+def test_batch_call_matches_ids():
+    session = FakeSession(lambda url, request: [
+        {"jsonrpc" : "2.0", "id" : 2, "result" : 100},
+        {"jsonrpc" : "2.0", "id" : 1, "result" : 5}
+    ])
+    calls = [("hmyv2_blockNumber", None), ("hmyv2_getBalance", AddressParameters(address="one1abc"))]
+    responses = batch_call("http://localhost:9500", calls, session)
+    assert len(session.posted) == 1
+    assert [c["id"] for c in session.posted[0][1]] == [1, 2]
+    assert isinstance(responses[0], BlockNumberResponse) and responses[0].result == 5
+    assert isinstance(responses[1], BalanceResponse) and responses[1].result == 100
+
+def test_batch_call_missing_response():
+    session = FakeSession(lambda url, request: [{"jsonrpc" : "2.0", "id" : 1, "result" : 5}])
+    responses = batch_call("http://localhost:9500", [("hmyv2_blockNumber", None), ("hmyv2_blockNumber", None)], session)
+    assert responses[0].result == 5
+    assert responses[1].error is not None
+
+def test_batch_call_rejected_batch():
+    session = FakeSession(lambda url, request: {"jsonrpc" : "2.0", "id" : None, "error" : {"code" : -32600, "message" : "Invalid Request"}})
+    responses = batch_call("http://localhost:9500", [("hmyv2_blockNumber", None), ("hmyv2_gasPrice", None)], session)
+    assert all(r.error["code"] == -32600 for r in responses)
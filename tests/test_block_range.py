@@ -0,0 +1,36 @@
+import pytest
+
+from harmony.block_range import AdaptiveChunkSize, iter_blocks_from_range
+from harmony.exceptions import BlockGapError
+
+from tests.fakes import BlockRangeSession
+
+def test_blocks_in_order():
+    session = BlockRangeSession()
+    blocks = list(iter_blocks_from_range("http://localhost:9500", 1, 500, chunk_size=AdaptiveChunkSize(initial=7), session=session))
+    assert [b.number for b in blocks] == list(range(1, 501))
+
+def test_failed_chunk_is_retried():
+    session = BlockRangeSession(fail_once=[1])
+    blocks = list(iter_blocks_from_range("http://localhost:9500", 1, 40, retry_backoff=0, chunk_size=AdaptiveChunkSize(initial=10), session=session))
+    assert [b.number for b in blocks] == list(range(1, 41))
+    assert (1, 5) in session.ranges and (6, 10) in session.ranges
+
+def test_short_chunk_is_retried():
+    session = BlockRangeSession(skip_once=[7])
+    blocks = list(iter_blocks_from_range("http://localhost:9500", 1, 20, retry_backoff=0, chunk_size=AdaptiveChunkSize(initial=10), session=session))
+    assert [b.number for b in blocks] == list(range(1, 21))
+    assert (6, 10) in session.ranges
+
+def test_gap_left_after_retrying_raises():
+    session = BlockRangeSession(skip_once=range(16, 21))
+    blocks = iter_blocks_from_range("http://localhost:9500", 1, 20, max_retries=0, retry_backoff=0, chunk_size=AdaptiveChunkSize(initial=10), session=session)
+    with pytest.raises(BlockGapError):
+        list(blocks)
+
+def test_chunk_size_adapts():
+    chunk_size = AdaptiveChunkSize(initial=100, target_seconds=1.0, target_bytes=10 ** 9)
+    chunk_size.observe(100, 4.0, 1000)
+    assert chunk_size.size == 25
+    chunk_size.observe(25, 0.01, 1000)
+    assert chunk_size.size == 50
@@ -0,0 +1,50 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from harmony.bloom import LogFilter, bloom_bits, decode_blooms, iter_candidate_blocks, keccak256
+
+from tests.fakes import BlockRangeSession, make_block
+
+TOKEN = "0x0b585f8daefbc68a311fbd4cb20d9174ad174016"
+OTHER = "0x" + "11" * 20
+TRANSFER = "0x" + keccak256(b"Transfer(address,address,uint256)").hex()
+APPROVAL = "0x" + keccak256(b"Approval(address,address,uint256)").hex()
+
+def make_bloom(*items):
+    bloom = bytearray(256)
+    for item in items:
+        for index, mask in bloom_bits(item):
+            bloom[index] |= mask
+    return "0x" + bloom.hex()
+
+def to_bech32(address):
+    charset = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+    bits = "".join("{:08b}".format(b) for b in bytes.fromhex(address[2:]))
+    # The checksum isn't verified when decoding
+    return "one1" + "".join(charset[int(bits[i:i + 5], 2)] for i in range(0, len(bits), 5)) + "qqqqqq"
+
+def test_keccak256():
+    assert keccak256(b"").hex() == "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"
+    assert TRANSFER == "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
+def test_filter_semantics():
+    blooms = decode_blooms([
+        make_bloom(TOKEN, TRANSFER),
+        make_bloom(TOKEN, APPROVAL),
+        make_bloom(OTHER, TRANSFER),
+        make_bloom(),
+        "0x"
+    ])
+    assert LogFilter(TOKEN, [TRANSFER]).match(blooms).tolist() == [True, False, False, False, True]
+    assert LogFilter([TOKEN], [[TRANSFER, APPROVAL]]).match(blooms).tolist() == [True, True, False, False, True]
+    assert LogFilter(to_bech32(TOKEN), [None]).match(blooms).tolist() == [True, True, False, False, True]
+    assert LogFilter().match(blooms).all()
+
+def test_candidate_blocks_from_a_range():
+
+    def block(number):
+        return make_block(number, logsBloom=make_bloom(TOKEN, TRANSFER) if number % 100 == 0 else make_bloom(OTHER, APPROVAL))
+
+    blocks = iter_candidate_blocks("http://localhost:9500", 1, 1000, LogFilter(TOKEN, [TRANSFER]), batch_size=64, session=BlockRangeSession(block=block))
+    assert [b.number for b in blocks] == list(range(100, 1001, 100))
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+
+from harmony.cache import BlockCache, ResponseCache, TTLCache
+from harmony.endpoints.batch import batch_call
+from harmony.models import AddressBlockNumberParameters
+from harmony.utils.sessions import CachingSession
+
+from tests.fakes import FakeSession, result
+
+def echo_block_numbers(url, calls):
+    return [result(call, call["params"][1]) for call in calls]
+
+def test_lookup_by_number_and_hash():
+    cache = BlockCache()
+    cache.put(("header",), "header-5", 5, "0x05")
+    assert cache.get(("header",), block_number=5) == "header-5"
+    assert cache.get(("header",), block_hash="0x05") == "header-5"
+    assert cache.get(("signers", False), block_number=5) is None
+    assert cache.get(("header",), block_hash="0x06") is None
+
+def test_least_recently_used_block_is_evicted():
+    cache = BlockCache(max_blocks=2)
+    cache.put(("header",), "header-1", 1, "0x01")
+    cache.put(("header",), "header-2", 2, "0x02")
+    cache.get(("header",), block_number=1)
+    cache.put(("header",), "header-3", 3, "0x03")
+    assert len(cache) == 2
+    assert cache.get(("header",), block_number=2) is None
+    assert cache.get(("header",), block_hash="0x02") is None
+    assert cache.get(("header",), block_hash="0x01") == "header-1"
+
+def test_response_cache_persists(tmp_path):
+    path = str(tmp_path / "responses.db")
+    cache = ResponseCache(path)
+    assert cache.put("http://localhost:9500", "hmyv2_getBalanceByBlockNumber", ["one1abc", 5], 100)
+    cache.close()
+    cache = ResponseCache(path)
+    assert cache.get("http://localhost:9500", "hmyv2_getBalanceByBlockNumber", ["one1abc", 5]) == "100"
+    assert cache.get("http://localhost:9501", "hmyv2_getBalanceByBlockNumber", ["one1abc", 5]) is None
+
+def test_response_cache_skips_mutable_results():
+    cache = ResponseCache(":memory:")
+    assert not cache.put("http://localhost:9500", "hmyv2_getBalance", ["one1abc"], 100)
+    assert not cache.put("http://localhost:9500", "hmyv2_getBlockByNumber", [10 ** 9, {}], None)
+    assert not cache.put("http://localhost:9500", "hmyv2_getBlocks", [1, 10, {}], [{}] * 5)
+    pending = {"blockHash" : "0x" + "0" * 64, "blockNumber" : None}
+    assert not cache.put("http://localhost:9500", "hmyv2_getTransactionByHash", ["0xabc"], pending)
+
+def test_caching_session_batch():
+    session = FakeSession(echo_block_numbers)
+    caching = CachingSession(ResponseCache(":memory:"), session)
+    calls = [("hmyv2_getBalanceByBlockNumber", AddressBlockNumberParameters(address="one1abc", block_number=n)) for n in range(3)]
+    assert [r.result for r in batch_call("http://localhost:9500", calls, caching)] == [0, 1, 2]
+    calls.append(("hmyv2_getBalanceByBlockNumber", AddressBlockNumberParameters(address="one1abc", block_number=3)))
+    assert [r.result for r in batch_call("http://localhost:9500", calls, caching)] == [0, 1, 2, 3]
+    assert [len(calls) for _, calls in session.posted] == [3, 1]
+
+def test_ttl_cache_expires():
+    cache = TTLCache({"current_gas_price" : 0.05})
+    calls = []
+    fetch = lambda: calls.append(1) or len(calls)
+    assert cache.fetch("current_gas_price", fetch) == 1
+    assert cache.fetch("current_gas_price", fetch) == 1
+    time.sleep(0.06)
+    assert cache.fetch("current_gas_price", fetch) == 2
+
+def test_ttl_cache_single_flight():
+    cache = TTLCache()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.05)
+        return 10
+
+    threads = [threading.Thread(target=cache.fetch, args=("current_gas_price", fetch)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+
+    async def afetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 20
+
+    async def fetch_all():
+        return await asyncio.gather(*[cache.afetch("current_block_number", afetch) for _ in range(8)])
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(fetch_all()) == [20] * 8
+    finally:
+        loop.close()
+    assert len(calls) == 2
@@ -0,0 +1,45 @@
+import pytest
+
+from harmony.utils import codec
+
+@pytest.fixture
+def backends():
+    previous = codec.backend()
+    installed = []
+    for name in codec.BACKENDS:
+        try:
+            codec.use_backend(name)
+        except ImportError:
+            continue
+        installed.append(name)
+    yield installed
+    codec.use_backend(previous)
+
+def test_backends_agree(backends):
+    payload = {"jsonrpc" : "2.0", "id" : 1, "result" : [{"number" : 5, "hash" : "0x05", "miner" : "one1", "size" : 2 ** 62, "value" : 10 ** 24}]}
+    for name in backends:
+        codec.use_backend(name)
+        assert codec.loads(codec.dumps(payload).encode("utf-8")) == payload
+        assert codec.loads(codec.dumps(payload)) == payload
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        codec.use_backend("simplejson")
+
+def test_numbers_over_64_bits_are_exact(backends):
+    # Atto amounts routinely exceed 64 bits, and must never come back as floats
+    body = b'{"jsonrpc":"2.0","id":1,"result":12345678901234567890123456}'
+    for name in backends:
+        codec.use_backend(name)
+        for data in (body, body.decode("utf-8")):
+            result = codec.loads(data)["result"]
+            assert isinstance(result, int) and result == 12345678901234567890123456
+        assert codec.loads(codec.dumps({"value" : 2 ** 64 + 1}))["value"] == 2 ** 64 + 1
+
+def test_default_backend_is_lossless():
+    previous = codec.backend()
+    try:
+        codec.use_backend()
+        assert codec.loads(b"[18446744073709551617]") == [2 ** 64 + 1]
+    finally:
+        codec.use_backend(previous)
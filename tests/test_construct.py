@@ -0,0 +1,37 @@
+import json
+
+from harmony.endpoints.blockchain import getShardingStructure
+from harmony.models import Block, BlockListResponse, GetShardingStructureResponse, Transaction
+from harmony.utils.construct import construct_model
+from harmony.utils.sessions import TrustedSession
+
+from tests.fakes import FakeSession, make_block, result
+
+SHARDS = [{"current" : True, "http" : "https://api.s0.t.hmny.io", "shardID" : 0, "ws" : "wss://ws.s0.t.hmny.io"}]
+
+def sharding_structure(url, request):
+    return result(request, SHARDS)
+
+def test_construct_matches_validated():
+    data = {"jsonrpc" : "2.0", "id" : 1, "result" : [make_block(n) for n in range(3)]}
+    trusted = construct_model(BlockListResponse, data)
+    assert trusted == BlockListResponse(**data)
+    assert trusted.result[1].hash_ == "0x%064x" % 1
+    assert trusted.error is None
+
+def test_trusted_session_skips_validation():
+    trusted = getShardingStructure("http://localhost:9500", TrustedSession(FakeSession(sharding_structure)))
+    validated = getShardingStructure("http://localhost:9500", FakeSession(sharding_structure))
+    assert trusted.result == validated.result
+    assert trusted.result[0].shardID == 0
+    assert isinstance(trusted, GetShardingStructureResponse)
+
+def test_block_transactions_are_built_when_accessed():
+    tx = {"blockHash" : "0x01", "blockNumber" : 1, "from" : "one1a", "timestamp" : 1, "gas" : 21000, "gasPrice" : 1, "hash" : "0xaa", "input" : "0x", "nonce" : 1, "to" : "one1b", "transactionIndex" : 0, "value" : 5, "shardID" : 0, "toShardID" : 0}
+    data = make_block(1, transactions=[tx, "0xbb"])
+    for block in (Block(**data), construct_model(Block, data)):
+        assert block.transactions.raw[0] is tx
+        assert isinstance(block.transactions[0], Transaction)
+        assert block.transactions[0] is block.transactions[0]
+        assert [t if isinstance(t, str) else t.hash_ for t in block.transactions] == ["0xaa", "0xbb"]
+        assert json.loads(block.json())["transactions"] == [tx, "0xbb"]
@@ -0,0 +1,27 @@
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.parquet as pq
+
+from harmony.export import export_block_range
+
+from tests.fakes import BlockRangeSession, make_block, make_transaction
+
+def with_transactions(number):
+    return make_block(number, transactions=[make_transaction(number, i, value=10 ** 24) for i in range(2)])
+
+def test_export_block_range(tmp_path):
+    writers = export_block_range("http://localhost:9500", 1, 25, str(tmp_path), row_group_size=10, session=BlockRangeSession(block=with_transactions))
+    blocks = pq.ParquetFile(writers["blocks"].path)
+    assert blocks.metadata.num_rows == 25
+    assert blocks.metadata.num_row_groups == 3
+    transactions = pq.read_table(writers["transactions"].path)
+    assert transactions.num_rows == 50
+    assert transactions.column("value")[0].as_py() == str(10 ** 24)
+    assert transactions.column("blockNumber").to_pylist() == [n for n in range(1, 26) for _ in range(2)]
+    assert writers["staking_transactions"].rows == 0
+
+def test_export_arrow(tmp_path):
+    writers = export_block_range("http://localhost:9500", 1, 5, str(tmp_path), file_format="arrow", session=BlockRangeSession())
+    with pa.ipc.open_file(writers["blocks"].path) as reader:
+        assert reader.read_all().column("number").to_pylist() == [1, 2, 3, 4, 5]
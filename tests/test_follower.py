@@ -0,0 +1,69 @@
+import itertools
+
+import pytest
+
+from harmony.follower import AdaptivePolling, BlockFollower, FileCheckpoint
+from harmony.exceptions import BlockGapError
+
+from tests.fakes import FakeChain
+
+def test_follows_and_checkpoints(tmp_path):
+    chain = FakeChain(9)
+    checkpoint = FileCheckpoint(str(tmp_path / "checkpoint.json"))
+    follower = BlockFollower(chain, start=5, batch_size=3, checkpoint=checkpoint, polling=AdaptivePolling(minimum=0.001, maximum=0.001))
+    blocks = follower.__iter__()
+    assert [b.number for b in itertools.islice(blocks, 5)] == [5, 6, 7, 8, 9]
+    chain.grow(2)
+    assert [b.number for b in itertools.islice(blocks, 2)] == [10, 11]
+    assert checkpoint.load()[0] == 9
+    resumed = iter(BlockFollower(chain, checkpoint=checkpoint, polling=AdaptivePolling(minimum=0.001, maximum=0.001)))
+    assert next(resumed).number == 10
+
+def test_reorg_rewinds_to_common_ancestor():
+    chain = FakeChain(9)
+    reorgs = []
+    follower = BlockFollower(chain, start=0, on_reorg=lambda ancestor, dropped: reorgs.append((ancestor, dropped)), polling=AdaptivePolling(minimum=0.001, maximum=0.001))
+    blocks = iter(follower)
+    assert [b.number for b in itertools.islice(blocks, 10)] == list(range(10))
+    chain.replace_from(7, "b")
+    chain.grow(1, "b")
+    replaced = list(itertools.islice(blocks, 4))
+    assert reorgs == [(6, [7, 8, 9])]
+    assert [b.number for b in replaced] == [7, 8, 9, 10]
+    assert all(b.hash_.startswith("0xb") for b in replaced)
+
+def test_gap_is_retried_then_raised():
+    chain = FakeChain(9)
+    chain.hidden.add(3)
+    follower = BlockFollower(chain, start=0, max_retries=2, polling=AdaptivePolling(minimum=0.001, maximum=0.001))
+    blocks = iter(follower)
+    assert [b.number for b in itertools.islice(blocks, 3)] == [0, 1, 2]
+    with pytest.raises(BlockGapError):
+        next(blocks)
+    chain.hidden.clear()
+    assert next(iter(follower)).number == 3
+
+def test_ancestor_walk_is_retried():
+    chain = FakeChain(9)
+    reorgs = []
+    follower = BlockFollower(chain, start=0, on_reorg=lambda ancestor, dropped: reorgs.append((ancestor, dropped)), polling=AdaptivePolling(minimum=0.001, maximum=0.001))
+    blocks = iter(follower)
+    assert [b.number for b in itertools.islice(blocks, 10)] == list(range(10))
+    chain.replace_from(8, "b")
+    chain.grow(1, "b")
+    chain.header_failures = 2
+    assert [b.number for b in itertools.islice(blocks, 3)] == [8, 9, 10]
+    assert reorgs == [(7, [8, 9])]
+
+def test_view_changes_are_left_out_of_the_interval():
+    polling = AdaptivePolling(initial_interval=2.0)
+    polling.observe(100)
+    polling.observe(130, view_change=True)
+    assert polling.interval == 2.0
+
+def test_adaptive_polling_waits_for_the_next_block():
+    polling = AdaptivePolling(initial_interval=2.0, minimum=0.1)
+    polling.observe(100)
+    polling.observe(102)
+    assert 1.5 < polling.delay() <= 2.0
+    assert [polling.delay() for _ in range(3)] == [0.1, 0.2, 0.4]
@@ -0,0 +1,52 @@
+import json
+import threading
+
+from harmony.history import iter_transactions_history
+from harmony.utils.sessions import make_response
+
+class HistorySession(object):
+
+    def __init__(self, n, grow_after=None, grow_by=0):
+        self.hashes = ["0x%064x" % i for i in range(n)]
+        self.grow_after = grow_after
+        self.grow_by = grow_by
+        self.pages = []
+        self._lock = threading.Lock()
+
+    def post(self, url, headers=None, data=None, **kwargs):
+        request = json.loads(data)
+        if request["method"] == "hmyv2_getTransactionsCount":
+            return make_response(url, json.dumps({"jsonrpc" : "2.0", "id" : "1", "result" : len(self.hashes)}))
+        params = request["params"][0]
+        with self._lock:
+            ordered = self.hashes if params["order"] == "ASC" else self.hashes[::-1]
+            start = params["pageIndex"] * params["pageSize"]
+            page = ordered[start:start + params["pageSize"]]
+            self.pages.append(params["pageIndex"])
+            if len(self.pages) == self.grow_after:
+                n = len(self.hashes)
+                self.hashes.extend("0x%064x" % i for i in range(n, n + self.grow_by))
+        return make_response(url, json.dumps({"jsonrpc" : "2.0", "id" : "1", "result" : {"transactions" : page}}))
+
+def test_pages_are_yielded_in_order():
+    session = HistorySession(95)
+    hashes = list(iter_transactions_history("http://localhost:9500", "one1", page_size=10, max_workers=3, session=session))
+    assert hashes == session.hashes
+    assert sorted(session.pages) == list(range(10))
+
+def test_new_transactions_during_a_descending_scan():
+    session = HistorySession(40, grow_after=1, grow_by=3)
+    original = session.hashes[::-1]
+    hashes = list(iter_transactions_history("http://localhost:9500", "one1", sort_order="DESC", page_size=10, max_workers=1, session=session))
+    # The pages shift by the 3 new transactions, which are newer than the scan
+    assert hashes == original
+    assert max(session.pages) == 4
+
+def test_new_transactions_during_an_ascending_scan():
+    session = HistorySession(30, grow_after=1, grow_by=15)
+    hashes = list(iter_transactions_history("http://localhost:9500", "one1", page_size=10, max_workers=2, session=session))
+    assert hashes == session.hashes
+
+def test_empty_history():
+    session = HistorySession(0)
+    assert list(iter_transactions_history("http://localhost:9500", "one1", session=session)) == []
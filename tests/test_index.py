@@ -0,0 +1,123 @@
+import itertools
+
+from harmony.api import HarmonyAPI
+from harmony.cache import TTLCache
+from harmony.follower import AdaptivePolling
+from harmony.index import TransactionIndex
+from harmony.models import Block
+
+from tests.fakes import FakeChain, FakeSession, result
+
+ALICE, BOB, CAROL = "one1alice", "one1bob", "one1carol"
+
+def make_tx(number, index, sender, receiver):
+    return {
+        "blockHash" : "0x%064x" % number, "blockNumber" : number, "from" : sender, "to" : receiver,
+        "timestamp" : number, "gas" : 21000, "gasPrice" : 1, "hash" : "0x%062x%02x" % (number, index),
+        "ethHash" : "0xe%061x%02x" % (number, index), "input" : "0x", "nonce" : index,
+        "transactionIndex" : index, "value" : 1, "shardID" : 0, "toShardID" : 0
+    }
+
+class TxChain(FakeChain):
+
+    def _block(self, number, fork):
+        block = super()._block(number, fork).dict(by_alias=True)
+        block["transactions"] = [make_tx(number, 0, ALICE, BOB), make_tx(number, 1, BOB, CAROL if number % 2 else BOB)]
+        block["stakingTransactions"] = [{
+            "blockHash" : block["hash"], "blockNumber" : number, "from" : CAROL, "timestamp" : number, "gas" : 1,
+            "gasPrice" : 1, "nonce" : number, "transactionIndex" : 0, "type" : "Delegate",
+            "hash" : "0x5%061x00" % number, "msg" : {"delegatorAddress" : CAROL, "validatorAddress" : ALICE}
+        }]
+        return Block(**block)
+
+    def iter_blocks(self, start, end, *opts):
+        return iter(self.get_blocks(start, end))
+
+def test_sync_and_lookups():
+    chain = TxChain(9)
+    index = TransactionIndex(":memory:")
+    assert index.sync(chain) == 9
+    assert index.complete and index.load() == (9, chain.blocks[9].hash_)
+    tx = make_tx(4, 1, BOB, BOB)
+    assert index.get_transaction(tx["hash"]).hash_ == tx["hash"]
+    assert index.get_transaction(tx["ethHash"]).to == BOB
+    assert index.transaction_location(tx["hash"]) == (4, chain.blocks[4].hash_, 1, False)
+    assert index.block_transactions(4) == [make_tx(4, 0, ALICE, BOB)["hash"], tx["hash"]]
+    assert index.get_staking_transaction("0x5%061x00" % 3).msg["validatorAddress"] == ALICE
+    # Bob sends to himself in even blocks, which counts once
+    assert index.transaction_count(BOB) == 20
+    assert index.transaction_count(BOB, "SENT") == 10
+    assert index.transaction_count(BOB, "RECEIVED") == 15
+    assert index.transaction_count(ALICE, staking=True) == 10
+    page = index.transaction_history(ALICE, page_index=1, page_size=3, sort_order="DESC")
+    assert page == [make_tx(n, 0, ALICE, BOB)["hash"] for n in (6, 5, 4)]
+    chain.grow(2)
+    assert index.sync(chain) == 11
+
+def test_follow_rolls_back_reorgs(tmp_path):
+    chain = TxChain(5)
+    index = TransactionIndex(str(tmp_path / "index.db"))
+    index.sync(chain, end=3)
+    reorgs = []
+    blocks = index.follow(chain, on_reorg=lambda ancestor, dropped: reorgs.append(ancestor), polling=AdaptivePolling(minimum=0.001, maximum=0.001))
+    assert [b.number for b in itertools.islice(blocks, 2)] == [4, 5]
+    dropped = make_tx(5, 0, ALICE, BOB)["hash"]
+    chain.replace_from(5, "b")
+    chain.blocks[5].transactions.raw.pop(0)
+    chain.grow(1, "b")
+    assert next(blocks).hash_ == chain.blocks[5].hash_
+    assert reorgs == [4]
+    assert index.get_transaction(dropped) is None
+    assert index.transaction_count(ALICE, "SENT") == 5
+    reopened = TransactionIndex(str(tmp_path / "index.db"))
+    assert reopened.load() == (5, chain.blocks[5].hash_)
+
+def node(chain):
+    def respond(url, request):
+        if request["method"] == "hmyv2_blockNumber":
+            return result(request, chain.current_block_number())
+        return result(request, 1000)
+    return respond
+
+def test_api_answers_from_the_index():
+    chain = TxChain(3)
+    index = TransactionIndex(":memory:", history_from=1)
+    index.sync(chain, start=1)
+    api = HarmonyAPI("http://localhost:9500", session=FakeSession(node(chain)), transaction_index=index)
+    tx = make_tx(2, 0, ALICE, BOB)
+    assert api.get_transaction(tx["hash"]).hash_ == tx["hash"]
+    assert api.get_account_transaction_count(ALICE) == 3
+    history = api.get_account_transaction_history(ALICE, page_size=2, include_full_transaction_data=True)
+    assert [t.blockNumber for t in history["transactions"]] == [1, 2]
+
+def test_api_asks_the_node_while_the_index_lags():
+    chain = TxChain(3)
+    index, unchecked = TransactionIndex(":memory:", max_lag=2), TransactionIndex(":memory:", max_lag=None)
+    index.sync(chain)
+    unchecked.sync(chain)
+    api = HarmonyAPI("http://localhost:9500", session=FakeSession(node(chain)), transaction_index=index)
+    assert api.get_account_transaction_count(ALICE) == 4
+    # The chain moves on without the index being synced
+    chain.grow(3)
+    assert index.lag(chain.current_block_number()) == 3
+    assert api.get_account_transaction_count(ALICE) == 1000
+    api = HarmonyAPI("http://localhost:9500", session=FakeSession(node(chain)), transaction_index=unchecked)
+    assert api.get_account_transaction_count(ALICE) == 4
+
+def test_api_takes_the_head_from_the_follower_or_the_cache():
+    chain = TxChain(3)
+    index = TransactionIndex(":memory:")
+    index.sync(chain)
+    session = FakeSession(node(chain))
+    api = HarmonyAPI("http://localhost:9500", session=session, state_cache=TTLCache(), transaction_index=index)
+    assert [api.get_account_transaction_count(ALICE) for _ in range(3)] == [4] * 3
+    assert len(session.posted) == 1
+    session = FakeSession(node(chain))
+    api = HarmonyAPI("http://localhost:9500", session=session, transaction_index=index)
+    blocks = index.follow(chain, polling=AdaptivePolling(minimum=0.001, maximum=0.001))
+    chain.grow(1)
+    assert next(blocks).number == 4 and index.head == 4
+    assert api.get_account_transaction_count(ALICE) == 5
+    assert session.posted == []
+    blocks.close()
+    assert index.head is None
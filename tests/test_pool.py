@@ -0,0 +1,93 @@
+import json
+import time
+
+import pytest
+import requests
+
+from harmony.pool import EndpointPool, HedgePolicy
+from harmony.utils.sessions import PooledSession
+
+from tests.fakes import FakeSession, result
+
+class NodesSession(FakeSession):
+
+    def __init__(self, down=(), archival=(), slow=(), timing_out=()):
+        super().__init__(self._answer)
+        self.down = set(down)
+        self.archival = set(archival)
+        self.slow = set(slow)
+        self.timing_out = set(timing_out)
+
+    def _answer(self, url, request):
+        if url in self.down:
+            raise requests.ConnectionError(url)
+        if url in self.timing_out:
+            raise requests.ReadTimeout(url)
+        if url in self.slow:
+            time.sleep(0.2)
+        if request["method"] == "hmyv2_getNodeMetadata":
+            return result(request, {"is-archival" : url in self.archival})
+        return result(request, url)
+
+def post(session, method, params=()):
+    return json.loads(session.post("http://unused", data=json.dumps({"jsonrpc" : "2.0", "id" : 1, "method" : method, "params" : list(params)})).content)["result"]
+
+def test_routes_to_the_fastest_node():
+    pool = EndpointPool(["http://a", "http://b"])
+    a, b = pool.endpoints
+    pool.record(pool.select(), 0.5, True)
+    pool.record(pool.select(), 0.1, True)
+    assert a.latency == 0.5 and b.latency == 0.1
+    assert pool.select() is b
+
+def test_fails_over_and_ejects():
+    pool = EndpointPool(["http://a", "http://b"], max_failures=2)
+    session = PooledSession(pool, NodesSession(down=["http://a"]))
+    assert [post(session, "hmyv2_blockNumber") for _ in range(4)] == ["http://b"] * 4
+    a = pool.endpoints[0]
+    assert a.ejected and a.failures == 2
+    # An ejected node is only probed again once its ejection is over
+    assert [url for url, _ in session.session.posted].count("http://a") == 2
+    a.ejected_until = 1.0
+    session.session.down.clear()
+    assert post(session, "hmyv2_blockNumber") == "http://a"
+    assert not a.ejected
+
+def test_transactions_only_fail_over_on_connect_errors():
+    session = PooledSession(EndpointPool(["http://a", "http://b"]), NodesSession(down=["http://a"]))
+    assert post(session, "hmyv2_sendRawTransaction", ["0x00"]) == "http://b"
+    session = PooledSession(EndpointPool(["http://a", "http://b"]), NodesSession(timing_out=["http://a"]))
+    with pytest.raises(requests.ReadTimeout):
+        post(session, "hmyv2_sendRawTransaction", ["0x00"])
+    assert [url for url, _ in session.session.posted] == ["http://a"]
+
+def test_archival_calls_go_to_archival_nodes():
+    pool = EndpointPool(["http://a", "http://b"])
+    session = PooledSession(pool, NodesSession(archival=["http://b"]))
+    assert post(session, "hmyv2_getBalanceByBlockNumber", ["one1abc", 5]) == "http://b"
+    assert [e.archival for e in pool.endpoints] == [False, True]
+    pool.endpoints[1].latency = 10.0
+    assert post(session, "hmyv2_getBalanceByBlockNumber", ["one1abc", 5]) == "http://b"
+
+def test_slow_reads_are_hedged():
+    hedging = HedgePolicy(percentile=50, min_samples=5)
+    for _ in range(5):
+        hedging.observe("hmyv2_getBalance", 0.01)
+        hedging.observe("hmyv2_sendRawTransaction", 0.01)
+    pool = EndpointPool(["http://slow", "http://fast"])
+    session = PooledSession(pool, NodesSession(slow=["http://slow"]), hedging)
+    assert post(session, "hmyv2_getBalance", ["one1abc"]) == "http://fast"
+    assert hedging.metrics()["hmyv2_getBalance"]["hedge_won"] == 1
+    pool.endpoints[1].latency = 10.0
+    assert post(session, "hmyv2_sendRawTransaction", ["0x00"]) == "http://slow"
+    assert [url for url, call in session.session.posted if call["method"] == "hmyv2_sendRawTransaction"] == ["http://slow"]
+
+def test_hedging_stops_while_its_threads_are_busy():
+    hedging = HedgePolicy(percentile=50, min_samples=5, max_workers=1)
+    for _ in range(5):
+        hedging.observe("hmyv2_getBalance", 0.01)
+    pool = EndpointPool(["http://slow", "http://fast"])
+    session = PooledSession(pool, NodesSession(slow=["http://slow"]), hedging)
+    # The only thread is taken by the first request, so the slow node's answer is waited for
+    assert post(session, "hmyv2_getBalance", ["one1abc"]) == "http://slow"
+    assert hedging.metrics()["hmyv2_getBalance"]["hedged"] == 0
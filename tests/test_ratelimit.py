@@ -0,0 +1,95 @@
+import asyncio
+import json
+import threading
+import time
+
+from harmony.utils.communication import format_api_data
+from harmony.utils.ratelimit import ConcurrencyLimit, Limit, RateLimiter, TokenBucket
+from harmony.utils.sessions import RateLimitedSession, make_response
+
+class CountingSession(object):
+
+    def __init__(self, status=200, delay=0.0, headers=None):
+        self.status = status
+        self.delay = delay
+        self.headers = headers or {}
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def post(self, url, headers=None, data=None, **kwargs):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        resp = make_response(url, json.dumps({"jsonrpc" : "2.0", "id" : "1", "result" : 1}), self.status)
+        resp.headers.update(self.headers)
+        return resp
+
+def test_bucket_allows_burst_then_waits():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0 and bucket.reserve() == 0
+    assert 0.05 < bucket.reserve() <= 0.1
+    assert 0.15 < bucket.reserve() <= 0.2
+
+def test_throttle_halves_rate_and_recovers():
+    bucket = TokenBucket(rate=8, burst=1, recovery=0.25)
+    bucket.throttle(retry_after=0.5)
+    assert bucket.rate == 4
+    assert bucket.reserve() >= 0.45
+    for _ in range(4):
+        bucket.recover()
+    assert bucket.rate == 8
+
+def test_max_in_flight_is_shared_between_threads():
+    limiter = RateLimiter(Limit(rate=None, max_in_flight=2))
+    inner = CountingSession(delay=0.02)
+    session = RateLimitedSession(limiter, inner)
+    data = format_api_data("hmyv2_blockNumber", None)
+    threads = [threading.Thread(target=session.post, args=("http://a",), kwargs={"data" : data}) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert inner.calls == 8 and inner.peak == 2
+
+def test_heavy_methods_have_their_own_limit():
+    limiter = RateLimiter(Limit(rate=1000, burst=100), classes={"heavy" : Limit(rate=1000, burst=1, max_in_flight=1)})
+    light = [gate for gate, _ in limiter.gates("http://a", ["hmyv2_blockNumber"])]
+    heavy = [gate for gate, _ in limiter.gates("http://a", ["hmyv2_getAllValidatorInformation"])]
+    assert len(light) == 1 and len(heavy) == 2 and heavy[0] is light[0]
+    assert limiter.gates("http://b", ["hmyv2_blockNumber"])[0][0] is not light[0]
+
+def test_429_slows_the_endpoint_down():
+    limiter = RateLimiter(Limit(rate=100, burst=1))
+    session = RateLimitedSession(limiter, CountingSession(status=429, headers={"Retry-After" : "0.2"}))
+    session.post("http://a", data=format_api_data("hmyv2_blockNumber", None))
+    bucket = limiter.gates("http://a", [])[0][0].bucket
+    assert bucket.rate == 50
+    start = time.monotonic()
+    session.post("http://a", data=format_api_data("hmyv2_blockNumber", None))
+    assert time.monotonic() - start >= 0.15
+
+def test_concurrency_limit_serves_threads_and_tasks():
+    limit = ConcurrencyLimit(1)
+    limit.acquire()
+    order = []
+
+    async def task():
+        await limit.acquire_async()
+        order.append("task")
+        limit.release()
+
+    async def main():
+        waiting = asyncio.ensure_future(task())
+        await asyncio.sleep(0.01)
+        assert not order
+        threading.Timer(0.01, limit.release).start()
+        await asyncio.wait_for(waiting, 1)
+
+    asyncio.run(main())
+    assert order == ["task"] and limit.active == 0
@@ -0,0 +1,69 @@
+import pytest
+
+from harmony.receipts import iter_block_receipts, iter_receipts
+from harmony.models import Block, TransactionReceipt
+
+from tests.fakes import FakeSession, error, make_block, result
+
+def make_receipt(transaction_hash):
+    return {
+        "blockHash" : "0x0", "blockNumber" : 1, "contractAddress" : None, "cumulativeGasUsed" : 21000,
+        "from" : "one1", "gasUsed" : 21000, "logs" : [], "logsBloom" : "0x", "shardID" : 0, "status" : 1,
+        "to" : "one1", "transactionHash" : transaction_hash, "transactionIndex" : 0
+    }
+
+class ReceiptSession(FakeSession):
+
+    def __init__(self, unknown=(), fail_once=()):
+        super().__init__(self._receipts)
+        self.unknown = set(unknown)
+        self.fail_once = set(fail_once)
+        self.batches = []
+        self.first_hashes = []
+
+    def _receipts(self, url, calls):
+        payload = []
+        with self._lock:
+            self.batches.append(len(calls))
+            self.first_hashes.append(calls[0]["params"][0])
+            for call in calls:
+                transaction_hash = call["params"][0]
+                if transaction_hash in self.fail_once:
+                    self.fail_once.discard(transaction_hash)
+                    payload.append(error(call, -32000, "busy"))
+                else:
+                    payload.append(result(call, None if transaction_hash in self.unknown else make_receipt(transaction_hash)))
+        return payload[::-1]
+
+def test_receipts_in_order():
+    hashes = ["0x%064x" % i for i in range(250)]
+    session = ReceiptSession(unknown=[hashes[7]], fail_once=[hashes[42]])
+    receipts = list(iter_receipts("http://localhost:9500", hashes, batch_size=40, max_workers=3, retry_backoff=0, session=session))
+    assert receipts[7] is None
+    assert [r.transactionHash for r in receipts if r is not None] == hashes[:7] + hashes[8:]
+    assert max(session.batches) == 40 and 1 in session.batches
+
+def test_backoff_leaves_the_worker_free():
+    hashes = ["0x%064x" % i for i in range(4)]
+    session = ReceiptSession(fail_once=[hashes[0]])
+    receipts = list(iter_receipts("http://localhost:9500", hashes, batch_size=2, max_workers=1, retry_backoff=0.1, session=session))
+    assert [r.transactionHash for r in receipts] == hashes
+    # The second batch is sent while the failed call of the first waits out its backoff
+    assert session.first_hashes == [hashes[0], hashes[2], hashes[0]]
+
+def test_receipts_grouped_by_block():
+    blocks = []
+    for number in range(6):
+        data = make_block(number)
+        # Blocks fetched without their full transaction data only hold the hashes
+        data["transactions"] = ["0x%062x%02x" % (number, i) for i in range(number % 3)]
+        blocks.append(Block(**data))
+    grouped = list(iter_block_receipts("http://localhost:9500", iter(blocks), batch_size=2, max_workers=2, session=ReceiptSession()))
+    assert [block.number for block, _ in grouped] == list(range(6))
+    for block, receipts in grouped:
+        assert [r.transactionHash for r in receipts] == block.transactions.raw
+
+def test_misspelled_gas_field_still_reads():
+    receipt = TransactionReceipt(**make_receipt("0x01"))
+    with pytest.warns(DeprecationWarning):
+        assert receipt.culmulativeGasUsed == receipt.cumulativeGasUsed == 21000
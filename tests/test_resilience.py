@@ -0,0 +1,89 @@
+import json
+
+import pytest
+import requests
+
+from harmony import HarmonyAPI
+from harmony.exceptions import CircuitOpenError, HarmonyNodeError
+from harmony.pool import EndpointPool
+from harmony.utils.communication import format_api_data, post_request
+from harmony.utils.resilience import CircuitBreaker, RetryPolicy, is_transient_error
+from harmony.utils.sessions import PooledSession, ResilientSession, make_response
+
+class FlakySession(object):
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.timeouts = []
+
+    def post(self, url, headers=None, data=None, timeout=None, **kwargs):
+        self.timeouts.append(timeout)
+        outcome = self.outcomes.pop(0) if self.outcomes else 200
+        if isinstance(outcome, Exception):
+            raise outcome
+        if isinstance(outcome, dict):
+            return make_response(url, json.dumps({"jsonrpc" : "2.0", "id" : "1", "error" : outcome}))
+        return make_response(url, json.dumps({"jsonrpc" : "2.0", "id" : "1", "result" : 5}), outcome)
+
+def policy(**kwargs):
+    return RetryPolicy(backoff=0, **kwargs)
+
+def test_reads_are_retried_with_timeouts():
+    session = FlakySession(requests.ConnectionError(), 503, {"code" : -32603, "message" : "internal"})
+    resp = post_request("http://a", format_api_data("hmyv2_blockNumber", None), ResilientSession(policy(max_retries=3, connect_timeout=1, read_timeout=2), session))
+    assert json.loads(resp.content)["result"] == 5
+    assert session.timeouts == [(1, 2)] * 4
+
+def test_gives_up_after_max_retries():
+    session = ResilientSession(policy(max_retries=1), FlakySession(502, 502, 200))
+    with pytest.raises(HarmonyNodeError):
+        post_request("http://b", format_api_data("hmyv2_blockNumber", None), session)
+
+def test_transactions_are_not_retried():
+    session = FlakySession(503, 200)
+    with pytest.raises(HarmonyNodeError):
+        post_request("http://c", format_api_data("hmyv2_sendRawTransaction", None), ResilientSession(policy(), session))
+    assert len(session.timeouts) == 1
+
+def test_circuit_opens_and_resets():
+    session = ResilientSession(policy(max_retries=0, failure_threshold=2, reset_seconds=0.05), FlakySession(503, 503, 503, 200))
+    data = format_api_data("hmyv2_blockNumber", None)
+    for _ in range(2):
+        with pytest.raises(HarmonyNodeError):
+            post_request("http://d", data, session)
+    with pytest.raises(CircuitOpenError):
+        post_request("http://d", data, session)
+    assert session.breakers.get("http://d").state == "open"
+
+def test_breaker_counts_calls_not_attempts():
+    session = ResilientSession(policy(max_retries=2, failure_threshold=2), FlakySession(*[503] * 6))
+    data = format_api_data("hmyv2_blockNumber", None)
+    with pytest.raises(HarmonyNodeError):
+        post_request("http://e", data, session)
+    assert session.breakers.get("http://e").state == "closed"
+    with pytest.raises(HarmonyNodeError):
+        post_request("http://e", data, session)
+    assert session.breakers.get("http://e").state == "open"
+
+def test_clients_have_their_own_breakers():
+    first, second = (HarmonyAPI("http://f", session=FlakySession()) for _ in range(2))
+    assert first.session.breakers.get("http://f") is not second.session.breakers.get("http://f")
+
+def test_pooled_sessions_are_not_retried():
+    session = FlakySession(*[requests.ConnectionError()] * 6)
+    pooled = ResilientSession(policy(), PooledSession(EndpointPool(["http://g", "http://h"]), session))
+    with pytest.raises(requests.ConnectionError):
+        post_request("http://g", format_api_data("hmyv2_blockNumber", None), pooled)
+    assert len(session.timeouts) == 2
+
+def test_breaker_half_open_allows_one_trial():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0)
+    breaker.failure()
+    assert breaker.allow() and not breaker.allow()
+    breaker.success()
+    assert breaker.state == "closed"
+
+def test_error_classification():
+    assert is_transient_error({"code" : -32005, "message" : "limit exceeded"})
+    assert not is_transient_error({"code" : -32602, "message" : "invalid params"})
+    assert RetryPolicy(max_backoff=1).delay(0, "30") == 1
@@ -0,0 +1,30 @@
+import json
+import threading
+import time
+
+from harmony.utils.sessions import CoalescingSession, make_response
+
+class SlowSession(object):
+
+    def __init__(self):
+        self.posted = []
+
+    def post(self, url, headers=None, data=None, **kwargs):
+        self.posted.append(data)
+        time.sleep(0.05)
+        call = json.loads(data)
+        return make_response(url, json.dumps({"jsonrpc" : "2.0", "id" : call["id"], "result" : call["params"]}))
+
+def test_identical_requests_share_one_call():
+    session = CoalescingSession(SlowSession())
+    same = json.dumps({"jsonrpc" : "2.0", "id" : "1", "method" : "hmyv2_getTransactionByHash", "params" : ["0x01"]})
+    other = json.dumps({"jsonrpc" : "2.0", "id" : "1", "method" : "hmyv2_getTransactionByHash", "params" : ["0x02"]})
+    responses = []
+    threads = [threading.Thread(target=lambda data: responses.append(session.post("http://localhost:9500", data=data)), args=(data,)) for data in [same] * 5 + [other]]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(session.session.posted) == 2
+    assert session.coalesced == 4
+    assert sorted(r.json()["result"][0] for r in responses) == ["0x01"] * 5 + ["0x02"]
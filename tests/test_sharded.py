@@ -0,0 +1,43 @@
+import time
+
+import pytest
+
+from harmony.sharded import ShardedHarmonyAPI
+
+from tests.fakes import FakeSession, result
+
+SHARDS = {shard_id : "http://shard{}:9500".format(shard_id) for shard_id in range(4)}
+
+def shards(url, call):
+    shard_id = int(url[len("http://shard")])
+    if call["method"] == "hmyv2_getShardingStructure":
+        return result(call, [{"current" : i == 0, "http" : url, "shardID" : i, "ws" : url.replace("http", "ws")} for i, url in SHARDS.items()])
+    if call["method"] == "hmyv2_blockNumber":
+        return result(call, 1000 + shard_id)
+    if call["method"] == "hmyv2_getBalance":
+        return result(call, 10 ** 18 * shard_id)
+    if call["method"] == "hmyv2_getTransactionByHash":
+        return result(call, {"hash" : call["params"][0], "shardID" : shard_id} if shard_id == 2 else None)
+
+def test_discovers_and_fans_out():
+    session = FakeSession(shards)
+    with ShardedHarmonyAPI(SHARDS[0], session_factory=lambda: session, trusted=True) as api:
+        assert api.shard_ids == [0, 1, 2, 3]
+        assert api.shard(3).url == SHARDS[3]
+        assert api.current_block_numbers() == {0 : 1000, 1 : 1001, 2 : 1002, 3 : 1003}
+        assert api.get_account_balance("one1abc") == 6 * 10 ** 18
+        assert api.get_transaction("0xabc").shardID == 2
+
+def test_map_waits_for_every_call():
+    finished = []
+
+    def fail_first(api):
+        if api.url == SHARDS[0]:
+            raise ValueError(api.url)
+        time.sleep(0.05)
+        finished.append(api.url)
+
+    with ShardedHarmonyAPI(SHARDS[0], session_factory=lambda: FakeSession(shards), trusted=True) as api:
+        with pytest.raises(ValueError):
+            api.map(fail_first)
+        assert len(finished) == 3
@@ -0,0 +1,86 @@
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from harmony.utils import transport
+from harmony.utils.communication import format_api_data, post_request
+from harmony.utils.transport import TransportConfig, create_session, default_session, set_default_transport
+
+class Handler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            self.server.clients.add(self.client_address)
+        body = json.dumps({"jsonrpc" : "2.0", "id" : "1", "result" : 1}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.clients = set()
+    httpd.lock = threading.Lock()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+def test_adapter_uses_the_config():
+    session = create_session(TransportConfig(max_connections_per_host=4, max_hosts=2, block=True))
+    adapter = session.get_adapter("https://api.s0.t.hmny.io")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 4
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+    assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in adapter.poolmanager.connection_pool_kw["socket_options"]
+
+def test_threads_share_the_connections_of_a_session(server):
+    session = create_session(TransportConfig(max_connections_per_host=3, block=True))
+    url = "http://127.0.0.1:{}".format(server.server_address[1])
+    data = format_api_data("hmyv2_blockNumber", None)
+    errors = []
+
+    def work():
+        try:
+            for _ in range(10):
+                assert json.loads(post_request(url, data, session).content)["result"] == 1
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    session.close()
+    assert not errors
+    assert len(server.clients) <= 3
+
+def test_calls_without_a_session_reuse_the_default_one(server):
+    set_default_transport(TransportConfig(max_connections_per_host=1, block=True))
+    try:
+        assert default_session() is default_session()
+        url = "http://127.0.0.1:{}".format(server.server_address[1])
+        for _ in range(5):
+            post_request(url, format_api_data("hmyv2_blockNumber", None))
+        assert len(server.clients) == 1
+    finally:
+        set_default_transport(transport.DEFAULT_TRANSPORT)
+
+def test_without_keepalive_connections_are_closed(server):
+    session = create_session(TransportConfig(keepalive=False))
+    url = "http://127.0.0.1:{}".format(server.server_address[1])
+    for _ in range(3):
+        post_request(url, format_api_data("hmyv2_blockNumber", None), session)
+    assert len(server.clients) == 3
@@ -0,0 +1,49 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from harmony.models import ValidatorInformation
+from harmony.validator_stats import ValidatorStats
+
+ONE = 10 ** 18
+
+def make_validator(address, stake, delegations, signed=90, to_sign=100, apr=0.1, elected=True):
+    return ValidatorInformation(**{
+        "validator" : {
+            "bls-public-keys" : ["0xkey"], "creation-height" : 1, "address" : address, "details" : "", "identity" : address,
+            "last-epoch-in-committee" : 1, "max-change-rate" : "0.05", "max-rate" : "0.2", "min-self-delegation" : 10000 * ONE,
+            "max-total-delegation" : 10 ** 9 * ONE, "name" : address, "rate" : "0.1", "security-contact" : "", "update-height" : 1, "website" : "",
+            "delegations" : [{"delegator-address" : d, "amount" : a * ONE, "reward" : ONE, "undelegations" : []} for d, a in delegations]
+        },
+        "total-delegation" : stake * ONE, "currently-in-committee" : elected, "active-status" : "active",
+        "epos-status" : "currently elected" if elected else "not eligible to be elected next epoch",
+        "lifetime" : {"reward-accumulated" : 5 * ONE, "blocks" : {"to-sign" : to_sign, "signed" : signed}, "apr" : apr}
+    })
+
+@pytest.fixture
+def stats():
+    return ValidatorStats([
+        make_validator("one1a", 600, [("one1a", 100), ("one1x", 500)]),
+        make_validator("one1b", 300, [("one1b", 300)], signed=0, to_sign=0, apr=0.2),
+        make_validator("one1c", 100, [("one1x", 60), ("one1y", 40)], apr=0.3),
+        make_validator("one1d", 50, [], elected=False)
+    ])
+
+def test_flattened(stats):
+    assert len(stats) == 4
+    assert stats.delegation_indptr.tolist() == [0, 2, 3, 5, 5]
+    assert stats.n_delegations.tolist() == [2, 1, 2, 0]
+    assert stats.delegated_per_validator().tolist() == [600, 300, 100, 0]
+    assert stats.self_delegation().tolist() == [100, 300, 0, 0]
+    assert stats.delegated_per_delegator() == {"one1a" : 100, "one1b" : 300, "one1x" : 560, "one1y" : 40}
+    assert stats.unclaimed_rewards_per_validator().tolist() == [2, 1, 2, 0]
+
+def test_aggregates(stats):
+    signing = stats.signing_percentage()
+    assert signing[0] == 0.9 and np.isnan(signing[1])
+    assert stats.apr_percentiles((50,)).tolist() == [0.2]
+    assert stats.nakamoto_coefficient() == 1
+    assert stats.nakamoto_coefficient(0.6) == 2
+    assert stats.herfindahl_index() == pytest.approx(0.6 ** 2 + 0.3 ** 2 + 0.1 ** 2)
+    assert stats.gini_coefficient(mask=np.ones(4, dtype=bool)) > stats.gini_coefficient(mask=np.array([True, True, False, False]))
+    assert stats.summary()["elected"] == 3